@@ -1,6 +1,27 @@
 class Notification:
+    FIELDS = ("username", "action", "project_id", "time_str")
+    __slots__ = FIELDS
+
     def __init__(self, username="", action="", project_id="", time_str=""):
         self.username = username
         self.action = action
         self.project_id = project_id
         self.time_str = time_str
+
+    def to_dict(self):
+        return {
+            "username": self.username,
+            "action": self.action,
+            "project_id": self.project_id,
+            "time_str": self.time_str,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls.__new__(cls)
+        get = data.get
+        obj.username = get("username", "")
+        obj.action = get("action", "")
+        obj.project_id = get("project_id", "")
+        obj.time_str = get("time_str", "")
+        return obj
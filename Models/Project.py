@@ -1,6 +1,26 @@
-from datetime import datetime
+from datetime import date, datetime
+
+from libs.DateUtils import parse_date, to_ordinal
+
 
 class Project:
+    # Các trường được lưu xuống file/DB, theo đúng thứ tự trong JSON
+    FIELDS = (
+        "project_id", "name", "assignment", "manager", "status", "progress",
+        "start_date", "end_date", "color", "priority", "description", "attachments",
+        "dependency", "estimated_time", "view_gantt", "view_kanban", "drag_and_drop",
+        "version"
+    )
+    # Các trường nặng mà bảng/Kanban/Gantt/biểu đồ không cần: một bản "summary" (xem summary())
+    # chưa có chúng, chúng được nạp qua loader ở lần đọc đầu tiên (hoặc theo lô bằng set_details)
+    HEAVY_FIELDS = ("description", "attachments")
+    # start_date/end_date là property: chuỗi gốc được giữ để hiển thị và ghi lại,
+    # còn start_ordinal/end_ordinal (số ngày, int hoặc None) được tính 1 lần khi gán.
+    __slots__ = tuple(f for f in FIELDS if f not in ("start_date", "end_date", "description", "attachments")) + (
+        "_start_date", "_end_date", "start_ordinal", "end_ordinal",
+        "_description", "_attachments", "_details_loader"
+    )
+
     def __init__(
         self,
         project_id: str,
@@ -19,8 +39,10 @@ class Project:
         estimated_time="",
         view_gantt=False,
         view_kanban=False,
-        drag_and_drop=False
+        drag_and_drop=False,
+        version=0
     ):
+        self._details_loader = None
         self.project_id = project_id
         self.name = name
         self.assignment = assignment if assignment else []
@@ -38,6 +60,152 @@ class Project:
         self.view_gantt = view_gantt
         self.view_kanban = view_kanban
         self.drag_and_drop = drag_and_drop
+        # Số lần đã lưu; save_project từ chối ghi đè nếu bản lưu trữ đã có version mới hơn
+        self.version = version
+
+    @property
+    def start_date(self):
+        return self._start_date
+
+    @start_date.setter
+    def start_date(self, value):
+        self._start_date = value
+        self.start_ordinal = to_ordinal(value)
+
+    @property
+    def end_date(self):
+        return self._end_date
+
+    @end_date.setter
+    def end_date(self, value):
+        self._end_date = value
+        self.end_ordinal = to_ordinal(value)
+
+    @property
+    def description(self):
+        if self._details_loader is not None:
+            self.load_details()
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        if self._details_loader is not None:
+            self.load_details()
+        self._description = value
+
+    @property
+    def attachments(self):
+        if self._details_loader is not None:
+            self.load_details()
+        return self._attachments
+
+    @attachments.setter
+    def attachments(self, value):
+        if self._details_loader is not None:
+            self.load_details()
+        self._attachments = value
+
+    @property
+    def details_loaded(self):
+        """False for a summary whose description/attachments have not been fetched yet."""
+        return self._details_loader is None
+
+    def load_details(self):
+        """
+        Fetches description and attachments of a summary (no-op once they are loaded).
+        Returns False if the loader failed; the fields read as empty until the next try.
+        """
+        loader = self._details_loader
+        if loader is None:
+            return True
+        details = loader(self.project_id)
+        if details is None:
+            return False
+        self.set_details(details.get("description", ""), details.get("attachments"))
+        return True
+
+    def set_details(self, description, attachments):
+        """Fills the heavy fields (e.g. fetched for a batch of summaries in one query)."""
+        self._details_loader = None
+        self._description = description
+        self._attachments = attachments if attachments else []
+
+    @property
+    def start_day(self):
+        """start_date as a datetime.date (None if it could not be parsed)."""
+        return date.fromordinal(self.start_ordinal) if self.start_ordinal is not None else None
+
+    @property
+    def end_day(self):
+        return date.fromordinal(self.end_ordinal) if self.end_ordinal is not None else None
+
+    def to_dict(self, details=True):
+        """
+        Returns the persisted fields as a plain dict (lists are not copied).
+        With details=False the heavy fields of a summary are left out instead of fetched.
+        """
+        if not details and self._details_loader is not None:
+            return {f: getattr(self, f) for f in self.FIELDS if f not in self.HEAVY_FIELDS}
+        return {
+            "project_id": self.project_id,
+            "name": self.name,
+            "assignment": self.assignment,
+            "manager": self.manager,
+            "status": self.status,
+            "progress": self.progress,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "color": self.color,
+            "priority": self.priority,
+            "description": self.description,
+            "attachments": self.attachments,
+            "dependency": self.dependency,
+            "estimated_time": self.estimated_time,
+            "view_gantt": self.view_gantt,
+            "view_kanban": self.view_kanban,
+            "drag_and_drop": self.drag_and_drop,
+            "version": self.version,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a Project straight from a JSON dict, filling the slots without going
+        through **kwargs. Unknown keys are ignored; a missing required key raises KeyError.
+        """
+        obj = cls.__new__(cls)
+        obj._details_loader = None
+        get = data.get
+        obj.project_id = data["project_id"]
+        obj.name = data["name"]
+        obj.assignment = get("assignment") or []
+        obj.manager = data["manager"]
+        obj.status = data["status"]
+        obj.progress = data["progress"]
+        obj.start_date = data["start_date"]
+        obj.end_date = data["end_date"]
+        obj.color = get("color", "#FF6B6B")
+        obj.priority = get("priority", "Normal")
+        obj.description = get("description", "")
+        obj.attachments = get("attachments") or []
+        obj.dependency = get("dependency", "")
+        obj.estimated_time = get("estimated_time", "")
+        obj.view_gantt = get("view_gantt", False)
+        obj.view_kanban = get("view_kanban", False)
+        obj.drag_and_drop = get("drag_and_drop", False)
+        obj.version = get("version", 0)
+        return obj
+
+    @classmethod
+    def summary(cls, data, loader):
+        """
+        Builds a summary Project from a dict without description/attachments.
+        `loader(project_id)` returns {"description": ..., "attachments": [...]} (None on
+        error) and is called the first time one of those fields is read or written.
+        """
+        obj = cls.from_dict(data)
+        obj._details_loader = loader
+        return obj
 
     def __str__(self):
         return (
@@ -53,15 +221,12 @@ class Project:
 
     def parse_date(self, date_str: str) -> datetime:
         """
-        Attempt to parse a date string using multiple common formats.
+        Parse a date string with the lenient parser in libs.DateUtils.
         Fallback to the current date if parsing fails.
         """
-        formats = ["%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        d = parse_date(date_str)
+        if d is not None:
+            return datetime(d.year, d.month, d.day)
         # Fallback
         print(f"Failed to parse date: '{date_str}'. Using current date/time.")
         return datetime.now()
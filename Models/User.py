@@ -1,7 +1,13 @@
 import os
 from PyQt6.QtGui import QPixmap
 
+DEFAULT_AVATAR = "D:\PHẦN MỀM QUẢN LÝ DỰ ÁN_FINALPROJECT\Image\avt.png"
+
+
 class User:
+    FIELDS = ("Name", "Email", "PhoneNum", "Username", "Password", "Avatar")
+    __slots__ = FIELDS
+
     def __init__(self, Name, Email, PhoneNum, Username, Password, Avatar=None):
         self.Name = Name
         self.Email = Email
@@ -9,7 +15,31 @@ class User:
         self.Username = Username
         self.Password = Password
         # If no avatar is provided, use a default image (adjust the path as needed)
-        self.Avatar = Avatar if Avatar else "D:\PHẦN MỀM QUẢN LÝ DỰ ÁN_FINALPROJECT\Image\avt.png"
+        self.Avatar = Avatar if Avatar else DEFAULT_AVATAR
+
+    def to_dict(self):
+        return {
+            "Name": self.Name,
+            "Email": self.Email,
+            "PhoneNum": self.PhoneNum,
+            "Username": self.Username,
+            "Password": self.Password,
+            "Avatar": self.Avatar,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a User straight from a JSON dict. A missing required key raises KeyError.
+        """
+        obj = cls.__new__(cls)
+        obj.Name = data["Name"]
+        obj.Email = data["Email"]
+        obj.PhoneNum = data["PhoneNum"]
+        obj.Username = data["Username"]
+        obj.Password = data["Password"]
+        obj.Avatar = data.get("Avatar") or DEFAULT_AVATAR
+        return obj
 
     def get_avatar_pixmap(self):
         """
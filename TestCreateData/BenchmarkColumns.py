@@ -0,0 +1,49 @@
+import random
+import sys
+import time
+from datetime import date
+
+from Models.Project import Project
+from libs.ProjectColumns import ProjectColumns, STATUSES
+
+# --- Đo tốc độ các phép thống kê trên ProjectColumns (NumPy) ---
+# Chạy: python -m TestCreateData.BenchmarkColumns [số_project]
+
+
+def make_projects(count):
+    rnd = random.Random(7)
+    today = date.today().toordinal()
+    projects = []
+    for i in range(count):
+        start = date.fromordinal(today - rnd.randint(0, 700))
+        end = date.fromordinal(start.toordinal() + rnd.randint(1, 400))
+        projects.append(Project(
+            f"PRJ{i:07d}", f"Project {i}", [], "manager", rnd.choice(STATUSES), rnd.randint(0, 100),
+            start.strftime("%d/%m/%Y"), end.strftime("%d/%m/%Y"), priority=f"Priority {rnd.randint(1, 4)}"
+        ))
+    return projects
+
+
+def timed(label, fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000 / repeat:9.3f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    projects = make_projects(count)
+    print(f"{count} projects")
+    cols = timed("build (one time)", lambda: ProjectColumns.from_projects(projects), repeat=1)
+    timed("python loop status count", lambda: {s: sum(1 for p in projects if p.status == s) for s in STATUSES}, repeat=1)
+    timed("status_counts", cols.status_counts)
+    timed("priority_counts", cols.priority_counts)
+    timed("progress_histogram", cols.progress_histogram)
+    timed("date_range", cols.date_range)
+    timed("overdue_mask", cols.overdue_mask)
+    timed("week_histogram", cols.week_histogram)
+    p = projects[count // 2]
+    p.status = "Completed"
+    timed("patch one project", lambda: cols.patch(p), repeat=1000)
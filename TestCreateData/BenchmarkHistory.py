@@ -0,0 +1,101 @@
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from libs.ProjectHistory import ProjectHistory
+from libs.ProjectJournal import ProjectJournal
+
+# --- Dựng lại project / toàn bộ dữ liệu tại một thời điểm trong quá khứ ---
+# Chạy: python -m TestCreateData.BenchmarkHistory [số_project] [số_lần_lưu]
+# So sánh ProjectHistory có checkpoint (mặc định) với replay từ đầu (không checkpoint),
+# và kiểm tra kết quả với trạng thái thật đã ghi lại ở vài thời điểm.
+
+STATUSES = ["Open", "Pending", "Ongoing", "Completed", "Canceled"]
+
+
+def make_rows(count):
+    rows = {}
+    for i in range(1, count + 1):
+        pid = f"PRJ{i:05d}"
+        rows[pid] = {"project_id": pid, "name": f"Project {i}", "status": "Open", "progress": 0,
+                     "description": "x" * 200, "version": 1}
+    return rows
+
+
+def make_saves(rows, count):
+    """Mỗi lần lưu đổi 1-2 trường của một project; thỉnh thoảng thêm/xoá project."""
+    rnd = random.Random(7)
+    ids = list(rows)
+    saves = []
+    next_id = len(rows) + 1
+    for i in range(count):
+        if i % 50 == 49:
+            pid = f"PRJ{next_id:05d}"
+            next_id += 1
+            ids.append(pid)
+            saves.append([{"op": "put", "data": {"project_id": pid, "name": f"New {pid}", "status": "Open",
+                                                 "progress": 0, "description": "", "version": 1}}])
+        elif i % 97 == 96:
+            pid = ids.pop(rnd.randrange(len(ids)))
+            saves.append([{"op": "delete", "project_id": pid}])
+        else:
+            fields = {"progress": rnd.randint(0, 100)}
+            if rnd.random() < 0.3:
+                fields["status"] = rnd.choice(STATUSES)
+            saves.append([{"op": "set", "project_id": rnd.choice(ids), "fields": fields}])
+    return saves
+
+
+def record_all(history, rows, saves, samples):
+    """Ghi mọi lần lưu; trả về [(thời điểm, bản sao trạng thái)] tại các lần lưu được chọn."""
+    state = dict(rows)
+    checkpoints = []
+    start = time.perf_counter()
+    for i, records in enumerate(saves):
+        history.record(records, lambda: state)
+        ProjectJournal.replay(state, records)
+        if i in samples:
+            checkpoints.append((time.time(), dict(state)))
+            time.sleep(0.002)  # để mốc thời gian không trùng với lần lưu kế tiếp
+    elapsed = time.perf_counter() - start
+    print(f"  record {len(saves)} saves                {elapsed * 1e6 / len(saves):9.1f} us/save")
+    return checkpoints
+
+
+def timed(label, fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    print(f"  {label:<36} {(time.perf_counter() - start) * 1000 / repeat:9.2f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    save_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    rows = make_rows(count)
+    saves = make_saves(rows, save_count)
+    samples = {save_count // 10, save_count // 2, save_count - 2}
+    print(f"{count} projects, {save_count} saves")
+
+    for label, checkpoint_size in [("checkpoints", ProjectHistory.DEFAULT_CHECKPOINT_SIZE),
+                                   ("replay from start", 1 << 62)]:
+        workdir = tempfile.mkdtemp(prefix="procheck_history_")
+        try:
+            print(label)
+            history = ProjectHistory(workdir, checkpoint_size=checkpoint_size)
+            states = record_all(history, rows, saves, samples)
+            for when, expected in states:
+                pid = next(iter(expected))
+                got = timed(f"dataset at {time.strftime('%H:%M:%S', time.localtime(when))}.{int(when * 1000) % 1000:03d}",
+                            lambda: history.dataset_at(when), repeat=1)
+                assert got == expected, "dataset_at() differs from the recorded state"
+                one = timed(f"  one project ({pid})", lambda: history.project_at(pid, when))
+                assert one == expected[pid], pid
+            pid = next(iter(rows))
+            entries = timed(f"changes of {pid}", lambda: list(history.changes(pid)), repeat=1)
+            print(f"  ({len(entries)} entries)")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
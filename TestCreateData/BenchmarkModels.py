@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Models.Project import Project
+from libs.JsonFileFactory import JsonFileFactory
+
+# --- So sánh model __slots__ + codec với cách cũ (__dict__ + **kwargs) ---
+# Chạy: python -m TestCreateData.BenchmarkModels [số_project]
+
+
+class LegacyProject:
+    """Project như trước: object thường có __dict__."""
+    def __init__(self, project_id, name, assignment, manager, status, progress, start_date, end_date,
+                 color="#FF6B6B", priority="Normal", description="", attachments=None, dependency="",
+                 estimated_time="", view_gantt=False, view_kanban=False, drag_and_drop=False):
+        self.project_id = project_id
+        self.name = name
+        self.assignment = assignment if assignment else []
+        self.manager = manager
+        self.status = status
+        self.progress = progress
+        self.start_date = start_date
+        self.end_date = end_date
+        self.color = color
+        self.priority = priority
+        self.description = description
+        self.attachments = attachments if attachments else []
+        self.dependency = dependency
+        self.estimated_time = estimated_time
+        self.view_gantt = view_gantt
+        self.view_kanban = view_kanban
+        self.drag_and_drop = drag_and_drop
+
+
+def legacy_read(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    result = []
+    for item in data:
+        try:
+            result.append(LegacyProject(**item))
+        except TypeError:
+            pass
+    return result
+
+
+def legacy_write(items, filename):
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(json.dumps([item.__dict__ for item in items], default=str, indent=4, ensure_ascii=False))
+
+
+def make_rows(count):
+    return [{
+        "project_id": f"PRJ{i:06d}", "name": f"Project {i}", "assignment": [f"user{i % 100}"],
+        "manager": f"user{i % 50}", "status": "Open", "progress": i % 101,
+        "start_date": "1/01/2025", "end_date": "31/12/2025", "color": "#FF6B6B",
+        "priority": "Normal", "description": "", "attachments": [], "dependency": "",
+        "estimated_time": "", "view_gantt": False, "view_kanban": False, "drag_and_drop": False
+    } for i in range(count)]
+
+
+def measure(label, decode, encode, rows):
+    """Đo riêng phần codec (dict <-> object) và bộ nhớ của các object."""
+    start = time.perf_counter()
+    objects = decode(rows)
+    decode_s = time.perf_counter() - start
+    del objects
+
+    # Đo bộ nhớ ở lượt riêng vì tracemalloc làm chậm việc tạo object
+    tracemalloc.start()
+    objects = decode(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    encode(objects)
+    encode_s = time.perf_counter() - start
+    print(f"{label:<22} decode {decode_s:7.3f}s  encode {encode_s:7.3f}s  "
+          f"memory {current / 1024 / 1024:8.1f} MB  ({current / len(objects):6.0f} B/project)")
+
+
+def measure_files(label, load, save, filename, out_file):
+    """Đo trọn vòng đọc/ghi file (bao gồm json.load / json.dumps)."""
+    start = time.perf_counter()
+    objects = load(filename)
+    load_s = time.perf_counter() - start
+    start = time.perf_counter()
+    save(objects, out_file)
+    save_s = time.perf_counter() - start
+    print(f"{label:<22} load   {load_s:7.3f}s  save   {save_s:7.3f}s")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workdir = tempfile.mkdtemp(prefix="procheck_models_")
+    src = os.path.join(workdir, "projects.json")
+    out = os.path.join(workdir, "out.json")
+    with open(src, "w", encoding="utf-8") as f:
+        json.dump(make_rows(count), f, indent=4, ensure_ascii=False)
+
+    rows = make_rows(count)
+    jff = JsonFileFactory()
+    print(f"{count} projects")
+    measure("legacy (__dict__)",
+            lambda data: [LegacyProject(**r) for r in data],
+            lambda objs: [o.__dict__ for o in objs], rows)
+    measure("slots + codec",
+            lambda data: [Project.from_dict(r) for r in data],
+            lambda objs: [jff.encode(o) for o in objs], rows)
+    measure_files("legacy (__dict__)", legacy_read, legacy_write, src, out)
+    measure_files("slots + codec", lambda fn: jff.read_data(fn, Project), jff.write_data, src, out)
+
+    for name in os.listdir(workdir):
+        os.remove(os.path.join(workdir, name))
+    os.rmdir(workdir)
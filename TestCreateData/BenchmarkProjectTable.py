@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from libs.ChunkedLoader import ChunkedLoader
+from Models.Project import Project
+from TestCreateData.BenchmarkColumns import make_projects, timed
+from ui.MainWindowNew.ProjectTableModel import (
+    ButtonDelegate, ProgressDelegate, ProjectFilterProxy, ProjectTableModel, StatusDelegate
+)
+
+# --- Bảng project dạng model/view: nạp, cuộn và cập nhật từng dòng ---
+# Một model dùng chung, 6 bảng (All + 5 tab trạng thái) xem qua ProjectFilterProxy như trong MainWindowNewExt.
+# Chạy: python -m TestCreateData.BenchmarkProjectTable [số_project]
+# (không cần màn hình: QT_QPA_PLATFORM=offscreen được đặt mặc định)
+
+STATUSES = ["Open", "Pending", "Ongoing", "Completed", "Canceled"]
+
+
+def make_view(model, status=None):
+    proxy = ProjectFilterProxy(status)
+    proxy.setSourceModel(model)
+    view = QTableView()
+    view.setModel(proxy)
+    buttons = ButtonDelegate(view)
+    view.setItemDelegateForColumn(ProjectTableModel.ASSIGNMENT, buttons)
+    view.setItemDelegateForColumn(ProjectTableModel.DETAILS, buttons)
+    view.setItemDelegateForColumn(ProjectTableModel.STATUS, StatusDelegate(STATUSES, view))
+    view.setItemDelegateForColumn(ProjectTableModel.PROGRESS, ProgressDelegate(view))
+    view.resize(1260, 720)
+    view.show()
+    return view
+
+
+def repaint(view):
+    view.viewport().repaint()
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    app = QApplication(sys.argv)
+    projects = make_projects(count)
+    print(f"{count} projects")
+
+    model = ProjectTableModel()
+    view = make_view(model)
+    tabs = {status: make_view(model, status) for status in STATUSES}
+    timed("set_projects (6 tables) + paint", lambda: (model.set_projects(projects), repaint(view)), repeat=3)
+
+
+    # Nạp dần như lúc khởi động: thời gian tới dòng đầu tiên và tới khi nạp xong
+    chunked = ProjectTableModel()
+    make_view(chunked)
+    loader = ChunkedLoader(projects, [chunked.extend], first_chunk=100, chunk_size=1000)
+    loader.finished.connect(app.quit)
+    loader.start()
+    app.exec()
+    print(f"  {'chunked: first rows':<28} {loader.first_row_ms:9.3f} ms")
+    print(f"  {'chunked: all rows':<28} {loader.all_rows_ms:9.3f} ms")
+
+    bar = view.verticalScrollBar()
+    steps = 200
+    start = time.perf_counter()
+    for i in range(steps):
+        bar.setValue(bar.maximum() * i // steps)
+        repaint(view)
+    print(f"  {'scroll + paint (per step)':<28} {(time.perf_counter() - start) * 1000 / steps:9.3f} ms")
+
+    def patch():
+        project = projects[count // 2]
+        project.progress = (project.progress + 1) % 101
+        model.update(project, ["progress"])
+        app.processEvents()
+    timed("patch one row", patch, repeat=100)
+
+    def move_status():
+        project = projects[count // 2]
+        project.status = STATUSES[(STATUSES.index(project.status) + 1) % len(STATUSES)]
+        model.update(project, ["status"])
+        app.processEvents()
+    timed("status change (row moves tab)", move_status, repeat=100)
+    def reconcile_one_edit():
+        project = projects[count // 4]
+        project.progress = (project.progress + 1) % 101
+        model.reconcile(projects)
+        app.processEvents()
+    timed("reconcile after one edit", reconcile_one_edit, repeat=3)
+    timed("reconcile one row moved", lambda: (model.reconcile(projects[1:] + projects[:1]), app.processEvents()), repeat=1)
+    # Sắp xếp nhiều cột (khoá tính sẵn): status rồi end date, lần đầu phải tính khoá cho mọi project
+    by_status_end = [(ProjectTableModel.STATUS, Qt.SortOrder.AscendingOrder), (8, Qt.SortOrder.DescendingOrder)]
+    timed("sort status+end (cold keys)", lambda: model.sort_by(by_status_end), repeat=1)
+    timed("sort status+end", lambda: (model.sort_by(by_status_end), app.processEvents()), repeat=3)
+    timed("sort name (accents ignored)", lambda: model.sort_by([(2, Qt.SortOrder.AscendingOrder)]), repeat=3)
+    timed("sort priority+progress", lambda: model.sort_by([(9, Qt.SortOrder.AscendingOrder),
+                                                          (6, Qt.SortOrder.DescendingOrder)]), repeat=3)
+    timed("search in one tab", lambda: tabs["Open"].model().set_matches(p.project_id for p in projects[::50]), repeat=3)
+    tabs["Open"].model().set_matches(None)
+    timed("remove one row", lambda: model.remove(model.project(count // 3).project_id), repeat=100)
+    new = Project.from_dict(dict(projects[0].to_dict(), project_id="NEW0000001"))
+    timed("append one row", lambda: model.put(new), repeat=1)
@@ -0,0 +1,76 @@
+import random
+import sys
+import time
+
+from libs.SearchIndex import SearchIndex, fold, fold_fields, score
+
+# --- So sánh tìm kiếm bằng SearchIndex (trigram) với quét chuỗi từng project ---
+# Chạy: python -m TestCreateData.BenchmarkSearch [số_project]
+
+WORDS = ["Dự án", "Hệ thống", "Quản lý", "Khách hàng", "Đào tạo", "Báo cáo", "Website", "Ứng dụng",
+         "Kho", "Bán hàng", "Nhân sự", "Tài chính", "Marketing", "Mobile", "Dữ liệu", "Phân tích"]
+PEOPLE = ["an", "binh", "chi", "dung", "giang", "hoa", "khanh", "linh", "minh", "nam", "phuong", "quan"]
+
+
+def make_rows(count):
+    rnd = random.Random(13)
+    rows = {}
+    for i in range(count):
+        pid = f"PRJ{i:06d}"
+        rows[pid] = {
+            "project_id": pid,
+            "name": " ".join(rnd.sample(WORDS, 3)) + f" {i}",
+            "description": " ".join(rnd.sample(WORDS, 5)).lower(),
+            "manager": rnd.choice(PEOPLE),
+            "assignment": rnd.sample(PEOPLE, 2),
+        }
+    return rows
+
+
+def legacy_scan(rows, query):
+    """Cách cũ của filter_projects: lower() + so chuỗi id/name trên từng project."""
+    query = query.strip().lower()
+    return [pid for pid, row in rows.items() if query in pid.lower() or query in row["name"].lower()]
+
+
+def folded_scan(folded, query):
+    """Cùng kết quả với SearchIndex nhưng quét mọi project (text đã fold sẵn)."""
+    query = fold(query)
+    hits = [(-score(query, fields), i, pid) for i, (pid, fields) in enumerate(folded)]
+    return [pid for s, _, pid in sorted(h for h in hits if h[0])]
+
+
+def timed(label, fn, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    print(f"  {label:<34} {(time.perf_counter() - start) * 1000 / repeat:9.3f} ms  ({len(result)} hits)")
+    return result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(count)
+    folded = [(pid, fold_fields(row)) for pid, row in rows.items()]
+    print(f"{count} projects")
+    start = time.perf_counter()
+    index = SearchIndex.from_rows(rows)
+    print(f"  build (one time)                   {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    for query in ["PRJ004217", "quan ly kho", "du an 4217", "4217", "khanh", "phân tích dữ liệu 99", "du", "d", "42", "nh"]:
+        fast = timed(f"index  '{query}'", lambda: index.search(query, limit=200))
+        timed(f"legacy '{query}'", lambda: legacy_scan(rows, query), repeat=3)
+        slow = timed(f"scan   '{query}'", lambda: folded_scan(folded, query), repeat=1)
+        assert fast == slow[:200], query
+
+    # Gõ từng ký tự như search-as-you-type
+    typed = "du an 1234"
+    start = time.perf_counter()
+    for n in range(1, len(typed) + 1):
+        index.search(typed[:n], limit=200)
+    print(f"  type '{typed}' key by key          {(time.perf_counter() - start) * 1000 / len(typed):9.3f} ms/key")
+
+    row = dict(rows["PRJ000010"], name="Hệ thống đặt vé")
+    timed("update one project", lambda: [index.put("PRJ000010", row)], repeat=1)
+    assert index.search("he thong dat ve") == ["PRJ000010"]
+    timed("short query after the update", lambda: index.search("he", limit=200), repeat=1)
@@ -0,0 +1,102 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Models.Project import Project
+from libs.StorageBackend import create_connector
+
+# --- Đo tốc độ các thao tác chính trên mọi backend lưu trữ (json / sqlite / mysql) ---
+# Chạy: python -m TestCreateData.BenchmarkStorage [số_project] [backend ...]
+# JSON và SQLite chạy trên thư mục tạm; MySQL dùng database trong Dataset/storage.json
+# (nên trỏ tới một database thử nghiệm vì bảng projects sẽ bị ghi đè).
+
+STATUSES = ["Open", "Pending", "Ongoing", "Completed", "Canceled"]
+
+
+def make_projects(count):
+    rnd = random.Random(42)
+    projects = []
+    for i in range(1, count + 1):
+        projects.append(Project(
+            project_id=f"PRJ{i:05d}",
+            name=f"Benchmark project {i}",
+            assignment=[f"user{rnd.randint(1, 100)}" for _ in range(rnd.randint(1, 4))],
+            manager=f"user{rnd.randint(1, 100)}",
+            status=rnd.choice(STATUSES),
+            progress=rnd.randint(0, 100),
+            start_date=f"{rnd.randint(1, 28)}/{rnd.randint(1, 12):02d}/2025",
+            end_date=f"{rnd.randint(1, 28)}/{rnd.randint(1, 12):02d}/2026",
+            description="x" * rnd.randint(50, 500)
+        ))
+    return projects
+
+
+def timed(label, fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) * 1000 / repeat
+    print(f"  {label:<32} {elapsed:10.3f} ms")
+    return result
+
+
+def memory(label, fn):
+    """Bộ nhớ còn giữ sau khi gọi fn (kết quả vẫn được giữ lại)."""
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<32} {current / 1e6:10.1f} MB")
+    return result
+
+
+def run(backend, count, workdir):
+    options = {}
+    if backend == "json":
+        options = {"dataset_dir": os.path.join(workdir, "json")}
+        os.makedirs(options["dataset_dir"], exist_ok=True)
+    elif backend == "sqlite":
+        options = {"db_file": os.path.join(workdir, "bench.db")}
+    dc = create_connector(backend, **options)
+    if dc.name != backend:
+        print(f"[{backend}] not available, skipped")
+        return
+
+    print(f"[{backend}] {count} projects")
+    projects = make_projects(count)
+    timed("save_all_projects (initial)", lambda: dc.save_all_projects(projects))
+    loaded = timed("get_all_projects", dc.get_all_projects, repeat=5)
+    # Bản summary cho bảng/Kanban/Gantt: description/attachments chỉ nạp cho các dòng đang hiện
+    timed("get_project_summaries", dc.get_project_summaries, repeat=5)
+    memory("memory: get_all_projects", dc.get_all_projects)
+    summaries = memory("memory: get_project_summaries", dc.get_project_summaries)
+    timed("load_project_details (40 rows)", lambda: dc.load_project_details(summaries[:40]))
+    ids = [p.project_id for p in loaded]
+    sample = random.Random(1).sample(ids, min(100, len(ids)))
+    timed("get_project_by_projectid x100", lambda: [dc.get_project_by_projectid(i) for i in sample])
+    timed("count_projects('Ongoing')", lambda: dc.count_projects("Ongoing"))
+    timed("find_projects('99', limit=10)", lambda: dc.find_projects("99", limit=10))
+
+    edited = dc.get_project_by_projectid(ids[len(ids) // 2])
+    edited.progress = (edited.progress + 1) % 101
+    timed("save_project (one edit)", lambda: dc.save_project(edited))
+    batch = loaded[:50]
+    for p in batch:
+        p.status = "Ongoing"
+    timed("save_projects (50 edits)", lambda: dc.save_projects(batch))
+    dc.close()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    backends = sys.argv[2:] or ["json", "sqlite", "mysql"]
+    workdir = tempfile.mkdtemp(prefix="procheck_bench_")
+    try:
+        for name in backends:
+            run(name, count, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
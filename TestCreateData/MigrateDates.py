@@ -0,0 +1,22 @@
+import sys
+
+from libs.DateUtils import CANONICAL_FORMAT, normalize_project_dates
+from libs.StorageBackend import create_connector
+
+# --- Chuẩn hoá start_date/end_date của mọi project về một định dạng (dd/mm/yyyy) ---
+# Ví dụ "7/08/2025" -> "07/08/2025", "8/011/2025" -> "08/11/2025".
+# Chạy 1 lần: python -m TestCreateData.MigrateDates [json|sqlite|mysql]
+backend = sys.argv[1] if len(sys.argv) > 1 else None
+
+dc = create_connector(backend)
+projects = dc.get_all_projects()
+changed = normalize_project_dates(projects)
+unparsed = [p.project_id for p in projects if p.start_ordinal is None or p.end_ordinal is None]
+
+if changed and not dc.save_projects(changed):
+    print("Migration failed.")
+    sys.exit(1)
+print(f"Rewrote dates of {len(changed)} of {len(projects)} projects to {CANONICAL_FORMAT} ({dc.name}).")
+if unparsed:
+    print("Could not parse dates of:", ", ".join(map(str, unparsed)))
+dc.close()
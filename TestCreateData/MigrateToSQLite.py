@@ -0,0 +1,19 @@
+import sys
+
+from libs.DataConnector import DataConnector
+from libs.SQLiteConnector import SQLiteConnector
+
+# --- Chuyển dữ liệu JSON (Dataset/*.json) sang SQLite (Dataset/procheck.db) ---
+# Chạy 1 lần: python -m TestCreateData.MigrateToSQLite [đường_dẫn_db]
+db_file = sys.argv[1] if len(sys.argv) > 1 else None
+
+dc = DataConnector()
+sqlite_dc = SQLiteConnector(db_file)
+result = sqlite_dc.import_from_json(dc)
+sqlite_dc.close()
+
+if result is None:
+    print("Migration failed.")
+    sys.exit(1)
+print(f"Imported {result['projects']} projects, {result['users']} users, "
+      f"{result['notifications']} notifications into {sqlite_dc.db_file}")
@@ -0,0 +1,145 @@
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from Models.Project import Project
+from libs.StorageBackend import create_connector
+
+# --- Nhiều tiến trình cùng ghi vào một thư mục Dataset (hoặc một file SQLite) ---
+# Chạy: python -m TestCreateData.StressConcurrency [số_tiến_trình] [số_thao_tác] [json|sqlite]
+# Mỗi tiến trình xen kẽ: tăng bộ đếm của vài project "nóng" (đọc - sửa - ghi, thử lại khi
+# bị báo xung đột version) và thêm project mới (id lấy từ sequence). Một tiến trình đọc
+# liên tục projects.json để chắc chắn không bao giờ thấy file ghi dở.
+# Cuối cùng kiểm tra: không mất lần tăng nào, không trùng id, dữ liệu đọc lại đầy đủ
+# và (json) lịch sử dựng lại khớp với dữ liệu cuối cùng.
+
+HOT_PROJECTS = ["PRJ001", "PRJ002", "PRJ003", "PRJ004"]
+
+
+def connector(backend, workdir):
+    if backend == "sqlite":
+        return create_connector("sqlite", db_file=os.path.join(workdir, "stress.db"))
+    dc = create_connector("json", dataset_dir=workdir)
+    # Ngưỡng nhỏ để các tiến trình compact journal trong lúc người khác đang ghi
+    dc.repository.journal.compact_threshold = int(os.environ.get("STRESS_COMPACT", 16 * 1024))
+    return dc
+
+
+def make_project(pid, name):
+    return Project(pid, name, ["user1"], "user1", "Open", 0, "01/01/2025", "31/12/2025", estimated_time="0")
+
+
+def writer(backend, workdir, ops, seed, start_event):
+    dc = connector(backend, workdir)
+    rnd = random.Random(seed)
+    increments = {pid: 0 for pid in HOT_PROJECTS}
+    added = []
+    conflicts = 0
+    start_event.wait()
+    start = time.perf_counter()
+    for i in range(ops):
+        if i % 2 == 0:
+            pid = rnd.choice(HOT_PROJECTS)
+            while True:
+                project = dc.get_project_by_projectid(pid)
+                project.estimated_time = str(int(project.estimated_time or 0) + 1)
+                if dc.save_project(project):
+                    increments[pid] += 1
+                    break
+                conflicts += 1
+        else:
+            pid = dc.new_project_id()
+            if dc.add_project(make_project(pid, f"Added by {seed}")):
+                added.append(pid)
+    return increments, added, conflicts, time.perf_counter() - start
+
+
+def reader(workdir, stop_event):
+    """Reads projects.json in a loop; returns (reads, errors)."""
+    path = os.path.join(workdir, "projects.json")
+    reads = errors = 0
+    while not stop_event.is_set():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                json.load(f)
+            reads += 1
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            errors += 1
+        time.sleep(0.001)
+    return reads, errors
+
+
+def run(processes, ops, backend):
+    workdir = tempfile.mkdtemp(prefix="procheck_stress_")
+    try:
+        dc = connector(backend, workdir)
+        dc.save_all_projects([make_project(pid, f"Hot project {pid}") for pid in HOT_PROJECTS])
+        if backend == "json":
+            dc.compact_projects()
+
+        ctx = multiprocessing.get_context("spawn")
+        manager = ctx.Manager()
+        start_event, stop_event = manager.Event(), manager.Event()
+        with ctx.Pool(processes + 1) as pool:
+            read_result = pool.apply_async(reader, (workdir, stop_event)) if backend == "json" else None
+            results = [pool.apply_async(writer, (backend, workdir, ops, seed, start_event))
+                       for seed in range(processes)]
+            time.sleep(0.5)  # chờ các tiến trình khởi động xong
+            start = time.perf_counter()
+            start_event.set()
+            results = [r.get() for r in results]
+            elapsed = time.perf_counter() - start
+            stop_event.set()
+            reads, read_errors = read_result.get() if read_result else (0, 0)
+
+        # Đọc lại bằng một tiến trình con mới để không dùng cache của tiến trình này
+        with ctx.Pool(1) as pool:
+            final = pool.apply(load_final, (backend, workdir))
+
+        expected = {pid: sum(r[0][pid] for r in results) for pid in HOT_PROJECTS}
+        added = [pid for r in results for pid in r[1]]
+        conflicts = sum(r[2] for r in results)
+        lost = {pid: expected[pid] - final["counters"][pid] for pid in HOT_PROJECTS
+                if final["counters"][pid] != expected[pid]}
+        missing = set(added) - set(final["ids"])
+        total_ops = processes * ops
+        print(f"[{backend}] {processes} writers x {ops} ops: {total_ops / elapsed:8.0f} ops/s"
+              f"  ({elapsed:.2f} s, {conflicts} conflicts retried, {reads} clean reads)")
+        assert not lost, f"lost updates: {lost}"
+        assert len(added) == len(set(added)), "duplicate project ids"
+        assert not missing, f"added projects missing: {sorted(missing)[:5]}"
+        assert read_errors == 0, f"{read_errors} reads saw a half-written projects.json"
+        assert len(final["ids"]) == len(HOT_PROJECTS) + len(added), "unexpected project count"
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def load_final(backend, workdir):
+    dc = connector(backend, workdir)
+    projects = dc.get_all_projects()
+    by_id = {p.project_id: p for p in projects}
+    if backend == "json":
+        # Lịch sử dựng lại "bây giờ" phải khớp đúng dữ liệu đang lưu
+        rebuilt = {p.project_id: p.to_dict() for p in dc.get_projects_at(None)}
+        assert rebuilt == {pid: p.to_dict() for pid, p in by_id.items()}, "history differs from the dataset"
+    return {
+        "ids": [p.project_id for p in projects],
+        "counters": {pid: int(by_id[pid].estimated_time) for pid in HOT_PROJECTS},
+    }
+
+
+if __name__ == "__main__":
+    counts = [int(sys.argv[1])] if len(sys.argv) > 1 else [1, 2, 4, 8]
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    backends = sys.argv[3:] or ["json", "sqlite"]
+    for backend in backends:
+        for n in counts:
+            run(n, ops, backend)
+    print("OK: no lost updates, no duplicate ids, no partial reads")
@@ -0,0 +1,82 @@
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class ChunkedLoader(QObject):
+    """
+    Feeds a long list of projects to the views in chunks from the event loop.
+
+    start() hands the first screenful to every sink at once, so the window
+    appears with rows in it; the rest follows in chunks of `chunk_size`, one
+    chunk per timer tick, so input and painting keep running in between.
+    A sink is a callable taking a list of projects; it must skip the projects
+    it already shows (they may have arrived meanwhile through backend events).
+
+    `first_rows` is emitted with the time-to-first-row: milliseconds from
+    `started_at` (default: start()) to the first turn of the event loop after
+    the first screenful was added, i.e. once the window is up and painted.
+    `finished` is emitted with the time until every project was added.
+    """
+
+    progress = pyqtSignal(int, int)  # số project đã nạp, tổng số
+    first_rows = pyqtSignal(float)
+    finished = pyqtSignal(float)
+
+    def __init__(self, projects, sinks, first_chunk=100, chunk_size=1000, started_at=None, parent=None):
+        super().__init__(parent)
+        self.projects = list(projects)
+        self.sinks = list(sinks)
+        self.first_chunk = first_chunk
+        self.chunk_size = chunk_size
+        self.started_at = started_at
+        self.done = 0
+        self._skip = set()  # project_id bị xoá trước khi kịp nạp
+
+        # Thống kê (ms)
+        self.first_row_ms = None
+        self.all_rows_ms = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._next_chunk)
+
+    def start(self):
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+        self._feed(self.first_chunk)
+        self.timer.start()
+
+    def stop(self):
+        """Abandons the remaining chunks (e.g. the views are being rebuilt from scratch)."""
+        self.timer.stop()
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def discard(self, project_id):
+        """Makes sure a project deleted during loading is not added afterwards."""
+        self._skip.add(str(project_id))
+
+    def _elapsed_ms(self):
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def _feed(self, count):
+        chunk = self.projects[self.done:self.done + count]
+        self.done += len(chunk)
+        if self._skip:
+            chunk = [p for p in chunk if str(p.project_id) not in self._skip]
+        for sink in self.sinks:
+            sink(chunk)
+        self.progress.emit(self.done, len(self.projects))
+
+    def _next_chunk(self):
+        if self.first_row_ms is None:
+            self.first_row_ms = self._elapsed_ms()
+            self.first_rows.emit(self.first_row_ms)
+        if self.done < len(self.projects):
+            self._feed(self.chunk_size)
+        if self.done >= len(self.projects):
+            self.timer.stop()
+            self.all_rows_ms = self._elapsed_ms()
+            self.finished.emit(self.all_rows_ms)
@@ -3,75 +3,189 @@ import os
 
 from Models.Project import Project
 from Models.User import User
+from libs.DataRepository import DataRepository
+from libs.EventBus import NOTIFICATION_ADDED
 from libs.JsonFileFactory import JsonFileFactory
+from libs.NotificationLog import NotificationLog
+from libs.StorageBackend import StorageBackend
 
 
-class DataConnector:
+class DataConnector(StorageBackend):
     """
     DataConnector provides methods to read and write project, user, and notification data
     from JSON files using the JsonFileFactory.
+    Reads are served from a shared DataRepository, so each file is only parsed
+    again after it changes on disk.
+
+    With journaled=True (default) project changes are appended as small delta
+    records to projects.journal.jsonl instead of rewriting projects.json;
+    the journal is folded back into projects.json in the background.
+
+    Writes are safe when several processes share the Dataset directory:
+    read-modify-write of users.json and projects.json runs under the
+    repository's file locks, and save_project returns False instead of
+    overwriting a project another process saved since it was read.
+    Every save is also recorded as a field-level diff in Dataset/history/
+    (get_project_history, get_project_at, get_projects_at).
     """
 
-    def __init__(self):
+    name = "json"
+
+    def __init__(self, journaled=True, dataset_dir=None):
         # Build an absolute path to the JSON data files
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.projects_file = os.path.join(base_dir, "..", "Dataset", "projects.json")
-        self.users_file = os.path.join(base_dir, "..", "Dataset", "users.json")
-        # Đường dẫn cho notifications.json
-        self.notifications_file = os.path.join(base_dir, "..", "Dataset", "notifications.json")
+        if dataset_dir is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            dataset_dir = os.path.join(base_dir, "..", "Dataset")
+        self.dataset_dir = dataset_dir
+        self.projects_file = os.path.join(self.dataset_dir, "projects.json")
+        self.users_file = os.path.join(self.dataset_dir, "users.json")
+        # Đường dẫn cho notifications.json (dữ liệu cũ, được nhập vào log ở lần chạy đầu)
+        self.notifications_file = os.path.join(self.dataset_dir, "notifications.json")
+        self.notification_log = NotificationLog(
+            os.path.join(self.dataset_dir, "notifications"), legacy_file=self.notifications_file
+        )
+        self.repository = DataRepository.shared(self.dataset_dir)
+        self.journaled = journaled
+
+    @property
+    def events(self):
+        """
+        The repository's EventBus, shared by every DataConnector on the same Dataset directory.
+        """
+        return self.repository.events
 
     def get_all_projects(self):
         """
         Returns a list of Project objects loaded from the projects JSON file.
+        The list is a copy, the Project objects are shared with the repository cache.
         """
-        print("Projects file path:", self.projects_file)
-        if not os.path.exists(self.projects_file):
-            print("File not found:", self.projects_file)
-            return []
+        return list(self.repository.get_projects())
+
+    def iter_projects(self):
+        """
+        Yields Project objects one by one.
+        If the projects are already cached they are served from memory; otherwise the
+        file is streamed (snapshot + journal) without loading the whole dataset.
+        """
+        if self.repository.projects_loaded:
+            yield from list(self.repository.get_projects())
+            return
         jff = JsonFileFactory()
-        projects = jff.read_data(self.projects_file, Project)
-        print("Loaded projects:", projects)  # Debug
-        return projects if projects is not None else []
+        rows = self.repository.journal.iter_replayed(jff.iter_data(self.projects_file, dict))
+        for row in rows:
+            project = jff.build_object(row, Project)
+            if project is not None:
+                yield project
+
+    def export_projects(self, filename):
+        """
+        Streams every project to a JSON Lines file. Returns the number of projects written.
+        """
+        return JsonFileFactory().write_lines(self.iter_projects(), filename)
+
+    def iter_users(self):
+        """
+        Yields User objects one by one from the users JSON file.
+        """
+        if os.path.exists(self.users_file):
+            yield from JsonFileFactory().iter_data(self.users_file, User)
+
+    def iter_notifications(self):
+        """
+        Yields notification dicts one by one (oldest first), one log segment at a time.
+        """
+        yield from self.notification_log
 
     def get_all_users(self):
         """
         Returns a list of User objects loaded from the users JSON file.
         """
-        if not os.path.exists(self.users_file):
-            print("File not found:", self.users_file)
-            return []
-        jff = JsonFileFactory()
-        return jff.read_data(self.users_file, User) or []
+        return list(self.repository.get_users())
 
     def get_user_by_username(self, username):
         """
         Returns a User object matching the given username, or None if not found.
         """
-        users = self.get_all_users()
-        for user in users:
-            if user.Username == username:
-                return user
-        return None
+        return self.repository.get_user_by_username(username)
+
+    def get_user_by_email(self, email):
+        """
+        Returns a User object matching the given email (case-insensitive), or None if not found.
+        """
+        return self.repository.get_user_by_email(email)
+
+    def get_project_columns(self):
+        """
+        Returns the repository's ProjectColumns, patched in place as projects change.
+        """
+        return self.repository.get_columns()
+
+    def get_projects_by_status(self, status):
+        """
+        Returns the projects with the given status from the repository's status index.
+        """
+        return self.repository.get_projects_by("status", status)
+
+    def get_projects_by_assignee(self, username):
+        """
+        Returns the projects whose assignment list contains `username`.
+        """
+        return self.repository.get_projects_by("assignee", username)
+
+    def get_projects_by_manager(self, manager):
+        return self.repository.get_projects_by("manager", manager)
+
+    def get_projects_by_priority(self, priority):
+        return self.repository.get_projects_by("priority", priority)
+
+    def search_projects(self, query, limit=None):
+        """
+        Ranked, diacritic-insensitive search served by the repository's trigram index.
+        """
+        return self.repository.search_projects(query, limit)
+
+    def count_projects(self, status=None):
+        if status is None:
+            return len(self.repository.get_projects())
+        return self.repository.get_index().count("status", status)
+
+    def get_dependency_graph(self):
+        """
+        Returns the repository's DependencyGraph; saves that would create a dependency cycle are refused.
+        """
+        return self.repository.get_dependency_graph()
+
+    def reserve_project_ids(self, count):
+        """
+        Returns `count` new project ids from the persistent sequence in the Dataset
+        directory (one for a new project, a whole block for bulk imports), without
+        scanning the projects. Returns [] if the sequence file cannot be locked or written.
+        """
+        try:
+            return self.repository.reserve_project_ids(count)
+        except OSError as e:
+            print("Error reserving project ids:", e)
+            return []
 
     def get_project_by_projectid(self, project_id):
         """
         Returns a Project object matching the given project_id (compared as string),
         or None if not found.
         """
-        projects = self.get_all_projects()
-        for project in projects:
-            if str(project.project_id) == str(project_id):
-                return project
-        return None
+        return self.repository.get_project(project_id)
 
     def add_project(self, project):
         """
         Adds a new project to the projects JSON file.
         """
-        projects = self.get_all_projects()
-        projects.append(project)
-        jff = JsonFileFactory()
-        jff.write_data(projects, self.projects_file)
+        if self.journaled:
+            return self.repository.commit_projects([project])
+        with self.repository.write_lock:
+            projects = self.get_all_projects()
+            projects.append(project)
+            ok = self.write_projects_to_file(projects)
+        self.repository.deliver_events()
+        return ok
 
     def add_user(self, user):
         """
@@ -79,37 +193,158 @@ class DataConnector:
         before saving.
         """
         user.Password = hashlib.sha256(user.Password.encode()).hexdigest()
-        users = self.get_all_users()
-        users.append(user)
+        with self.repository.users_lock:
+            users = self.get_all_users()
+            users.append(user)
+            self.save_all_users(users)
+
+    def save_user(self, user):
+        """
+        Updates the user with the same Username or adds it if it doesn't exist.
+        The password is saved as-is (it is expected to be hashed already).
+        """
+        with self.repository.users_lock:
+            users = self.get_all_users()
+            for i, u in enumerate(users):
+                if u.Username == user.Username:
+                    users[i] = user
+                    break
+            else:
+                users.append(user)
+            return self.save_all_users(users)
+
+    def delete_user(self, username):
+        """
+        Removes the user with the given Username from the users JSON file.
+        """
+        with self.repository.users_lock:
+            users = [u for u in self.get_all_users() if u.Username != username]
+            return self.save_all_users(users)
+
+    def save_all_users(self, users):
+        """
+        Writes the given list of User objects to the users JSON file.
+        """
         jff = JsonFileFactory()
-        jff.write_data(users, self.users_file)
+        with self.repository.users_lock:
+            ok = jff.write_data(users, self.users_file)
+            if ok:
+                self.repository.store_users(users)
+        return ok
 
     def save_project(self, project):
         """
-        Updates an existing project with the same project_id or adds it if it doesn't exist,
-        then writes the full list to the projects JSON file.
+        Updates an existing project with the same project_id or adds it if it doesn't exist.
+        In journaled mode only the changed fields are appended to the journal,
+        otherwise the full list is written to the projects JSON file.
         """
-        projects = self.get_all_projects()
-        for i, p in enumerate(projects):
-            if p.project_id == project.project_id:
-                projects[i] = project
-                break
-        else:
-            projects.append(project)
-        self.write_projects_to_file(projects)
+        if self.journaled:
+            return self.repository.commit_projects([project])
+        with self.repository.write_lock:
+            projects = self.get_all_projects()
+            for i, p in enumerate(projects):
+                if p.project_id == project.project_id:
+                    projects[i] = project
+                    break
+            else:
+                projects.append(project)
+            ok = self.write_projects_to_file(projects)
+        self.repository.deliver_events()
+        return ok
+
+    def save_projects(self, projects):
+        """
+        Updates or adds several projects in one write (other projects are left untouched).
+        """
+        if self.journaled:
+            return self.repository.commit_projects(projects)
+        with self.repository.write_lock:
+            by_id = {str(p.project_id): p for p in projects}
+            merged = [by_id.pop(str(p.project_id), p) for p in self.get_all_projects()]
+            merged.extend(by_id.values())
+            ok = self.write_projects_to_file(merged)
+        self.repository.deliver_events()
+        return ok
 
     def save_all_projects(self, projects):
         """
-        Saves the given list of Project objects to the projects JSON file.
+        Saves the given list of Project objects (projects missing from the list are deleted).
+        """
+        if self.journaled:
+            return self.repository.commit_projects(projects, complete=True)
+        return self.write_projects_to_file(projects)
+
+    def delete_projects(self, project_ids):
+        """
+        Deletes the projects with these ids in one journal append (one snapshot write
+        when not journaled). Returns the number of deleted projects, or -1 on error.
+        """
+        ids = [str(pid) for pid in project_ids]
+        count = sum(self.repository.get_project(pid) is not None for pid in set(ids))
+        if not count:
+            return 0
+        if self.journaled:
+            ok = self.repository.commit_projects([], deleted=ids)
+        else:
+            with self.repository.write_lock:
+                ok = self.write_projects_to_file([p for p in self.get_all_projects() if str(p.project_id) not in ids])
+            self.repository.deliver_events()
+        return count if ok else -1
+
+    def commit_bulk(self, projects=(), deleted=(), notifications=()):
+        """
+        Saves `projects` and deletes the ids in `deleted` with one journal append
+        (one snapshot write when not journaled), then appends every notification
+        with one write to the notification log.
         """
-        self.write_projects_to_file(projects)
+        projects = list(projects)
+        if self.journaled:
+            ok = self.repository.commit_projects(projects, deleted=deleted)
+        else:
+            deleted = {str(pid) for pid in deleted}
+            with self.repository.write_lock:
+                by_id = {str(p.project_id): p for p in self.get_all_projects() if str(p.project_id) not in deleted}
+                by_id.update((str(p.project_id), p) for p in projects)
+                ok = self.write_projects_to_file(list(by_id.values()))
+            self.repository.deliver_events()
+        notifications = list(notifications)
+        if not ok or not self.notification_log.append_many(notifications):
+            return False
+        for notification in notifications:
+            self.events.emit(NOTIFICATION_ADDED, notification)
+        return True
 
     def write_projects_to_file(self, projects):
         """
-        Writes the list of Project objects to the projects JSON file using JsonFileFactory.
+        Rewrites the whole projects JSON file with the given list and clears the journal.
         """
-        jff = JsonFileFactory()
-        jff.write_data(projects, self.projects_file)
+        return self.repository.write_snapshot(projects)
+
+    def get_project_history(self, project_id, since=None, until=None):
+        """
+        Returns the saved changes of one project, oldest first, from Dataset/history/
+        (see ProjectHistory.changes for the entry format).
+        """
+        return list(self.repository.history.changes(project_id, since, until))
+
+    def get_project_at(self, project_id, when):
+        """
+        Returns the project as it was at `when` (datetime, date or epoch seconds), or None.
+        Rebuilt from the nearest history checkpoint, not from the first save.
+        """
+        return self.repository.project_at(project_id, when)
+
+    def get_projects_at(self, when):
+        """
+        Returns every project as it was at `when`.
+        """
+        return self.repository.projects_at(when)
+
+    def compact_projects(self):
+        """
+        Folds the project journal into projects.json right away.
+        """
+        return self.repository.compact()
 
     def login(self, username, password):
         """
@@ -117,10 +352,9 @@ class DataConnector:
         or None otherwise.
         """
         hashed_input = hashlib.sha256(password.encode()).hexdigest()
-        users = self.get_all_users()
-        for user in users:
-            if user.Username == username and user.Password == hashed_input:
-                return user
+        user = self.get_user_by_username(username)
+        if user is not None and user.Password == hashed_input:
+            return user
         return None
 
     def update_password(self, email, new_password):
@@ -128,29 +362,41 @@ class DataConnector:
         Updates the password for the user with the specified email. The password is hashed
         before saving. Returns True if successful, otherwise False.
         """
-        email_normalized = email.strip().lower()
-        users = self.get_all_users()
-        updated = False
-
-        for user in users:
-            print(f"Checking user: {user.Username} (or {user.Email})")
-            if user.Email.strip().lower() == email_normalized:
-                user.Password = hashlib.sha256(new_password.encode()).hexdigest()
-                updated = True
-                print(f"Password updated for user: {user.Username}")
-                break
-
-        if updated:
-            jff = JsonFileFactory()
-            jff.write_data(users, self.users_file)
-            return True
-        else:
-            print("No matching user found for email:", email)
+        with self.repository.users_lock:
+            user = self.get_user_by_email(email)
+            if user is None:
+                print("No matching user found for email:", email)
+                return False
+
+            user.Password = hashlib.sha256(new_password.encode()).hexdigest()
+            print(f"Password updated for user: {user.Username}")
+            return self.save_all_users(self.get_all_users())
+
+    def add_notification(self, notification):
+        """
+        Appends one notification dict to the notification log (a single file append).
+        """
+        if not self.notification_log.append(notification):
             return False
+        self.events.emit(NOTIFICATION_ADDED, notification)
+        return True
+
+    def get_recent_notifications(self, limit=20, offset=0):
+        """
+        Returns up to `limit` notification dicts, newest first, skipping the `offset` newest.
+        Only the log segments holding that page are read.
+        """
+        return self.notification_log.page(offset, limit)
+
+    def archive_notifications(self, keep_segments=4):
+        """
+        Moves old notification segments to Dataset/notifications/archive/.
+        """
+        return self.notification_log.archive(keep_segments)
 
     def save_notifications(self, notifications):
         """
-        Saves the list of notification dicts to the notifications JSON file.
+        Replaces the whole notification history with the list of notification dicts.
         Each dict should contain:
           {
             "username": ...,
@@ -159,16 +405,11 @@ class DataConnector:
             "time_str": ...
           }
         """
-        jff = JsonFileFactory()
-        return jff.write_data(notifications, self.notifications_file)
+        return self.notification_log.rewrite(notifications)
 
     def load_notifications(self):
         """
-        Loads the list of notification dicts from the notifications JSON file.
-        Returns a list of dicts.
+        Loads every notification dict (oldest first).
+        Prefer get_recent_notifications() for display.
         """
-        if not os.path.exists(self.notifications_file):
-            return []
-        jff = JsonFileFactory()
-        data = jff.read_data(self.notifications_file, dict)  # đọc file chứa list of dict
-        return data if data is not None else []
+        return self.notification_log.read_all()
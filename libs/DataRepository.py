@@ -0,0 +1,841 @@
+import functools
+import os
+import threading
+
+from Models.Project import Project
+from Models.User import User
+from libs.DependencyGraph import DependencyGraph, DependencyCycleError
+from libs.EventBus import EventBus, PROJECT_ADDED, PROJECT_DELETED, PROJECT_UPDATED, SAVE_REJECTED, row_changes
+from libs.FileLock import FileLock
+from libs.IdAllocator import IdSequence, format_project_id, next_number_after
+from libs.JsonFileFactory import JsonFileFactory
+from libs.ProjectHistory import ProjectHistory
+from libs.ProjectIndex import ProjectIndex
+from libs.ProjectJournal import ProjectJournal
+from libs.SearchIndex import SearchIndex
+from libs.Versioning import VersionConflictError, check_versions
+
+
+def _delivers_events(method):
+    """
+    Runs a repository method, then emits the events it queued once the outermost
+    repository call of this thread returns and the Dataset write lock is not held.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        calls = self._calls
+        calls.depth = getattr(calls, "depth", 0) + 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            calls.depth -= 1
+            if not calls.depth and not self.write_lock.held:
+                self.deliver_events()
+    return wrapper
+
+
+class DataRepository:
+    """
+    In-memory copy of the Dataset JSON files shared by every DataConnector.
+
+    Each file is parsed once and kept together with dict indexes
+    (project_id -> Project, Username -> User, normalized Email -> User).
+    A file is parsed again only when its (mtime, size) signature changes,
+    so point lookups are O(1) and repeated get_all_* calls cost no I/O.
+    Project changes are appended to a ProjectJournal; only the new part of the
+    journal is read when another writer appends to it.
+    Secondary indexes (status, assignee, manager, priority), the trigram
+    search index, the dependency graph and the NumPy columns are built on
+    first use and then patched with every change.
+    Every change (own commits, records of other writers, reloads) is
+    published on `events` as project_added / project_updated / project_deleted.
+    Events are queued while the locks are held and emitted after they are
+    released, so subscribers never run under `write_lock` or the repository lock.
+
+    Several processes may share one Dataset directory: every project write
+    (journal append, snapshot, compaction install) runs under `write_lock`, an
+    advisory lock file next to projects.json, after reading what the other
+    processes appended. Each stored row carries a `version` that grows by one
+    per saved change; a save whose copy is based on an older version is refused
+    instead of overwriting the other writer's change. Files are replaced by
+    renaming a finished temporary file, so readers never see a partial file.
+    Saved changes are also recorded in `history` (Dataset/history/), which can
+    rebuild a project or the whole dataset as it was at an earlier time.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, dataset_dir):
+        """
+        Returns the repository for the given Dataset directory, creating it on first use.
+        All DataConnector instances pointing at the same directory share one repository.
+        """
+        key = os.path.normcase(os.path.abspath(dataset_dir))
+        with cls._instances_lock:
+            repo = cls._instances.get(key)
+            if repo is None:
+                repo = cls(key)
+                cls._instances[key] = repo
+            return repo
+
+    def __init__(self, dataset_dir):
+        self.dataset_dir = dataset_dir
+        self.projects_file = os.path.join(dataset_dir, "projects.json")
+        self.users_file = os.path.join(dataset_dir, "users.json")
+        self.journal = ProjectJournal(self.projects_file)
+        self.id_sequence = IdSequence(os.path.join(dataset_dir, "project_ids.seq"))
+        self.history = ProjectHistory(os.path.join(dataset_dir, "history"))
+        self.write_lock = FileLock(self.projects_file + ".lock")
+        self.users_lock = FileLock(self.users_file + ".lock")
+        self._lock = threading.RLock()
+
+        # Projects: persisted rows (plain dicts) + live Project objects, both keyed by id
+        # and kept in file order (dicts preserve insertion order).
+        self._rows = {}
+        self._projects_by_id = {}
+        self._projects_list = None
+        self._projects_loaded = False
+        self._snapshot_signature = None
+        self._journal_signature = None
+        self._journal_offset = 0
+        self._compacting = False
+        self._columns = None  # ProjectColumns, built on first use then patched
+        self._index = None    # ProjectIndex, built on first use then patched
+        self._search = None   # SearchIndex, built on first use then patched
+        self._graph = None    # DependencyGraph, built on first use then patched
+        self.events = EventBus()
+        self._outbox = []  # (event, args) chờ phát sau khi nhả khoá
+        self._calls = threading.local()
+
+        self._users = []
+        self._users_by_username = {}
+        self._users_by_email = {}
+        self._users_signature = None
+
+        # Số lần thật sự parse file (dùng để kiểm tra cache)
+        self.parse_count = {"projects": 0, "journal": 0, "users": 0}
+
+    @staticmethod
+    def file_signature(filename):
+        """
+        Returns (mtime_ns, size, inode) of a file, or None if it does not exist.
+        The inode changes whenever the file is replaced by a rename.
+        """
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    @staticmethod
+    def normalize_email(email):
+        return (email or "").strip().lower()
+
+    @staticmethod
+    def project_to_row(project):
+        """
+        Returns a detached dict copy of a Project (lists are copied too,
+        so later in-place edits on the object show up as changes).
+        """
+        return {k: (list(v) if isinstance(v, list) else v) for k, v in project.to_dict().items()}
+
+    @staticmethod
+    def _make_project(row):
+        try:
+            return Project.from_dict({k: (list(v) if isinstance(v, list) else v) for k, v in row.items()})
+        except (KeyError, TypeError) as e:
+            print("Error constructing Project from item:", row, "->", e)
+            return None
+
+    # ----- Projects -----
+    def _refresh_projects(self):
+        snapshot_signature = self.file_signature(self.projects_file)
+        if not self._projects_loaded or snapshot_signature != self._snapshot_signature:
+            self._load_projects(snapshot_signature)
+            return
+        journal_signature = self.file_signature(self.journal.journal_file)
+        if journal_signature == self._journal_signature:
+            return
+        if (journal_signature is None or journal_signature[1] < self._journal_offset
+                or (self._journal_signature is not None and journal_signature[2] != self._journal_signature[2])):
+            # Log was reset or replaced by someone else (e.g. read together with an older snapshot
+            # during a compaction): our offset means nothing in the new file, start over
+            self._load_projects(snapshot_signature)
+            return
+        records, self._journal_offset = self.journal.read(self._journal_offset)
+        self._journal_signature = journal_signature
+        if records:
+            self.parse_count["journal"] += 1
+            self._apply_records(records)
+
+    def _load_projects(self, snapshot_signature):
+        rows = {}
+        if snapshot_signature is not None:
+            for item in JsonFileFactory().read_data(self.projects_file, dict) or []:
+                if isinstance(item, dict):
+                    rows[str(item.get("project_id", ""))] = item
+            self.parse_count["projects"] += 1
+        journal_signature = self.file_signature(self.journal.journal_file)
+        records, self._journal_offset = self.journal.read(0)
+        ProjectJournal.replay(rows, records)
+        described = self._describe(self._row_records(rows)) if self._projects_loaded else []
+
+        old_objects = self._projects_by_id
+        dirty = {pid for pid in old_objects if pid in rows and self._is_dirty(pid)}
+        self._rows = {}
+        self._projects_by_id = {}
+        for pid, row in rows.items():
+            project = old_objects.get(pid)
+            if project is not None:
+                if pid not in dirty:
+                    self._update_object(project, row)
+            else:
+                project = self._make_project(row)
+            if project is not None:
+                self._rows[pid] = row
+                self._projects_by_id[pid] = project
+        self._projects_list = None
+        self._columns = None
+        self._index = None
+        self._search = None
+        self._graph = None
+        self._projects_loaded = True
+        self._snapshot_signature = snapshot_signature
+        self._journal_signature = journal_signature
+        self._publish(described)
+
+    def _update_object(self, project, row):
+        for k in Project.FIELDS:
+            if k in row:
+                v = row[k]
+                setattr(project, k, list(v) if isinstance(v, list) else v)
+
+    @staticmethod
+    def _record_id(record):
+        if record.get("op") == "put":
+            return str((record.get("data") or {}).get("project_id", ""))
+        return str(record.get("project_id", ""))
+
+    def _is_dirty(self, pid):
+        """
+        True if the live Project has edits that are not saved yet. Such objects are not
+        overwritten by other writers' changes; their old version makes the save a conflict.
+        """
+        project = self._projects_by_id.get(pid)
+        row = self._rows.get(pid)
+        if project is None or row is None:
+            return False
+        # Trường thiếu trong row và khác biệt giữa 2 giá trị rỗng ("" / None / []) không tính
+        return any(k in row and row[k] != v and (row[k] or v) for k, v in project.to_dict().items())
+
+    def _apply_records(self, records):
+        """
+        Replays log records written by someone else onto the cached objects.
+        """
+        described = self._describe(records)
+        dirty = {pid for pid in map(self._record_id, records) if self._is_dirty(pid)}
+        touched, deleted = ProjectJournal.replay(self._rows, records)
+        for pid in deleted:
+            self._projects_by_id.pop(pid, None)
+            if self._columns is not None:
+                self._columns.remove(pid)
+            if self._index is not None:
+                self._index.remove(pid)
+            if self._search is not None:
+                self._search.remove(pid)
+            if self._graph is not None:
+                self._graph.remove(pid)
+        for pid in touched:
+            row = self._rows[pid]
+            project = self._projects_by_id.get(pid)
+            if project is not None:
+                if pid not in dirty:
+                    self._update_object(project, row)
+            else:
+                project = self._make_project(row)
+                if project is None:
+                    del self._rows[pid]
+                    continue
+                self._projects_by_id[pid] = project
+            if self._columns is not None:
+                self._columns.patch(project)
+            if self._index is not None:
+                self._index.put(pid, row, project)
+            if self._search is not None:
+                self._search.put(pid, row)
+            if self._graph is not None:
+                self._graph.put(pid, row)
+        self._projects_list = None
+        self._publish(described)
+
+    @_delivers_events
+    def get_projects(self):
+        """
+        Returns the cached list of Project objects (do not mutate the list itself).
+        """
+        with self._lock:
+            self._refresh_projects()
+            if self._projects_list is None:
+                self._projects_list = list(self._projects_by_id.values())
+            return self._projects_list
+
+    @property
+    def projects_loaded(self):
+        return self._projects_loaded
+
+    @_delivers_events
+    def get_columns(self):
+        """
+        Returns the ProjectColumns (NumPy arrays) for the current project set.
+        Built once, then patched on every change instead of rebuilt.
+        """
+        with self._lock:
+            self._refresh_projects()
+            if self._columns is None:
+                from libs.ProjectColumns import ProjectColumns
+                self._columns = ProjectColumns.from_projects(self._projects_by_id.values())
+            return self._columns
+
+    @_delivers_events
+    def get_index(self):
+        """
+        Returns the ProjectIndex (status / assignee / manager / priority -> ids).
+        Built once, then patched on every change instead of rebuilt.
+        """
+        with self._lock:
+            self._refresh_projects()
+            if self._index is None:
+                self._index = ProjectIndex.from_rows(self._rows, self._projects_by_id)
+            return self._index
+
+    @_delivers_events
+    def get_projects_by(self, field, key):
+        """
+        Returns the Project objects filed under `key` in one of the ProjectIndex fields.
+        """
+        with self._lock:
+            return self.get_index().projects(field, key)
+
+    @_delivers_events
+    def get_search_index(self):
+        """
+        Returns the SearchIndex (trigrams of id, name, description, manager, assignees).
+        """
+        with self._lock:
+            self._refresh_projects()
+            if self._search is None:
+                self._search = SearchIndex.from_rows(self._rows)
+            return self._search
+
+    @_delivers_events
+    def search_projects(self, query, limit=None):
+        """
+        Returns the Project objects matching `query`, best match first.
+        """
+        with self._lock:
+            ids = self.get_search_index().search(query, limit)
+            by_id = self._projects_by_id
+            return [by_id[pid] for pid in ids if pid in by_id]
+
+    @_delivers_events
+    def get_dependency_graph(self):
+        """
+        Returns the DependencyGraph (Project.dependency edges + critical path schedule).
+        """
+        with self._lock:
+            self._refresh_projects()
+            if self._graph is None:
+                self._graph = DependencyGraph.from_rows(self._rows)
+            return self._graph
+
+    def _check_dependencies(self, records):
+        """
+        Raises DependencyCycleError if the records would make Project.dependency cyclic.
+        """
+        changed = {}
+        removed = set()
+        for r in records:
+            op = r.get("op")
+            if op == "put" and (r.get("data") or {}).get("dependency"):
+                changed[str(r["data"].get("project_id", ""))] = r["data"]
+            elif op == "set" and "dependency" in (r.get("fields") or {}):
+                changed[str(r.get("project_id", ""))] = r["fields"]
+            elif op == "delete":
+                removed.add(str(r.get("project_id", "")))
+        if changed:
+            self.get_dependency_graph().check(changed, removed)
+
+    def _drop_cycles(self, projects, records, rejected):
+        """
+        Leaves out of the save every project whose new dependency would close a cycle,
+        adding it to `rejected` ({project_id: reason}). Stored projects go back to their
+        stored rows; rejected new projects are left out of `projects`.
+        Returns (projects, records) without the rejected changes.
+        """
+        while True:
+            try:
+                self._check_dependencies(records)
+                break
+            except DependencyCycleError as e:
+                # Phần tử cuối của vòng luôn là project đang đổi dependency
+                pid = str(e.cycle[-1])
+                rejected[pid] = str(e)
+                records = [r for r in records if self._record_id(r) != pid]
+        if rejected:
+            self._revert_to_stored(projects, rejected)
+            projects = [p for p in projects if str(p.project_id) not in rejected or str(p.project_id) in self._rows]
+        return projects, records
+
+    def _revert_to_stored(self, projects, ids):
+        """
+        Overwrites the projects of `projects` whose id is in `ids` with their stored rows
+        (published as project_updated), so views show what is stored.
+        """
+        for p in projects:
+            pid = str(p.project_id)
+            if pid not in ids or pid not in self._rows:
+                continue
+            row = self._rows[pid]
+            changes = row_changes(self.project_to_row(p), row)
+            self._update_object(p, row)
+            if changes and self._projects_by_id.get(pid) is p:
+                self._queue(PROJECT_UPDATED, p, changes)
+
+    def _patch_derived(self, records):
+        """
+        Applies just-committed records to the columns and the indexes (if built).
+        """
+        if all(d is None for d in (self._columns, self._index, self._search, self._graph)):
+            return
+        for r in records:
+            op = r.get("op")
+            if op == "delete":
+                pid = str(r.get("project_id", ""))
+                if self._columns is not None:
+                    self._columns.remove(pid)
+                if self._index is not None:
+                    self._index.remove(pid)
+                if self._search is not None:
+                    self._search.remove(pid)
+                if self._graph is not None:
+                    self._graph.remove(pid)
+                continue
+            pid = str((r.get("data") or {}).get("project_id", "")) if op == "put" else str(r.get("project_id", ""))
+            project = self._projects_by_id.get(pid)
+            if project is None:
+                continue
+            if self._columns is not None:
+                self._columns.patch(project)
+            if self._index is not None and pid in self._rows:
+                self._index.put(pid, self._rows[pid], project)
+            if self._search is not None and pid in self._rows:
+                self._search.put(pid, self._rows[pid])
+            if self._graph is not None and pid in self._rows:
+                self._graph.put(pid, self._rows[pid])
+
+    def _row_records(self, rows):
+        """
+        Records that turn the current rows into `rows` (used to describe a reload as changes).
+        """
+        if not self.events.has_subscribers():
+            return []
+        records = [{"op": "delete", "project_id": pid} for pid in self._rows if pid not in rows]
+        for pid, row in rows.items():
+            old = self._rows.get(pid)
+            if old is None:
+                records.append({"op": "put", "data": row})
+            elif old != row:
+                records.append({"op": "set", "project_id": pid, "fields": row})
+        return records
+
+    def _describe(self, records):
+        """
+        Returns the events `records` will cause as (event, project_id, changes or deleted Project).
+        Must run before the records are applied, while the old rows are still known.
+        """
+        if not self.events.has_subscribers():
+            return []
+        described = []
+        current = {}  # project_id -> row after the records seen so far (None = deleted)
+        for r in records:
+            op = r.get("op")
+            data = r.get("data") or {}
+            pid = str(data.get("project_id", "")) if op == "put" else str(r.get("project_id", ""))
+            old = current[pid] if pid in current else self._rows.get(pid)
+            if op == "delete":
+                if old is not None:
+                    described.append((PROJECT_DELETED, pid, self._projects_by_id.get(pid)))
+                current[pid] = None
+            elif op == "put":
+                if old is None:
+                    described.append((PROJECT_ADDED, pid, None))
+                else:
+                    changes = row_changes(old, data)
+                    if changes:
+                        described.append((PROJECT_UPDATED, pid, changes))
+                current[pid] = data
+            elif op == "set" and old is not None:
+                fields = r.get("fields") or {}
+                changes = row_changes(old, fields)
+                if changes:
+                    described.append((PROJECT_UPDATED, pid, changes))
+                current[pid] = {**old, **fields}
+        return described
+
+    def _publish(self, described):
+        """
+        Queues the events listed by _describe() once the records are applied.
+        """
+        for event, pid, payload in described:
+            if event == PROJECT_DELETED:
+                self._queue(event, pid, payload)
+                continue
+            project = self._projects_by_id.get(pid)
+            if project is None:
+                continue
+            if event == PROJECT_ADDED:
+                self._queue(event, project)
+            else:
+                self._queue(event, project, payload)
+
+    def _queue(self, event, *args):
+        if self.events.has_subscribers(event):
+            with self._lock:
+                self._outbox.append((event, args))
+
+    def deliver_events(self):
+        """
+        Emits the queued events. Call without holding `write_lock` or the repository lock
+        (repository methods do it themselves when they return).
+        """
+        with self._lock:
+            if not self._outbox:
+                return
+            outbox, self._outbox = self._outbox, []
+        for event, args in outbox:
+            self.events.emit(event, *args)
+
+    @_delivers_events
+    def reserve_project_ids(self, count=1):
+        """
+        Returns `count` new project ids (PRJxxx) from the persistent id sequence,
+        unique across every process using this Dataset directory.
+        If one of them is already taken (projects written without the sequence),
+        the sequence is moved past the highest existing id and the block is reserved again.
+        """
+        def seed():
+            with self._lock:
+                self._refresh_projects()
+                return next_number_after(self._rows)
+
+        first = self.id_sequence.reserve(count, seed)
+        with self._lock:
+            self._refresh_projects()
+            taken = any(format_project_id(n) in self._rows for n in range(first, first + count))
+        if taken:
+            first = self.id_sequence.reserve(count, at_least=seed())
+        return [format_project_id(n) for n in range(first, first + count)]
+
+    @_delivers_events
+    def get_project(self, project_id):
+        with self._lock:
+            self._refresh_projects()
+            return self._projects_by_id.get(str(project_id))
+
+    def diff_projects(self, projects, complete=False, deleted=()):
+        """
+        Builds journal records describing how `projects` differ from what is persisted.
+        Every new or changed project gets the next version.
+        With complete=True, ids missing from `projects` are recorded as deleted;
+        otherwise only the stored ids listed in `deleted` are.
+        """
+        records = []
+        seen = set()
+        for p in projects:
+            pid = str(p.project_id)
+            seen.add(pid)
+            row = self.project_to_row(p)
+            old = self._rows.get(pid)
+            if old is None:
+                row["version"] = (row.get("version") or 0) + 1
+                records.append({"op": "put", "data": row})
+                continue
+            fields = {k: v for k, v in row.items() if k != "version" and (k not in old or old[k] != v)}
+            if fields:
+                fields["version"] = (old.get("version") or 0) + 1
+                records.append({"op": "set", "project_id": pid, "fields": fields})
+        if complete:
+            for pid in self._rows:
+                if pid not in seen:
+                    records.append({"op": "delete", "project_id": pid})
+        else:
+            for pid in dict.fromkeys(str(pid) for pid in deleted):
+                if pid in self._rows and pid not in seen:
+                    records.append({"op": "delete", "project_id": pid})
+        return records
+
+    def _check_versions(self, projects, expected):
+        """
+        Raises VersionConflictError if a project in `projects` was saved by another writer
+        after the version in `expected` ({project_id: version}) was read. The stale
+        copies are first overwritten with the stored rows (published as project_updated),
+        so views show what is stored and the user can redo the edit; the conflicting
+        ids are published as save_rejected.
+        """
+        stored = {pid: self._rows[pid].get("version", 0) for pid in expected if pid in self._rows}
+        try:
+            check_versions(expected, stored)
+        except VersionConflictError as e:
+            self._revert_to_stored(projects, e.conflicts)
+            self._queue(SAVE_REJECTED, e.reasons())
+            raise
+
+    @_delivers_events
+    def commit_projects(self, projects, complete=False, deleted=()):
+        """
+        Persists the changes in `projects` by appending delta records to the journal,
+        together with the deletion of the ids in `deleted` (one append for both).
+        The cost depends on how many projects changed, not on the dataset size.
+        The Dataset write lock is held from reading the other writers' records to
+        the append, and a project changed by another writer since it was read is
+        a conflict: nothing is written. A project whose new dependency would close
+        a cycle is reverted and left out, the rest is saved, and the refused ids are
+        published as save_rejected. Returns True if every change was saved.
+        """
+        # Version mà bản sao của người gọi dựa trên, lấy trước khi refresh
+        expected = {str(p.project_id): p.version or 0 for p in projects}
+        with self._lock:
+            # Đọc thay đổi của tiến trình khác trước khi lấy khoá file, để việc parse lại
+            # snapshot (sau khi ai đó compact) không chặn các writer khác
+            self._refresh_projects()
+        rejected = {}
+        try:
+            with self.write_lock, self._lock:
+                self._refresh_projects()
+                self._check_versions(projects, expected)
+                records = self.diff_projects(projects, complete, deleted)
+                projects, records = self._drop_cycles(projects, records, rejected)
+                if not records:
+                    return self._report_rejected(rejected)
+                described = self._describe(records)
+                offset_before = self._journal_offset
+                written = self.journal.append(records)
+                if written < 0:
+                    self._report_rejected(rejected)
+                    return False
+                self.history.record(records, lambda: self._rows)
+
+                ProjectJournal.replay(self._rows, records)
+                if complete:
+                    self._projects_by_id = {str(p.project_id): p for p in projects}
+                    self._rows = {pid: self._rows[pid] for pid in self._projects_by_id}
+                else:
+                    for p in projects:
+                        self._projects_by_id[str(p.project_id)] = p
+                    for pid in deleted:
+                        if str(pid) not in self._rows:
+                            self._projects_by_id.pop(str(pid), None)
+                for r in records:
+                    pid = self._record_id(r)
+                    if pid in self._rows:
+                        self._projects_by_id[pid].version = self._rows[pid]["version"]
+                self._projects_list = None
+                self._patch_derived(records)
+                if self._index is not None:
+                    # Unchanged projects may come back as different objects: keep the buckets pointing at the live ones
+                    for p in projects:
+                        pid = str(p.project_id)
+                        if not self._index.holds(pid, p) and pid in self._rows:
+                            self._index.put(pid, self._rows[pid], p)
+
+                journal_signature = self.file_signature(self.journal.journal_file)
+                if journal_signature and journal_signature[1] == offset_before + written:
+                    self._journal_offset = journal_signature[1]
+                    self._journal_signature = journal_signature
+                # Otherwise another writer appended too; the next refresh replays from offset_before.
+                self._publish(described)
+        except (VersionConflictError, TimeoutError) as e:
+            print("Error saving projects:", e)
+            return False
+
+        if self.journal.needs_compaction():
+            self.compact_async()
+        return self._report_rejected(rejected)
+
+    def _report_rejected(self, rejected):
+        """
+        Publishes save_rejected for the ids in `rejected` ({project_id: reason}).
+        Returns True if nothing was rejected.
+        """
+        if not rejected:
+            return True
+        for reason in rejected.values():
+            print("Error saving projects:", reason)
+        self._queue(SAVE_REJECTED, dict(rejected))
+        return False
+
+    @_delivers_events
+    def write_snapshot(self, projects):
+        """
+        Rewrites projects.json with exactly `projects` and clears the journal.
+        Same locking and version check as commit_projects().
+        """
+        expected = {str(p.project_id): p.version or 0 for p in projects}
+        try:
+            with self.write_lock, self._lock:
+                self._refresh_projects()
+                self._check_versions(projects, expected)
+                records = self.diff_projects(projects, complete=True)
+                replayed = dict(self._rows)
+                ProjectJournal.replay(replayed, records)
+                rows = {str(p.project_id): replayed[str(p.project_id)] for p in projects}
+                described = self._describe(self._row_records(rows))
+                tmp_file = self.journal.write_snapshot_file(list(rows.values()))
+                if tmp_file is None:
+                    return False
+                if not self.journal.install_snapshot(tmp_file):
+                    self.journal.discard_snapshot_file(tmp_file)
+                    return False
+                self.history.record(records, lambda: self._rows)
+                for p in projects:
+                    p.version = rows[str(p.project_id)]["version"]
+                self._rows = rows
+                self._projects_by_id = {str(p.project_id): p for p in projects}
+                self._projects_list = None
+                self._columns = None
+                self._index = None
+                self._search = None
+                self._graph = None
+                self._snapshot_signature = self.file_signature(self.projects_file)
+                self._journal_signature = self.file_signature(self.journal.journal_file)
+                self._journal_offset = 0
+                self._publish(described)
+                return True
+        except (VersionConflictError, TimeoutError) as e:
+            print("Error writing projects:", e)
+            return False
+
+    def compact(self):
+        """
+        Folds the journal into a new projects.json snapshot.
+        Serialization happens outside the locks so writers are not blocked; the
+        snapshot is only installed if no other process replaced projects.json meanwhile.
+        """
+        with self._lock:
+            self._refresh_projects()
+            rows_list = list(self._rows.values())
+            offset = self._journal_offset
+            signature = self._snapshot_signature
+        tmp_file = self.journal.write_snapshot_file(rows_list)
+        if tmp_file is None:
+            return False
+        try:
+            with self.write_lock, self._lock:
+                if (self.file_signature(self.projects_file) != signature
+                        or self.journal.size() < offset):
+                    # Tiến trình khác đã compact trước: bản snapshot này đã cũ
+                    self.journal.discard_snapshot_file(tmp_file)
+                    return False
+                tail = self.journal.read_tail(offset)
+                if not self.journal.install_snapshot(tmp_file, tail):
+                    self.journal.discard_snapshot_file(tmp_file)
+                    return False
+                self._snapshot_signature = self.file_signature(self.projects_file)
+                # The tail is replayed on the next refresh (replay is idempotent).
+                self._journal_offset = 0
+                self._journal_signature = None
+                return True
+        except TimeoutError as e:
+            print("Error compacting projects:", e)
+            self.journal.discard_snapshot_file(tmp_file)
+            return False
+
+    def compact_async(self):
+        """
+        Starts compaction in a background thread (at most one at a time).
+        """
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+
+        def run():
+            try:
+                self.compact()
+            finally:
+                with self._lock:
+                    self._compacting = False
+
+        threading.Thread(target=run, name="ProjectJournalCompaction", daemon=True).start()
+
+    # ----- History -----
+    def project_at(self, project_id, when):
+        """
+        Returns a new Project object as the project was at `when` (datetime, date or
+        epoch seconds), or None if it did not exist then.
+        """
+        row = self.history.project_at(project_id, when)
+        return self._make_project(row) if row is not None else None
+
+    def projects_at(self, when):
+        """
+        Returns new Project objects for every project as it was at `when`
+        ([] if `when` is before the history starts).
+        """
+        rows = self.history.dataset_at(when) or {}
+        return [p for p in map(self._make_project, rows.values()) if p is not None]
+
+    # ----- Users -----
+    def _refresh_users(self):
+        signature = self.file_signature(self.users_file)
+        if signature is not None and signature == self._users_signature:
+            return
+        users = []
+        if signature is not None:
+            users = JsonFileFactory().read_data(self.users_file, User) or []
+            self.parse_count["users"] += 1
+        self._set_users(users, signature)
+
+    def _set_users(self, users, signature):
+        self._users = list(users)
+        self._users_by_username = {}
+        self._users_by_email = {}
+        for u in self._users:
+            self._users_by_username.setdefault(u.Username, u)
+            self._users_by_email.setdefault(self.normalize_email(u.Email), u)
+        self._users_signature = signature
+
+    def get_users(self):
+        """
+        Returns the cached list of User objects (do not mutate the list itself).
+        """
+        with self._lock:
+            self._refresh_users()
+            return self._users
+
+    def get_user_by_username(self, username):
+        with self._lock:
+            self._refresh_users()
+            return self._users_by_username.get(username)
+
+    def get_user_by_email(self, email):
+        with self._lock:
+            self._refresh_users()
+            return self._users_by_email.get(self.normalize_email(email))
+
+    def store_users(self, users):
+        """
+        Replaces the cached users after they were written to disk.
+        """
+        with self._lock:
+            self._set_users(users, self.file_signature(self.users_file))
+
+    def invalidate(self):
+        """
+        Forces the next access to re-read every file from disk.
+        """
+        with self._lock:
+            self._projects_loaded = False
+            self._users_signature = None
@@ -0,0 +1,78 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+# Định dạng chuẩn cho mọi ngày lưu trong Dataset (giống QDateTime "dd/MM/yyyy" ở AddProjectWindow)
+CANONICAL_FORMAT = "%d/%m/%Y"
+
+_SPLIT = re.compile(r"[/\-.]")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text):
+    """
+    Leniently parses a date string and returns a datetime.date, or None.
+    Accepts d/m/Y (with or without zero padding, e.g. "7/08/2025" or "8/011/2025"),
+    Y-m-d, Y/m/d, d-m-Y and m/d/Y when the day is > 12. A time part after a space
+    or "T" is ignored.
+    """
+    if not text or not isinstance(text, str):
+        return None
+    head = text.strip().split(" ")[0].split("T")[0]
+    parts = _SPLIT.split(head)
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        return None
+    a, b, c = (int(p) for p in parts)
+    if len(parts[0]) == 4:
+        year, month, day = a, b, c
+    else:
+        day, month, year = a, b, c
+        if month > 12 >= day:
+            day, month = month, day  # m/d/Y
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def to_ordinal(text):
+    """
+    Returns the proleptic Gregorian day ordinal of a date string, or None if it cannot be parsed.
+    """
+    d = parse_date(text)
+    return d.toordinal() if d is not None else None
+
+
+def ordinal_to_datetime(ordinal):
+    """
+    Midnight datetime for a day ordinal.
+    """
+    return datetime.fromordinal(ordinal)
+
+
+def format_date(d):
+    return d.strftime(CANONICAL_FORMAT)
+
+
+def normalize_date_string(text):
+    """
+    Rewrites a date string in CANONICAL_FORMAT; strings that cannot be parsed are returned unchanged.
+    """
+    d = parse_date(text)
+    return format_date(d) if d is not None else text
+
+
+def normalize_project_dates(projects):
+    """
+    Rewrites start_date/end_date of each project in the canonical format.
+    Returns the list of projects that changed.
+    """
+    changed = []
+    for p in projects:
+        start = normalize_date_string(p.start_date)
+        end = normalize_date_string(p.end_date)
+        if start != p.start_date or end != p.end_date:
+            p.start_date = start
+            p.end_date = end
+            changed.append(p)
+    return changed
@@ -0,0 +1,362 @@
+from collections import deque
+from datetime import date
+
+from libs.DateUtils import ordinal_to_datetime, to_ordinal
+
+
+def parse_dependencies(text):
+    """
+    Returns the predecessor ids written in Project.dependency ("PRJ001" or "PRJ001, PRJ004").
+    """
+    if not text:
+        return ()
+    if isinstance(text, (list, tuple)):
+        parts = text
+    else:
+        parts = str(text).split(",")
+    ids = []
+    for part in parts:
+        pid = str(part).strip()
+        if pid and pid.lower() != "none" and pid not in ids:
+            ids.append(pid)
+    return tuple(ids)
+
+
+def duration_of(row):
+    """
+    Duration in days of a project row: end - start, else estimated_time as a number of days, else 0.
+    """
+    start = to_ordinal(row.get("start_date"))
+    end = to_ordinal(row.get("end_date"))
+    if start is not None and end is not None:
+        return max(0, end - start)
+    try:
+        return max(0, int(float(str(row.get("estimated_time") or "").split()[0])))
+    except (ValueError, IndexError):
+        return 0
+
+
+class DependencyCycleError(ValueError):
+    def __init__(self, cycle):
+        super().__init__("Dependency cycle: " + " -> ".join(cycle))
+        self.cycle = cycle
+
+
+class DependencyGraph:
+    """
+    Finish-to-start dependency DAG built from Project.dependency, with a
+    critical path (CPM) schedule in day ordinals:
+
+        ES(n) = max(planned start of n, EF of every predecessor)
+        EF(n) = ES(n) + duration(n)
+        tail(n) = duration(n) + max tail of its successors
+        LS(n) = horizon - tail(n),  LF(n) = LS(n) + duration(n)
+        slack(n) = LS(n) - ES(n)   (0 = on the critical path)
+
+    horizon is the latest EF of all projects (one virtual end node), so
+    LS only depends on the downstream part of the graph. Changes mark
+    nodes dirty; the next query recomputes ES/EF for the descendants of
+    the dirty nodes and tail for their ancestors only, in topological
+    order within that subgraph. Ids that are referenced but not present
+    are kept as edges and ignored until the project shows up.
+    """
+
+    def __init__(self, today=None):
+        self.today = today if today is not None else date.today().toordinal()
+        self._preds = {}     # id -> tuple of predecessor ids (as written)
+        self._succs = {}     # id -> set of successor ids (also for ids not present yet)
+        self._base = {}      # id -> planned start ordinal
+        self._duration = {}  # id -> days
+        self._es = {}
+        self._tail = {}
+        self._dirty_forward = set()
+        self._dirty_backward = set()
+        self._horizon = None
+        # Thống kê: số node được tính lại ở lần cập nhật gần nhất
+        self.last_recomputed = 0
+
+    # ----- Building -----
+    @classmethod
+    def from_rows(cls, rows, today=None):
+        """
+        Builds the graph for a {project_id: row} mapping and schedules every project.
+        """
+        graph = cls(today)
+        for pid, row in rows.items():
+            graph._set_node(str(pid), row)
+        graph._dirty_forward = set(graph._preds)
+        graph._dirty_backward = set(graph._preds)
+        return graph
+
+    @classmethod
+    def from_projects(cls, projects, today=None):
+        return cls.from_rows({str(p.project_id): p.to_dict(details=False) for p in projects}, today)
+
+    def _set_node(self, pid, row):
+        """
+        Stores one node; returns (old predecessors, duration changed).
+        """
+        preds = tuple(p for p in parse_dependencies(row.get("dependency")) if p != pid)
+        old_preds = self._preds.get(pid, ())
+        for p in old_preds:
+            if p not in preds:
+                self._succs.get(p, set()).discard(pid)
+        for p in preds:
+            self._succs.setdefault(p, set()).add(pid)
+        self._succs.setdefault(pid, set())
+        self._preds[pid] = preds
+        start = to_ordinal(row.get("start_date"))
+        self._base[pid] = start if start is not None else self.today
+        duration = duration_of(row)
+        duration_changed = self._duration.get(pid) != duration
+        self._duration[pid] = duration
+        return old_preds, duration_changed
+
+    def put(self, project_id, row):
+        """
+        Adds or updates one project row (does not check for cycles, see check()).
+        """
+        pid = str(project_id)
+        is_new = pid not in self._preds
+        old_preds, duration_changed = self._set_node(pid, row)
+        preds = self._preds[pid]
+        self._dirty_forward.add(pid)
+        if is_new or duration_changed:
+            self._dirty_backward.add(pid)
+        if old_preds != preds:
+            # Tập successor của các predecessor cũ/mới thay đổi -> tail của chúng phải tính lại
+            self._dirty_backward.update(p for p in set(old_preds) | set(preds) if p in self._preds)
+        if is_new:
+            # Project trước đây chỉ được tham chiếu nay đã có: các successor cần tính lại ES
+            self._dirty_forward.update(self._succs[pid])
+
+    def remove(self, project_id):
+        pid = str(project_id)
+        if pid not in self._preds:
+            return
+        for p in self._preds.pop(pid):
+            self._succs.get(p, set()).discard(pid)
+            if p in self._preds:
+                self._dirty_backward.add(p)
+        self._dirty_forward.update(self._succs[pid])
+        if not self._succs[pid]:
+            del self._succs[pid]
+        for store in (self._base, self._duration, self._es, self._tail):
+            store.pop(pid, None)
+        self._dirty_forward.discard(pid)
+        self._dirty_backward.discard(pid)
+        self._horizon = None
+
+    def __contains__(self, project_id):
+        return str(project_id) in self._preds
+
+    def __len__(self):
+        return len(self._preds)
+
+    # ----- Cycles / order -----
+    def predecessors(self, project_id):
+        return tuple(p for p in self._preds.get(str(project_id), ()) if p in self._preds)
+
+    def successors(self, project_id):
+        return tuple(s for s in self._succs.get(str(project_id), ()) if s in self._preds)
+
+    def _path(self, source, target, step=None):
+        """
+        Returns a successor path source -> ... -> target, or None.
+        """
+        step = step or self.successors
+        parent = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                return path[::-1]
+            for s in step(node):
+                if s not in parent:
+                    parent[s] = node
+                    queue.append(s)
+        return None
+
+    def check(self, rows, removed=()):
+        """
+        Checks changed project rows ({project_id: row}) against the rest of the graph,
+        ignoring the projects in `removed` (deleted in the same save).
+        Raises DependencyCycleError if, together, their dependencies would create a cycle.
+        The graph itself is not modified.
+        """
+        new_preds = {str(pid): parse_dependencies(row.get("dependency")) for pid, row in rows.items()}
+        added = {}  # predecessor -> changed projects that will depend on it
+        for pid, preds in new_preds.items():
+            for p in preds:
+                added.setdefault(p, set()).add(pid)
+        known = set(self._preds).union(new_preds).difference(removed)
+
+        def step(node):
+            # Cạnh hiện có của project đang đổi bị thay bằng cạnh mới của nó
+            for s in self._succs.get(node, ()):
+                if s in known and s not in new_preds:
+                    yield s
+            for s in added.get(node, ()):
+                if s in known:
+                    yield s
+
+        for pid, preds in new_preds.items():
+            for p in preds:
+                if p == pid:
+                    raise DependencyCycleError([pid, pid])
+                if p in known:
+                    path = self._path(pid, p, step)
+                    if path:
+                        raise DependencyCycleError(path + [pid])
+
+    def would_create_cycle(self, project_id, dependency):
+        """
+        Returns the cycle (list of ids) that giving `project_id` this dependency would close, or None.
+        """
+        try:
+            self.check({project_id: {"dependency": dependency}})
+        except DependencyCycleError as e:
+            return e.cycle
+        return None
+
+    def find_cycle(self):
+        """
+        Returns one cycle present in the graph (list of ids), or None.
+        """
+        order = self.topological_order()
+        if len(order) == len(self._preds):
+            return None
+        remaining = set(self._preds) - set(order)
+        for pid in remaining:
+            for p in self._preds[pid]:
+                if p in remaining:
+                    path = self._path(pid, p)
+                    if path:
+                        return path + [pid]
+        return None
+
+    def topological_order(self):
+        """
+        Returns every project id, predecessors first. Projects on a cycle are left out.
+        """
+        return self._kahn(set(self._preds), self.predecessors, self.successors)
+
+    @staticmethod
+    def _kahn(nodes, inward, outward):
+        degree = {n: sum(1 for m in inward(n) if m in nodes) for n in nodes}
+        queue = deque(sorted(n for n, d in degree.items() if d == 0))
+        order = []
+        while queue:
+            n = queue.popleft()
+            order.append(n)
+            for m in outward(n):
+                if m in degree:
+                    degree[m] -= 1
+                    if degree[m] == 0:
+                        queue.append(m)
+        return order
+
+    def _closure(self, start, step):
+        seen = set(start)
+        stack = list(start)
+        while stack:
+            for m in step(stack.pop()):
+                if m not in seen:
+                    seen.add(m)
+                    stack.append(m)
+        return seen
+
+    # ----- Scheduling -----
+    def _update(self):
+        recomputed = 0
+        if self._dirty_forward:
+            region = self._closure([n for n in self._dirty_forward if n in self._preds], self.successors)
+            self._dirty_forward = set()
+            es, base, duration = self._es, self._base, self._duration
+            order = self._kahn(region, self.predecessors, self.successors)
+            for n in order:
+                es[n] = max([base[n]] + [es[p] + duration[p] for p in self.predecessors(n) if p in es])
+            # Node trên chu trình (nếu dữ liệu cũ có) không có thứ tự: chỉ dùng ngày dự kiến
+            for n in region.difference(order):
+                es[n] = base[n]
+            recomputed += len(region)
+            self._horizon = None
+        if self._dirty_backward:
+            region = self._closure([n for n in self._dirty_backward if n in self._preds], self.predecessors)
+            self._dirty_backward = set()
+            tail, duration = self._tail, self._duration
+            order = self._kahn(region, self.successors, self.predecessors)
+            for n in order:
+                tail[n] = duration[n] + max([0] + [tail[s] for s in self.successors(n) if s in tail])
+            for n in region.difference(order):
+                tail[n] = duration[n]
+            recomputed += len(region)
+        if self._horizon is None and self._es:
+            duration = self._duration
+            self._horizon = max(es + duration[n] for n, es in self._es.items())
+        if recomputed:
+            self.last_recomputed = recomputed
+
+    @property
+    def horizon(self):
+        """Latest earliest-finish ordinal over all projects (None if the graph is empty)."""
+        self._update()
+        return self._horizon
+
+    def earliest_start(self, project_id):
+        self._update()
+        return self._es.get(str(project_id))
+
+    def earliest_finish(self, project_id):
+        es = self.earliest_start(project_id)
+        return None if es is None else es + self._duration[str(project_id)]
+
+    def latest_start(self, project_id):
+        self._update()
+        pid = str(project_id)
+        if pid not in self._tail:
+            return None
+        return self._horizon - self._tail[pid]
+
+    def latest_finish(self, project_id):
+        ls = self.latest_start(project_id)
+        return None if ls is None else ls + self._duration[str(project_id)]
+
+    def slack(self, project_id):
+        ls = self.latest_start(project_id)
+        return None if ls is None else ls - self._es[str(project_id)]
+
+    def schedule(self, project_id):
+        """
+        Returns the CPM values of one project as a dict (dates as datetime), or None.
+        """
+        pid = str(project_id)
+        es = self.earliest_start(pid)
+        if es is None:
+            return None
+        ls = self.latest_start(pid)
+        duration = self._duration[pid]
+        return {
+            "earliest_start": ordinal_to_datetime(es),
+            "earliest_finish": ordinal_to_datetime(es + duration),
+            "latest_start": ordinal_to_datetime(ls),
+            "latest_finish": ordinal_to_datetime(ls + duration),
+            "duration": duration,
+            "slack": ls - es,
+            "critical": ls == es,
+            "predecessors": self.predecessors(pid),
+        }
+
+    def critical_path(self):
+        """
+        Returns the ids of the zero-slack projects, in schedule order.
+        """
+        self._update()
+        horizon = self._horizon
+        critical = [n for n, es in self._es.items() if horizon - self._tail[n] == es]
+        critical.sort(key=lambda n: (self._es[n], self._es[n] + self._duration[n]))
+        return critical
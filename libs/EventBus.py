@@ -0,0 +1,60 @@
+import threading
+
+# Kiểu sự kiện và tham số gửi kèm
+PROJECT_ADDED = "project_added"              # (project)
+PROJECT_UPDATED = "project_updated"          # (project, changes: {field: (old, new)})
+PROJECT_DELETED = "project_deleted"          # (project_id, last known Project or None)
+NOTIFICATION_ADDED = "notification_added"    # (notification dict)
+SAVE_REJECTED = "save_rejected"              # ({project_id: reason}) thay đổi bị từ chối, không được lưu
+
+EVENTS = (PROJECT_ADDED, PROJECT_UPDATED, PROJECT_DELETED, NOTIFICATION_ADDED, SAVE_REJECTED)
+
+
+def row_changes(old, new):
+    """
+    Returns {field: (old value, new value)} for the fields of `new` that differ from `old` (dicts).
+    """
+    return {k: (old.get(k), v) for k, v in new.items() if old.get(k) != v}
+
+
+class EventBus:
+    """
+    Typed change events published by the storage layer after a write succeeds.
+
+    Views subscribe to the events they care about and patch only the rows,
+    cards or chart slices of the projects named in the event, instead of
+    rebuilding everything after every change. Callbacks run synchronously
+    in the thread that published the event (the UI relays them to the GUI
+    thread); an exception in one callback is printed and does not stop the
+    others.
+    """
+
+    def __init__(self):
+        self._subscribers = {event: [] for event in EVENTS}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event, callback):
+        with self._lock:
+            callbacks = self._subscribers.setdefault(event, [])
+            if callback not in callbacks:
+                # Copy-on-write: emit() can iterate the old list without the lock
+                self._subscribers[event] = callbacks + [callback]
+        return callback
+
+    def unsubscribe(self, event, callback):
+        with self._lock:
+            callbacks = self._subscribers.get(event, [])
+            if callback in callbacks:
+                self._subscribers[event] = [c for c in callbacks if c != callback]
+
+    def has_subscribers(self, event=None):
+        if event is not None:
+            return bool(self._subscribers.get(event))
+        return any(self._subscribers.values())
+
+    def emit(self, event, *args):
+        for callback in self._subscribers.get(event, ()):
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in {event} handler:", e)
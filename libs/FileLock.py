@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+
+
+class _LockState:
+    """Per-path state shared by every FileLock of this process."""
+    __slots__ = ("thread_lock", "fd", "depth", "owner")
+
+    def __init__(self):
+        self.thread_lock = threading.RLock()
+        self.fd = None
+        self.depth = 0
+        self.owner = None
+
+
+class FileLock:
+    """
+    Exclusive advisory lock shared by every process that opens the same lock
+    file (fcntl.flock on POSIX, msvcrt.locking on Windows), combined with a
+    thread lock so threads of one process also wait for each other.
+
+        with FileLock(path + ".lock"):
+            ...  # only one writer at a time, in any process
+
+    The lock is re-entrant for the thread holding it (FileLock objects for the
+    same path share their state). acquire() polls until `timeout` seconds
+    have passed, then raises TimeoutError. The OS releases the lock if the
+    process dies while holding it.
+    """
+
+    _states = {}
+    _states_guard = threading.Lock()
+
+    def __init__(self, path, timeout=10.0, poll_interval=0.002):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        key = os.path.normcase(os.path.abspath(path))
+        with self._states_guard:
+            self._state = self._states.setdefault(key, _LockState())
+
+    def acquire(self):
+        state = self._state
+        deadline = time.monotonic() + self.timeout
+        if not state.thread_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(f"Timed out waiting for lock {self.path}")
+        if state.depth:
+            # Luồng đang giữ khoá gọi lại: chỉ tăng bộ đếm
+            state.depth += 1
+            return self
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                delay = self.poll_interval
+                while not self._try_lock(fd):
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"Timed out waiting for lock {self.path}")
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.005)
+            except BaseException:
+                os.close(fd)
+                raise
+        except BaseException:
+            state.thread_lock.release()
+            raise
+        state.fd = fd
+        state.depth = 1
+        state.owner = threading.get_ident()
+        return self
+
+    def release(self):
+        state = self._state
+        state.depth -= 1
+        try:
+            if state.depth == 0:
+                state.owner = None
+                fd, state.fd = state.fd, None
+                try:
+                    self._unlock(fd)
+                finally:
+                    os.close(fd)
+        finally:
+            state.thread_lock.release()
+
+    @property
+    def locked(self):
+        """True while some thread of this process holds the lock."""
+        return self._state.depth > 0
+
+    @property
+    def held(self):
+        """True if the calling thread holds the lock."""
+        return self._state.owner == threading.get_ident()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    if os.name == "nt":
+        @staticmethod
+        def _try_lock(fd):
+            import msvcrt
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                return False
+
+        @staticmethod
+        def _unlock(fd):
+            import msvcrt
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        @staticmethod
+        def _try_lock(fd):
+            import fcntl
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except (BlockingIOError, PermissionError):
+                return False
+
+        @staticmethod
+        def _unlock(fd):
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_UN)
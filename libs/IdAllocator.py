@@ -0,0 +1,79 @@
+from libs.FileLock import FileLock
+from libs.JsonFileFactory import JsonFileFactory
+
+PROJECT_ID_PREFIX = "PRJ"
+
+
+def format_project_id(number):
+    """PRJ001, PRJ002, ... (more digits once the number passes 999)."""
+    return f"{PROJECT_ID_PREFIX}{number:03d}"
+
+
+def project_number(project_id):
+    """
+    Returns the number of a "PRJxxx" id, or None for ids in another format.
+    """
+    pid = str(project_id or "")
+    if pid.startswith(PROJECT_ID_PREFIX) and pid[len(PROJECT_ID_PREFIX):].isdigit():
+        return int(pid[len(PROJECT_ID_PREFIX):])
+    return None
+
+
+def next_number_after(project_ids):
+    """
+    Returns 1 + the highest PRJ number among `project_ids` (1 if there is none).
+    """
+    numbers = (project_number(pid) for pid in project_ids)
+    return max((n for n in numbers if n is not None), default=0) + 1
+
+
+class IdSequence:
+    """
+    Persistent counter stored in a small text file (the next free number),
+    shared by every process that uses the same Dataset directory.
+
+    reserve(count) takes the file lock, reads the counter, writes
+    counter + count and returns the first number of the block, so a single
+    id or a whole block for a bulk import costs one tiny read and write no
+    matter how many projects exist. Numbers are never handed out twice;
+    a block that is not used leaves a gap.
+
+    The first call (no counter file yet) asks `seed()` for the first free
+    number, e.g. by scanning the existing project ids once.
+    """
+
+    def __init__(self, path, timeout=10.0):
+        self.path = path
+        self.lock = FileLock(path + ".lock", timeout=timeout)
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, value):
+        # Ghi file tạm rồi thay thế, để không bao giờ đọc được bộ đếm ghi dở
+        JsonFileFactory.write_atomic(str(value), self.path)
+
+    def reserve(self, count=1, seed=None, at_least=None):
+        """
+        Reserves `count` consecutive numbers and returns the first one.
+        `at_least` moves the counter forward first (used when ids were created
+        without the sequence, e.g. by an import script).
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        with self.lock:
+            first = self._read()
+            if first is None:
+                first = seed() if seed is not None else 1
+            if at_least is not None:
+                first = max(first, at_least)
+            self._write(first + count)
+            return first
+
+    def peek(self):
+        """Returns the next number that reserve() would hand out (None before the first call)."""
+        return self._read()
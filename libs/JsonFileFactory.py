@@ -1,29 +1,23 @@
 import json
 import os
+import re
+import threading
+import time
+
+_SKIP_SEPARATORS = re.compile(r"[\s,]*")
+
 
 class JsonFileFactory:
     def write_data(self, arr_data, filename):
         """
         Converts a list of objects OR dicts to JSON and writes it to the specified file.
+        The file is replaced atomically (see write_atomic).
         """
         try:
-            new_list = []
-            for item in arr_data:
-                if isinstance(item, dict):
-                    # Nếu item là dict, ta giữ nguyên
-                    new_list.append(item)
-                else:
-                    # Nếu item là object, ta dùng item.__dict__
-                    new_list.append(item.__dict__)
-
-            json_string = json.dumps(
-                new_list,
-                default=str,
-                indent=4,
-                ensure_ascii=False
-            )
-            with open(filename, 'w', encoding='utf-8') as json_file:
-                json_file.write(json_string)
+            # dict giữ nguyên, object dùng to_dict() (model) hoặc __dict__
+            new_list = [self.encode(item) for item in arr_data]
+
+            self.write_atomic(self.dumps_list(new_list), filename)
             return True
         except Exception as e:
             print("Error writing data to JSON:", e)
@@ -47,17 +41,186 @@ class JsonFileFactory:
             if ClassName is dict:
                 return data
 
+            decode = getattr(ClassName, "from_dict", None)
+            if decode is not None:
+                # Đường nhanh: 1 try cho cả danh sách, chỉ khi có item lỗi mới xử lý từng item
+                try:
+                    return [decode(item) for item in data]
+                except (KeyError, TypeError, AttributeError):
+                    pass
+
             arr_data = []
             for item in data:
-                if not isinstance(item, dict):
-                    continue
-                try:
-                    obj = ClassName(**item)
+                obj = self.build_object(item, ClassName)
+                if obj is not None:
                     arr_data.append(obj)
-                except TypeError as e:
-                    print(f"Error constructing {ClassName.__name__} from item:", item, "->", e)
 
             return arr_data
         except Exception as e:
             print("Error reading data from JSON:", e)
             return []
+
+    @staticmethod
+    def write_atomic(text, filename):
+        """
+        Writes text to a temporary file next to `filename`, flushes it to disk and
+        renames it over `filename`, so readers (in any process) see either the old
+        or the new file, never a half-written one.
+        """
+        tmp_file = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            JsonFileFactory.replace_file(tmp_file, filename)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+    @staticmethod
+    def replace_file(src, dst, retries=20):
+        """
+        os.replace with a few retries: on Windows the rename fails while another
+        process has `dst` open for reading.
+        """
+        for attempt in range(retries):
+            try:
+                os.replace(src, dst)
+                return
+            except PermissionError:
+                if attempt == retries - 1:
+                    raise
+                time.sleep(0.01 * (attempt + 1))
+
+    @staticmethod
+    def dumps_list(dicts):
+        """
+        Serializes a list of dicts as a JSON array with one object per line.
+        Unlike indent=4 (pure-Python encoder) this uses the C encoder for every item.
+        """
+        if not dicts:
+            return "[]"
+        encode = json.JSONEncoder(default=str, ensure_ascii=False).encode
+        return "[\n    " + ",\n    ".join(encode(d) for d in dicts) + "\n]"
+
+    @staticmethod
+    def encode(item):
+        """
+        Returns the JSON-ready dict for a dict or a model object.
+        """
+        if isinstance(item, dict):
+            return item
+        to_dict = getattr(item, "to_dict", None)
+        return to_dict() if to_dict is not None else item.__dict__
+
+    @staticmethod
+    def build_object(item, ClassName):
+        """
+        Builds one ClassName object from a dict (or returns the dict if ClassName is dict).
+        Model classes are decoded with ClassName.from_dict, other classes through **kwargs.
+        Returns None if the item cannot be converted.
+        """
+        if not isinstance(item, dict):
+            return None
+        if ClassName is dict:
+            return item
+        try:
+            decode = getattr(ClassName, "from_dict", None)
+            return decode(item) if decode is not None else ClassName(**item)
+        except (KeyError, TypeError) as e:
+            print(f"Error constructing {ClassName.__name__} from item:", item, "->", e)
+            return None
+
+    def iter_data(self, filename, ClassName, chunk_size=64 * 1024):
+        """
+        Yields ClassName objects (or dicts) one by one instead of loading the whole file.
+        Works with a JSON array file, or a JSON Lines file (*.jsonl, one object per line).
+        Only one chunk of text and one item are held in memory at a time,
+        and the caller can stop early by breaking out of the loop.
+        """
+        if not os.path.isfile(filename):
+            return
+        if filename.endswith(".jsonl"):
+            yield from self._iter_json_lines(filename, ClassName)
+        else:
+            yield from self._iter_json_array(filename, ClassName, chunk_size)
+
+    def _iter_json_lines(self, filename, ClassName):
+        with open(filename, 'r', encoding='utf-8') as file:
+            for line_no, line in enumerate(file, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError as e:
+                    print(f"Error reading line {line_no} of {filename}:", e)
+                    continue
+                obj = self.build_object(item, ClassName)
+                if obj is not None:
+                    yield obj
+
+    def _iter_json_array(self, filename, ClassName, chunk_size):
+        decoder = json.JSONDecoder()
+        with open(filename, 'r', encoding='utf-8') as file:
+            buf = ""
+            pos = 0
+            started = False
+            while True:
+                pos = _SKIP_SEPARATORS.match(buf, pos).end()
+                if pos >= len(buf):
+                    more = file.read(chunk_size)
+                    if not more:
+                        if started:
+                            print("Unexpected end of JSON array in", filename)
+                        return
+                    buf, pos = buf[pos:] + more, 0
+                    continue
+                if not started:
+                    if buf[pos] != "[":
+                        print("Expected a JSON array in", filename)
+                        return
+                    started = True
+                    pos += 1
+                    continue
+                if buf[pos] == "]":
+                    return
+                try:
+                    item, pos = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    # Item cut at the end of the chunk: read more and retry
+                    more = file.read(chunk_size)
+                    if not more:
+                        print("Error reading data from JSON: truncated item in", filename)
+                        return
+                    buf, pos = buf[pos:] + more, 0
+                    continue
+                obj = self.build_object(item, ClassName)
+                if obj is not None:
+                    yield obj
+                if pos > chunk_size:
+                    buf, pos = buf[pos:], 0
+
+    def write_lines(self, items, filename):
+        """
+        Writes objects OR dicts as JSON Lines, one item at a time (items may be a generator),
+        into a temporary file that then replaces `filename`.
+        Returns the number of items written, or -1 on error.
+        """
+        tmp_file = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            count = 0
+            with open(tmp_file, 'w', encoding='utf-8') as json_file:
+                for item in items:
+                    data = self.encode(item)
+                    json_file.write(json.dumps(data, default=str, ensure_ascii=False) + "\n")
+                    count += 1
+            self.replace_file(tmp_file, filename)
+            return count
+        except Exception as e:
+            print("Error writing JSON Lines:", e)
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return -1
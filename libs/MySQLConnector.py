@@ -1,36 +1,663 @@
-"""Lỗi - Rejected File"""
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+
 import mysql.connector
+from mysql.connector import pooling
+from mysql.connector.constants import ClientFlag
+
+from libs.EventBus import NOTIFICATION_ADDED
+from libs.IdAllocator import format_project_id
+from libs.StorageBackend import StorageBackend, PROJECT_COLUMNS, PROJECT_SUMMARY_COLUMNS, NOTIFICATION_COLUMNS
+from libs.Versioning import VersionConflictError, check_versions
+
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS projects (
+        seq            INT AUTO_INCREMENT PRIMARY KEY,
+        project_id     VARCHAR(64) NOT NULL UNIQUE,
+        name           VARCHAR(255) NOT NULL DEFAULT '',
+        assignment     TEXT,
+        manager        VARCHAR(255) NOT NULL DEFAULT '',
+        status         VARCHAR(32) NOT NULL DEFAULT 'Open',
+        progress       INT NOT NULL DEFAULT 0,
+        start_date     VARCHAR(32) NOT NULL DEFAULT '',
+        end_date       VARCHAR(32) NOT NULL DEFAULT '',
+        color          VARCHAR(16) NOT NULL DEFAULT '#FF6B6B',
+        priority       VARCHAR(32) NOT NULL DEFAULT 'Normal',
+        description    TEXT,
+        attachments    TEXT,
+        dependency     VARCHAR(255) NOT NULL DEFAULT '',
+        estimated_time VARCHAR(64) NOT NULL DEFAULT '',
+        view_gantt     TINYINT NOT NULL DEFAULT 0,
+        view_kanban    TINYINT NOT NULL DEFAULT 0,
+        drag_and_drop  TINYINT NOT NULL DEFAULT 0,
+        version        INT NOT NULL DEFAULT 0,
+        INDEX idx_projects_status (status),
+        INDEX idx_projects_manager (manager),
+        INDEX idx_projects_priority (priority)
+    ) CHARACTER SET utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        seq         INT AUTO_INCREMENT PRIMARY KEY,
+        Username    VARCHAR(255) NOT NULL UNIQUE,
+        Name        VARCHAR(255) NOT NULL DEFAULT '',
+        Email       VARCHAR(255) NOT NULL DEFAULT '',
+        EmailNorm   VARCHAR(255) NOT NULL DEFAULT '',
+        PhoneNum    VARCHAR(32) NOT NULL DEFAULT '',
+        Password    VARCHAR(128) NOT NULL DEFAULT '',
+        Avatar      TEXT,
+        INDEX idx_users_email (EmailNorm)
+    ) CHARACTER SET utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS notifications (
+        id          INT AUTO_INCREMENT PRIMARY KEY,
+        username    VARCHAR(255) NOT NULL DEFAULT '',
+        action      VARCHAR(255) NOT NULL DEFAULT '',
+        project_id  VARCHAR(64) NOT NULL DEFAULT '',
+        time_str    VARCHAR(64) NOT NULL DEFAULT '',
+        INDEX idx_notifications_username (username)
+    ) CHARACTER SET utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS id_sequences (
+        name        VARCHAR(64) PRIMARY KEY,
+        next_value  BIGINT NOT NULL
+    ) CHARACTER SET utf8mb4
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS project_history (
+        id          BIGINT AUTO_INCREMENT PRIMARY KEY,
+        ts          DOUBLE NOT NULL,
+        project_id  VARCHAR(64) NOT NULL,
+        entry       LONGTEXT NOT NULL,
+        INDEX idx_history_project (project_id, ts),
+        INDEX idx_history_ts (ts)
+    ) CHARACTER SET utf8mb4
+    """,
+]
+
+# Cột thêm sau này: CREATE TABLE IF NOT EXISTS không thêm chúng vào bảng đã có sẵn
+# (AUTO_INCREMENT phải có index, nên seq được thêm kèm UNIQUE; các dòng cũ được đánh số theo thứ tự khoá chính)
+MIGRATIONS = [
+    ("projects", "version", "INT NOT NULL DEFAULT 0"),
+    ("projects", "seq", "INT NOT NULL AUTO_INCREMENT UNIQUE"),
+    ("users", "seq", "INT NOT NULL AUTO_INCREMENT UNIQUE"),
+]
+
+
+class MySQLConnector(StorageBackend):
+    """
+    MySQL/MariaDB storage with the same methods as DataConnector.
+    Uses the same row layout as SQLiteConnector (lists stored as JSON text).
 
-class MySQLConnector:
-    def __init__(self, host, user, password, database):
-        self.conn = mysql.connector.connect(
-            host="localhost",
-            port=3306,
-            user="root",
-            password="",
-            database="procheck_db"
+    Connections come from a pool; each public method borrows one connection and
+    runs in a single transaction. Bulk writes are sent with executemany in
+    batches of `batch_size` rows (one round trip per batch), and large reads
+    are streamed with an unbuffered cursor and fetchmany. Every saved change is
+    also kept in project_history (see StorageBackend.get_project_at).
+    """
+
+    name = "mysql"
+
+    def __init__(self, host="localhost", user="root", password="", database="procheck_db",
+                 port=3306, pool_name="procheck_pool", pool_size=5, batch_size=1000):
+        self.database = database
+        self.batch_size = batch_size
+        self.pool = pooling.MySQLConnectionPool(
+            pool_name=pool_name,
+            pool_size=pool_size,
+            pool_reset_session=True,
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            database=database,
+            charset="utf8mb4",
+            autocommit=False,
+            client_flags=[ClientFlag.FOUND_ROWS]  # rowcount = matched rows, not changed rows
         )
-        self.cursor = self.conn.cursor(dictionary=True)
+        with self.transaction() as cursor:
+            for statement in SCHEMA:
+                cursor.execute(statement)
+            self._migrate(cursor)
+            # Mốc bắt đầu lịch sử (project_id rỗng): trước thời điểm này không dựng lại được dữ liệu
+            cursor.execute(
+                "INSERT INTO project_history (ts, project_id, entry) SELECT %s, '', '{\"op\": \"start\"}' "
+                "FROM DUAL WHERE NOT EXISTS (SELECT 1 FROM project_history)", (time.time(),)
+            )
+
+    @staticmethod
+    def _migrate(cursor):
+        """
+        Adds the MIGRATIONS columns missing from tables created by an older version of the app.
+        """
+        cursor.execute(
+            "SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE()"
+        )
+        existing = {(r["table_name"], r["column_name"]) for r in cursor.fetchall()}
+        for table, column, definition in MIGRATIONS:
+            if (table, column) not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Borrows a pooled connection and yields a dictionary cursor.
+        Commits on success, rolls back on error; the connection always goes back to the pool.
+        """
+        conn = self.pool.get_connection()
+        cursor = conn.cursor(dictionary=True, buffered=True)
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _batches(self, items):
+        for start in range(0, len(items), self.batch_size):
+            yield items[start:start + self.batch_size]
+
+    def _write(self, sql, params=None, many=False):
+        try:
+            with self.transaction() as cursor:
+                if many:
+                    for batch in self._batches(params):
+                        cursor.executemany(sql, batch)
+                else:
+                    cursor.execute(sql, params)
+                return cursor.rowcount
+        except mysql.connector.Error as e:
+            print("Error writing to MySQL:", e)
+            return -1
+
+    def _query(self, sql, params=None, one=False):
+        with self.transaction() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone() if one else cursor.fetchall()
+
+    def stream(self, sql, params=None):
+        """
+        Yields rows of a large result set batch by batch without buffering it client-side.
+        The pooled connection is held until the generator is exhausted or closed.
+        """
+        conn = self.pool.get_connection()
+        cursor = conn.cursor(dictionary=True, buffered=False)
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            try:
+                cursor.fetchall()  # stopped early: drain the rest so the connection can be reused
+            except mysql.connector.Error:
+                pass
+            cursor.close()
+            conn.close()
+
+    # ----- Projects -----
+    _UPSERT_PROJECT = (
+        f"INSERT INTO projects ({', '.join(PROJECT_COLUMNS)}) "
+        f"VALUES ({', '.join('%(' + c + ')s' for c in PROJECT_COLUMNS)}) "
+        f"ON DUPLICATE KEY UPDATE "
+        + ", ".join(f"{c} = VALUES({c})" for c in PROJECT_COLUMNS if c != "project_id")
+    )
+
+    # Chỉ cập nhật các cột summary: description/attachments đang lưu được giữ nguyên
+    _UPSERT_PROJECT_SUMMARY = (
+        f"INSERT INTO projects ({', '.join(PROJECT_SUMMARY_COLUMNS)}) "
+        f"VALUES ({', '.join('%(' + c + ')s' for c in PROJECT_SUMMARY_COLUMNS)}) "
+        f"ON DUPLICATE KEY UPDATE "
+        + ", ".join(f"{c} = VALUES({c})" for c in PROJECT_SUMMARY_COLUMNS if c != "project_id")
+    )
 
     def fetch_all_projects(self):
-        self.cursor.execute("SELECT * FROM projects")
-        return self.cursor.fetchall()
+        return self._query("SELECT * FROM projects ORDER BY seq")
 
     def insert_project(self, project_data):
         sql = """
-        INSERT INTO projects (project_id, name, assignment, manager, status, progress, 
+        INSERT INTO projects (project_id, name, assignment, manager, status, progress,
         start_date, end_date, priority, dependency, description, attachments)
-        VALUES (%(project_id)s, %(name)s, %(assignment)s, %(manager)s, %(status)s, 
-        %(progress)s, %(start_date)s, %(end_date)s, %(priority)s, %(dependency)s, 
+        VALUES (%(project_id)s, %(name)s, %(assignment)s, %(manager)s, %(status)s,
+        %(progress)s, %(start_date)s, %(end_date)s, %(priority)s, %(dependency)s,
         %(description)s, %(attachments)s)
         """
-        self.cursor.execute(sql, project_data)
-        self.conn.commit()
+        return self._write(sql, project_data) >= 0
+
+    def get_all_projects(self):
+        return [self.row_to_project(r) for r in self.fetch_all_projects()]
+
+    def get_project_summaries(self):
+        """
+        Returns every project without transferring description/attachments; they are
+        fetched on first access, or per batch with load_project_details().
+        """
+        rows = self._query(f"SELECT {', '.join(PROJECT_SUMMARY_COLUMNS)} FROM projects ORDER BY seq")
+        return [self.row_to_summary(r, self._project_details) for r in rows]
+
+    def _fetch_details(self, project_ids):
+        for batch in self._batches(project_ids):
+            placeholders = ", ".join(["%s"] * len(batch))
+            yield from self._query(
+                f"SELECT project_id, description, attachments FROM projects WHERE project_id IN ({placeholders})",
+                batch
+            )
+
+    def _project_details(self, project_id):
+        """Loader of one summary (see Project.summary)."""
+        try:
+            rows = list(self._fetch_details([str(project_id)]))
+        except mysql.connector.Error as e:
+            print("Error loading project details from MySQL:", e)
+            return None
+        return self.row_to_details(rows[0]) if rows else {}
+
+    def load_project_details(self, projects):
+        """
+        Fetches description/attachments of the summaries in `projects`, one query per batch.
+        """
+        try:
+            self._fill_details(projects, self._fetch_details)
+        except mysql.connector.Error as e:
+            print("Error loading project details from MySQL:", e)
+
+    def iter_projects(self):
+        """
+        Streams every project in insertion order.
+        """
+        for row in self.stream("SELECT * FROM projects ORDER BY seq"):
+            yield self.row_to_project(row)
+
+    def get_projects_by_status(self, status):
+        rows = self._query("SELECT * FROM projects WHERE status = %s ORDER BY seq", (status,))
+        return [self.row_to_project(r) for r in rows]
+
+    def get_projects_by_assignee(self, username):
+        rows = self._query(
+            "SELECT * FROM projects WHERE JSON_CONTAINS(assignment, JSON_QUOTE(%s)) ORDER BY seq", (username,)
+        )
+        return [self.row_to_project(r) for r in rows]
+
+    def get_projects_by_manager(self, manager):
+        rows = self._query("SELECT * FROM projects WHERE manager = %s ORDER BY seq", (manager,))
+        return [self.row_to_project(r) for r in rows]
+
+    def get_projects_by_priority(self, priority):
+        rows = self._query("SELECT * FROM projects WHERE priority = %s ORDER BY seq", (priority,))
+        return [self.row_to_project(r) for r in rows]
+
+    def count_projects(self, status=None):
+        if status is None:
+            row = self._query("SELECT COUNT(*) AS n FROM projects", one=True)
+        else:
+            row = self._query("SELECT COUNT(*) AS n FROM projects WHERE status = %s", (status,), one=True)
+        return row["n"]
+
+    def find_projects(self, query, limit=None):
+        pattern = "%" + query.strip().lower() + "%"
+        sql = "SELECT * FROM projects WHERE LOWER(project_id) LIKE %s OR LOWER(name) LIKE %s ORDER BY seq"
+        params = [pattern, pattern]
+        if limit is not None:
+            sql += " LIMIT %s"
+            params.append(int(limit))
+        return [self.row_to_project(r) for r in self._query(sql, params)]
+
+    def _change_stamp(self):
+        """
+        Row count, version sum and highest seq of the projects table: one aggregate row
+        instead of streaming the table. Every saved change bumps a version, an insert a seq.
+        """
+        row = self._query(
+            "SELECT COUNT(*) AS n, COALESCE(SUM(version), 0) AS versions, COALESCE(MAX(seq), 0) AS last_seq "
+            "FROM projects", one=True
+        )
+        return (row["n"], int(row["versions"]), row["last_seq"]) if row else None
+
+    def get_project_by_projectid(self, project_id):
+        row = self._query("SELECT * FROM projects WHERE project_id = %s", (str(project_id),), one=True)
+        return self.row_to_project(row) if row else None
+
+    def _stored_rows(self, cursor, project_ids):
+        """
+        {project_id: stored row} of `project_ids`, locked with FOR UPDATE, one query per batch.
+        """
+        rows = {}
+        for batch in self._batches(project_ids):
+            placeholders = ", ".join(["%s"] * len(batch))
+            cursor.execute(f"SELECT * FROM projects WHERE project_id IN ({placeholders}) FOR UPDATE", batch)
+            rows.update((r["project_id"], r) for r in cursor.fetchall())
+        return rows
+
+    def _record_history(self, cursor, before, params, removed):
+        # Trong giao dịch ghi; ts cắt tới ms như lịch sử JSON
+        entries = self._history_entries(before, params, removed, int(time.time() * 1000) / 1000)
+        for batch in self._batches(entries):
+            cursor.executemany("INSERT INTO project_history (ts, project_id, entry) VALUES (%s, %s, %s)", batch)
+
+    def _read_history(self, project_id=None, since=None):
+        sql = "SELECT entry FROM project_history WHERE project_id != ''"
+        params = []
+        if project_id is not None:
+            sql += " AND project_id = %s"
+            params.append(str(project_id))
+        if since is not None:
+            sql += " AND ts >= %s"
+            params.append(since)
+        for row in self._query(sql + " ORDER BY id", tuple(params)):
+            yield json.loads(row["entry"])
+
+    def _history_start(self):
+        row = self._query("SELECT ts FROM project_history ORDER BY id LIMIT 1", one=True)
+        return row["ts"] if row else None
+
+    def _write_projects(self, projects, complete=False, deleted=(), notifications=()):
+        """
+        Upserts the projects of `projects` that differ from their stored row in one
+        transaction (complete=True: other ids are deleted), together with deleting the
+        ids in `deleted` and inserting `notifications`, one round trip per batch; every
+        change is also added to project_history. The stored rows are read with FOR UPDATE, so no other
+        client can save them in between; raises VersionConflictError (nothing written)
+        if one of the projects was saved by someone else since it was read.
+        Returns the stored rows it replaced or deleted ({project_id: row}).
+        """
+        with self.transaction() as cursor:
+            ids = [str(p.project_id) for p in projects]
+            before = self._stored_rows(cursor, list(dict.fromkeys(ids + list(deleted))))
+            check_versions({str(p.project_id): p.version or 0 for p in projects},
+                           {pid: before[pid]["version"] for pid in ids if pid in before})
+            if complete:
+                cursor.execute("CREATE TEMPORARY TABLE IF NOT EXISTS keep_ids (project_id VARCHAR(64) PRIMARY KEY)")
+                cursor.execute("DELETE FROM keep_ids")
+                for batch in self._batches([(pid,) for pid in ids]):
+                    cursor.executemany("INSERT IGNORE INTO keep_ids VALUES (%s)", batch)
+                cursor.execute(
+                    "SELECT p.* FROM projects p LEFT JOIN keep_ids k ON k.project_id = p.project_id "
+                    "WHERE k.project_id IS NULL FOR UPDATE"
+                )
+                before.update((r["project_id"], r) for r in cursor.fetchall())
+                cursor.execute(
+                    "DELETE p FROM projects p LEFT JOIN keep_ids k ON k.project_id = p.project_id "
+                    "WHERE k.project_id IS NULL"
+                )
+            for batch in self._batches(list(deleted)):
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(f"DELETE FROM projects WHERE project_id IN ({placeholders})", batch)
+            # Chỉ ghi (và tăng version) các project khác với dòng đang lưu
+            params, changed = self._changed_params([p for p in projects if p.details_loaded], before)
+            for batch in self._batches(params):
+                cursor.executemany(self._UPSERT_PROJECT, batch)
+            # Summary chưa nạp description/attachments: không cần đọc chúng chỉ để ghi lại y nguyên
+            summary_params, changed_summaries = self._changed_params(
+                [p for p in projects if not p.details_loaded], before, PROJECT_SUMMARY_COLUMNS)
+            for batch in self._batches(summary_params):
+                cursor.executemany(self._UPSERT_PROJECT_SUMMARY, batch)
+            kept = set(ids)
+            self._record_history(cursor, before, params + summary_params, [pid for pid in before if pid not in kept])
+            rows = [{c: n.get(c, "") for c in NOTIFICATION_COLUMNS} for n in notifications]
+            for batch in self._batches(rows):
+                cursor.executemany(self._INSERT_NOTIFICATION, batch)
+        for p in changed + changed_summaries:
+            p.version = (p.version or 0) + 1
+        return before
+
+    def _save(self, projects, complete=False, deleted=(), notifications=()):
+        deleted = [str(pid) for pid in deleted]
+        try:
+            before = self._write_projects(projects, complete, deleted, notifications)
+        except VersionConflictError as e:
+            print("Error saving projects to MySQL:", e)
+            self._revert_conflicts(projects, e)
+            return False
+        except mysql.connector.Error as e:
+            print("Error saving projects to MySQL:", e)
+            return False
+        before = self._stored_images(before)
+        self._publish_saved(before, projects, complete)
+        if deleted and before is not None:
+            self._publish_deleted({pid: before[pid] for pid in deleted if pid in before})
+        for notification in notifications:
+            self.events.emit(NOTIFICATION_ADDED, notification)
+        return True
+
+    def save_project(self, project):
+        return self._save([project])
+
+    def save_projects(self, projects):
+        """
+        Upserts several projects in one transaction, one round trip per batch.
+        """
+        if not projects:
+            return True
+        return self._save(list(projects))
+
+    def save_all_projects(self, projects):
+        """
+        Makes the table match `projects`: missing ids are deleted, the rest upserted,
+        all in one transaction.
+        """
+        return self._save(list(projects), complete=True)
+
+    def commit_bulk(self, projects=(), deleted=(), notifications=()):
+        """
+        Upserts `projects`, deletes the ids in `deleted` and inserts `notifications`
+        in one transaction (nothing is written on a version conflict).
+        """
+        return self._save(list(projects), deleted=deleted, notifications=list(notifications))
 
     def delete_project(self, project_id):
-        sql = "DELETE FROM projects WHERE project_id = %s"
-        self.cursor.execute(sql, (project_id,))
-        self.conn.commit()
+        return self.delete_projects([project_id]) >= 0
+
+    def delete_projects(self, project_ids):
+        """
+        Deletes many projects in one transaction with one DELETE ... IN (...) per batch.
+        Returns the number of deleted rows, or -1 on error.
+        """
+        ids = [str(pid) for pid in project_ids]
+        deleted = 0
+        try:
+            with self.transaction() as cursor:
+                before = self._stored_rows(cursor, ids)
+                for batch in self._batches(ids):
+                    placeholders = ", ".join(["%s"] * len(batch))
+                    cursor.execute(f"DELETE FROM projects WHERE project_id IN ({placeholders})", batch)
+                    deleted += cursor.rowcount
+                self._record_history(cursor, before, [], list(before))
+        except mysql.connector.Error as e:
+            print("Error deleting projects from MySQL:", e)
+            return -1
+        self._publish_deleted(self._stored_images(before))
+        return deleted
+
+    # Số PRJ tiếp theo sau id lớn nhất hiện có (chỉ dùng khi khởi tạo / sửa sequence)
+    _NEXT_PROJECT_NUMBER = (
+        "SELECT COALESCE(MAX(CAST(SUBSTRING(project_id, 4) AS UNSIGNED)), 0) + 1 "
+        "FROM projects WHERE project_id REGEXP '^PRJ[0-9]+$'"
+    )
+
+    @staticmethod
+    def _take_project_numbers(cursor, count):
+        cursor.execute(
+            "UPDATE id_sequences SET next_value = next_value + %s WHERE name = 'project_id'", (count,)
+        )
+        cursor.execute("SELECT next_value FROM id_sequences WHERE name = 'project_id'")
+        first = cursor.fetchone()["next_value"] - count
+        return [format_project_id(n) for n in range(first, first + count)]
+
+    def _any_project_exists(self, cursor, project_ids):
+        for batch in self._batches(project_ids):
+            placeholders = ", ".join(["%s"] * len(batch))
+            cursor.execute(f"SELECT 1 FROM projects WHERE project_id IN ({placeholders}) LIMIT 1", batch)
+            if cursor.fetchone():
+                return True
+        return False
+
+    def reserve_project_ids(self, count):
+        """
+        Reserves `count` project ids from the id_sequences table in one transaction.
+        The UPDATE locks the sequence row until commit, so concurrent clients
+        always get disjoint blocks. Returns [] on error.
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(
+                    "INSERT IGNORE INTO id_sequences (name, next_value) "
+                    f"SELECT 'project_id', ({self._NEXT_PROJECT_NUMBER})"
+                )
+                ids = self._take_project_numbers(cursor, count)
+                if self._any_project_exists(cursor, ids):
+                    # Có project được thêm không qua sequence (import, script): nhảy qua id lớn nhất
+                    cursor.execute(
+                        "UPDATE id_sequences SET next_value = "
+                        f"GREATEST(next_value, ({self._NEXT_PROJECT_NUMBER})) WHERE name = 'project_id'"
+                    )
+                    ids = self._take_project_numbers(cursor, count)
+            return ids
+        except mysql.connector.Error as e:
+            print("Error reserving project ids in MySQL:", e)
+            return []
+
+    # ----- Users -----
+    _UPSERT_USER = (
+        "INSERT INTO users (Username, Name, Email, EmailNorm, PhoneNum, Password, Avatar) "
+        "VALUES (%(Username)s, %(Name)s, %(Email)s, %(EmailNorm)s, %(PhoneNum)s, %(Password)s, %(Avatar)s) "
+        "ON DUPLICATE KEY UPDATE Name = VALUES(Name), Email = VALUES(Email), "
+        "EmailNorm = VALUES(EmailNorm), PhoneNum = VALUES(PhoneNum), "
+        "Password = VALUES(Password), Avatar = VALUES(Avatar)"
+    )
+
+    def get_all_users(self):
+        return [self.row_to_user(r) for r in self._query("SELECT * FROM users ORDER BY seq")]
+
+    def get_user_by_username(self, username):
+        row = self._query("SELECT * FROM users WHERE Username = %s", (username,), one=True)
+        return self.row_to_user(row) if row else None
+
+    def get_user_by_email(self, email):
+        row = self._query(
+            "SELECT * FROM users WHERE EmailNorm = %s ORDER BY seq LIMIT 1",
+            ((email or "").strip().lower(),), one=True
+        )
+        return self.row_to_user(row) if row else None
+
+    def add_user(self, user):
+        """
+        Adds a new user. The user's password is hashed before saving.
+        """
+        user.Password = hashlib.sha256(user.Password.encode()).hexdigest()
+        return self.save_user(user)
+
+    def save_user(self, user):
+        return self._write(self._UPSERT_USER, self.user_to_params(user)) >= 0
+
+    def delete_user(self, username):
+        return self._write("DELETE FROM users WHERE Username = %s", (username,)) >= 0
+
+    def save_all_users(self, users):
+        try:
+            with self.transaction() as cursor:
+                cursor.execute("DELETE FROM users")
+                for batch in self._batches([self.user_to_params(u) for u in users]):
+                    cursor.executemany(self._UPSERT_USER, batch)
+            return True
+        except mysql.connector.Error as e:
+            print("Error saving users to MySQL:", e)
+            return False
+
+    def login(self, username, password):
+        hashed_input = hashlib.sha256(password.encode()).hexdigest()
+        row = self._query(
+            "SELECT * FROM users WHERE Username = %s AND Password = %s", (username, hashed_input), one=True
+        )
+        return self.row_to_user(row) if row else None
+
+    def update_password(self, email, new_password):
+        """
+        Updates the password of the user with the given email.
+        Returns True if a row was changed.
+        """
+        hashed = hashlib.sha256(new_password.encode()).hexdigest()
+        changed = self._write(
+            "UPDATE users SET Password = %s WHERE EmailNorm = %s ORDER BY seq LIMIT 1",
+            (hashed, (email or "").strip().lower())
+        )
+        if changed == 0:
+            print("No matching user found for email:", email)
+        return changed > 0
+
+    # ----- Notifications -----
+    _INSERT_NOTIFICATION = (
+        "INSERT INTO notifications (username, action, project_id, time_str) "
+        "VALUES (%(username)s, %(action)s, %(project_id)s, %(time_str)s)"
+    )
+
+    def save_notifications(self, notifications):
+        """
+        Replaces all notifications with the given list of dicts.
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.execute("DELETE FROM notifications")
+                rows = [{c: n.get(c, "") for c in NOTIFICATION_COLUMNS} for n in notifications]
+                for batch in self._batches(rows):
+                    cursor.executemany(self._INSERT_NOTIFICATION, batch)
+            return True
+        except mysql.connector.Error as e:
+            print("Error saving notifications to MySQL:", e)
+            return False
+
+    def add_notification(self, notification):
+        if self._write(self._INSERT_NOTIFICATION, {c: notification.get(c, "") for c in NOTIFICATION_COLUMNS}) < 0:
+            return False
+        self.events.emit(NOTIFICATION_ADDED, notification)
+        return True
+
+    def get_recent_notifications(self, limit=20, offset=0):
+        return self._query(
+            "SELECT username, action, project_id, time_str FROM notifications "
+            "ORDER BY id DESC LIMIT %s OFFSET %s", (int(limit), int(offset))
+        )
+
+    def load_notifications(self):
+        return self._query("SELECT username, action, project_id, time_str FROM notifications ORDER BY id")
+
+    # ----- Migration -----
+    def import_from_json(self, dc):
+        """
+        One-shot import of projects, users and notifications from a DataConnector,
+        in one transaction with batched executemany. Existing rows with the same keys
+        are replaced. Passwords are copied as-is since they are already hashed.
+        """
+        projects = dc.get_all_projects()
+        users = dc.get_all_users()
+        notifications = dc.load_notifications()
+        try:
+            with self.transaction() as cursor:
+                for batch in self._batches([self.project_to_params(p) for p in projects]):
+                    cursor.executemany(self._UPSERT_PROJECT, batch)
+                for batch in self._batches([self.user_to_params(u) for u in users]):
+                    cursor.executemany(self._UPSERT_USER, batch)
+                cursor.execute("DELETE FROM notifications")
+                rows = [{c: n.get(c, "") for c in NOTIFICATION_COLUMNS} for n in notifications]
+                for batch in self._batches(rows):
+                    cursor.executemany(self._INSERT_NOTIFICATION, batch)
+        except mysql.connector.Error as e:
+            print("Error importing JSON data into MySQL:", e)
+            return None
+        return {"projects": len(projects), "users": len(users), "notifications": len(notifications)}
 
     def close(self):
-        self.conn.close()
+        # Connections are returned to the pool after every call; nothing stays open.
+        pass
+
@@ -0,0 +1,241 @@
+import json
+import os
+
+from libs.FileLock import FileLock
+
+
+class NotificationLog:
+    """
+    Append-only notification history split into size-limited segment files:
+
+        Dataset/notifications/
+            index.json            sealed segments (name + entry count) and the active one
+            seg-000001.jsonl      one JSON notification per line, oldest first
+            seg-000002.jsonl      <- active segment, the only file that is appended to
+            archive/              sealed segments moved out by archive()
+
+    Adding a notification is a single append to the active segment; the index is
+    only rewritten when a segment is sealed (rotation) or archived. Paging reads
+    segments from the newest backwards and skips whole sealed segments using
+    their counts, so showing the latest N entries never loads the full history.
+    Writers in several processes are serialized with a lock file next to the
+    log directory (notifications.lock), so rotation never seals a segment twice.
+    """
+
+    DEFAULT_SEGMENT_SIZE = 64 * 1024  # bytes
+    INDEX_FILE = "index.json"
+    ARCHIVE_DIR = "archive"
+
+    def __init__(self, log_dir, segment_size=DEFAULT_SEGMENT_SIZE, legacy_file=None):
+        self.log_dir = log_dir
+        self.segment_size = segment_size
+        self.legacy_file = legacy_file
+        self.index_file = os.path.join(log_dir, self.INDEX_FILE)
+        self.lock = FileLock(os.path.normpath(log_dir) + ".lock")
+        self._index = None
+        self._index_signature = None
+
+    # ----- Index -----
+    @staticmethod
+    def segment_name(seq):
+        return f"seg-{seq:06d}.jsonl"
+
+    def _signature(self):
+        try:
+            st = os.stat(self.index_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load_index(self):
+        signature = self._signature()
+        if self._index is not None and signature == self._index_signature:
+            return self._index
+        if signature is None:
+            with self.lock:
+                # Tiến trình khác có thể vừa tạo log trong lúc chờ khoá
+                if self._signature() is None:
+                    self._create()
+                    return self._index
+            return self._load_index()
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        except Exception as e:
+            print("Error reading notification index:", e)
+            self._index = {"next_seq": 2, "active": self.segment_name(1), "segments": [], "archived": []}
+        self._index_signature = signature
+        return self._index
+
+    def _save_index(self, index):
+        tmp_file = self.index_file + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print("Error writing notification index:", e)
+            return False
+        self._index = index
+        self._index_signature = self._signature()
+        return True
+
+    def _create(self):
+        """
+        Creates an empty log; imports the old notifications.json on first use.
+        """
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._save_index({"next_seq": 2, "active": self.segment_name(1), "segments": [], "archived": []})
+        if self.legacy_file and os.path.isfile(self.legacy_file):
+            try:
+                with open(self.legacy_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print("Error importing legacy notifications:", e)
+                return
+            if isinstance(data, list):
+                self.append_many([d for d in data if isinstance(d, dict)])
+
+    # ----- Segments -----
+    def _path(self, name):
+        return os.path.join(self.log_dir, name)
+
+    def _read_segment(self, name):
+        """
+        Returns the entries of one segment, oldest first. Broken or partial lines are skipped.
+        """
+        entries = []
+        try:
+            with open(self._path(name), "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        return entries
+
+    def _rotate(self, index):
+        """
+        Seals the active segment and starts a new one.
+        """
+        active = index["active"]
+        sealed = dict(index, segments=index["segments"] + [{"name": active, "count": len(self._read_segment(active))}])
+        sealed["active"] = self.segment_name(index["next_seq"])
+        sealed["next_seq"] = index["next_seq"] + 1
+        return self._save_index(sealed)
+
+    # ----- Writing -----
+    def append(self, notification):
+        """
+        Appends one notification dict. Returns True on success.
+        """
+        return self.append_many([notification])
+
+    def append_many(self, notifications):
+        """
+        Appends several notifications in one write (rotating first if the active segment is full).
+        """
+        if not notifications:
+            return True
+        data = "".join(
+            json.dumps(n, default=str, ensure_ascii=False, separators=(",", ":")) + "\n" for n in notifications
+        ).encode("utf-8")
+        try:
+            with self.lock:
+                index = self._load_index()
+                with open(self._path(index["active"]), "ab") as f:
+                    f.write(data)
+                    size = f.tell()
+                if size >= self.segment_size:
+                    self._rotate(index)
+        except Exception as e:
+            print("Error appending notification:", e)
+            return False
+        return True
+
+    def rewrite(self, notifications):
+        """
+        Replaces the whole history with `notifications` (oldest first).
+        Live segments are removed; archived segments are kept.
+        """
+        with self.lock:
+            index = self._load_index()
+            for seg in index["segments"] + [{"name": index["active"]}]:
+                try:
+                    os.remove(self._path(seg["name"]))
+                except OSError:
+                    pass
+            fresh = dict(index, segments=[], active=self.segment_name(index["next_seq"]), next_seq=index["next_seq"] + 1)
+            if not self._save_index(fresh):
+                return False
+            return self.append_many(list(notifications))
+
+    def archive(self, keep_segments=4):
+        """
+        Moves every sealed segment except the newest `keep_segments` into archive/.
+        Returns the number of archived segments.
+        """
+        with self.lock:
+            index = self._load_index()
+            segments = index["segments"]
+            cut = max(0, len(segments) - keep_segments)
+            if cut == 0:
+                return 0
+            archive_dir = os.path.join(self.log_dir, self.ARCHIVE_DIR)
+            os.makedirs(archive_dir, exist_ok=True)
+            moved = []
+            for seg in segments[:cut]:
+                try:
+                    os.replace(self._path(seg["name"]), os.path.join(archive_dir, seg["name"]))
+                except OSError as e:
+                    print("Error archiving notification segment:", e)
+                    break
+                moved.append(seg)
+            if moved:
+                self._save_index(dict(index, segments=segments[len(moved):], archived=index["archived"] + moved))
+            return len(moved)
+
+    # ----- Reading -----
+    def count(self):
+        index = self._load_index()
+        return sum(seg["count"] for seg in index["segments"]) + len(self._read_segment(index["active"]))
+
+    def page(self, offset=0, limit=20):
+        """
+        Returns up to `limit` notifications, newest first, skipping the `offset` newest ones.
+        Only the segments that hold the requested page are read.
+        """
+        index = self._load_index()
+        result = []
+        skip = offset
+        segments = [(index["active"], None)] + [(s["name"], s["count"]) for s in reversed(index["segments"])]
+        for name, count in segments:
+            if count is not None and skip >= count:
+                skip -= count
+                continue
+            entries = self._read_segment(name)
+            if skip >= len(entries):
+                skip -= len(entries)
+                continue
+            newest_first = entries[::-1][skip:]
+            skip = 0
+            result.extend(newest_first[:limit - len(result)])
+            if len(result) >= limit:
+                break
+        return result
+
+    def __iter__(self):
+        """
+        Yields every live notification, oldest first.
+        """
+        index = self._load_index()
+        for seg in index["segments"]:
+            yield from self._read_segment(seg["name"])
+        yield from self._read_segment(index["active"])
+
+    def read_all(self):
+        return list(self)
@@ -0,0 +1,223 @@
+from datetime import date
+
+import numpy as np
+
+STATUSES = ("Open", "Pending", "Ongoing", "Completed", "Canceled")
+CLOSED_STATUSES = ("Completed", "Canceled")
+NO_DATE = -1  # ordinal dùng cho ngày không parse được
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class ProjectColumns:
+    """
+    Column-oriented copy of the project set for dashboards and charts.
+
+    One NumPy array per field (status code, progress, start/end day ordinal,
+    priority code), so counts, histograms, date ranges and overdue masks are
+    single vectorized calls instead of Python loops over Project objects.
+    Status and priority strings are stored as small integer codes; the code
+    tables grow when a new label shows up.
+
+    The columns are patched row by row (patch/remove) when projects change,
+    so they never need a full rebuild after the first one. Row order is not
+    the project order (remove() moves the last row into the hole).
+    """
+
+    def __init__(self, capacity=1024):
+        capacity = max(16, capacity)
+        self.ids = []      # row -> project_id
+        self.row_of = {}   # project_id -> row
+        self.size = 0
+        self.status_labels = list(STATUSES)
+        self._status_code = {s: i for i, s in enumerate(self.status_labels)}
+        self.priority_labels = []
+        self._priority_code = {}
+        self._status = np.empty(capacity, dtype=np.int16)
+        self._priority = np.empty(capacity, dtype=np.int16)
+        self._progress = np.empty(capacity, dtype=np.int16)
+        self._start = np.empty(capacity, dtype=np.int32)
+        self._end = np.empty(capacity, dtype=np.int32)
+
+    # ----- Building / patching -----
+    @staticmethod
+    def _code(table, labels, label):
+        code = table.get(label)
+        if code is None:
+            code = table[label] = len(labels)
+            labels.append(label)
+        return code
+
+    @staticmethod
+    def _progress_value(value):
+        try:
+            return max(0, min(100, int(value)))
+        except (TypeError, ValueError):
+            return 0
+
+    def _ensure_capacity(self, needed):
+        capacity = len(self._status)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        for name in ("_status", "_priority", "_progress", "_start", "_end"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    @classmethod
+    def from_projects(cls, projects):
+        """
+        Builds the columns for a whole project list in one pass per column.
+        """
+        projects = list(projects)
+        n = len(projects)
+        cols = cls(capacity=n)
+        cols.ids = [str(p.project_id) for p in projects]
+        cols.row_of = {pid: i for i, pid in enumerate(cols.ids)}
+        cols.size = n
+        status_code = cols._status_code
+        priority_code = cols._priority_code
+        cols._status[:n] = np.fromiter(
+            (cls._code(status_code, cols.status_labels, p.status) for p in projects), np.int16, n)
+        cols._priority[:n] = np.fromiter(
+            (cls._code(priority_code, cols.priority_labels, p.priority) for p in projects), np.int16, n)
+        cols._progress[:n] = np.fromiter((cls._progress_value(p.progress) for p in projects), np.int16, n)
+        cols._start[:n] = np.fromiter(
+            (NO_DATE if p.start_ordinal is None else p.start_ordinal for p in projects), np.int32, n)
+        cols._end[:n] = np.fromiter(
+            (NO_DATE if p.end_ordinal is None else p.end_ordinal for p in projects), np.int32, n)
+        return cols
+
+    def patch(self, project):
+        """
+        Inserts or updates the row of one project.
+        """
+        pid = str(project.project_id)
+        row = self.row_of.get(pid)
+        if row is None:
+            row = self.size
+            self._ensure_capacity(row + 1)
+            self.ids.append(pid)
+            self.row_of[pid] = row
+            self.size += 1
+        self._status[row] = self._code(self._status_code, self.status_labels, project.status)
+        self._priority[row] = self._code(self._priority_code, self.priority_labels, project.priority)
+        self._progress[row] = self._progress_value(project.progress)
+        self._start[row] = NO_DATE if project.start_ordinal is None else project.start_ordinal
+        self._end[row] = NO_DATE if project.end_ordinal is None else project.end_ordinal
+
+    def remove(self, project_id):
+        """
+        Removes the row of a project (the last row is moved into its place).
+        """
+        row = self.row_of.pop(str(project_id), None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            for arr in (self._status, self._priority, self._progress, self._start, self._end):
+                arr[row] = arr[last]
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.row_of[moved] = row
+        self.ids.pop()
+        self.size = last
+
+    # ----- Column views -----
+    @property
+    def status(self):
+        return self._status[:self.size]
+
+    @property
+    def priority(self):
+        return self._priority[:self.size]
+
+    @property
+    def progress(self):
+        return self._progress[:self.size]
+
+    @property
+    def start(self):
+        return self._start[:self.size]
+
+    @property
+    def end(self):
+        return self._end[:self.size]
+
+    def __len__(self):
+        return self.size
+
+    # ----- Analytics -----
+    def status_counts(self):
+        """
+        Returns {status: count} for every known status (zero counts included).
+        """
+        counts = np.bincount(self.status, minlength=len(self.status_labels))
+        return {label: int(c) for label, c in zip(self.status_labels, counts)}
+
+    def priority_counts(self):
+        counts = np.bincount(self.priority, minlength=len(self.priority_labels))
+        return {label: int(c) for label, c in zip(self.priority_labels, counts)}
+
+    def status_mask(self, *statuses):
+        # Bảng tra theo mã trạng thái: nhanh hơn np.isin trên mảng lớn
+        lookup = np.zeros(len(self.status_labels), dtype=bool)
+        for s in statuses:
+            if s in self._status_code:
+                lookup[self._status_code[s]] = True
+        return lookup[self.status]
+
+    def progress_histogram(self, bins=10):
+        """
+        Returns (counts, edges) of progress values between 0 and 100 in `bins` equal bins.
+        """
+        idx = np.minimum(self.progress.astype(np.int32) * bins // 100, bins - 1)
+        return np.bincount(idx, minlength=bins), np.linspace(0, 100, bins + 1)
+
+    def date_range(self):
+        """
+        Returns (earliest start ordinal, latest end ordinal), ignoring unparsed dates.
+        Either value is None if no project has a valid date.
+        """
+        if not self.size:
+            return None, None
+        earliest = int(self.start.min())
+        if earliest == NO_DATE:
+            valid = self.start[self.start != NO_DATE]
+            earliest = int(valid.min()) if valid.size else None
+        latest = int(self.end.max())
+        return earliest, (latest if latest != NO_DATE else None)
+
+    def overdue_mask(self, today=None):
+        """
+        Boolean mask of projects whose end date has passed and that are not completed/canceled.
+        """
+        today = date.today().toordinal() if today is None else today
+        end = self.end
+        return (end != NO_DATE) & (end < today) & ~self.status_mask(*CLOSED_STATUSES)
+
+    def ids_where(self, mask):
+        return [self.ids[i] for i in np.flatnonzero(mask)]
+
+    def week_histogram(self):
+        """
+        Returns {ISO week number: count} of project start dates.
+        """
+        earliest, _ = self.date_range()
+        if earliest is None:
+            return {}
+        # Đếm theo từng ngày trước (bincount), rồi chỉ đổi các ngày khác nhau sang số tuần
+        starts = self.start
+        if starts.min() < earliest:
+            starts = starts[starts != NO_DATE]
+        day_counts = np.bincount(starts - earliest)
+        days = np.flatnonzero(day_counts)
+        ordinals = days.astype(np.int64) + earliest
+        # ISO week = week of the Thursday in the same Monday-based week
+        thursday = ordinals - (ordinals - 1) % 7 + 3
+        year = (thursday - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[Y]")
+        jan1 = year.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+        weeks = (thursday - jan1) // 7 + 1
+        week_counts = np.bincount(weeks, weights=day_counts[days], minlength=54)
+        return {int(w): int(week_counts[w]) for w in np.flatnonzero(week_counts)}
@@ -0,0 +1,255 @@
+import json
+import os
+import time
+from datetime import date, datetime
+
+from libs.FileLock import FileLock
+from libs.JsonFileFactory import JsonFileFactory
+from libs.ProjectJournal import ProjectJournal
+
+
+def to_timestamp(when):
+    """
+    Converts a point in time to epoch seconds: a datetime, a date (the end of that
+    day), a number (already epoch seconds) or None (now).
+    """
+    if when is None:
+        return time.time()
+    if isinstance(when, datetime):
+        return when.timestamp()
+    if isinstance(when, date):
+        return datetime(when.year, when.month, when.day, 23, 59, 59, 999999).timestamp()
+    return float(when)
+
+
+def _dumps(obj):
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+class ProjectHistory:
+    """
+    Every saved project change, kept forever, so a project or the whole dataset
+    can be rebuilt as it was at any point in time:
+
+        Dataset/history/
+            changes.jsonl               one entry per saved change, oldest first
+            cp-000000262144.jsonl       checkpoint: every project (one row per line)
+            index.json                  checkpoints (file, byte offset in changes.jsonl, time)
+
+    An entry is the journal record of the save (see ProjectJournal) plus a
+    timestamp, so an update stores only the changed fields, never the whole
+    project:
+        {"ts": 1735689600.123, "op": "set", "project_id": "PRJ001", "fields": {"status": "Done", "version": 4}}
+
+    A checkpoint of the full dataset is written on the first save and then
+    whenever the entries since the last checkpoint are as large as that
+    checkpoint (and at least `checkpoint_size` bytes). Checkpoints of a large
+    dataset are thus written less often, so writing them costs at most about as
+    much as writing the entries themselves. Rebuilding the state at time T
+    loads the newest checkpoint taken before T and replays the entries after it
+    (no more bytes than the checkpoint itself). Writers in several processes are
+    serialized with history.lock.
+    """
+
+    DEFAULT_CHECKPOINT_SIZE = 256 * 1024  # minimum bytes of entries between two checkpoints
+    INDEX_FILE = "index.json"
+    CHANGES_FILE = "changes.jsonl"
+
+    def __init__(self, history_dir, checkpoint_size=DEFAULT_CHECKPOINT_SIZE):
+        self.history_dir = history_dir
+        self.checkpoint_size = checkpoint_size
+        self.index_file = os.path.join(history_dir, self.INDEX_FILE)
+        self.changes_file = os.path.join(history_dir, self.CHANGES_FILE)
+        self.lock = FileLock(os.path.normpath(history_dir) + ".lock")
+        self._index = None
+        self._index_signature = None
+
+    # ----- Index -----
+    def _signature(self):
+        try:
+            st = os.stat(self.index_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _load_index(self):
+        """
+        Returns the index dict, or None if no history was recorded yet.
+        """
+        signature = self._signature()
+        if signature is None:
+            return None
+        if self._index is not None and signature == self._index_signature:
+            return self._index
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        except Exception as e:
+            print("Error reading project history index:", e)
+            return None
+        self._index_signature = signature
+        return self._index
+
+    def _changes_size(self):
+        try:
+            return os.path.getsize(self.changes_file)
+        except OSError:
+            return 0
+
+    def _write_checkpoint(self, index, rows, offset, ts):
+        """
+        Stores `rows` ({project_id: row}) as the state at byte `offset` of changes.jsonl
+        and adds it to the index. Returns the new index.
+        """
+        name = f"cp-{offset:012d}.jsonl"
+        content = "".join(_dumps(row) + "\n" for row in rows.values())
+        JsonFileFactory.write_atomic(content, os.path.join(self.history_dir, name))
+        checkpoint = {"name": name, "offset": offset, "ts": ts, "count": len(rows), "size": len(content)}
+        index = dict(index, checkpoints=index["checkpoints"] + [checkpoint])
+        JsonFileFactory.write_atomic(json.dumps(index, indent=4, ensure_ascii=False), self.index_file)
+        self._index = index
+        self._index_signature = self._signature()
+        return index
+
+    # ----- Writing -----
+    def record(self, records, current_rows):
+        """
+        Appends the journal records of one save (put / set / delete) as history entries.
+        `current_rows()` must return the dataset before the records, {project_id: row};
+        it is only called when a checkpoint is due (first save, then once the
+        entries since the last checkpoint outgrow it). Returns True on success.
+        """
+        if not records:
+            return True
+        try:
+            with self.lock:
+                # Lấy thời gian trong khoá để các entry luôn theo thứ tự thời gian trong file;
+                # cắt (không làm tròn) tới ms để ts không bao giờ muộn hơn lúc lưu thật
+                ts = int(time.time() * 1000) / 1000
+                index = self._load_index()
+                if index is None:
+                    # Lần ghi đầu tiên: lưu toàn bộ dữ liệu hiện có làm điểm bắt đầu của lịch sử
+                    os.makedirs(self.history_dir, exist_ok=True)
+                    index = self._write_checkpoint({"checkpoints": []}, current_rows(), self._changes_size(), ts)
+                data = "".join(_dumps({"ts": ts, **r}) + "\n" for r in records).encode("utf-8")
+                with open(self.changes_file, "ab") as f:
+                    f.write(data)
+                    end = f.tell()
+                last = index["checkpoints"][-1]
+                if end - last["offset"] >= max(self.checkpoint_size, last.get("size", 0)):
+                    rows = dict(current_rows())
+                    ProjectJournal.replay(rows, records)
+                    self._write_checkpoint(index, rows, end, ts)
+        except Exception as e:
+            print("Error recording project history:", e)
+            return False
+        return True
+
+    # ----- Reading -----
+    @staticmethod
+    def _entry_id(entry):
+        if entry.get("op") == "put":
+            return str((entry.get("data") or {}).get("project_id", ""))
+        return str(entry.get("project_id", ""))
+
+    @staticmethod
+    def _needle(project_id):
+        # Lọc nhanh theo byte trước khi parse JSON: mọi entry/row của project đều chứa chuỗi này
+        return ('"project_id":' + json.dumps(str(project_id), ensure_ascii=False)).encode("utf-8")
+
+    def _read_lines(self, filename, offset=0, needle=None):
+        """
+        Yields the JSON objects stored one per line after `offset`, skipping lines that
+        do not contain `needle`. Stops at a line that is still being written.
+        """
+        try:
+            with open(filename, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    if needle is not None and needle not in line:
+                        continue
+                    try:
+                        yield json.loads(line.decode("utf-8"))
+                    except ValueError:
+                        continue
+        except OSError as e:
+            print("Error reading project history:", e)
+
+    def _checkpoint_at(self, ts):
+        """
+        Returns the newest checkpoint taken at or before `ts`, or None if `ts`
+        is before the history starts.
+        """
+        index = self._load_index()
+        found = None
+        for checkpoint in (index or {}).get("checkpoints", []):
+            if checkpoint["ts"] > ts:
+                break
+            found = checkpoint
+        return found
+
+    def changes(self, project_id=None, since=None, until=None):
+        """
+        Yields the entries of one project (all projects if None), oldest first,
+        saved between `since` and `until` (see to_timestamp; None = no limit).
+        Entries older than the checkpoint before `since` are not even read.
+        """
+        start = to_timestamp(since) if since is not None else None
+        end = to_timestamp(until) if until is not None else None
+        checkpoint = self._checkpoint_at(start) if start is not None else None
+        needle = self._needle(project_id) if project_id is not None else None
+        for entry in self._read_lines(self.changes_file, checkpoint["offset"] if checkpoint else 0, needle):
+            if end is not None and entry.get("ts", 0) > end:
+                break
+            if start is not None and entry.get("ts", 0) < start:
+                continue
+            if project_id is None or self._entry_id(entry) == str(project_id):
+                yield entry
+
+    def dataset_at(self, when):
+        """
+        Returns every project as it was at `when`, {project_id: row} in file order,
+        or None if `when` is before the history starts.
+        """
+        ts = to_timestamp(when)
+        checkpoint = self._checkpoint_at(ts)
+        if checkpoint is None:
+            return None
+        rows = {}
+        for row in self._read_lines(os.path.join(self.history_dir, checkpoint["name"])):
+            rows[str(row.get("project_id", ""))] = row
+        entries = []
+        for entry in self._read_lines(self.changes_file, checkpoint["offset"]):
+            if entry.get("ts", 0) > ts:
+                break
+            entries.append(entry)
+        ProjectJournal.replay(rows, entries)
+        return rows
+
+    def project_at(self, project_id, when):
+        """
+        Returns the row of one project as it was at `when`, or None if it did not
+        exist then (or `when` is before the history starts).
+        Only the lines mentioning the project are parsed.
+        """
+        ts = to_timestamp(when)
+        checkpoint = self._checkpoint_at(ts)
+        if checkpoint is None:
+            return None
+        pid = str(project_id)
+        needle = self._needle(pid)
+        rows = {}
+        for row in self._read_lines(os.path.join(self.history_dir, checkpoint["name"]), needle=needle):
+            if str(row.get("project_id", "")) == pid:
+                rows[pid] = row
+                break
+        entries = []
+        for entry in self._read_lines(self.changes_file, checkpoint["offset"], needle):
+            if entry.get("ts", 0) > ts:
+                break
+            if self._entry_id(entry) == pid:
+                entries.append(entry)
+        ProjectJournal.replay(rows, entries)
+        return rows.get(pid)
@@ -0,0 +1,117 @@
+class ProjectIndex:
+    """
+    Secondary indexes over the persisted project rows:
+
+        status     -> projects
+        assignee   -> projects (one entry per name in "assignment")
+        manager    -> projects
+        priority   -> projects
+
+    Each bucket is an insertion-ordered dict project_id -> Project, so adding
+    or removing one project touches only its own buckets and a lookup costs
+    O(result size) without going back through the id -> Project map.
+    The keys a project was filed under are remembered, so an update only
+    moves it between the buckets whose value actually changed.
+    """
+
+    FIELDS = ("status", "assignee", "manager", "priority")
+
+    def __init__(self):
+        self._buckets = {field: {} for field in self.FIELDS}
+        self._keys = {}     # project_id -> {field: tuple of keys}
+        self._objects = {}  # project_id -> Project stored in the buckets
+
+    @staticmethod
+    def keys_of(row):
+        """
+        Returns {field: tuple of keys} for a project row (dict).
+        """
+        assignment = row.get("assignment") or []
+        if isinstance(assignment, str):
+            assignment = [assignment]
+        return {
+            "status": (row.get("status"),),
+            "assignee": tuple(dict.fromkeys(a for a in assignment if a)),
+            "manager": (row.get("manager"),),
+            "priority": (row.get("priority"),),
+        }
+
+    @classmethod
+    def from_rows(cls, rows, projects):
+        """
+        Builds the indexes for {project_id: row} and the matching {project_id: Project}.
+        """
+        index = cls()
+        for pid, row in rows.items():
+            project = projects.get(pid)
+            if project is not None:
+                index.put(pid, row, project)
+        return index
+
+    def put(self, project_id, row, project):
+        """
+        Files a new or changed project row under its current keys.
+        """
+        pid = str(project_id)
+        new_keys = self.keys_of(row)
+        old_keys = self._keys.get(pid)
+        rebind = self._objects.get(pid) is not project
+        for field, keys in new_keys.items():
+            old = old_keys[field] if old_keys else ()
+            if old == keys and not rebind:
+                continue
+            buckets = self._buckets[field]
+            for key in old:
+                if key not in keys:
+                    self._discard(buckets, key, pid)
+            for key in keys:
+                buckets.setdefault(key, {})[pid] = project
+        self._keys[pid] = new_keys
+        self._objects[pid] = project
+
+    def holds(self, project_id, project):
+        """
+        True if `project` is the object filed for this id.
+        """
+        return self._objects.get(str(project_id)) is project
+
+    def remove(self, project_id):
+        pid = str(project_id)
+        old_keys = self._keys.pop(pid, None)
+        if old_keys is None:
+            return
+        del self._objects[pid]
+        for field, keys in old_keys.items():
+            for key in keys:
+                self._discard(self._buckets[field], key, pid)
+
+    @staticmethod
+    def _discard(buckets, key, pid):
+        bucket = buckets.get(key)
+        if bucket is None:
+            return
+        bucket.pop(pid, None)
+        if not bucket:
+            del buckets[key]
+
+    def ids(self, field, key):
+        """
+        Returns the ids of the projects filed under `key` for an indexed field.
+        """
+        return list(self._buckets[field].get(key, ()))
+
+    def projects(self, field, key):
+        """
+        Returns the Project objects filed under `key` for an indexed field.
+        """
+        bucket = self._buckets[field].get(key)
+        return list(bucket.values()) if bucket else []
+
+    def count(self, field, key):
+        return len(self._buckets[field].get(key, ()))
+
+    def keys(self, field):
+        return list(self._buckets[field])
+
+    def __len__(self):
+        return len(self._keys)
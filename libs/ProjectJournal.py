@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+
+from libs.JsonFileFactory import JsonFileFactory
+
+
+class ProjectJournal:
+    """
+    Append-only change log stored next to projects.json (projects.journal.jsonl).
+
+    Each line is one small JSON record:
+        {"op": "put", "data": {...full project...}}           -> new project
+        {"op": "set", "project_id": "PRJ001", "fields": {...}} -> changed fields only
+        {"op": "delete", "project_id": "PRJ001"}
+
+    The current dataset is the snapshot (projects.json) with every record replayed
+    on top of it. Replaying is idempotent (put = upsert, delete of a missing id is
+    ignored), so a reader that sees a freshly compacted snapshot together with the
+    old log still ends up with the right data.
+    """
+
+    DEFAULT_COMPACT_THRESHOLD = 512 * 1024  # bytes
+
+    def __init__(self, projects_file, compact_threshold=DEFAULT_COMPACT_THRESHOLD):
+        self.projects_file = projects_file
+        base, _ = os.path.splitext(projects_file)
+        self.journal_file = base + ".journal.jsonl"
+        self.compact_threshold = compact_threshold
+
+    def size(self):
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+
+    def needs_compaction(self):
+        return self.size() >= self.compact_threshold
+
+    def append(self, records):
+        """
+        Appends the records to the log in a single write.
+        Returns the number of bytes written, or -1 on error.
+        """
+        if not records:
+            return 0
+        try:
+            data = "".join(
+                json.dumps(r, default=str, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for r in records
+            ).encode("utf-8")
+            with open(self.journal_file, "ab") as f:
+                f.write(data)
+                f.flush()
+            return len(data)
+        except Exception as e:
+            print("Error appending to project journal:", e)
+            return -1
+
+    def read(self, offset=0):
+        """
+        Reads the records written after the given byte offset.
+        Returns (records, end_offset). A trailing line without a newline
+        (a write still in progress or a crash) is left for the next read.
+        """
+        raw = self.read_tail(offset)
+        end = raw.rfind(b"\n") + 1
+        records = []
+        for line in raw[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line.decode("utf-8")))
+            except ValueError as e:
+                print("Skipping broken journal record:", e)
+        return records, offset + end
+
+    def read_tail(self, offset):
+        """
+        Returns the raw bytes of the log after the given offset.
+        """
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(offset)
+                return f.read()
+        except OSError:
+            return b""
+
+    @staticmethod
+    def replay(rows, records):
+        """
+        Applies records to rows, an insertion-ordered {project_id: dict}.
+        Returns (touched_ids, deleted_ids).
+        """
+        touched = set()
+        deleted = set()
+        for r in records:
+            op = r.get("op")
+            if op == "put":
+                data = r.get("data") or {}
+                pid = str(data.get("project_id", ""))
+                rows[pid] = data
+                deleted.discard(pid)
+                touched.add(pid)
+            elif op == "set":
+                pid = str(r.get("project_id", ""))
+                if pid in rows:
+                    rows[pid] = {**rows[pid], **(r.get("fields") or {})}
+                    touched.add(pid)
+            elif op == "delete":
+                pid = str(r.get("project_id", ""))
+                if rows.pop(pid, None) is not None:
+                    touched.discard(pid)
+                    deleted.add(pid)
+        return touched, deleted
+
+    def iter_replayed(self, snapshot_rows):
+        """
+        Streams snapshot rows with the journal applied on the fly.
+        Only the journal (small by design) is held in memory, not the snapshot.
+        """
+        records, _ = self.read(0)
+        puts, sets, deleted = {}, {}, set()
+        for r in records:
+            op = r.get("op")
+            pid = str((r.get("data") or {}).get("project_id", "")) if op == "put" else str(r.get("project_id", ""))
+            if op == "put":
+                puts[pid] = r.get("data") or {}
+                sets.pop(pid, None)
+                deleted.discard(pid)
+            elif op == "set":
+                if pid in puts:
+                    puts[pid] = {**puts[pid], **(r.get("fields") or {})}
+                else:
+                    sets[pid] = {**sets.get(pid, {}), **(r.get("fields") or {})}
+            elif op == "delete":
+                puts.pop(pid, None)
+                sets.pop(pid, None)
+                deleted.add(pid)
+
+        for row in snapshot_rows:
+            pid = str(row.get("project_id", ""))
+            if pid in puts:
+                yield puts.pop(pid)
+            elif pid in deleted:
+                continue
+            elif pid in sets:
+                yield {**row, **sets[pid]}
+            else:
+                yield row
+        yield from puts.values()
+
+    def write_snapshot_file(self, rows_list):
+        """
+        Serializes a snapshot into a temporary file next to projects.json.
+        Returns the temporary path, or None on error.
+        """
+        # Tên riêng cho mỗi tiến trình/luồng: nhiều writer có thể cùng serialize một lúc
+        tmp_file = f"{self.projects_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(JsonFileFactory.dumps_list(rows_list))
+                f.flush()
+                os.fsync(f.fileno())
+            return tmp_file
+        except Exception as e:
+            print("Error writing project snapshot:", e)
+            self.discard_snapshot_file(tmp_file)
+            return None
+
+    @staticmethod
+    def discard_snapshot_file(tmp_file):
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+    def install_snapshot(self, tmp_file, tail=b""):
+        """
+        Atomically replaces projects.json with tmp_file and resets the log to `tail`
+        (records appended while the snapshot was being written).
+        Both files are swapped with a rename, so readers never see a partial file.
+        The caller must hold the Dataset write lock.
+        """
+        try:
+            JsonFileFactory.replace_file(tmp_file, self.projects_file)
+            journal_tmp = self.journal_file + ".tmp"
+            with open(journal_tmp, "wb") as f:
+                f.write(tail)
+            JsonFileFactory.replace_file(journal_tmp, self.journal_file)
+            return True
+        except Exception as e:
+            print("Error installing project snapshot:", e)
+            return False
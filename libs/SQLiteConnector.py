@@ -0,0 +1,565 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from libs.EventBus import NOTIFICATION_ADDED
+from libs.IdAllocator import format_project_id
+from libs.StorageBackend import StorageBackend, PROJECT_COLUMNS, PROJECT_SUMMARY_COLUMNS, NOTIFICATION_COLUMNS
+from libs.Versioning import VersionConflictError, check_versions
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    project_id     TEXT PRIMARY KEY,
+    name           TEXT NOT NULL DEFAULT '',
+    assignment     TEXT NOT NULL DEFAULT '[]',
+    manager        TEXT NOT NULL DEFAULT '',
+    status         TEXT NOT NULL DEFAULT 'Open',
+    progress       INTEGER NOT NULL DEFAULT 0,
+    start_date     TEXT NOT NULL DEFAULT '',
+    end_date       TEXT NOT NULL DEFAULT '',
+    color          TEXT NOT NULL DEFAULT '#FF6B6B',
+    priority       TEXT NOT NULL DEFAULT 'Normal',
+    description    TEXT NOT NULL DEFAULT '',
+    attachments    TEXT NOT NULL DEFAULT '[]',
+    dependency     TEXT NOT NULL DEFAULT '',
+    estimated_time TEXT NOT NULL DEFAULT '',
+    view_gantt     INTEGER NOT NULL DEFAULT 0,
+    view_kanban    INTEGER NOT NULL DEFAULT 0,
+    drag_and_drop  INTEGER NOT NULL DEFAULT 0,
+    version        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status);
+CREATE INDEX IF NOT EXISTS idx_projects_manager ON projects(manager);
+CREATE INDEX IF NOT EXISTS idx_projects_priority ON projects(priority);
+
+CREATE TABLE IF NOT EXISTS users (
+    Username    TEXT PRIMARY KEY,
+    Name        TEXT NOT NULL DEFAULT '',
+    Email       TEXT NOT NULL DEFAULT '',
+    EmailNorm   TEXT NOT NULL DEFAULT '',
+    PhoneNum    TEXT NOT NULL DEFAULT '',
+    Password    TEXT NOT NULL DEFAULT '',
+    Avatar      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users(EmailNorm);
+
+CREATE TABLE IF NOT EXISTS notifications (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    username    TEXT NOT NULL DEFAULT '',
+    action      TEXT NOT NULL DEFAULT '',
+    project_id  TEXT NOT NULL DEFAULT '',
+    time_str    TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_username ON notifications(username);
+
+CREATE TABLE IF NOT EXISTS id_sequences (
+    name        TEXT PRIMARY KEY,
+    next_value  INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS project_history (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          REAL NOT NULL,
+    project_id  TEXT NOT NULL,
+    entry       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_project ON project_history(project_id, ts);
+CREATE INDEX IF NOT EXISTS idx_history_ts ON project_history(ts);
+"""
+
+
+class SQLiteConnector(StorageBackend):
+    """
+    SQLite storage with the same methods as DataConnector.
+
+    Every project/user is one row, so saving one project is a single-row
+    upsert instead of rewriting the whole dataset. Lists (assignment,
+    attachments) are stored as JSON text. Every saved change is also kept in
+    project_history (see StorageBackend.get_project_at).
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_file=None):
+        if db_file is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            db_file = os.path.join(base_dir, "..", "Dataset", "procheck.db")
+        self.db_file = db_file
+        # Chờ tối đa 30s khi tiến trình khác đang giữ khoá ghi
+        self.conn = sqlite3.connect(db_file, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(projects)")}
+        if "version" not in columns:
+            # Database tạo trước khi project có cột version
+            self.conn.execute("ALTER TABLE projects ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        # Mốc bắt đầu lịch sử (project_id rỗng): trước thời điểm này không dựng lại được dữ liệu
+        self.conn.execute(
+            "INSERT INTO project_history (ts, project_id, entry) SELECT ?, '', '{\"op\": \"start\"}' "
+            "WHERE NOT EXISTS (SELECT 1 FROM project_history)", (time.time(),)
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ----- Projects -----
+    _UPSERT_PROJECT = (
+        f"INSERT INTO projects ({', '.join(PROJECT_COLUMNS)}) "
+        f"VALUES ({', '.join(':' + c for c in PROJECT_COLUMNS)}) "
+        f"ON CONFLICT(project_id) DO UPDATE SET "
+        + ", ".join(f"{c} = excluded.{c}" for c in PROJECT_COLUMNS if c != "project_id")
+    )
+
+    # Chỉ cập nhật các cột summary: description/attachments đang lưu được giữ nguyên
+    _UPSERT_PROJECT_SUMMARY = (
+        f"INSERT INTO projects ({', '.join(PROJECT_SUMMARY_COLUMNS)}) "
+        f"VALUES ({', '.join(':' + c for c in PROJECT_SUMMARY_COLUMNS)}) "
+        f"ON CONFLICT(project_id) DO UPDATE SET "
+        + ", ".join(f"{c} = excluded.{c}" for c in PROJECT_SUMMARY_COLUMNS if c != "project_id")
+    )
+
+    def get_all_projects(self):
+        """
+        Returns a list of Project objects in insertion order.
+        """
+        rows = self.conn.execute("SELECT * FROM projects ORDER BY rowid").fetchall()
+        return [self.row_to_project(r) for r in rows]
+
+    def get_project_summaries(self):
+        """
+        Returns every project without reading description/attachments; they are
+        fetched on first access, or per batch with load_project_details().
+        """
+        rows = self.conn.execute(
+            f"SELECT {', '.join(PROJECT_SUMMARY_COLUMNS)} FROM projects ORDER BY rowid"
+        ).fetchall()
+        return [self.row_to_summary(r, self._project_details) for r in rows]
+
+    def _fetch_details(self, project_ids):
+        for start in range(0, len(project_ids), 500):
+            batch = project_ids[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            yield from self.conn.execute(
+                f"SELECT project_id, description, attachments FROM projects WHERE project_id IN ({placeholders})",
+                batch
+            ).fetchall()
+
+    def _project_details(self, project_id):
+        """Loader of one summary (see Project.summary)."""
+        try:
+            rows = list(self._fetch_details([str(project_id)]))
+        except sqlite3.Error as e:
+            print("Error loading project details from SQLite:", e)
+            return None
+        return self.row_to_details(rows[0]) if rows else {}
+
+    def load_project_details(self, projects):
+        """
+        Fetches description/attachments of the summaries in `projects`, 500 per query.
+        """
+        try:
+            self._fill_details(projects, self._fetch_details)
+        except sqlite3.Error as e:
+            print("Error loading project details from SQLite:", e)
+
+    def get_projects_by_status(self, status):
+        rows = self.conn.execute(
+            "SELECT * FROM projects WHERE status = ? ORDER BY rowid", (status,)
+        ).fetchall()
+        return [self.row_to_project(r) for r in rows]
+
+    def get_projects_by_assignee(self, username):
+        # assignment là mảng JSON: so khớp từng phần tử bằng json_each
+        rows = self.conn.execute(
+            "SELECT * FROM projects WHERE EXISTS "
+            "(SELECT 1 FROM json_each(projects.assignment) WHERE value = ?) ORDER BY rowid", (username,)
+        ).fetchall()
+        return [self.row_to_project(r) for r in rows]
+
+    def get_projects_by_manager(self, manager):
+        rows = self.conn.execute(
+            "SELECT * FROM projects WHERE manager = ? ORDER BY rowid", (manager,)
+        ).fetchall()
+        return [self.row_to_project(r) for r in rows]
+
+    def get_projects_by_priority(self, priority):
+        rows = self.conn.execute(
+            "SELECT * FROM projects WHERE priority = ? ORDER BY rowid", (priority,)
+        ).fetchall()
+        return [self.row_to_project(r) for r in rows]
+
+    def _change_stamp(self):
+        # Tăng khi một connection khác (tiến trình khác) commit; không đổi với commit của chính connection này
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def count_projects(self, status=None):
+        if status is None:
+            return self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM projects WHERE status = ?", (status,)).fetchone()[0]
+
+    def find_projects(self, query, limit=None):
+        pattern = "%" + query.strip().lower() + "%"
+        rows = self.conn.execute(
+            "SELECT * FROM projects WHERE lower(project_id) LIKE ? OR lower(name) LIKE ? "
+            "ORDER BY rowid LIMIT ?",
+            (pattern, pattern, -1 if limit is None else limit)
+        ).fetchall()
+        return [self.row_to_project(r) for r in rows]
+
+    def get_project_by_projectid(self, project_id):
+        row = self.conn.execute(
+            "SELECT * FROM projects WHERE project_id = ?", (str(project_id),)
+        ).fetchone()
+        return self.row_to_project(row) if row else None
+
+    # Số PRJ tiếp theo sau id lớn nhất hiện có (chỉ dùng khi khởi tạo / sửa sequence)
+    _NEXT_PROJECT_NUMBER = (
+        "SELECT COALESCE(MAX(CAST(SUBSTR(project_id, 4) AS INTEGER)), 0) + 1 "
+        "FROM projects WHERE project_id GLOB 'PRJ[0-9]*'"
+    )
+
+    def _take_project_numbers(self, count):
+        self.conn.execute(
+            "UPDATE id_sequences SET next_value = next_value + ? WHERE name = 'project_id'", (count,)
+        )
+        row = self.conn.execute("SELECT next_value FROM id_sequences WHERE name = 'project_id'").fetchone()
+        first = row[0] - count
+        return [format_project_id(n) for n in range(first, first + count)]
+
+    def _any_project_exists(self, project_ids):
+        for start in range(0, len(project_ids), 500):
+            batch = project_ids[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            if self.conn.execute(
+                f"SELECT 1 FROM projects WHERE project_id IN ({placeholders}) LIMIT 1", batch
+            ).fetchone():
+                return True
+        return False
+
+    def reserve_project_ids(self, count):
+        """
+        Reserves `count` project ids from the id_sequences table in one transaction.
+        The first statement takes SQLite's write lock, so processes sharing the
+        database file always get disjoint blocks. Returns [] on error.
+        """
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO id_sequences (name, next_value) "
+                    f"SELECT 'project_id', ({self._NEXT_PROJECT_NUMBER})"
+                )
+                ids = self._take_project_numbers(count)
+                if self._any_project_exists(ids):
+                    # Có project được thêm không qua sequence (import, script): nhảy qua id lớn nhất
+                    self.conn.execute(
+                        "UPDATE id_sequences SET next_value = "
+                        f"MAX(next_value, ({self._NEXT_PROJECT_NUMBER})) WHERE name = 'project_id'"
+                    )
+                    ids = self._take_project_numbers(count)
+            return ids
+        except sqlite3.Error as e:
+            print("Error reserving project ids in SQLite:", e)
+            return []
+
+    def add_project(self, project):
+        return self.save_project(project)
+
+    def _stored_rows(self, project_ids):
+        """
+        {project_id: stored row} of `project_ids`, 500 ids per query.
+        """
+        rows = {}
+        for start in range(0, len(project_ids), 500):
+            batch = project_ids[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            for row in self.conn.execute(f"SELECT * FROM projects WHERE project_id IN ({placeholders})", batch):
+                rows[row["project_id"]] = row
+        return rows
+
+    def _record_history(self, before, params, removed):
+        # Trong giao dịch ghi; ts cắt tới ms như lịch sử JSON
+        entries = self._history_entries(before, params, removed, int(time.time() * 1000) / 1000)
+        if entries:
+            self.conn.executemany("INSERT INTO project_history (ts, project_id, entry) VALUES (?, ?, ?)", entries)
+
+    def _read_history(self, project_id=None, since=None):
+        sql = "SELECT entry FROM project_history WHERE project_id != ''"
+        params = []
+        if project_id is not None:
+            sql += " AND project_id = ?"
+            params.append(str(project_id))
+        if since is not None:
+            sql += " AND ts >= ?"
+            params.append(since)
+        for row in self.conn.execute(sql + " ORDER BY id", params):
+            yield json.loads(row["entry"])
+
+    def _history_start(self):
+        row = self.conn.execute("SELECT ts FROM project_history ORDER BY id LIMIT 1").fetchone()
+        return row["ts"] if row else None
+
+    def _write_projects(self, projects, complete=False, deleted=(), notifications=()):
+        """
+        Upserts the projects of `projects` that differ from their stored row in one
+        transaction (complete=True: other ids are deleted), together with deleting the
+        ids in `deleted` and inserting `notifications`; every change is also added to
+        project_history. The transaction takes the write lock before the stored rows
+        are read, so no other process can save in between; raises VersionConflictError
+        (nothing written) if one of the projects was saved by someone else since it was read.
+        Returns the stored rows it replaced or deleted ({project_id: row}).
+        """
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            ids = [str(p.project_id) for p in projects]
+            before = self._stored_rows(list(dict.fromkeys(ids + list(deleted))))
+            check_versions({str(p.project_id): p.version or 0 for p in projects},
+                           {pid: before[pid]["version"] for pid in ids if pid in before})
+            if complete:
+                self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (project_id TEXT PRIMARY KEY)")
+                self.conn.execute("DELETE FROM keep_ids")
+                self.conn.executemany("INSERT OR IGNORE INTO keep_ids VALUES (?)", [(pid,) for pid in ids])
+                keep = "project_id NOT IN (SELECT project_id FROM keep_ids)"
+                before.update((row["project_id"], row) for row in
+                              self.conn.execute(f"SELECT * FROM projects WHERE {keep}"))
+                self.conn.execute(f"DELETE FROM projects WHERE {keep}")
+            if deleted:
+                self.conn.executemany("DELETE FROM projects WHERE project_id = ?", [(str(pid),) for pid in deleted])
+            # Chỉ ghi (và tăng version) các project khác với dòng đang lưu
+            params, changed = self._changed_params([p for p in projects if p.details_loaded], before)
+            self.conn.executemany(self._UPSERT_PROJECT, params)
+            # Summary chưa nạp description/attachments: không cần đọc chúng chỉ để ghi lại y nguyên
+            summary_params, changed_summaries = self._changed_params(
+                [p for p in projects if not p.details_loaded], before, PROJECT_SUMMARY_COLUMNS)
+            if summary_params:
+                self.conn.executemany(self._UPSERT_PROJECT_SUMMARY, summary_params)
+            kept = set(ids)
+            removed = [pid for pid in before if pid not in kept]
+            self._record_history(before, params + summary_params, removed)
+            if notifications:
+                self.conn.executemany(self._INSERT_NOTIFICATION,
+                                      [{c: n.get(c, "") for c in NOTIFICATION_COLUMNS} for n in notifications])
+        for p in changed + changed_summaries:
+            p.version = (p.version or 0) + 1
+        return before
+
+    def _save(self, projects, complete=False, deleted=(), notifications=()):
+        deleted = [str(pid) for pid in deleted]
+        try:
+            before = self._write_projects(projects, complete, deleted, notifications)
+        except VersionConflictError as e:
+            print("Error saving projects to SQLite:", e)
+            self._revert_conflicts(projects, e)
+            return False
+        except sqlite3.Error as e:
+            print("Error saving projects to SQLite:", e)
+            return False
+        before = self._stored_images(before)
+        self._publish_saved(before, projects, complete)
+        if deleted and before is not None:
+            self._publish_deleted({pid: before[pid] for pid in deleted if pid in before})
+        for notification in notifications:
+            self.events.emit(NOTIFICATION_ADDED, notification)
+        return True
+
+    def save_project(self, project):
+        """
+        Inserts the project or updates its single row.
+        """
+        return self._save([project])
+
+    def save_projects(self, projects):
+        """
+        Upserts several projects in one transaction.
+        """
+        return self._save(list(projects))
+
+    def save_all_projects(self, projects):
+        """
+        Makes the table match `projects`: missing ids are deleted, the rest upserted.
+        """
+        return self._save(list(projects), complete=True)
+
+    def commit_bulk(self, projects=(), deleted=(), notifications=()):
+        """
+        Upserts `projects`, deletes the ids in `deleted` and inserts `notifications`
+        in one transaction (nothing is written on a version conflict).
+        """
+        return self._save(list(projects), deleted=deleted, notifications=list(notifications))
+
+    def delete_project(self, project_id):
+        return self.delete_projects([project_id]) >= 0
+
+    def delete_projects(self, project_ids):
+        """
+        Deletes many projects in one transaction. Returns the number of deleted rows, or -1 on error.
+        """
+        ids = list(dict.fromkeys(str(pid) for pid in project_ids))
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                before = self._stored_rows(ids)
+                self.conn.executemany("DELETE FROM projects WHERE project_id = ?", [(pid,) for pid in before])
+                self._record_history(before, [], list(before))
+        except sqlite3.Error as e:
+            print("Error deleting project from SQLite:", e)
+            return -1
+        self._publish_deleted(self._stored_images(before))
+        return len(before)
+
+    # ----- Users -----
+    _UPSERT_USER = (
+        "INSERT INTO users (Username, Name, Email, EmailNorm, PhoneNum, Password, Avatar) "
+        "VALUES (:Username, :Name, :Email, :EmailNorm, :PhoneNum, :Password, :Avatar) "
+        "ON CONFLICT(Username) DO UPDATE SET Name = excluded.Name, Email = excluded.Email, "
+        "EmailNorm = excluded.EmailNorm, PhoneNum = excluded.PhoneNum, "
+        "Password = excluded.Password, Avatar = excluded.Avatar"
+    )
+
+    def get_all_users(self):
+        rows = self.conn.execute("SELECT * FROM users ORDER BY rowid").fetchall()
+        return [self.row_to_user(r) for r in rows]
+
+    def get_user_by_username(self, username):
+        row = self.conn.execute("SELECT * FROM users WHERE Username = ?", (username,)).fetchone()
+        return self.row_to_user(row) if row else None
+
+    def get_user_by_email(self, email):
+        row = self.conn.execute(
+            "SELECT * FROM users WHERE EmailNorm = ? ORDER BY rowid LIMIT 1",
+            ((email or "").strip().lower(),)
+        ).fetchone()
+        return self.row_to_user(row) if row else None
+
+    def add_user(self, user):
+        """
+        Adds a new user. The user's password is hashed before saving.
+        """
+        user.Password = hashlib.sha256(user.Password.encode()).hexdigest()
+        return self.save_user(user)
+
+    def save_user(self, user):
+        try:
+            with self.conn:
+                self.conn.execute(self._UPSERT_USER, self.user_to_params(user))
+            return True
+        except sqlite3.Error as e:
+            print("Error saving user to SQLite:", e)
+            return False
+
+    def delete_user(self, username):
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM users WHERE Username = ?", (username,))
+            return True
+        except sqlite3.Error as e:
+            print("Error deleting user from SQLite:", e)
+            return False
+
+    def save_all_users(self, users):
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM users")
+                self.conn.executemany(self._UPSERT_USER, [self.user_to_params(u) for u in users])
+            return True
+        except sqlite3.Error as e:
+            print("Error saving users to SQLite:", e)
+            return False
+
+    def login(self, username, password):
+        hashed_input = hashlib.sha256(password.encode()).hexdigest()
+        row = self.conn.execute(
+            "SELECT * FROM users WHERE Username = ? AND Password = ?", (username, hashed_input)
+        ).fetchone()
+        return self.row_to_user(row) if row else None
+
+    def update_password(self, email, new_password):
+        """
+        Updates the password of the user with the given email in one UPDATE.
+        Returns True if a row was changed.
+        """
+        hashed = hashlib.sha256(new_password.encode()).hexdigest()
+        try:
+            with self.conn:
+                cur = self.conn.execute(
+                    "UPDATE users SET Password = ? WHERE rowid = "
+                    "(SELECT rowid FROM users WHERE EmailNorm = ? ORDER BY rowid LIMIT 1)",
+                    (hashed, (email or "").strip().lower())
+                )
+            if cur.rowcount == 0:
+                print("No matching user found for email:", email)
+                return False
+            return True
+        except sqlite3.Error as e:
+            print("Error updating password in SQLite:", e)
+            return False
+
+    # ----- Notifications -----
+    _INSERT_NOTIFICATION = (
+        "INSERT INTO notifications (username, action, project_id, time_str) "
+        "VALUES (:username, :action, :project_id, :time_str)"
+    )
+
+    def save_notifications(self, notifications):
+        """
+        Replaces all notifications with the given list of dicts.
+        """
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM notifications")
+                self.conn.executemany(self._INSERT_NOTIFICATION,
+                                      [{c: n.get(c, "") for c in NOTIFICATION_COLUMNS} for n in notifications])
+            return True
+        except sqlite3.Error as e:
+            print("Error saving notifications to SQLite:", e)
+            return False
+
+    def add_notification(self, notification):
+        try:
+            with self.conn:
+                self.conn.execute(self._INSERT_NOTIFICATION,
+                                  {c: notification.get(c, "") for c in NOTIFICATION_COLUMNS})
+            self.events.emit(NOTIFICATION_ADDED, notification)
+            return True
+        except sqlite3.Error as e:
+            print("Error adding notification to SQLite:", e)
+            return False
+
+    def get_recent_notifications(self, limit=20, offset=0):
+        rows = self.conn.execute(
+            "SELECT username, action, project_id, time_str FROM notifications "
+            "ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset)
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def load_notifications(self):
+        rows = self.conn.execute(
+            "SELECT username, action, project_id, time_str FROM notifications ORDER BY id"
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    # ----- Migration -----
+    def import_from_json(self, dc):
+        """
+        One-shot import of projects, users and notifications from a DataConnector
+        (the JSON files under Dataset/). Existing rows with the same keys are replaced.
+        Passwords are copied as-is since they are already hashed.
+        """
+        projects = dc.get_all_projects()
+        users = dc.get_all_users()
+        notifications = dc.load_notifications()
+        try:
+            with self.conn:
+                self.conn.executemany(self._UPSERT_PROJECT, [self.project_to_params(p) for p in projects])
+                self.conn.executemany(self._UPSERT_USER, [self.user_to_params(u) for u in users])
+                self.conn.execute("DELETE FROM notifications")
+                self.conn.executemany(self._INSERT_NOTIFICATION,
+                                      [{c: n.get(c, "") for c in NOTIFICATION_COLUMNS} for n in notifications])
+        except sqlite3.Error as e:
+            print("Error importing JSON data into SQLite:", e)
+            return None
+        return {"projects": len(projects), "users": len(users), "notifications": len(notifications)}
@@ -0,0 +1,331 @@
+import heapq
+import unicodedata
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+
+SEARCH_FIELDS = ("project_id", "name", "description", "manager", "assignment")
+_SEPARATOR = "\x00"  # không xuất hiện trong câu tìm kiếm, nên kết quả không khớp xuyên qua 2 field
+
+
+def _build_fold_table():
+    # Bảng dịch ký tự có dấu -> ký tự gốc (Latin-1 .. Latin Extended Additional, gồm toàn bộ tiếng Việt)
+    table = {ord("đ"): "d", ord("Đ"): "d"}
+    for cp in range(0xC0, 0x1F00):
+        c = chr(cp)
+        base = "".join(ch for ch in unicodedata.normalize("NFD", c) if not unicodedata.combining(ch))
+        if base and base != c:
+            table[cp] = base.lower()
+    return table
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+def fold(text):
+    """
+    Lower-cases text, strips Vietnamese/Latin diacritics ("Dự án" -> "du an", "đ" -> "d")
+    and collapses runs of whitespace.
+    """
+    if not text:
+        return ""
+    text = str(text)
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text).translate(_FOLD_TABLE)
+        if not text.isascii():
+            text = "".join(c for c in unicodedata.normalize("NFD", text) if not unicodedata.combining(c))
+    return " ".join(text.lower().split())
+
+
+fold_query = lru_cache(maxsize=1024)(fold)
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _field_text(value):
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value if v)
+    return "" if value is None else str(value)
+
+
+def fold_fields(row):
+    """
+    Returns the folded (project_id, name, rest) texts searched for a project row.
+    """
+    rest = _SEPARATOR.join(fold(_field_text(row.get(f))) for f in SEARCH_FIELDS[2:])
+    return fold(row.get("project_id")), fold(row.get("name")), rest
+
+
+def score(query, fields):
+    """
+    Ranks a match of folded `query` in folded (project_id, name, rest); 0 means no match.
+    Exact id > id prefix > name prefix > word in name > id/name substring > other fields.
+    """
+    pid, name, rest = fields
+    if pid == query:
+        return 100
+    if pid.startswith(query):
+        return 80
+    if name.startswith(query):
+        return 60
+    if (" " + query) in name:
+        return 40
+    if query in pid or query in name:
+        return 20
+    if query in rest:
+        return 10
+    return 0
+
+
+class SearchIndex:
+    """
+    Trigram index over project id, name, description, manager and assignees.
+
+    Every project row is folded once (lower case, no diacritics) and each
+    3-character slice of the text points to the documents containing it.
+    There are two posting maps: one for id + name and one for the other
+    fields. A query is folded the same way and the posting sets of its
+    trigrams are intersected (smallest first); candidates are confirmed
+    with a substring test and ranked with score(). Because every id/name
+    match outranks a match in the other fields, those are only visited
+    (in indexing order) while the result is still short of `limit`.
+    Queries shorter than 3 characters (no trigram) and queries whose id/name
+    candidates exceed FLAT_THRESHOLD when a `limit` is given are answered by
+    str.find over one flat text of all folded projects instead, one pattern
+    per rank, stopping as soon as `limit` is reached. Projects changed after
+    the flat text was built are scored separately and merged in, so the text
+    is only rebuilt once many projects have changed. Those results are
+    cached until the next change.
+    put()/remove() touch only the changed project.
+    """
+
+    FLAT_THRESHOLD = 2000  # số ứng viên id/name tối đa để chấm điểm từng doc
+    MAX_STALE = 1024       # số doc đổi tối đa trước khi dựng lại văn bản phẳng
+    # Mẫu tìm cho từng mức điểm trong văn bản phẳng "\x01<id>\x03<name>"
+    _FLAT_PATTERNS = ((100, "\x01{}\x03"), (80, "\x01{}"), (60, "\x03{}"), (40, " {}"), (20, "{}"))
+
+    def __init__(self):
+        self._main = {}     # trigram -> set of doc numbers (project_id + name)
+        self._rest = {}     # trigram -> set of doc numbers (description, manager, assignees)
+        self._docs = {}     # doc number -> (project_id, folded fields)
+        self._doc_of = {}   # project_id -> doc number
+        self._next_doc = 0
+        self._flat = None   # văn bản phẳng cho câu tìm ngắn, None = cần dựng lại
+        self._stale = set()  # doc đã đổi/thêm/xoá sau khi dựng văn bản phẳng
+        self._flat_cache = {}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds the index for a {project_id: row} mapping in one pass.
+        """
+        index = cls()
+        main, rest = defaultdict(list), defaultdict(list)
+        for doc, (pid, row) in enumerate(rows.items()):
+            pid = str(pid)
+            fields = fold_fields(row)
+            index._doc_of[pid] = doc
+            index._docs[doc] = (pid, fields)
+            main_grams, rest_grams = cls._grams(fields)
+            for gram in main_grams:
+                main[gram].append(doc)
+            for gram in rest_grams:
+                rest[gram].append(doc)
+        index._main = {gram: set(docs) for gram, docs in main.items()}
+        index._rest = {gram: set(docs) for gram, docs in rest.items()}
+        index._next_doc = len(index._docs)
+        return index
+
+    @staticmethod
+    def _grams(fields):
+        return trigrams(fields[0] + _SEPARATOR + fields[1]), trigrams(fields[2])
+
+    def put(self, project_id, row):
+        """
+        Indexes a new project row or re-indexes a changed one.
+        """
+        pid = str(project_id)
+        fields = fold_fields(row)
+        doc = self._doc_of.get(pid)
+        if doc is not None:
+            old_fields = self._docs[doc][1]
+            if old_fields == fields:
+                return
+            old_main, old_rest = self._grams(old_fields)
+        else:
+            doc = self._doc_of[pid] = self._next_doc
+            self._next_doc += 1
+            old_main = old_rest = set()
+        new_main, new_rest = self._grams(fields)
+        self._update(self._main, doc, old_main, new_main)
+        self._update(self._rest, doc, old_rest, new_rest)
+        self._docs[doc] = (pid, fields)
+        self._mark_stale(doc)
+
+    def remove(self, project_id):
+        doc = self._doc_of.pop(str(project_id), None)
+        if doc is None:
+            return
+        _, fields = self._docs.pop(doc)
+        old_main, old_rest = self._grams(fields)
+        self._update(self._main, doc, old_main, ())
+        self._update(self._rest, doc, old_rest, ())
+        self._mark_stale(doc)
+
+    @staticmethod
+    def _update(postings, doc, old, new):
+        for gram in old:
+            if gram in new:
+                continue
+            bucket = postings.get(gram)
+            if bucket is not None:
+                bucket.discard(doc)
+                if not bucket:
+                    del postings[gram]
+        for gram in new:
+            if gram in old:
+                continue
+            bucket = postings.get(gram)
+            if bucket is None:
+                postings[gram] = {doc}
+            else:
+                bucket.add(doc)
+
+    @staticmethod
+    def _candidates(postings, grams):
+        sets = []
+        for gram in grams:
+            bucket = postings.get(gram)
+            if not bucket:
+                return set()
+            sets.append(bucket)
+        sets.sort(key=len)
+        result = sets[0]
+        for s in sets[1:]:
+            result = result & s
+            if not result:
+                break
+        return result
+
+    def search(self, query, limit=None):
+        """
+        Returns the ids of the matching projects, best match first
+        (ties keep the order in which projects were indexed).
+        """
+        query = fold_query(query)
+        if not query:
+            return []
+        docs = self._docs
+        grams = trigrams(query)
+        if not grams:
+            return self._search_flat(query, limit)
+        candidates = self._candidates(self._main, grams)
+        if limit is not None and len(candidates) > self.FLAT_THRESHOLD:
+            # Nhiều ứng viên: tìm theo từng mức điểm và dừng khi đủ limit thay vì chấm điểm tất cả
+            return self._search_flat(query, limit)
+
+        hits = []
+        for doc in candidates:
+            pid, fields = docs[doc]
+            s = score(query, fields)
+            if s > 10:
+                hits.append((-s, doc, pid))
+        hits.sort()
+        if limit is not None and len(hits) >= limit:
+            return [pid for _, _, pid in hits[:limit]]
+
+        # Khớp ở description/manager/assignee: cùng điểm, lấy theo thứ tự cho đến khi đủ limit
+        ranked = [pid for _, _, pid in hits]
+        seen = {doc for _, doc, _ in hits}
+        for doc in sorted(self._candidates(self._rest, grams)):
+            if doc in seen:
+                continue
+            pid, fields = docs[doc]
+            if query in fields[2]:
+                ranked.append(pid)
+                if limit is not None and len(ranked) >= limit:
+                    break
+        return ranked
+
+    def _mark_stale(self, doc):
+        self._flat_cache.clear()
+        if self._flat is None:
+            return
+        self._stale.add(doc)
+        if len(self._stale) > self.MAX_STALE:
+            self._flat = None
+            self._stale.clear()
+
+    def _build_flat(self):
+        entries = list(self._docs.items())
+        main, rest = [], []
+        main_starts, rest_starts = [], []
+        m = r = 0
+        for _, (_, (pid, name, other)) in entries:
+            seg = "\x01" + pid + "\x03" + name
+            main.append(seg)
+            main_starts.append(m)
+            m += len(seg)
+            seg = "\x01" + other
+            rest.append(seg)
+            rest_starts.append(r)
+            r += len(seg)
+        self._flat = (entries, "".join(main), main_starts, "".join(rest), rest_starts)
+        self._stale.clear()
+        return self._flat
+
+    @staticmethod
+    def _find_docs(text, starts, pattern):
+        """
+        Yields the positions (in `starts`) of the documents containing `pattern`, in order.
+        """
+        pos = text.find(pattern)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            yield i
+            if i + 1 >= len(starts):
+                return
+            pos = text.find(pattern, starts[i + 1])
+
+    def _search_flat(self, query, limit):
+        key = (query, limit)
+        if key not in self._flat_cache:
+            self._flat_cache[key] = self._scan_flat(query, limit)
+        return list(self._flat_cache[key])
+
+    def _scan_flat(self, query, limit):
+        entries, main, main_starts, rest, rest_starts = self._flat or self._build_flat()
+        stale = self._stale
+        # Doc đã đổi sau khi dựng văn bản phẳng: chấm điểm trực tiếp, sau đó trộn theo thứ tự doc
+        stale_hits = {}
+        for doc in sorted(stale):
+            entry = self._docs.get(doc)
+            if entry is not None:
+                tier = score(query, entry[1])
+                if tier:
+                    stale_hits.setdefault(tier, []).append((doc, entry[0]))
+
+        ranked = []
+        tiers = [(t, main, main_starts, p.format(query)) for t, p in self._FLAT_PATTERNS]
+        tiers.append((10, rest, rest_starts, query))
+        for tier, text, starts, pattern in tiers:
+            need = None if limit is None else limit - len(ranked)
+            found = []
+            for i in self._find_docs(text, starts, pattern):
+                doc, (pid, fields) = entries[i]
+                # Mỗi doc chỉ có đúng một mức điểm nên không bị lặp giữa các mức
+                if doc in stale or score(query, fields) != tier:
+                    continue
+                found.append((doc, pid))
+                if need is not None and len(found) >= need:
+                    break
+            for _, pid in heapq.merge(found, stale_hits.get(tier, ())):
+                ranked.append(pid)
+                if limit is not None and len(ranked) >= limit:
+                    return ranked
+        return ranked
+
+    def __len__(self):
+        return len(self._doc_of)
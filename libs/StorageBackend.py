@@ -0,0 +1,603 @@
+import json
+import os
+from abc import ABC, abstractmethod
+
+from Models.Project import Project
+from Models.User import User
+from libs.EventBus import (EventBus, NOTIFICATION_ADDED, PROJECT_ADDED, PROJECT_DELETED, PROJECT_UPDATED, SAVE_REJECTED,
+                           row_changes)
+from libs.ProjectHistory import to_timestamp
+
+
+PROJECT_COLUMNS = [
+    "project_id", "name", "assignment", "manager", "status", "progress",
+    "start_date", "end_date", "color", "priority", "description", "attachments",
+    "dependency", "estimated_time", "view_gantt", "view_kanban", "drag_and_drop", "version"
+]
+# Cột của bản summary (danh sách, Kanban, Gantt, biểu đồ): không có description/attachments
+PROJECT_SUMMARY_COLUMNS = [c for c in PROJECT_COLUMNS if c not in Project.HEAVY_FIELDS]
+PROJECT_LIST_COLUMNS = {"assignment", "attachments"}
+PROJECT_BOOL_COLUMNS = {"view_gantt", "view_kanban", "drag_and_drop"}
+
+USER_COLUMNS = ["Username", "Name", "Email", "PhoneNum", "Password", "Avatar"]
+NOTIFICATION_COLUMNS = ["username", "action", "project_id", "time_str"]
+
+BACKEND_ENV = "PROCHECK_STORAGE"
+DEFAULT_BACKEND = "json"
+
+
+class StorageBackend(ABC):
+    """
+    Methods every storage backend (JSON files, SQLite, MySQL) provides to the UI.
+
+    Windows receive a backend object (usually from create_connector()) and only
+    call the methods below, so switching storage is a configuration change.
+    The abstract methods must be implemented by every backend (a backend that
+    misses one cannot be created); the default implementations of the others
+    are built on get_all_projects() / get_all_users(), and backends override
+    them when they can do better.
+    Successful writes are published on `events` (see libs/EventBus.py).
+    Project saves check Project.version against the stored version and return
+    False on a conflict instead of overwriting another writer's change.
+    List views use get_project_summaries(): backends that can skip the heavy
+    fields (description, attachments) return summaries that fetch them on
+    first access, or per batch with load_project_details().
+    """
+
+    name = None
+    _events = None
+    _columns = None        # ProjectColumns, built on first use then patched (see get_project_columns)
+    _columns_stamp = None
+
+    @property
+    def events(self):
+        """
+        EventBus with the project_added / project_updated / project_deleted / notification_added events.
+        """
+        if self._events is None:
+            self._events = EventBus()
+        return self._events
+
+    def _stored_images(self, rows):
+        """
+        Returns {project_id: Project} of the stored rows a write replaced or deleted (read
+        inside its transaction), so that its changes can be published; None when nobody listens.
+        """
+        if not self.events.has_subscribers():
+            return None
+        return {str(pid): self.row_to_project(row) for pid, row in rows.items()}
+
+    def _publish_deleted(self, before):
+        for pid, old in (before or {}).items():
+            self.events.emit(PROJECT_DELETED, pid, old)
+
+    def _publish_saved(self, before, projects, complete=False):
+        """
+        Emits the events of a successful write of `projects` (complete=True: the others were deleted).
+        """
+        if before is None:
+            return
+        seen = set()
+        for p in projects:
+            pid = str(p.project_id)
+            seen.add(pid)
+            old = before.get(pid)
+            if old is None:
+                self.events.emit(PROJECT_ADDED, p)
+                continue
+            changes = row_changes(old.to_dict(), p.to_dict(details=False))
+            if changes:
+                self.events.emit(PROJECT_UPDATED, p, changes)
+        if complete:
+            for pid, old in before.items():
+                if pid not in seen:
+                    self.events.emit(PROJECT_DELETED, pid, old)
+
+    def _changed_params(self, projects, stored, columns=PROJECT_COLUMNS):
+        """
+        Row params for upserting the projects whose columns differ from their stored row
+        (`stored` is {project_id: row}), each with the next version (stored version + 1).
+        Projects stored with the same data are left out and keep their version, as in
+        the JSON journal. Returns (params, changed projects).
+        """
+        params, changed = [], []
+        for p in projects:
+            row = self.project_to_params(p, columns)
+            old = stored.get(str(p.project_id))
+            if old is not None and all(old[c] == row[c] for c in columns if c != "version"):
+                continue
+            row["version"] = (p.version or 0) + 1
+            params.append(row)
+            changed.append(p)
+        return params, changed
+
+    def _revert_conflicts(self, projects, error):
+        """
+        After a VersionConflictError `error`: overwrites the caller's stale copies with the stored
+        projects and publishes the difference, so views show what is stored again, then
+        publishes the conflicting ids as save_rejected.
+        """
+        for p in projects:
+            if str(p.project_id) not in error.conflicts:
+                continue
+            stored = self.get_project_by_projectid(p.project_id)
+            if stored is None or stored is p:
+                continue
+            changes = row_changes(p.to_dict(details=False), stored.to_dict())
+            for field in Project.FIELDS:
+                if field not in Project.HEAVY_FIELDS:
+                    setattr(p, field, getattr(stored, field))
+            p.set_details(stored.description, stored.attachments)
+            if changes:
+                self.events.emit(PROJECT_UPDATED, p, changes)
+        self.events.emit(SAVE_REJECTED, error.reasons())
+
+    def _fill_details(self, projects, fetch):
+        """
+        Loads the heavy fields of the summaries in `projects` (shared by the SQL backends).
+        `fetch(ids)` yields rows with project_id, description and attachments; projects
+        that are no longer stored get empty details.
+        """
+        pending = {}
+        for p in projects:
+            if not p.details_loaded:
+                pending.setdefault(str(p.project_id), []).append(p)
+        if not pending:
+            return
+        for row in fetch(list(pending)):
+            details = self.row_to_details(row)
+            for p in pending.pop(str(row["project_id"]), []):
+                p.set_details(details["description"], details["attachments"])
+        for waiting in pending.values():
+            for p in waiting:
+                p.set_details("", [])
+
+    # ----- Projects -----
+    @abstractmethod
+    def get_all_projects(self):
+        raise NotImplementedError
+
+    def get_project_by_projectid(self, project_id):
+        pid = str(project_id)
+        for p in self.get_all_projects():
+            if str(p.project_id) == pid:
+                return p
+        return None
+
+    def iter_projects(self):
+        yield from self.get_all_projects()
+
+    def get_project_summaries(self):
+        """
+        Returns every project for list views (table, Kanban, Gantt, charts).
+        Backends that can leave out description/attachments return summaries
+        (see Project.summary); here every project is complete.
+        """
+        return self.get_all_projects()
+
+    def load_project_details(self, projects):
+        """
+        Makes sure description/attachments of `projects` are loaded, e.g. for the
+        table rows scrolled into view. SQL backends fetch a whole batch in one query.
+        """
+        for p in projects:
+            p.load_details()
+
+    def get_projects_by_status(self, status):
+        return [p for p in self.iter_projects() if p.status == status]
+
+    def get_projects_by_assignee(self, username):
+        return [p for p in self.iter_projects() if username in (p.assignment or [])]
+
+    def get_projects_by_manager(self, manager):
+        return [p for p in self.iter_projects() if p.manager == manager]
+
+    def get_projects_by_priority(self, priority):
+        return [p for p in self.iter_projects() if p.priority == priority]
+
+    def count_projects(self, status=None):
+        return sum(1 for p in self.iter_projects() if status is None or p.status == status)
+
+    def find_projects(self, query, limit=None):
+        """
+        Returns projects whose project_id or name contains `query` (case-insensitive).
+        """
+        query = query.strip().lower()
+        found = []
+        for p in self.iter_projects():
+            if query in str(p.project_id).lower() or query in p.name.lower():
+                found.append(p)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def search_projects(self, query, limit=None):
+        """
+        Returns projects whose id, name, description, manager or assignees contain `query`,
+        ignoring case and diacritics, best match first.
+        """
+        from libs.SearchIndex import fold, fold_fields, score
+        query = fold(query)
+        if not query:
+            return []
+        hits = []
+        for i, p in enumerate(self.iter_projects()):
+            s = score(query, fold_fields(p.to_dict()))
+            if s:
+                hits.append((-s, i, p))
+        hits.sort(key=lambda h: h[:2])
+        return [p for _, _, p in hits[:limit]]
+
+    def _change_stamp(self):
+        """
+        Cheap value that changes when another client changes the stored projects (None: not
+        tracked). Changes made through this backend reach the cached columns through its events.
+        """
+        return None
+
+    def get_project_columns(self):
+        """
+        Returns a ProjectColumns (NumPy arrays) snapshot of every project, for charts and counts.
+        It is built with one scan on first use, then patched through this backend's
+        project events and only rebuilt when _change_stamp() changes.
+        """
+        stamp = self._change_stamp()
+        if self._columns is None or stamp != self._columns_stamp:
+            from libs.ProjectColumns import ProjectColumns
+            if self._columns is None:
+                self.events.subscribe(PROJECT_ADDED, self._patch_columns)
+                self.events.subscribe(PROJECT_UPDATED, self._patch_columns)
+                self.events.subscribe(PROJECT_DELETED, self._remove_column_row)
+            self._columns = ProjectColumns.from_projects(self.get_project_summaries())
+            self._columns_stamp = stamp
+        return self._columns
+
+    def _patch_columns(self, project, changes=None):
+        self._columns.patch(project)
+
+    def _remove_column_row(self, project_id, project=None):
+        self._columns.remove(project_id)
+
+    def get_dependency_graph(self):
+        """
+        Returns a DependencyGraph (Project.dependency edges, critical path schedule) of every project.
+        """
+        from libs.DependencyGraph import DependencyGraph
+        return DependencyGraph.from_projects(self.iter_projects())
+
+    def new_project_id(self):
+        """
+        Returns a new unique project id (PRJxxx), or None on error.
+        """
+        ids = self.reserve_project_ids(1)
+        return ids[0] if ids else None
+
+    def reserve_project_ids(self, count):
+        """
+        Returns `count` new project ids. Backends keep a persistent sequence;
+        this fallback scans every project and is only safe for a single writer.
+        """
+        from libs.IdAllocator import format_project_id, next_number_after
+        first = next_number_after(p.project_id for p in self.iter_projects())
+        return [format_project_id(n) for n in range(first, first + count)]
+
+    def add_project(self, project):
+        return self.save_project(project)
+
+    @abstractmethod
+    def save_project(self, project):
+        raise NotImplementedError
+
+    def save_projects(self, projects):
+        """
+        Updates or adds several projects (other projects are left untouched).
+        """
+        ok = True
+        for p in projects:
+            ok = self.save_project(p) and ok
+        return ok
+
+    @abstractmethod
+    def save_all_projects(self, projects):
+        raise NotImplementedError
+
+    def delete_projects(self, project_ids):
+        """
+        Deletes the projects with these ids. Returns the number of deleted projects, or -1 on error.
+        This fallback rewrites the project list with save_all_projects(); backends that
+        can delete rows in place override it.
+        """
+        ids = {str(pid) for pid in project_ids}
+        projects = self.get_all_projects()
+        kept = [p for p in projects if str(p.project_id) not in ids]
+        if len(kept) == len(projects):
+            return 0
+        return len(projects) - len(kept) if self.save_all_projects(kept) else -1
+
+    def commit_bulk(self, projects=(), deleted=(), notifications=()):
+        """
+        Saves `projects`, deletes the ids in `deleted` and appends `notifications`
+        (dicts), for bulk actions on many projects. Publishes the usual project events
+        and one notification_added per notification. Returns True on success.
+        This fallback is not atomic: it runs save_projects(), delete_projects() and one
+        notification write one after the other and stops at the first that fails, so
+        the earlier steps stay saved. The JSON and SQL backends override it with a
+        single change set.
+        """
+        projects, deleted, notifications = list(projects), list(deleted), list(notifications)
+        if projects and not self.save_projects(projects):
+            return False
+        if deleted and self.delete_projects(deleted) < 0:
+            return False
+        if notifications and not self.save_notifications(self.load_notifications() + notifications):
+            return False
+        for notification in notifications:
+            self.events.emit(NOTIFICATION_ADDED, notification)
+        return True
+
+    # ----- History -----
+    # The SQL backends keep one project_history row per saved change, written in the
+    # same transaction as the change. Besides the new values ("data" / "fields", as in
+    # the JSON history) an entry keeps the values it replaced ("old"), so the state at
+    # time T is the current rows with the entries saved after T undone, newest first.
+    def _read_history(self, project_id=None, since=None):
+        """
+        Yields the stored history entries (dicts) of one project (all if None), oldest
+        first, saved at or after `since` (epoch seconds, None = all). Overridden by
+        backends that keep a history.
+        """
+        return iter(())
+
+    def _history_start(self):
+        """
+        Epoch seconds at which the history starts, or None if the backend keeps none.
+        """
+        return None
+
+    def _history_entries(self, before, params, removed, ts):
+        """
+        History entries (ts, project_id, JSON text) of one write: `params` are the
+        upserted rows, `removed` the deleted ids, `before` the stored rows they replaced.
+        """
+        entries = []
+        for row in params:
+            pid = str(row["project_id"])
+            new = self.row_values(row, [c for c in row if c != "project_id"])
+            old = before.get(pid)
+            if old is None:
+                record = {"op": "put", "data": self.row_values(row, list(row))}
+            else:
+                old = self.row_values(old, list(new))
+                fields = {c: v for c, v in new.items() if old[c] != v}
+                record = {"op": "set", "project_id": pid, "fields": fields, "old": {c: old[c] for c in fields}}
+            entries.append((ts, pid, json.dumps({"ts": ts, **record}, default=str, ensure_ascii=False)))
+        for pid in removed:
+            record = {"op": "delete", "project_id": pid, "old": self.row_values(before[pid])}
+            entries.append((ts, pid, json.dumps({"ts": ts, **record}, default=str, ensure_ascii=False)))
+        return entries
+
+    @staticmethod
+    def _undo_history(rows, entries):
+        """
+        Turns `rows` ({project_id: values}) back to the state before `entries` (oldest first).
+        """
+        for entry in reversed(entries):
+            op = entry.get("op")
+            if op == "put":
+                rows.pop(str(entry["data"].get("project_id", "")), None)
+            elif op == "set" and entry.get("project_id") in rows:
+                pid = entry["project_id"]
+                rows[pid] = {**rows[pid], **entry.get("old", {})}
+            elif op == "delete":
+                rows[entry["project_id"]] = dict(entry.get("old") or {})
+
+    def get_project_history(self, project_id, since=None, until=None):
+        """
+        Returns the saved changes of one project, oldest first, as dicts
+        {"ts": epoch seconds, "op": "put" | "set" | "delete", "data" or "fields": ...}.
+        Backends that keep no history return [].
+        """
+        start = to_timestamp(since) if since is not None else None
+        end = to_timestamp(until) if until is not None else None
+        return [e for e in self._read_history(str(project_id), start) if end is None or e["ts"] <= end]
+
+    def get_project_at(self, project_id, when):
+        """
+        Returns the project as it was at `when` (datetime, date or epoch seconds),
+        or None if it did not exist then or the backend keeps no history.
+        """
+        ts = to_timestamp(when)
+        start = self._history_start()
+        if start is None or ts < start:
+            return None
+        pid = str(project_id)
+        current = self.get_project_by_projectid(pid)
+        rows = {pid: current.to_dict()} if current is not None else {}
+        self._undo_history(rows, [e for e in self._read_history(pid, ts) if e["ts"] > ts])
+        return Project.from_dict(rows[pid]) if pid in rows else None
+
+    def get_projects_at(self, when):
+        """
+        Returns every project as it was at `when` ([] without history, or before it starts).
+        """
+        ts = to_timestamp(when)
+        start = self._history_start()
+        if start is None or ts < start:
+            return []
+        rows = {str(p.project_id): p.to_dict() for p in self.iter_projects()}
+        self._undo_history(rows, [e for e in self._read_history(None, ts) if e["ts"] > ts])
+        return [Project.from_dict(row) for row in rows.values()]
+
+    # ----- Users -----
+    @abstractmethod
+    def get_all_users(self):
+        raise NotImplementedError
+
+    def get_user_by_username(self, username):
+        for u in self.get_all_users():
+            if u.Username == username:
+                return u
+        return None
+
+    def get_user_by_email(self, email):
+        email = (email or "").strip().lower()
+        for u in self.get_all_users():
+            if (u.Email or "").strip().lower() == email:
+                return u
+        return None
+
+    @abstractmethod
+    def add_user(self, user):
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_user(self, user):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_user(self, username):
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_all_users(self, users):
+        raise NotImplementedError
+
+    @abstractmethod
+    def login(self, username, password):
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_password(self, email, new_password):
+        raise NotImplementedError
+
+    # ----- Notifications -----
+    def add_notification(self, notification):
+        return self.save_notifications(self.load_notifications() + [notification])
+
+    def get_recent_notifications(self, limit=20, offset=0):
+        """
+        Returns up to `limit` notification dicts, newest first, skipping the `offset` newest.
+        """
+        return self.load_notifications()[::-1][offset:offset + limit]
+
+    @abstractmethod
+    def save_notifications(self, notifications):
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_notifications(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    # ----- Row <-> object (shared by the SQL backends) -----
+    @staticmethod
+    def project_to_params(project, columns=PROJECT_COLUMNS):
+        params = {}
+        for col in columns:
+            value = getattr(project, col)
+            if col in PROJECT_LIST_COLUMNS:
+                value = json.dumps(value or [], ensure_ascii=False)
+            elif col in PROJECT_BOOL_COLUMNS:
+                value = 1 if value else 0
+            params[col] = value
+        return params
+
+    @staticmethod
+    def row_values(row, columns=PROJECT_COLUMNS):
+        """
+        {column: value} of a project row with lists and booleans decoded.
+        """
+        data = {}
+        for col in columns:
+            value = row[col]
+            if col in PROJECT_LIST_COLUMNS:
+                value = json.loads(value) if value else []
+            elif col in PROJECT_BOOL_COLUMNS:
+                value = bool(value)
+            data[col] = value
+        return data
+
+    @staticmethod
+    def row_to_project(row):
+        return Project(**StorageBackend.row_values(row))
+
+    @staticmethod
+    def row_to_summary(row, loader):
+        """
+        Builds a summary Project from a row of PROJECT_SUMMARY_COLUMNS.
+        """
+        return Project.summary(StorageBackend.row_values(row, PROJECT_SUMMARY_COLUMNS), loader)
+
+    @staticmethod
+    def row_to_details(row):
+        """
+        {"description", "attachments"} of a row with those two columns (for Project.set_details).
+        """
+        return {"description": row["description"] or "",
+                "attachments": json.loads(row["attachments"]) if row["attachments"] else []}
+
+    @staticmethod
+    def user_to_params(user):
+        params = {col: getattr(user, col) for col in USER_COLUMNS}
+        params["EmailNorm"] = (user.Email or "").strip().lower()
+        return params
+
+    @staticmethod
+    def row_to_user(row):
+        return User(**{col: row[col] for col in USER_COLUMNS})
+
+
+def storage_config_file():
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, "..", "Dataset", "storage.json")
+
+
+def load_storage_config(config_file=None):
+    """
+    Reads the optional storage config, e.g.
+        {"backend": "sqlite", "sqlite": {"db_file": "Dataset/procheck.db"},
+         "mysql": {"host": "localhost", "user": "root", "password": "", "database": "procheck_db"}}
+    Returns {} if the file does not exist or cannot be read.
+    """
+    config_file = config_file or storage_config_file()
+    if not os.path.exists(config_file):
+        return {}
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        return config if isinstance(config, dict) else {}
+    except Exception as e:
+        print("Error reading storage config:", e)
+        return {}
+
+
+def create_connector(backend=None, **options):
+    """
+    Creates the storage backend chosen by (in order) the `backend` argument,
+    the PROCHECK_STORAGE environment variable, the "backend" key of
+    Dataset/storage.json, or JSON files by default.
+    Extra keyword arguments override the backend's section of the config file.
+    If a database backend cannot be opened the JSON backend is used instead.
+    """
+    config = load_storage_config()
+    backend = (backend or os.environ.get(BACKEND_ENV) or config.get("backend") or DEFAULT_BACKEND).strip().lower()
+    backend_options = {**(config.get(backend) or {}), **options}
+
+    try:
+        if backend == "sqlite":
+            from libs.SQLiteConnector import SQLiteConnector
+            return SQLiteConnector(**backend_options)
+        if backend == "mysql":
+            from libs.MySQLConnector import MySQLConnector
+            return MySQLConnector(**backend_options)
+        if backend != "json":
+            print(f"Unknown storage backend '{backend}', using JSON files.")
+            backend_options = {}
+    except Exception as e:
+        print(f"Error opening {backend} storage, using JSON files:", e)
+        backend_options = {}
+
+    from libs.DataConnector import DataConnector
+    return DataConnector(**backend_options)
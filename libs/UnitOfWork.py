@@ -0,0 +1,98 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from libs.EventBus import SAVE_REJECTED
+
+
+class ProjectUnitOfWork(QObject):
+    """
+    Collects edited (dirty) Project objects and writes them in one batch.
+
+    UI handlers call mark_dirty() on every change (slider tick, status combo,
+    Kanban drop, assignment edit). The batch is written when the debounce timer
+    fires, when flush() is called explicitly, or when the window closes.
+    `flushed` is emitted after each batch with the projects that were saved, the
+    refused changes ({project_id: reason}) and whether the whole batch was saved.
+    If the batch is refused because some projects were changed by another writer,
+    the backend reverts those copies to the stored data and publishes save_rejected;
+    the batch is then written once more so the other projects are still saved,
+    but the refused ones are not reported as saved. Projects that still could not
+    be saved stay pending for the next flush.
+    """
+
+    flushed = pyqtSignal(list, dict, bool)
+
+    def __init__(self, dc, delay_ms=300, parent=None):
+        super().__init__(parent)
+        self.dc = dc
+        self._dirty = {}  # project_id -> Project (keeps the latest object)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+        # Thống kê: số lần yêu cầu ghi và số lần ghi thật sự
+        self.requested_writes = 0
+        self.performed_writes = 0
+
+    @property
+    def coalesced_writes(self):
+        """Number of write requests that did not need their own file write."""
+        return self.requested_writes - self.performed_writes - len(self._dirty)
+
+    def has_pending(self):
+        return bool(self._dirty)
+
+    def mark_dirty(self, project):
+        """
+        Records that `project` changed and (re)starts the debounce timer.
+        """
+        if project is None:
+            return
+        self._dirty[str(project.project_id)] = project
+        self.requested_writes += 1
+        self.timer.start()
+
+    def discard(self, project_id):
+        """
+        Forgets pending changes for a project (e.g. it was deleted meanwhile).
+        """
+        self._dirty.pop(str(project_id), None)
+
+    def clear(self):
+        """
+        Drops every pending change, used when the caller writes the whole list itself.
+        """
+        self.timer.stop()
+        self._dirty.clear()
+
+    def flush(self):
+        """
+        Writes every dirty project in one batch. Returns True if every change was saved.
+        """
+        self.timer.stop()
+        if not self._dirty:
+            return True
+        projects = list(self._dirty.values())
+        self._dirty.clear()
+        rejected = {}
+        events = self.dc.events
+        events.subscribe(SAVE_REJECTED, rejected.update)
+        try:
+            ok = self.dc.save_projects(projects)
+            self.performed_writes += 1
+            if not ok and rejected:
+                # Bản bị xung đột đã được đưa về dữ liệu đang lưu: ghi lại để lưu các project còn lại
+                ok = self.dc.save_projects(projects)
+                self.performed_writes += 1
+        finally:
+            events.unsubscribe(SAVE_REJECTED, rejected.update)
+        saved = [p for p in projects if str(p.project_id) not in rejected]
+        if not ok:
+            print("❌ Error saving projects batch.")
+            for p in saved:
+                # Giữ lại để ghi ở lần flush sau (trừ khi đã được sửa tiếp trong lúc ghi)
+                self._dirty.setdefault(str(p.project_id), p)
+            saved = []
+        self.flushed.emit(saved, rejected, ok and not rejected)
+        return ok and not rejected
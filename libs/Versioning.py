@@ -0,0 +1,40 @@
+class VersionConflictError(ValueError):
+    """
+    Raised when a save is based on an older version of a project than the stored one
+    (another writer saved it in the meantime).
+    `conflicts` is {project_id: (version the save was based on, stored version)}.
+    """
+
+    def __init__(self, conflicts):
+        super().__init__("Changed by another writer: " + ", ".join(
+            f"{pid} (v{mine}, stored v{stored})" for pid, (mine, stored) in conflicts.items()
+        ))
+        self.conflicts = conflicts
+
+    def reasons(self):
+        """{project_id: message} for each conflicting project (payload of save_rejected)."""
+        return {pid: f"Changed by another writer (v{mine}, stored v{stored})"
+                for pid, (mine, stored) in self.conflicts.items()}
+
+
+def find_conflicts(expected, stored):
+    """
+    Compares {project_id: version the caller's copy was based on} with
+    {project_id: stored version}. Projects that are not stored (new, or
+    deleted meanwhile) are not conflicts: saving them creates them again.
+    """
+    conflicts = {}
+    for pid, version in expected.items():
+        current = stored.get(pid)
+        if current is not None and current != version:
+            conflicts[pid] = (version, current)
+    return conflicts
+
+
+def check_versions(expected, stored):
+    """
+    Raises VersionConflictError if find_conflicts() reports anything.
+    """
+    conflicts = find_conflicts(expected, stored)
+    if conflicts:
+        raise VersionConflictError(conflicts)
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# Chạy được cả bằng `pytest` lẫn `python -m pytest` từ thư mục gốc của repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Models.Project import Project  # noqa: E402
+
+
+def make_project(number, **fields):
+    data = dict(project_id=f"PRJ{number:03d}", name=f"Project {number}", assignment=["user1"], manager="user1",
+                status="Open", progress=0, start_date="01/01/2025", end_date="31/12/2025")
+    data.update(fields)
+    return Project(**data)
+
+
+@pytest.fixture
+def projects():
+    return [make_project(i) for i in range(1, 6)]
@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+
+import pytest
+
+from libs.SQLiteConnector import SQLiteConnector
+from tests.conftest import make_project
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLiteConnector(str(tmp_path / "procheck.db"))
+    yield db
+    db.close()
+
+
+def test_sqlite_batch_insert_then_update_in_one_transaction(db):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    projects = [make_project(i) for i in range(1, 1201)]
+    assert db.save_projects(projects)
+    assert sum(s.startswith("BEGIN") for s in statements) == 1
+    assert db.count_projects() == 1200
+    assert {p.version for p in projects} == {1}
+
+    statements.clear()
+    for p in projects[::3]:
+        p.status = "Completed"
+    assert db.save_projects(projects[::3])
+    assert sum(s.startswith("BEGIN") for s in statements) == 1
+    assert db.count_projects("Completed") == 400
+    assert db.get_project_by_projectid("PRJ004").status == "Completed"
+    assert db.get_project_by_projectid("PRJ002").status == "Open"
+
+
+def test_sqlite_batch_keeps_details_of_summaries(db):
+    db.save_projects([make_project(1, description="long text", attachments=["a.pdf"])])
+    summary = db.get_project_summaries()[0]
+    summary.progress = 50
+    assert db.save_projects([summary])
+    stored = db.get_project_by_projectid("PRJ001")
+    assert (stored.progress, stored.description, stored.attachments) == (50, "long text", ["a.pdf"])
+
+
+class FakeCursor:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, sql, params=None):
+        self.calls.append(("execute", sql, params))
+
+    def executemany(self, sql, rows):
+        self.calls.append(("executemany", sql, list(rows)))
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return None
+
+
+def test_mysql_upserts_are_sent_in_batches():
+    pytest.importorskip("mysql.connector")
+    from libs.MySQLConnector import MySQLConnector
+
+    cursor = FakeCursor()
+    db = MySQLConnector.__new__(MySQLConnector)
+    db.batch_size = 2
+
+    @contextmanager
+    def transaction():
+        yield cursor
+
+    db.transaction = transaction
+    assert db.save_projects([make_project(i) for i in range(1, 6)])
+    upserts = [rows for kind, sql, rows in cursor.calls if kind == "executemany" and "INSERT INTO projects" in sql]
+    assert [len(rows) for rows in upserts] == [2, 2, 1]
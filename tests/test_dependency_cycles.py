@@ -0,0 +1,33 @@
+from libs.DataConnector import DataConnector
+from libs.DataRepository import DataRepository
+from libs.EventBus import SAVE_REJECTED
+from tests.conftest import make_project
+
+
+def test_cycle_is_rejected_and_rest_of_batch_saved(tmp_path, projects):
+    dc = DataConnector(dataset_dir=str(tmp_path))
+    projects[1].dependency = "PRJ001"
+    assert dc.save_projects(projects)
+    rejected = []
+    dc.events.subscribe(SAVE_REJECTED, rejected.append)
+
+    live = {p.project_id: p for p in dc.get_all_projects()}
+    live["PRJ001"].dependency = "PRJ002"  # PRJ002 đã phụ thuộc PRJ001
+    live["PRJ003"].name = "Renamed"
+    assert not dc.save_projects([live["PRJ001"], live["PRJ003"]])
+
+    assert list(rejected[0]) == ["PRJ001"]
+    assert live["PRJ001"].dependency == ""
+    reread = {p.project_id: p for p in DataRepository(str(tmp_path)).get_projects()}
+    assert reread["PRJ001"].dependency == ""
+    assert reread["PRJ003"].name == "Renamed"
+
+
+def test_rejected_new_project_is_not_stored(tmp_path, projects):
+    dc = DataConnector(dataset_dir=str(tmp_path))
+    projects[0].dependency = "PRJ006"
+    new = make_project(6, dependency="PRJ001")
+    assert dc.save_projects(projects[1:])
+    assert not dc.save_projects([projects[0], new])
+    ids = {p.project_id for p in DataRepository(str(tmp_path)).get_projects()}
+    assert len(ids & {"PRJ001", "PRJ006"}) == 1
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from libs.FileLock import FileLock
+from libs.IdAllocator import IdSequence
+
+
+def test_reserve_hands_out_disjoint_blocks_across_threads(tmp_path):
+    path = str(tmp_path / "project_ids.seq")
+    firsts = []
+
+    def reserve():
+        # Mỗi luồng dùng một IdSequence riêng, như các tiến trình khác nhau
+        for _ in range(20):
+            firsts.append(IdSequence(path).reserve(5, seed=lambda: 1))
+
+    threads = [threading.Thread(target=reserve) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    numbers = [n for first in firsts for n in range(first, first + 5)]
+    assert sorted(numbers) == list(range(1, 401))
+    assert IdSequence(path).peek() == 401
+
+
+def test_reserve_seeds_once_and_moves_forward(tmp_path):
+    seq = IdSequence(str(tmp_path / "project_ids.seq"))
+    assert seq.peek() is None
+    assert seq.reserve(seed=lambda: 42) == 42
+    assert seq.reserve(seed=lambda: 1) == 43
+    assert seq.reserve(3, at_least=100) == 100
+    assert seq.peek() == 103
+    with pytest.raises(ValueError):
+        seq.reserve(0)
+
+
+def test_file_lock_is_reentrant_and_exclusive(tmp_path):
+    path = str(tmp_path / "projects.json.lock")
+    lock = FileLock(path)
+    results = []
+
+    def other():
+        try:
+            with FileLock(path, timeout=0.05):
+                results.append("acquired")
+        except TimeoutError:
+            results.append("timeout")
+
+    with lock:
+        with FileLock(path):
+            assert lock.held and lock.locked
+        assert lock.held
+        t = threading.Thread(target=other)
+        t.start()
+        t.join()
+    assert not lock.locked and not lock.held
+    t = threading.Thread(target=other)
+    t.start()
+    t.join()
+    assert results == ["timeout", "acquired"]
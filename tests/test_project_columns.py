@@ -0,0 +1,39 @@
+import pytest
+
+from libs.SQLiteConnector import SQLiteConnector
+from tests.conftest import make_project
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return str(tmp_path / "procheck.db")
+
+
+def test_columns_are_cached_and_patched_by_own_writes(db_file):
+    db = SQLiteConnector(db_file)
+    db.save_projects([make_project(i) for i in range(1, 5)])
+    columns = db.get_project_columns()
+    assert db.get_project_columns() is columns
+
+    project = db.get_project_by_projectid("PRJ002")
+    project.status = "Completed"
+    db.save_project(project)
+    db.save_project(make_project(9, status="Pending"))
+    db.delete_project("PRJ001")
+
+    assert db.get_project_columns() is columns
+    assert columns.status_counts() == {"Open": 2, "Pending": 1, "Ongoing": 0, "Completed": 1, "Canceled": 0}
+
+
+def test_columns_are_rebuilt_after_another_client_writes(db_file):
+    db = SQLiteConnector(db_file)
+    other = SQLiteConnector(db_file)
+    db.save_projects([make_project(i) for i in range(1, 4)])
+    columns = db.get_project_columns()
+
+    other.save_project(make_project(7, status="Canceled"))
+
+    rebuilt = db.get_project_columns()
+    assert rebuilt is not columns
+    assert rebuilt.status_counts()["Canceled"] == 1
+    assert len(rebuilt) == 4
@@ -0,0 +1,44 @@
+import threading
+
+from libs.DataConnector import DataConnector
+from libs.EventBus import PROJECT_DELETED, PROJECT_UPDATED
+from libs.SQLiteConnector import SQLiteConnector
+
+
+def test_sqlite_reads_pre_images_in_the_write_transaction(tmp_path, projects):
+    db = SQLiteConnector(str(tmp_path / "procheck.db"))
+    assert db.save_projects(projects)
+    updated, deleted = [], []
+    db.events.subscribe(PROJECT_UPDATED, lambda p, changes: updated.append((p.project_id, changes)))
+    db.events.subscribe(PROJECT_DELETED, lambda pid, old: deleted.append((pid, old.name)))
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+
+    projects[0].status = "Completed"
+    assert db.commit_bulk(projects[:2], deleted=["PRJ005"])
+    reads = [s for s in statements if s.startswith("SELECT")]
+    assert len(reads) == 1 and "IN" in reads[0]
+    assert statements.index(reads[0]) > next(i for i, s in enumerate(statements) if s.startswith("BEGIN"))
+    assert updated[0] == ("PRJ001", {"status": ("Open", "Completed"), "version": (1, 2)})
+    assert deleted == [("PRJ005", "Project 5")]
+    db.close()
+
+
+def test_json_events_run_after_the_locks_are_released(tmp_path, projects):
+    dc = DataConnector(dataset_dir=str(tmp_path))
+    assert dc.save_projects(projects)
+    repo = dc.repository
+    seen = []
+
+    def on_updated(project, changes):
+        other = threading.Thread(target=lambda: seen.append(repo._lock.acquire(timeout=1) and repo._lock.release()))
+        other.start()
+        other.join()
+        seen.append(repo.write_lock.held)
+
+    dc.events.subscribe(PROJECT_UPDATED, on_updated)
+    live = dc.get_all_projects()[0]
+    live.name = "Renamed"
+    assert dc.save_projects([live])
+    # lock lấy được từ luồng khác (release trả về None) và luồng này không giữ write_lock
+    assert seen == [None, False]
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from ui.MainWindowNew.ProjectTableModel import ProjectFilterProxy, ProjectTableModel  # noqa: E402
+from tests.conftest import make_project  # noqa: E402
+
+
+@pytest.fixture
+def proxy():
+    model = ProjectTableModel()
+    model.set_projects([make_project(i, status="Open" if i % 2 else "Pending") for i in range(1, 9)])
+    proxy = ProjectFilterProxy("Open")
+    proxy.setSourceModel(model)
+    return proxy
+
+
+def shown(proxy):
+    return [proxy.project(row).project_id for row in range(proxy.rowCount())]
+
+
+def test_search_result_is_shown_best_match_first(proxy):
+    proxy.set_matches(["PRJ007", "PRJ002", "PRJ003", "PRJ001"])
+    # PRJ002 là Pending: bị lọc khỏi tab Open, thứ tự theo hạng được giữ
+    assert shown(proxy) == ["PRJ007", "PRJ003", "PRJ001"]
+
+
+def test_clearing_the_search_restores_model_order(proxy):
+    proxy.set_matches(["PRJ005", "PRJ001"])
+    proxy.set_matches(None)
+    assert shown(proxy) == ["PRJ001", "PRJ003", "PRJ005", "PRJ007"]
+
+
+def test_large_results_keep_model_order(proxy, monkeypatch):
+    monkeypatch.setattr(ProjectFilterProxy, "MAX_RANKED", 2)
+    proxy.set_matches(["PRJ005", "PRJ003", "PRJ001"])
+    assert shown(proxy) == ["PRJ001", "PRJ003", "PRJ005"]
+
+
+def test_rows_loaded_after_clearing_a_search_keep_model_order(proxy, monkeypatch):
+    proxy.set_matches(["PRJ005", "PRJ001"])
+    proxy.set_matches(None)
+    calls = []
+    less_than = ProjectFilterProxy.lessThan
+    monkeypatch.setattr(ProjectFilterProxy, "lessThan", lambda self, l, r: calls.append(1) or less_than(self, l, r))
+    # Nạp thêm dòng (như ChunkedLoader) rồi sửa một dòng sau khi đã xoá ô tìm kiếm
+    proxy.sourceModel().extend([make_project(i, status="Open") for i in (9, 10)])
+    proxy.invalidateFilter()
+    assert shown(proxy) == ["PRJ001", "PRJ003", "PRJ005", "PRJ007", "PRJ009", "PRJ010"]
+    assert calls == []
+
+
+def test_less_than_falls_back_to_model_order_without_a_rank(proxy):
+    model = proxy.sourceModel()
+    first, second = model.index(0, 0), model.index(2, 0)
+    assert proxy.lessThan(first, second) and not proxy.lessThan(second, first)
+    proxy.set_matches(["PRJ003"])
+    # PRJ001 không có trong kết quả: so theo thứ tự dòng thay vì lỗi KeyError
+    assert proxy.lessThan(first, second)
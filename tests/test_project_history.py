@@ -0,0 +1,58 @@
+import os
+import time
+
+from libs.DataConnector import DataConnector
+from libs.ProjectHistory import ProjectHistory
+
+
+def tick():
+    time.sleep(0.01)
+    now = time.time()
+    time.sleep(0.01)
+    return now
+
+
+def test_json_rebuilds_projects_at_a_point_in_time(tmp_path, projects):
+    dc = DataConnector(dataset_dir=str(tmp_path))
+    t_empty = tick()
+    assert dc.save_projects(projects)
+    t_created = tick()
+    live = dc.get_project_by_projectid("PRJ001")
+    live.status = "Completed"
+    assert dc.save_project(live)
+    t_updated = tick()
+    assert dc.delete_projects(["PRJ002"]) == 1
+
+    assert dc.get_projects_at(t_empty) == []
+    assert dc.get_project_at("PRJ001", t_created).status == "Open"
+    assert dc.get_project_at("PRJ001", t_updated).status == "Completed"
+    assert dc.get_project_at("PRJ002", t_updated) is not None
+    assert dc.get_project_at("PRJ002", time.time()) is None
+    assert [p.project_id for p in dc.get_projects_at(t_created)] == [p.project_id for p in projects]
+    assert [e["op"] for e in dc.get_project_history("PRJ001")] == ["put", "set"]
+
+
+def test_checkpoints_scale_with_the_dataset(tmp_path, projects):
+    history = ProjectHistory(str(tmp_path / "history"), checkpoint_size=1)
+    rows = {}
+
+    def save(status):
+        records = [{"op": "set", "project_id": "PRJ001", "fields": {"status": status}}]
+        history.record(records, lambda: rows)
+        rows["PRJ001"]["status"] = status
+
+    rows.update((p.project_id, {"project_id": p.project_id, "status": "Open", "name": "x" * 200})
+                for p in projects)
+    history.record([{"op": "put", "data": dict(r)} for r in rows.values()], lambda: {})
+    t_first = tick()
+    for i in range(30):
+        save(f"S{i}")
+
+    checkpoints = history._load_index()["checkpoints"]
+    # Mỗi checkpoint (~1 KB) chỉ được ghi khi các entry từ checkpoint trước đã lớn bằng nó
+    assert 1 < len(checkpoints) < 10
+    for before, after in zip(checkpoints, checkpoints[1:]):
+        assert after["offset"] - before["offset"] >= before["size"]
+    assert history.project_at("PRJ001", t_first)["status"] == "Open"
+    assert history.project_at("PRJ001", time.time())["status"] == "S29"
+    assert len(os.listdir(tmp_path / "history")) == len(checkpoints) + 2
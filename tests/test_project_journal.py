@@ -0,0 +1,116 @@
+import pytest
+
+from libs.DataConnector import DataConnector
+from libs.DataRepository import DataRepository
+from libs.EventBus import SAVE_REJECTED
+from libs.SQLiteConnector import SQLiteConnector
+
+
+def notification(project_id, action="deleted"):
+    return {"username": "user1", "action": action, "project_id": project_id, "time_str": "00:00:00 - 01/01/2025"}
+
+
+@pytest.fixture
+def dc(tmp_path, projects):
+    dc = DataConnector(dataset_dir=str(tmp_path))
+    assert dc.save_projects(projects)
+    return dc
+
+
+def reread(tmp_path):
+    # Repository mới (không dùng cache): đọc lại snapshot + journal từ đĩa
+    return {p.project_id: p for p in DataRepository(str(tmp_path)).get_projects()}
+
+
+def test_stale_copy_is_a_conflict_and_is_reverted(tmp_path, dc):
+    stale = reread(tmp_path)["PRJ001"]
+    live = dc.get_project_by_projectid("PRJ001")
+    live.name = "Theirs"
+    assert dc.save_project(live)
+
+    rejected = []
+    dc.events.subscribe(SAVE_REJECTED, rejected.append)
+    stale.name = "Mine"
+    assert not dc.save_project(stale)
+
+    assert list(rejected[0]) == ["PRJ001"]
+    assert "stored v2" in rejected[0]["PRJ001"]
+    assert (stale.name, stale.version) == ("Theirs", 2)
+    assert reread(tmp_path)["PRJ001"].name == "Theirs"
+
+
+def test_journal_replays_and_compacts(tmp_path, dc):
+    live = {p.project_id: p for p in dc.get_all_projects()}
+    live["PRJ001"].status = "Completed"
+    live["PRJ002"].progress = 50
+    assert dc.save_projects([live["PRJ001"], live["PRJ002"]])
+    assert dc.delete_projects(["PRJ005"]) == 1
+    journal = dc.repository.journal
+    assert journal.size() > 0
+
+    before = reread(tmp_path)
+    assert sorted(before) == ["PRJ001", "PRJ002", "PRJ003", "PRJ004"]
+    assert (before["PRJ001"].status, before["PRJ001"].version) == ("Completed", 2)
+    assert before["PRJ002"].progress == 50
+
+    assert dc.compact_projects()
+    assert journal.size() == 0
+    after = reread(tmp_path)
+    assert {pid: (p.status, p.progress, p.version) for pid, p in after.items()} == \
+        {pid: (p.status, p.progress, p.version) for pid, p in before.items()}
+
+    # Ghi tiếp sau khi compact vẫn đọc lại đúng
+    live["PRJ003"].name = "After compaction"
+    assert dc.save_project(live["PRJ003"])
+    assert reread(tmp_path)["PRJ003"].name == "After compaction"
+
+
+def test_json_commit_bulk_saves_deletes_and_notifies_at_once(tmp_path, dc):
+    live = {p.project_id: p for p in dc.get_all_projects()}
+    live["PRJ001"].status = "Completed"
+    size = dc.repository.journal.size()
+    assert dc.commit_bulk([live["PRJ001"]], ["PRJ002"],
+                          [notification("PRJ001", "changed status of"), notification("PRJ002")])
+    assert reread(tmp_path)["PRJ001"].status == "Completed"
+    assert "PRJ002" not in reread(tmp_path)
+    assert dc.repository.journal.size() > size
+    assert [n["project_id"] for n in dc.get_recent_notifications()] == ["PRJ002", "PRJ001"]
+
+
+def test_json_commit_bulk_writes_nothing_on_a_conflict(tmp_path, dc):
+    stale = reread(tmp_path)
+    live = dc.get_project_by_projectid("PRJ001")
+    live.name = "Theirs"
+    assert dc.save_project(live)
+    stale["PRJ001"].status = "Completed"
+    stale["PRJ003"].status = "Completed"
+
+    assert not dc.commit_bulk([stale["PRJ001"], stale["PRJ003"]], ["PRJ002"], [notification("PRJ002")])
+    stored = reread(tmp_path)
+    assert (stored["PRJ001"].status, stored["PRJ003"].status) == ("Open", "Open")
+    assert "PRJ002" in stored
+    assert dc.get_recent_notifications() == []
+
+
+def test_sqlite_commit_bulk_is_one_transaction(tmp_path, projects):
+    db = SQLiteConnector(str(tmp_path / "procheck.db"))
+    assert db.save_projects(projects)
+    projects[0].status = "Completed"
+    assert db.commit_bulk([projects[0]], ["PRJ002"], [notification("PRJ002")])
+    assert db.get_project_by_projectid("PRJ001").status == "Completed"
+    assert db.get_project_by_projectid("PRJ002") is None
+    assert len(db.get_recent_notifications()) == 1
+
+    # PRJ003 được connection khác lưu trước: cả lô không được ghi
+    other = SQLiteConnector(str(tmp_path / "procheck.db"))
+    theirs = other.get_project_by_projectid("PRJ003")
+    theirs.name = "Theirs"
+    assert other.save_project(theirs)
+    other.close()
+    projects[2].name = "Mine"
+    projects[3].status = "Completed"
+    assert not db.commit_bulk([projects[2], projects[3]], ["PRJ004"], [notification("PRJ004")])
+    assert db.get_project_by_projectid("PRJ004").status == "Open"
+    assert db.get_project_by_projectid("PRJ003").name == "Theirs"
+    assert len(db.get_recent_notifications()) == 1
+    db.close()
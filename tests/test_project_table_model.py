@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import Qt  # noqa: E402
+
+from ui.MainWindowNew.ProjectTableModel import ProjectTableModel  # noqa: E402
+from tests.conftest import make_project  # noqa: E402
+
+NAME = 2
+ASC = Qt.SortOrder.AscendingOrder
+
+
+def ids(model):
+    return [p.project_id for p in model.projects()]
+
+
+@pytest.fixture
+def model():
+    model = ProjectTableModel()
+    model.set_projects([make_project(i, name=name) for i, name in enumerate("DBCA", 1)])
+    model.sort_by([(NAME, ASC)])
+    return model
+
+
+def test_sort_by_name(model):
+    assert ids(model) == ["PRJ004", "PRJ002", "PRJ003", "PRJ001"]
+
+
+def test_reconcile_sorts_changed_projects_by_their_new_values(model):
+    # Đối tượng mới cùng id: khoá sắp xếp đã cache theo tên cũ không được dùng lại
+    fresh = [make_project(i, name=name) for i, name in enumerate("DZCA", 1)]
+    stats = model.reconcile(fresh)
+    assert ids(model) == ["PRJ004", "PRJ003", "PRJ001", "PRJ002"]
+    assert stats["updated"] == 1
+
+
+def test_reconcile_inserts_and_removes_in_sorted_order(model):
+    projects = [p for p in model.projects() if p.project_id != "PRJ003"] + [make_project(5, name="BB")]
+    stats = model.reconcile(projects)
+    assert ids(model) == ["PRJ004", "PRJ002", "PRJ005", "PRJ001"]
+    assert (stats["removed"], stats["inserted"]) == (1, 1)
+
+
+def test_extend_then_resort_applies_the_active_sort(model):
+    model.extend([make_project(5, name="AA"), make_project(6, name="E")])
+    assert ids(model)[-2:] == ["PRJ005", "PRJ006"]
+    model.resort()
+    assert ids(model) == ["PRJ004", "PRJ005", "PRJ002", "PRJ003", "PRJ001", "PRJ006"]
@@ -0,0 +1,67 @@
+from libs.SearchIndex import SearchIndex, fold, fold_fields, score, trigrams
+
+
+def row(pid, name, description="", manager="", assignment=()):
+    return {"project_id": pid, "name": name, "description": description,
+            "manager": manager, "assignment": list(assignment)}
+
+
+def build(*rows):
+    return SearchIndex.from_rows({r["project_id"]: r for r in rows})
+
+
+def test_fold_strips_case_diacritics_and_extra_spaces():
+    assert fold("  Dự   Án Đường ") == "du an duong"
+    assert fold("Crème Brûlée") == "creme brulee"
+    assert fold(None) == ""
+
+
+def test_trigrams_and_fields():
+    assert trigrams("abcd") == {"abc", "bcd"}
+    assert trigrams("ab") == set()
+    pid, name, rest = fold_fields(row("PRJ001", "Xây Nhà", "Mô tả", "Lan", ["an", "binh"]))
+    assert (pid, name) == ("prj001", "xay nha")
+    # Các field khác được nối bằng ký tự phân cách, nên không khớp xuyên qua hai field
+    assert "mo ta" in rest and "an binh" in rest and score("ta lan", (pid, name, rest)) == 0
+
+
+def test_ranking_best_match_first():
+    index = build(
+        row("PRJ010", "Website redesign"),
+        row("PRJ001", "Mobile app"),
+        row("PRJ002", "Old website"),
+        row("PRJ003", "Backend", description="website api"),
+        row("PRJ004", "Websites"),
+    )
+    # Tiền tố tên > từ trong tên > mô tả; cùng hạng giữ thứ tự đánh chỉ mục
+    assert index.search("website") == ["PRJ010", "PRJ004", "PRJ002", "PRJ003"]
+    assert index.search("prj001") == ["PRJ001"]
+    assert index.search("WEBSITE", limit=2) == ["PRJ010", "PRJ004"]
+    assert index.search("xyz") == []
+
+
+def test_put_reindexes_a_changed_project():
+    index = build(row("PRJ001", "Alpha"), row("PRJ002", "Beta"))
+    index.put("PRJ001", row("PRJ001", "Gamma"))
+    assert index.search("alpha") == []
+    assert index.search("gamma") == ["PRJ001"]
+    index.put("PRJ003", row("PRJ003", "Gamma ray"))
+    assert index.search("gamma") == ["PRJ001", "PRJ003"]
+    assert len(index) == 3
+
+
+def test_remove_drops_the_project_and_its_postings():
+    index = build(row("PRJ001", "Alpha"), row("PRJ002", "Alphabet"))
+    index.remove("PRJ001")
+    index.remove("PRJ404")
+    assert index.search("alpha") == ["PRJ002"]
+    assert len(index) == 1
+    assert all(0 not in docs for docs in index._main.values())
+
+
+def test_short_queries_use_the_flat_text_and_see_later_changes():
+    index = build(row("PRJ001", "Ab"), row("PRJ002", "Cd"), row("PRJ003", "xab"))
+    assert index.search("ab") == ["PRJ001", "PRJ003"]
+    index.put("PRJ002", row("PRJ002", "Abc"))
+    index.remove("PRJ001")
+    assert index.search("ab") == ["PRJ002", "PRJ003"]
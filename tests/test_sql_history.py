@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from libs.SQLiteConnector import SQLiteConnector
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLiteConnector(str(tmp_path / "procheck.db"))
+    yield db
+    db.close()
+
+
+def tick():
+    # ts của lịch sử được cắt tới ms: mốc thời gian cách xa cả lần lưu trước lẫn sau
+    time.sleep(0.01)
+    now = time.time()
+    time.sleep(0.01)
+    return now
+
+
+def test_sqlite_rebuilds_projects_at_a_point_in_time(db, projects):
+    assert db.save_projects(projects)
+    t_created = tick()
+    projects[0].status = "Completed"
+    projects[0].description = "done"
+    assert db.save_projects(projects[:2])
+    t_updated = tick()
+    assert db.delete_project("PRJ002")
+    tick()
+
+    history = db.get_project_history("PRJ001")
+    assert [e["op"] for e in history] == ["put", "set"]
+    assert history[1]["fields"] == {"status": "Completed", "description": "done", "version": 2}
+
+    before = db.get_project_at("PRJ001", t_created)
+    assert (before.status, before.description, before.version) == ("Open", "", 1)
+    assert db.get_project_at("PRJ001", t_updated).status == "Completed"
+    assert db.get_project_at("PRJ002", t_updated) is not None
+    assert db.get_project_by_projectid("PRJ002") is None
+
+    at_created = {p.project_id: p for p in db.get_projects_at(t_created)}
+    assert sorted(at_created) == [p.project_id for p in projects]
+    assert at_created["PRJ001"].status == "Open"
+    assert len(db.get_projects_at(time.time())) == 4
+
+
+def test_sqlite_history_starts_with_the_database(db, projects):
+    assert db.get_projects_at(0) == []
+    assert db.get_project_at("PRJ001", 0) is None
+    assert db.save_projects(projects)
+    assert db.get_project_history("PRJ001", until=0) == []
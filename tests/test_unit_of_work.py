@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from libs.EventBus import PROJECT_UPDATED, SAVE_REJECTED  # noqa: E402
+from libs.SQLiteConnector import SQLiteConnector  # noqa: E402
+from libs.UnitOfWork import ProjectUnitOfWork  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, projects):
+    db = SQLiteConnector(str(tmp_path / "procheck.db"))
+    db.save_projects(projects)
+    yield db
+    db.close()
+
+
+def test_flush_saves_the_rest_of_a_batch_with_a_conflict(tmp_path, db):
+    mine = {p.project_id: p for p in db.get_all_projects()}
+    other = SQLiteConnector(str(tmp_path / "procheck.db"))
+    theirs = other.get_project_by_projectid("PRJ002")
+    theirs.name = "Theirs"
+    assert other.save_project(theirs)
+    other.close()
+
+    rejected, flushed = [], []
+    db.events.subscribe(SAVE_REJECTED, rejected.append)
+    uow = ProjectUnitOfWork(db)
+    uow.flushed.connect(lambda saved, refused, ok: flushed.append(([p.project_id for p in saved], list(refused), ok)))
+    mine["PRJ001"].progress = 40
+    mine["PRJ002"].name = "Mine"  # PRJ002 đã được connection khác lưu
+    uow.mark_dirty(mine["PRJ001"])
+    uow.mark_dirty(mine["PRJ002"])
+
+    # PRJ001 được lưu, nhưng lần flush không được báo là đã lưu PRJ002
+    assert not uow.flush()
+    assert list(rejected[0]) == ["PRJ002"]
+    assert flushed == [(["PRJ001"], ["PRJ002"], False)]
+    assert not uow.has_pending()
+    assert mine["PRJ002"].name == "Theirs"
+    assert db.get_project_by_projectid("PRJ001").progress == 40
+    assert db.get_project_by_projectid("PRJ002").name == "Theirs"
+
+
+def test_flush_keeps_projects_pending_when_the_write_fails(db):
+    project = db.get_project_by_projectid("PRJ001")
+    project.progress = 10
+    uow = ProjectUnitOfWork(db)
+    flushed = []
+    uow.flushed.connect(lambda saved, refused, ok: flushed.append((saved, refused, ok)))
+    uow.mark_dirty(project)
+    db.conn.execute("CREATE TRIGGER no_writes BEFORE UPDATE ON projects BEGIN SELECT RAISE(ABORT, 'read only'); END")
+
+    assert not uow.flush()
+    assert flushed == [([], {}, False)]
+    assert uow.has_pending()
+
+
+def test_save_all_bumps_only_changed_rows(db):
+    updated = []
+    db.events.subscribe(PROJECT_UPDATED, lambda project, changes: updated.append(project.project_id))
+    projects = db.get_all_projects()
+    projects[2].status = "Completed"
+    assert db.save_all_projects(projects)
+    assert [p.version for p in projects] == [1, 1, 2, 1, 1]
+    assert {p.project_id: p.version for p in db.get_all_projects()}["PRJ002"] == 1
+    assert updated == ["PRJ003"]
@@ -9,7 +9,7 @@ from PyQt6.QtGui import QIcon, QPixmap
 
 from libs.email_assignee import send_assignment_html_email
 from ui.AddProjectWindow.AddProjectWindowNew import Ui_MainWindow
-from libs.DataConnector import DataConnector
+from libs.StorageBackend import create_connector
 from Models.Project import Project
 from ui.InformationAssigneeWindow.AssingeeMainWindowExt import AssigneeMainWindowExt
 
@@ -21,15 +21,17 @@ class AddProjectWindowNewExt(Ui_MainWindow):
     Extended class to handle adding a new project with support for multiple assignees.
     lineEditProjectID đã được bỏ; ta auto-generate project_id dạng PRJxxx.
     """
-    def __init__(self, onProjectAdded=None, main_ext=None):
+    def __init__(self, onProjectAdded=None, main_ext=None, dc=None):
         super().__init__()
         self.MainWindow = None
         self.onProjectAdded = onProjectAdded
         self.main_ext = main_ext
 
-        self.dc = DataConnector()
+        if dc is None:
+            dc = main_ext.dc if main_ext is not None else create_connector()
+        self.dc = dc
         self.users = self.dc.get_all_users()       # For populating assignees
-        self.projects = self.dc.get_all_projects() # For populating dependency list
+        self.projects = self.dc.get_project_summaries() # For populating dependency list (ids only)
 
         self.selected_assignees = []  # Store selected assignee usernames
         self.more_expanded = False
@@ -66,25 +68,6 @@ class AddProjectWindowNewExt(Ui_MainWindow):
     def showWindow(self):
         self.MainWindow.show()
 
-    # 1) Hàm tự sinh Project ID
-    def generate_new_project_id(self) -> str:
-        """
-        Tìm Project ID có dạng PRJxxx cao nhất, rồi +1.
-        Ví dụ: PRJ001, PRJ002,...
-        """
-        max_num = 0
-        for p in self.projects:
-            if p.project_id.startswith("PRJ"):
-                suffix = p.project_id[3:].strip()  # cắt "PRJ"
-                try:
-                    num = int(suffix)
-                    if num > max_num:
-                        max_num = num
-                except ValueError:
-                    pass
-        new_num = max_num + 1
-        return f"PRJ{new_num:03d}"
-
     # 2) Load combobox assignees
     def load_assignees(self):
         self.comboBoxAssignee.clear()
@@ -141,13 +124,16 @@ class AddProjectWindowNewExt(Ui_MainWindow):
         desc = self.lineEditProjectName_2.text().strip()  # "task description"
         status = self.comboBoxStatus.currentText()
 
-        # Generate ID
-        proj_id = self.generate_new_project_id()
-
         if not proj_name:
             QMessageBox.warning(self.MainWindow, "Warning", "Project name is required.")
             return
 
+        # Lấy ID mới từ sequence của tầng dữ liệu (không quét project, không trùng giữa các cửa sổ/tiến trình)
+        proj_id = self.dc.new_project_id()
+        if not proj_id:
+            QMessageBox.warning(self.MainWindow, "Error", "Could not allocate a new project ID.")
+            return
+
         start_str = self.dateTimeStartDate.dateTime().toString("dd/MM/yyyy")
         end_str = self.dateTimeEndDate.dateTime().toString("dd/MM/yyyy")
 
@@ -192,8 +178,18 @@ class AddProjectWindowNewExt(Ui_MainWindow):
             attachments=attachments_list
         )
 
+        # Không cho tạo vòng phụ thuộc (A phụ thuộc B, B phụ thuộc A, ...)
+        if dependency_pick:
+            cycle = self.dc.get_dependency_graph().would_create_cycle(proj_id, dependency_pick)
+            if cycle:
+                QMessageBox.warning(self.MainWindow, "Dependency cycle",
+                                    "This dependency would create a cycle:\n" + " -> ".join(cycle))
+                return
+
         # Save
-        self.dc.add_project(new_proj)
+        if not self.dc.add_project(new_proj):
+            QMessageBox.warning(self.MainWindow, "Error", "Could not save the project.")
+            return
 
         # Send email to each user
         for username in self.selected_assignees:
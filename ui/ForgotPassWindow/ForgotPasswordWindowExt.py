@@ -2,10 +2,14 @@ from PyQt6.QtWidgets import QMessageBox, QMainWindow
 from PyQt6.QtWidgets import QLineEdit
 from ui.ForgotPassWindow.ForgotPasswordWindow import Ui_MainWindow
 from OTP.otp_handler import generate_otp, send_otp_html_email
-from libs.DataConnector import DataConnector
+from libs.StorageBackend import create_connector
 
 
 class ForgotPasswordWindowExt(Ui_MainWindow):
+    def __init__(self, dc=None):
+        super().__init__()
+        self.dc = dc
+
     def setupUi(self, MainWindow):
         """
         Sets up the UI for a QMainWindow-based interface.
@@ -16,7 +20,8 @@ class ForgotPasswordWindowExt(Ui_MainWindow):
         self.setupSignalAndSlot()
         self.user_email = None
         self.otp_code = None
-        self.dc = DataConnector()
+        if self.dc is None:
+            self.dc = create_connector()
 
         # Trạng thái hiện/ẩn mật khẩu
         self.new_password_visible = False
@@ -44,9 +49,7 @@ class ForgotPasswordWindowExt(Ui_MainWindow):
             return
 
         # Check if email exists in user database
-        users = self.dc.get_all_users()
-        email_found = any(user.Email.strip().lower() == self.user_email.lower() for user in users)
-        if not email_found:
+        if not self.dc.get_user_by_email(self.user_email):
             QMessageBox.warning(self.MainWindow, "Error", "The entered email does not exist in our system.")
             return
 
@@ -100,7 +103,7 @@ class ForgotPasswordWindowExt(Ui_MainWindow):
                                  "Failed to update password. Please check your email and try again.")
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = LoginMainWindowExt()
+        self.myui = LoginMainWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()
 
@@ -108,7 +111,7 @@ class ForgotPasswordWindowExt(Ui_MainWindow):
         from ui.LoginWindow.LoginMainWindowExt import LoginMainWindowExt
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = LoginMainWindowExt()
+        self.myui = LoginMainWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()
 
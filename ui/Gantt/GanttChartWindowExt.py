@@ -13,7 +13,7 @@ Features:
 """
 
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from PyQt6.QtCore import Qt, QTimer, QRect, QSize
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont
@@ -23,7 +23,8 @@ from PyQt6.QtWidgets import (
     QHeaderView, QCalendarWidget, QMessageBox
 )
 
-from libs.DataConnector import DataConnector
+from libs.DateUtils import ordinal_to_datetime
+from libs.StorageBackend import create_connector
 from ui.Gantt.GanttChartWindow import Ui_MainWindow  # This is your .ui generated Python file
 
 # Mapping for project status to a color (for completed portion)
@@ -51,8 +52,8 @@ class GanttChartView(QWidget):
         # Default start date (will be recalculated in load_projects)
         self.start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=3)
 
-        # DataConnector instance for project data
-        self.dc = DataConnector()
+        # Storage backend (JSON / SQLite / MySQL, chosen by configuration)
+        self.dc = create_connector()
         self.load_projects()
         self.update_minimum_size()
 
@@ -80,32 +81,20 @@ class GanttChartView(QWidget):
 
     def load_projects(self):
         """Load projects from DataConnector and determine the chart's start date."""
-        self.projects = self.dc.get_all_projects()
+        self.projects = self.dc.get_project_summaries()
         print("Projects loaded:", self.projects)
         if not self.projects:
             self.start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=3)
         else:
-            try:
-                earliest = min([self.parse_date(proj.start_date) for proj in self.projects])
-                print("Earliest project start date:", earliest)
-            except Exception as e:
-                print("Error parsing project dates:", e)
-                earliest = datetime.now()
-            self.start_date = earliest - timedelta(days=3)
+            # Ngày bắt đầu sớm nhất lấy từ cột NumPy (min vector hoá), không có ngày hợp lệ thì dùng hôm nay
+            earliest, _ = self.dc.get_project_columns().date_range()
+            if earliest is None:
+                earliest = date.today().toordinal()
+            self.start_date = ordinal_to_datetime(earliest) - timedelta(days=3)
         print("Chart start date set to:", self.start_date)
         self.update_minimum_size()
         self.update()
 
-    def parse_date(self, date_str):
-        """Attempt to parse a date string using several formats."""
-        formats = ["%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        return datetime.now()
-
     def wheelEvent(self, event):
         """SHIFT+Mouse Wheel scrolls horizontally by adjusting start_date."""
         if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
@@ -231,12 +220,14 @@ class GanttChartView(QWidget):
         painter.setClipRect(clip_rect)
 
         # 10) Draw project bars
+        today = date.today().toordinal()
+        chart_start = self.start_date.toordinal()
         for idx, project in enumerate(self.projects):
             y = self.header_height + idx * self.row_height
-            sdate = self.parse_date(project.start_date)
-            edate = self.parse_date(project.end_date)
-            days_from_start = (sdate - self.start_date).days
-            duration = (edate - sdate).days + 1
+            s_ord = project.start_ordinal if project.start_ordinal is not None else today
+            e_ord = project.end_ordinal if project.end_ordinal is not None else today
+            days_from_start = s_ord - chart_start
+            duration = e_ord - s_ord + 1
             if days_from_start < 0:
                 duration += days_from_start
                 days_from_start = 0
@@ -356,7 +347,7 @@ class GanttChartWindowExt(Ui_MainWindow):
     def setupUi(self, MainWindow):
         super().setupUi(MainWindow)
         self.MainWindow = MainWindow
-        self.dc = DataConnector()
+        self.dc = create_connector()
         self.setupSignalAndSlot()
 
         # Use ClickableGanttChartView for interactivity
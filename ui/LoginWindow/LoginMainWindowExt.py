@@ -2,14 +2,16 @@ from PyQt6.QtWidgets import QMainWindow, QMessageBox
 from PyQt6.QtCore import Qt
 from PyQt6 import QtWidgets
 
-from libs.DataConnector import DataConnector
+from libs.StorageBackend import create_connector
 from ui.LoginWindow.LoginMainWindow import Ui_MainWindow
 from ui.MainWindowNew.MainWindowNewExt import MainWindowNewExt
 from ui.RegisterWindow.RegisterMainWindowExt import RegisterMainWindowExt
 
 class LoginMainWindowExt(Ui_MainWindow):
-    def __init__(self):
+    def __init__(self, dc=None):
         super().__init__()
+        # Backend lưu trữ (JSON/SQLite/MySQL) được chọn theo cấu hình
+        self.dc = dc if dc is not None else create_connector()
         self.failed_attempts = 0
         self.max_attempts = 3
         self.password_hidden = True  # Start with hidden password
@@ -39,7 +41,7 @@ class LoginMainWindowExt(Ui_MainWindow):
         from ui.ForgotPassWindow.ForgotPasswordWindowExt import ForgotPasswordWindowExt
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = ForgotPasswordWindowExt()
+        self.myui = ForgotPasswordWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()
 
@@ -47,12 +49,12 @@ class LoginMainWindowExt(Ui_MainWindow):
         """Open 'Register' window."""
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = RegisterMainWindowExt()
+        self.myui = RegisterMainWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()
 
     def process_login(self):
-        dc = DataConnector()
+        dc = self.dc
         uid = self.lineEditUsername.text().strip()
         pwd = self.lineEditPassword.text().strip()
 
@@ -75,7 +77,7 @@ class LoginMainWindowExt(Ui_MainWindow):
             # Pass the authenticated user to MainWindowNewExt
             self.MainWindow.close()
             self.mainwindow = QMainWindow()
-            self.myui = MainWindowNewExt(self.mainwindow, current_user=user)
+            self.myui = MainWindowNewExt(self.mainwindow, current_user=user, dc=dc)
             self.myui.showWindow()
         else:
             self.failed_attempts += 1
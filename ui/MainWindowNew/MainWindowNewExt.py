@@ -1,30 +1,38 @@
 import json
 import sys
+import time
 import logging
-from collections import Counter
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import os
 
-from PyQt6.QtCore import Qt, QDate, QSize, QTimer, QRect
+from PyQt6.QtCore import Qt, QDate, QSize, QTimer, QRect, QEvent, QObject, QPointF, pyqtSignal
 from PyQt6.QtGui import (QFont, QPainter, QPixmap, QPen, QColor, QAction, QIcon)
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QDialog, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, QSlider, QCheckBox,
-    QTableWidgetItem, QMenu, QMessageBox, QListWidget, QListWidgetItem, QFrame,
-    QInputDialog, QFileDialog, QScrollArea, QToolButton, QSystemTrayIcon, QCalendarWidget, QHeaderView, QSizePolicy
+    QLabel, QLineEdit, QPushButton, QComboBox,
+    QMenu, QMessageBox, QListWidget, QListWidgetItem, QFrame, QAbstractItemView,
+    QInputDialog, QFileDialog, QScrollArea, QToolButton, QSystemTrayIcon, QCalendarWidget, QHeaderView, QSizePolicy,
+    QProgressBar
 )
-from PyQt6.QtCharts import QChart, QChartView, QPieSeries, QLineSeries
+from PyQt6.QtCharts import QChart, QChartView, QPieSeries, QPieSlice, QLineSeries
 
 from Models.Notification import Notification
 # ---------------------------------------------------------------------
-# 1) Import DataConnector, Models, and UI files
+# 1) Import storage backend, Models, and UI files
 # ---------------------------------------------------------------------
-from libs.DataConnector import DataConnector
+from libs.ChunkedLoader import ChunkedLoader
+from libs.DateUtils import ordinal_to_datetime, to_ordinal
+from libs.EventBus import EVENTS, NOTIFICATION_ADDED, PROJECT_ADDED, PROJECT_DELETED, PROJECT_UPDATED, SAVE_REJECTED
+from libs.StorageBackend import create_connector
+from libs.UnitOfWork import ProjectUnitOfWork
 from libs.email_utils import send_assignment_html_email
 from Models.Project import Project
 from Models.User import User
 from ui.AddProjectWindow.AddProjectWindowNewExt import AddProjectWindowNewExt
 from ui.MainWindowNew.MainWindow_new import Ui_MainWindow
+from ui.MainWindowNew.ProjectTableModel import (
+    PROJECT_ROLE, ButtonDelegate, ProgressDelegate, ProjectFilterProxy, ProjectTableModel, StatusDelegate
+)
 
 # ---------------------------------------------------------------------
 # 2) Dialogs for editing assignments
@@ -76,8 +84,7 @@ class AddAssigneeWindow(QDialog):
 
         # Thêm vào assignment
         self.project.assignment.append(username)
-        self.dc.save_all_projects(self.main_ext.projects)
-        self.main_ext.update_ui()
+        self.main_ext.uow.mark_dirty(self.project)
 
         # Gửi email
         if selected_user.Email:
@@ -127,9 +134,8 @@ class EditAssignmentDialog(QDialog):
 
     def load_assignments(self):
         self.list_assignees.clear()
-        all_users = self.main_ext.dc.get_all_users()
         for username in self.project.assignment:
-            user_obj = next((u for u in all_users if u.Username == username), None)
+            user_obj = self.dc.get_user_by_username(username)
             display_text = username
             if user_obj and user_obj.Email:
                 display_text += f" ({user_obj.Email})"
@@ -158,8 +164,7 @@ class EditAssignmentDialog(QDialog):
         menu.exec(self.list_assignees.mapToGlobal(pos))
 
     def update_main_table(self):
-        self.main_ext.dc.save_all_projects(self.main_ext.projects)
-        self.main_ext.update_ui()
+        self.main_ext.uow.mark_dirty(self.project)
 
 
 # ---------------------------------------------------------------------
@@ -244,14 +249,15 @@ class KanbanColumn(QListWidget):
                 if isinstance(source_item, ProjectItem):
                     project = source_item.project
                     project.status = self.status
-                    new_item = ProjectItem(project)
+                    # Chuyển chính item đó sang cột mới (main_ext giữ item theo project_id)
+                    source.takeItem(source.row(source_item))
                     drop_index = self.indexAt(event.position().toPoint())
                     if drop_index.isValid():
-                        self.insertItem(drop_index.row(), new_item)
+                        self.insertItem(drop_index.row(), source_item)
                     else:
-                        self.addItem(new_item)
-                    source.takeItem(source.row(source_item))
-                    self.update_callback()
+                        self.addItem(source_item)
+                    source_item.update_text()
+                    self.update_callback(project)
                 event.acceptProposedAction()
 
 
@@ -265,6 +271,7 @@ class ProjectDetailsDialog(QDialog):
         self.setWindowTitle("Project Details")
         self.project = project
         layout = QVBoxLayout(self)
+        # Với bản summary, description/attachments được nạp từ backend ở lần đọc đầu tiên dưới đây
 
         details = [
             f"Project ID: {project.project_id}",
@@ -280,6 +287,15 @@ class ProjectDetailsDialog(QDialog):
             f"Description: {project.description}",
             f"Attachments: {', '.join(project.attachments)}",
         ]
+        # Lịch theo phụ thuộc (critical path) nếu cửa sổ cha có backend
+        dc = getattr(parent, "dc", None)
+        schedule = dc.get_dependency_graph().schedule(project.project_id) if dc else None
+        if schedule:
+            details += [
+                f"Earliest Start: {schedule['earliest_start'].strftime('%d/%m/%Y')}",
+                f"Latest Start: {schedule['latest_start'].strftime('%d/%m/%Y')}",
+                f"Slack: {schedule['slack']} day(s)" + (" - critical path" if schedule["critical"] else ""),
+            ]
         for d in details:
             lbl = QLabel(d)
             layout.addWidget(lbl)
@@ -431,6 +447,32 @@ class GanttNamesView(QWidget):
         self.setFixedWidth(self.label_width)
         self.update()
 
+    def _resize(self):
+        self.setMinimumHeight(self.header_height + len(self.projects)*self.row_height + 10)
+
+    def _update_row(self, row):
+        self.update(0, self.header_height + row*self.row_height, self.label_width, self.row_height)
+
+    def set_project(self, row, project):
+        self.projects[row] = project
+        self._update_row(row)
+
+    def add_project(self, project):
+        self.projects.append(project)
+        self._resize()
+        self._update_row(len(self.projects) - 1)
+
+    def extend(self, projects):
+        first = len(self.projects)
+        self.projects.extend(projects)
+        self._resize()
+        self.update(0, self.header_height + first*self.row_height, self.label_width, len(projects)*self.row_height)
+
+    def remove_row(self, row):
+        del self.projects[row]
+        self._resize()
+        self.update()
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -482,18 +524,21 @@ class GanttTimeLineView(QWidget):
         self.label_width = 0 # phải trùng hoặc gần với GanttNamesView để canh cột
 
         self.start_date = None
+        self.start_ordinal = None
+        self.bar_days = []  # (start_ordinal, end_ordinal) cho từng project
+
+    @staticmethod
+    def _bar_days(project, today):
+        # Ngày đã được parse sẵn thành ordinal trên Project; ngày lỗi dùng hôm nay như trước
+        return (project.start_ordinal if project.start_ordinal is not None else today,
+                project.end_ordinal if project.end_ordinal is not None else today)
 
     def set_projects(self, projects):
-        self.projects = projects
-        if projects:
-            earliest = None
-            for p in projects:
-                dt = self._parse_date(p.start_date)
-                if not earliest or dt < earliest:
-                    earliest = dt
-            self.start_date = earliest if earliest else datetime.now()
-        else:
-            self.start_date = datetime.now()
+        self.projects = list(projects)
+        today = date.today().toordinal()
+        self.bar_days = [self._bar_days(p, today) for p in self.projects]
+        self.start_ordinal = min((s for s, _ in self.bar_days), default=today)
+        self.start_date = ordinal_to_datetime(self.start_ordinal)
 
         # Tính chiều cao tối thiểu
         total_height = self.header_height + len(projects)*self.row_height + 20
@@ -502,14 +547,48 @@ class GanttTimeLineView(QWidget):
         self.setMinimumSize(timeline_w, total_height)
         self.update()
 
-    def _parse_date(self, date_str):
-        fmts = ["%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y"]
-        for f in fmts:
-            try:
-                return datetime.strptime(date_str, f)
-            except:
-                pass
-        return datetime.now()
+    def _update_row(self, row):
+        self.update(0, self.header_height + row*self.row_height, self.width(), self.row_height)
+
+    def set_project(self, row, project):
+        """Redraws the bar of one project; the whole view only if the timeline start moves."""
+        self.projects[row] = project
+        old_start = self.bar_days[row][0]
+        self.bar_days[row] = self._bar_days(project, date.today().toordinal())
+        if self.bar_days[row][0] < self.start_ordinal or old_start == self.start_ordinal:
+            self.set_projects(self.projects)
+        else:
+            self._update_row(row)
+
+    def add_project(self, project):
+        self.projects.append(project)
+        self.bar_days.append(self._bar_days(project, date.today().toordinal()))
+        if self.bar_days[-1][0] < self.start_ordinal:
+            self.set_projects(self.projects)
+            return
+        self.setMinimumHeight(self.header_height + len(self.projects)*self.row_height + 20)
+        self._update_row(len(self.projects) - 1)
+
+    def extend(self, projects):
+        first = len(self.projects)
+        today = date.today().toordinal()
+        self.projects.extend(projects)
+        self.bar_days.extend(self._bar_days(p, today) for p in projects)
+        if min((s for s, _ in self.bar_days[first:]), default=self.start_ordinal) < self.start_ordinal:
+            self.set_projects(self.projects)
+            return
+        self.setMinimumHeight(self.header_height + len(self.projects)*self.row_height + 20)
+        self.update(0, self.header_height + first*self.row_height, self.width(), len(projects)*self.row_height)
+
+    def remove_row(self, row):
+        del self.projects[row]
+        start, _ = self.bar_days.pop(row)
+        if start == self.start_ordinal:
+            # Có thể là project bắt đầu sớm nhất: tính lại điểm đầu timeline
+            self.set_projects(self.projects)
+            return
+        self.setMinimumHeight(self.header_height + len(self.projects)*self.row_height + 20)
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -578,13 +657,12 @@ class GanttTimeLineView(QWidget):
         # Vẽ thanh progress cho mỗi project
         for idx, proj in enumerate(self.projects):
             top_y = self.header_height + idx*self.row_height
-            start_dt = self._parse_date(proj.start_date)
-            end_dt   = self._parse_date(proj.end_date)
-            if end_dt < start_dt:
-                end_dt = start_dt
+            start_ord, end_ord = self.bar_days[idx]
+            if end_ord < start_ord:
+                end_ord = start_ord
 
-            days_from_start = (start_dt - self.start_date).days
-            dur = (end_dt - start_dt).days + 1
+            days_from_start = start_ord - self.start_ordinal
+            dur = end_ord - start_ord + 1
             if days_from_start < 0:
                 dur += days_from_start
                 days_from_start = 0
@@ -645,6 +723,7 @@ class GanttContainer(QWidget):
         super().__init__(parent)
         self.namesView = GanttNamesView()
         self.timelineView = GanttTimeLineView()
+        self._rows = {}  # project_id -> row
 
         # Scroll cho cột tên
         self.namesScroll = QScrollArea()
@@ -685,24 +764,126 @@ class GanttContainer(QWidget):
     def set_projects(self, projects):
         self.namesView.set_projects(projects)
         self.timelineView.set_projects(projects)
+        self._rows = {str(p.project_id): i for i, p in enumerate(projects)}
         # Đưa scrollbar về top
         self.namesScroll.verticalScrollBar().setValue(0)
         self.timelineScroll.verticalScrollBar().setValue(0)
 
+    # --- Cập nhật từng project (không dựng lại cả biểu đồ) ---
+    def update_project(self, project):
+        row = self._rows.get(str(project.project_id))
+        if row is None:
+            self.add_project(project)
+            return
+        self.namesView.set_project(row, project)
+        self.timelineView.set_project(row, project)
+
+    def add_project(self, project):
+        self._rows[str(project.project_id)] = len(self.timelineView.projects)
+        self.namesView.add_project(project)
+        self.timelineView.add_project(project)
+
+    def extend(self, projects):
+        """Appends the projects not shown yet (chunked loading: one resize per chunk)."""
+        projects = [p for p in projects if str(p.project_id) not in self._rows]
+        if not projects:
+            return
+        for p in projects:
+            self._rows[str(p.project_id)] = len(self._rows)
+        self.namesView.extend(projects)
+        self.timelineView.extend(projects)
+
+    def remove_project(self, project_id):
+        row = self._rows.pop(str(project_id), None)
+        if row is None:
+            return
+        for pid, r in self._rows.items():
+            if r > row:
+                self._rows[pid] = r - 1
+        self.namesView.remove_row(row)
+        self.timelineView.remove_row(row)
+
+    def remove_projects(self, project_ids):
+        """Removes several projects with one relayout (bulk delete); the scroll position is kept."""
+        ids = {str(pid) for pid in project_ids}
+        if ids.isdisjoint(self._rows):
+            return
+        projects = [p for p in self.timelineView.projects if str(p.project_id) not in ids]
+        self.namesView.set_projects(projects)
+        self.timelineView.set_projects(projects)
+        self._rows = {str(p.project_id): i for i, p in enumerate(projects)}
+
+class DataEventRelay(QObject):
+    """
+    Subscribes to a backend's EventBus and re-emits every event as a Qt signal,
+    so handlers always run in the GUI thread (events may come from the
+    background compaction thread).
+    """
+    received = pyqtSignal(str, object)
+
+    def __init__(self, events, parent=None):
+        super().__init__(parent)
+        self.events = events
+        self._callbacks = {}
+        for event in EVENTS:
+            self._callbacks[event] = events.subscribe(event, self._forwarder(event))
+
+    def _forwarder(self, event):
+        return lambda *args: self.received.emit(event, args)
+
+    def close(self):
+        for event, callback in self._callbacks.items():
+            self.events.unsubscribe(event, callback)
+        self._callbacks = {}
+
+
 class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
-    def __init__(self, main_window: QMainWindow, current_user: User = None):
+    NOTIFICATION_PAGE_SIZE = 20
+    STATUSES = ("Open", "Pending", "Ongoing", "Completed", "Canceled")
+    PRIORITIES = ("Priority 1", "Priority 2", "Priority 3", "Priority 4")
+    NOTIFICATION_ICON = "D:/PHẦN MỀM QUẢN LÝ DỰ ÁN_FINALPROJECT/Image/notification_8625350.png"
+    GANTT_FIELDS = {"name", "start_date", "end_date", "progress"}
+
+    # Nạp dần khi khởi động: số dòng nạp ngay (một màn hình) và số dòng mỗi lượt của event loop
+    FIRST_CHUNK = 100
+    CHUNK_SIZE = 1000
+
+    def __init__(self, main_window: QMainWindow, current_user: User = None, dc=None):
         super().__init__()
+        started_at = time.perf_counter()
         self.MainWindow = main_window
         self.setupUi(self.MainWindow)
 
-        self.dc = DataConnector()
-        self.projects = self.dc.get_all_projects() or []
+        # JSON / SQLite / MySQL: backend được truyền vào hoặc chọn theo cấu hình
+        self.dc = dc if dc is not None else create_connector()
+        # Gom các thay đổi liên tục (slider, status, kanban...) thành 1 lần ghi
+        self.uow = ProjectUnitOfWork(self.dc, parent=self)
+        self.uow.flushed.connect(self._on_projects_flushed)
+        self._pending_refreshes = []
+        self.MainWindow.installEventFilter(self)
+        QApplication.instance().aboutToQuit.connect(self.uow.flush)
+
+        # Bản summary: description/attachments chỉ được nạp cho các dòng đang hiện (xem ProjectTableModel)
+        self.projects = self.dc.get_project_summaries() or []
         self.users = self.dc.get_all_users() or []
         self.current_user = current_user
 
-        self.notification_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Dataset", "notifications.json")
         self.notifications = []
 
+        # Trạng thái của các view để cập nhật từng phần theo sự kiện
+        # Một model cho mọi bảng project; mỗi bảng xem qua một proxy lọc theo status + tìm kiếm
+        self.project_model = ProjectTableModel(load_details=self.dc.load_project_details, parent=self)
+        self.project_model.edited.connect(self.on_table_edited)
+        self._table_proxies = {}    # None (All Projects) / status -> ProjectFilterProxy
+        self._kanban_items = {}     # project_id -> ProjectItem
+        self._status_counts = {}
+        self._week_counts = {}
+        self._loader = None         # ChunkedLoader khi khởi động
+        self._loading_bar = None
+        self._deferred_events = None  # sự kiện nhận được trong lúc ghi một thao tác hàng loạt
+        self.events = DataEventRelay(self.dc.events, parent=self)
+        self.events.received.connect(self._on_data_event)
+
         self.setup_tray_icon()
 
         # Setup UI
@@ -713,23 +894,13 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         self.setup_account_tab()
         self.setup_gantt_tab()
 
-        #setup tab Open, Pending, Ongoing, Completed, Canceled
-        self.setup_tab_open()
-        self.setup_tab_pending()
-        self.setup_tab_ongoing()
-        self.setup_tab_completed()
-        self.setup_tab_canceled()
-
         self.setup_notifications_tab()
         self.load_notifications()
         self.update_notifications_view()
 
-        print("Notifications count =", len(self.notifications))
-
-        # Load
+        # Load: một màn hình ngay, phần còn lại được nạp dần từ event loop
         self.update_project_counts()
-        self.show_projects()
-        self.load_kanban_projects()
+        self.start_progressive_load(started_at)
         self.update_account_display()
 
         if hasattr(self, "labelWelcome") and self.current_user:
@@ -740,6 +911,262 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
     def showWindow(self):
         self.MainWindow.showMaximized()
 
+    def eventFilter(self, obj, event):
+        # Ghi các thay đổi còn chờ trước khi cửa sổ đóng
+        if obj is self.MainWindow and event.type() == QEvent.Type.Close:
+            self.uow.flush()
+            self.events.close()
+        return super().eventFilter(obj, event)
+
+    # --- Lưu dữ liệu (unit of work) ---
+    def schedule_refresh(self, refresh_fn=None):
+        """Queues a view refresh that runs once, after the pending changes are written."""
+        if refresh_fn and refresh_fn not in self._pending_refreshes:
+            self._pending_refreshes.append(refresh_fn)
+        if not self.uow.has_pending():
+            self._run_pending_refreshes()
+
+    def _run_pending_refreshes(self):
+        # Các view đã được cập nhật qua sự kiện của backend; chỉ chạy các refresh được yêu cầu riêng
+        refreshes = self._pending_refreshes
+        self._pending_refreshes = []
+        for fn in refreshes:
+            fn()
+
+    def _on_projects_flushed(self, saved, rejected, ok):
+        self._run_pending_refreshes()
+        if not hasattr(self, "statusbar"):
+            return
+        if ok:
+            self.statusbar.showMessage(
+                f"Saved {len(saved)} project(s) - {self.uow.coalesced_writes} write(s) coalesced so far", 5000)
+        elif rejected and saved:
+            # Các thay đổi bị từ chối đã được báo bằng on_save_rejected
+            self.statusbar.showMessage(f"Saved {len(saved)} project(s); {len(rejected)} change(s) not saved", 5000)
+        elif not rejected:
+            self.statusbar.showMessage("Could not save the changes; they will be saved again later")
+
+    # --- Cập nhật giao diện theo sự kiện của backend (chỉ phần bị ảnh hưởng) ---
+    def _on_data_event(self, event, args):
+        if self._deferred_events is not None:
+            # Đang ghi một thao tác hàng loạt: áp dụng tất cả một lần khi ghi xong (_apply_bulk_events)
+            self._deferred_events.append((event, args))
+            return
+        handler = {
+            PROJECT_ADDED: self.on_project_added,
+            PROJECT_UPDATED: self.on_project_updated,
+            PROJECT_DELETED: self.on_project_deleted,
+            NOTIFICATION_ADDED: self.on_notification_added,
+            SAVE_REJECTED: self.on_save_rejected,
+        }.get(event)
+        if handler is not None:
+            handler(*args)
+
+    def on_project_added(self, project):
+        pid = str(project.project_id)
+        if not any(str(p.project_id) == pid for p in self.projects):
+            self.projects.append(project)
+        self.project_model.put(project)
+        self._bump_status_count(project.status, 1)
+        self._bump_week_count(project.start_ordinal, 1)
+        self._kanban_put(project)
+        if hasattr(self, "gantt_container"):
+            self.gantt_container.add_project(project)
+
+    def on_project_updated(self, project, changes):
+        """Patches the cells, card, bar and chart points of one project; `changes` is {field: (old, new)}."""
+        # Một dataChanged; proxy của các tab tự chuyển dòng sang tab của trạng thái mới
+        self.project_model.update(project, changes)
+        if "status" in changes:
+            old, new = changes["status"]
+            self._bump_status_count(old, -1)
+            self._bump_status_count(new, 1)
+        if "start_date" in changes:
+            old, new = changes["start_date"]
+            self._bump_week_count(to_ordinal(old), -1)
+            self._bump_week_count(to_ordinal(new), 1)
+        if "status" in changes or "name" in changes:
+            self._kanban_put(project)
+        if hasattr(self, "gantt_container") and not self.GANTT_FIELDS.isdisjoint(changes):
+            self.gantt_container.update_project(project)
+
+    def on_project_deleted(self, project_id, project=None):
+        pid = str(project_id)
+        for i, p in enumerate(self.projects):
+            if str(p.project_id) == pid:
+                del self.projects[i]
+                break
+        self.project_model.remove(pid)
+        if self._loader is not None:
+            self._loader.discard(pid)
+        if project is not None:
+            self._bump_status_count(project.status, -1)
+            self._bump_week_count(project.start_ordinal, -1)
+        else:
+            # Không biết trạng thái cũ: đếm lại từ backend
+            self.update_project_counts()
+            self.draw_pie_chart()
+            self.draw_line_chart()
+        item = self._kanban_items.pop(pid, None)
+        if item is not None and item.listWidget() is not None:
+            item.listWidget().takeItem(item.listWidget().row(item))
+        if hasattr(self, "gantt_container"):
+            self.gantt_container.remove_project(pid)
+
+    def on_save_rejected(self, rejected):
+        """Tells the user which changes the backend refused; `rejected` is {project_id: reason}."""
+        lines = [f"{pid}: {reason}" for pid, reason in sorted(rejected.items())]
+        QMessageBox.warning(self.MainWindow, "Changes not saved",
+                            "These changes were not saved:\n" + "\n".join(lines))
+
+    def on_notification_added(self, data):
+        noti = self._notifications_from_dicts([data])[0]
+        self.notifications.insert(0, noti)
+        # Chỉ thêm 1 card mới lên đầu thay vì dựng lại toàn bộ danh sách
+        if hasattr(self, "notificationLayout"):
+            self.notificationLayout.insertWidget(0, self.create_notification_card(noti))
+
+    def _bump_status_count(self, status, delta):
+        count = self._status_counts[status] = self._status_counts.get(status, 0) + delta
+        if status not in self.STATUSES:
+            return
+        label = getattr(self, f"lbl{status}Count", None)
+        if label is not None:
+            label.setText(str(count))
+        series = getattr(self, "_pie_series", None)
+        if series is None:
+            return
+        pie_slice = self._pie_slices.get(status)
+        if pie_slice is None:
+            if count > 0:
+                # Giữ thứ tự trạng thái như khi vẽ lần đầu
+                pos = sum(1 for s in self.STATUSES[:self.STATUSES.index(status)] if s in self._pie_slices)
+                pie_slice = self._pie_slices[status] = QPieSlice(f"{status} ({count})", count)
+                series.insert(pos, pie_slice)
+        elif count > 0:
+            pie_slice.setValue(count)
+            pie_slice.setLabel(f"{status} ({count})")
+        else:
+            series.remove(pie_slice)
+            del self._pie_slices[status]
+
+    def _bump_week_count(self, ordinal, delta):
+        series = getattr(self, "_line_series", None)
+        if series is None or ordinal is None:
+            return
+        week = date.fromordinal(ordinal).isocalendar()[1]
+        counts = self._week_counts
+        is_new = week not in counts
+        counts[week] = counts.get(week, 0) + delta
+        # Các điểm của series luôn theo thứ tự tuần tăng dần (tối đa 53 điểm)
+        pos = sorted(counts).index(week)
+        if is_new:
+            series.insert(pos, QPointF(week, counts[week]))
+        else:
+            series.replace(pos, week, counts[week])
+        for axis in self._line_chart.axes(Qt.Orientation.Horizontal):
+            axis.setRange(min(counts), max(counts))
+        for axis in self._line_chart.axes(Qt.Orientation.Vertical):
+            axis.setRange(min(counts.values()), max(counts.values()))
+
+    def _kanban_put(self, project):
+        """Adds the card of a project or moves it to the column of its status."""
+        pid = str(project.project_id)
+        column = self.kanban_columns.get(project.status) if hasattr(self, "kanban_columns") else None
+        item = self._kanban_items.get(pid)
+        if item is None:
+            if column is not None:
+                item = self._kanban_items[pid] = ProjectItem(project)
+                column.addItem(item)
+            return
+        item.project = project
+        current = item.listWidget()
+        if current is not column:
+            if current is not None:
+                current.takeItem(current.row(item))
+            if column is None:
+                del self._kanban_items[pid]
+                return
+            column.addItem(item)
+        item.update_text()
+
+    # --- Bảng project (All Projects: key None, các tab: key = status) ---
+    def _project_table(self, key):
+        if key is None:
+            return self.tableWidgetAllProjects
+        if key in self.STATUSES:
+            return getattr(self, f"tableWidget{key}", None)
+        return None
+
+    def _setup_project_table(self, key):
+        """Shows the shared project model in the table of `key` through its own filter proxy."""
+        table = self._project_table(key)
+        if table is None:
+            return None
+        proxy = self._table_proxies[key] = ProjectFilterProxy(key, parent=self)
+        proxy.setSourceModel(self.project_model)
+        table.setModel(proxy)
+        buttons = ButtonDelegate(table)
+        buttons.clicked.connect(lambda index, key=key: self.on_table_button_clicked(key, index))
+        table.setItemDelegateForColumn(ProjectTableModel.ASSIGNMENT, buttons)
+        table.setItemDelegateForColumn(ProjectTableModel.DETAILS, buttons)
+        table.setItemDelegateForColumn(ProjectTableModel.STATUS, StatusDelegate(self.STATUSES, table))
+        table.setItemDelegateForColumn(ProjectTableModel.PROGRESS, ProgressDelegate(table))
+        # Combo/slider chỉ được tạo khi người dùng bấm vào ô status/progress
+        table.setEditTriggers(QAbstractItemView.EditTrigger.CurrentChanged
+                              | QAbstractItemView.EditTrigger.SelectedClicked
+                              | QAbstractItemView.EditTrigger.DoubleClicked
+                              | QAbstractItemView.EditTrigger.EditKeyPressed)
+        table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        table.customContextMenuRequested.connect(lambda pos, key=key: self.show_context_menu(pos, key))
+        table.horizontalHeader().setStretchLastSection(True)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Bấm header: sắp xếp theo khoá tính sẵn; -1: giữ thứ tự nạp cho tới lần bấm đầu tiên
+        table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        table.setSortingEnabled(True)
+        return proxy
+
+    def _search_box(self, key):
+        return getattr(self, "lineEditSearchAll" if key is None else f"lineEditSearch{key}", None)
+
+    def _table_project(self, key, pos):
+        """Project in the row under `pos` (viewport coordinates of the table), or None."""
+        table = self._project_table(key)
+        proxy = self._table_proxies.get(key)
+        if table is None or proxy is None:
+            return None
+        index = table.indexAt(pos)
+        return proxy.project(index.row()) if index.isValid() else None
+
+    def on_table_edited(self, project, field, value):
+        """A status/progress editor of a project table changed a value."""
+        if field == "status":
+            self.on_status_changed(project, value)
+        else:
+            project.progress = value
+            # Ghi file được gom lại (debounce) trong self.uow; các view khác cập nhật khi ghi xong
+            self.uow.mark_dirty(project)
+
+    def on_table_button_clicked(self, key, index):
+        project = index.data(PROJECT_ROLE)
+        if project is None:
+            return
+        if index.column() == ProjectTableModel.ASSIGNMENT:
+            dlg = EditAssignmentDialog(self, project)
+            dlg.exec()
+            self.uow.mark_dirty(project)
+            self.project_model.update(project, ("assignment",))
+        else:
+            dlg = ProjectDetailsDialog(project, self.MainWindow if key is None else self)
+            dlg.exec()
+
+    def search_projects(self, query, status=None):
+        """Ranked search (id, name, description, manager, assignees; accents ignored), optionally for one status."""
+        found = self.dc.search_projects(query)
+        if status is not None:
+            found = [p for p in found if p.status == status]
+        return found
+
     def setup_search_buttons(self):
         """Gắn sự kiện cho các nút Home, Today, Activity (trong tab Search)."""
         if hasattr(self, "pushButtonHome"):
@@ -764,22 +1191,6 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         # Tùy theo thứ tự tab, bạn chỉnh index cho đúng
         self.QWidget.setCurrentIndex(5)
 
-    #  Tạo hàm sinh Project ID tự động: "PRJ001", "PRJ002", ...
-    # ---------------------------------------------------------------------
-    def generate_new_project_id(self) -> str:
-        max_num = 0
-        for p in self.projects:
-            if p.project_id.startswith("PRJ"):
-                try:
-                    num_part = p.project_id[3:]  # Bỏ "PRJ"
-                    num_val = int(num_part)
-                    if num_val > max_num:
-                        max_num = num_val
-                except:
-                    pass
-        new_num = max_num + 1
-        return f"PRJ{new_num:03d}"
-
     # --- PHẦN THÔNG BÁO ---
 
     def create_notification_card(self, noti: Notification) -> QWidget:
@@ -848,6 +1259,11 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
             scroll.setWidget(self.notificationContainer)
             layout.addWidget(scroll)
 
+            # Chỉ tải trang mới nhất; nút này tải thêm các thông báo cũ hơn
+            self.btnLoadMoreNotifications = QPushButton("Load more")
+            self.btnLoadMoreNotifications.clicked.connect(self.load_more_notifications)
+            layout.addWidget(self.btnLoadMoreNotifications)
+
     def add_notification(self, action: str, project: Project, user: User = None):
         """Thêm 1 notification vào self.notifications, lưu file JSON, và cập nhật hiển thị."""
         if user is None:
@@ -862,9 +1278,6 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
             time_str=now_str
         )
 
-        self.notifications.append(new_noti)
-        print(">>> After add_notification, total noti =", len(self.notifications))
-
         # Hiển thị popup system tray
         message_title = "New Notification"
         if project:
@@ -874,43 +1287,51 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         self.trayIcon.showMessage(
             message_title,
             message_body,
-            QIcon("D:/PHẦN MỀM QUẢN LÝ DỰ ÁN_FINALPROJECT/Image/notification_8625350.png"),
+            QIcon(self.NOTIFICATION_ICON),
             3000
         )
 
-        # Chuyển danh sách notification sang list[dict]
-        data_list = [{
-            "username": noti.username,
-            "action": noti.action,
-            "project_id": noti.project_id,
-            "time_str": noti.time_str
-        } for noti in self.notifications]
-
-        if self.dc.save_notifications(data_list):
-            print("✅ Notifications saved successfully.")
-        else:
-            print("❌ Error saving notifications.")
-            # Cập nhật giao diện hiển thị thông báo
-        self.update_notifications_view()
+        # Ghi thêm đúng 1 dòng vào notification log
+        if not self.dc.add_notification({
+            "username": new_noti.username,
+            "action": new_noti.action,
+            "project_id": new_noti.project_id,
+            "time_str": new_noti.time_str
+        }):
+            print("❌ Error saving notification.")
+        # Card mới được thêm lên đầu danh sách trong on_notification_added
+
+    def _notifications_from_dicts(self, data_list):
+        return [Notification(
+            username=d.get("username", ""),
+            action=d.get("action", ""),
+            project_id=d.get("project_id", ""),
+            time_str=d.get("time_str", "")
+        ) for d in data_list]
 
     def load_notifications(self):
-        """Đọc file notifications.json và xây dựng lại danh sách notifications."""
-        data_list = self.dc.load_notifications()
-        print("Loaded notifications from file:", data_list)
-        self.notifications.clear()
-        for d in data_list:
-            n = Notification(
-                username=d.get("username", ""),
-                action=d.get("action", ""),
-                project_id=d.get("project_id", ""),
-                time_str=d.get("time_str", "")
-            )
-            self.notifications.append(n)
+        """Đọc trang thông báo mới nhất (không tải toàn bộ lịch sử)."""
+        data_list = self.dc.get_recent_notifications(self.NOTIFICATION_PAGE_SIZE)
+        self.notifications = self._notifications_from_dicts(data_list)
+        self._update_load_more_button(len(data_list))
+
+    def load_more_notifications(self):
+        """Tải trang thông báo cũ hơn kế tiếp và thêm card vào cuối danh sách."""
+        data_list = self.dc.get_recent_notifications(self.NOTIFICATION_PAGE_SIZE, len(self.notifications))
+        older = self._notifications_from_dicts(data_list)
+        self.notifications.extend(older)
+        if hasattr(self, "notificationLayout"):
+            for noti in older:
+                self.notificationLayout.addWidget(self.create_notification_card(noti))
+        self._update_load_more_button(len(data_list))
+
+    def _update_load_more_button(self, loaded_count):
+        if hasattr(self, "btnLoadMoreNotifications"):
+            self.btnLoadMoreNotifications.setVisible(loaded_count >= self.NOTIFICATION_PAGE_SIZE)
 
     def update_notifications_view(self):
         """
-        Cập nhật giao diện hiển thị danh sách thông báo.
-        Các thông báo được sắp xếp theo thứ tự mới nhất lên đầu.
+        Dựng lại giao diện danh sách thông báo đã tải (mới nhất ở đầu).
         """
         if not hasattr(self, "notificationLayout"):
             return
@@ -921,8 +1342,8 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
             if child.widget():
                 child.widget().deleteLater()
 
-        # Thêm các card thông báo vào layout (thứ tự đảo ngược: mới nhất ở đầu)
-        for noti in reversed(self.notifications):
+        # self.notifications đã theo thứ tự mới nhất ở đầu
+        for noti in self.notifications:
             card = self.create_notification_card(noti)
             self.notificationLayout.addWidget(card)
 
@@ -936,1114 +1357,6 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         self.trayIcon.setToolTip("Notifications")
         self.trayIcon.show()
 
-    def setup_tab_open(self):
-        if hasattr(self, "pushButtonOpenAddTask"):
-            self.pushButtonOpenAddTask.clicked.connect(self.open_add_project_open)
-        if hasattr(self, "pushButtonOpenDelete"):
-            self.pushButtonOpenDelete.clicked.connect(self.remove_selected_projects_open)
-        if hasattr(self, "pushButtonOpenSearch"):
-            self.pushButtonOpenSearch.clicked.connect(self.filter_projects_open)
-        if hasattr(self, "pushButtonOpenReload"):
-            self.pushButtonOpenReload.clicked.connect(self.reset_filter_open)
-        if hasattr(self, "checkBoxSelectAllOpen"):
-            self.checkBoxSelectAllOpen.stateChanged.connect(self.select_all_projects_open)
-
-        if hasattr(self, "tableWidgetOpen"):
-            self.tableWidgetOpen.setColumnCount(14)
-            self.tableWidgetOpen.setHorizontalHeaderLabels([
-                "Select", "ID", "Name", "Assignment", "Manager",
-                "Status", "Progress", "Start Date", "End Date",
-                "Priority", "Dependency", "Description", "Attachments", "Details"
-            ])
-            self.tableWidgetOpen.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            self.tableWidgetOpen.customContextMenuRequested.connect(self.show_context_menu_open)
-        self.show_projects_open()
-        self.tableWidgetOpen.horizontalHeader().setStretchLastSection(True)
-        self.tableWidgetOpen.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-    def show_projects_open(self):
-        if not hasattr(self, "tableWidgetOpen"):
-            return
-        table = self.tableWidgetOpen
-        table.setRowCount(0)
-        open_projects = [p for p in self.projects if p.status == "Open"]
-        for row, project in enumerate(open_projects):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_open)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_open)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_open)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_open)
-            table.setCellWidget(row, 13, btn_details)
-
-    def open_add_project_open(self):
-        self.mainwindow_open = QMainWindow()
-        self.myui_open = AddProjectWindowNewExt(onProjectAdded=self.load_projects_open, main_ext=self)
-        self.myui_open.setupUi(self.mainwindow_open)
-        self.mainwindow_open.show()
-
-    def load_projects_open(self, new_project=None):
-        self.projects = self.dc.get_all_projects() or []
-        self.show_projects_open()
-
-
-    def remove_selected_projects_open(self):
-        if not hasattr(self, "tableWidgetOpen"):
-            return
-        table = self.tableWidgetOpen
-        selected_rows = []
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox) and w.isChecked():
-                selected_rows.append(row)
-        open_projects = [p for p in self.projects if p.status == "Open"]
-        for row in reversed(selected_rows):
-            if row < len(open_projects):
-                proj = open_projects[row]
-                self.projects.remove(proj)
-                self.add_notification("deleted", proj, self.current_user)
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_open()
-
-    def filter_projects_open(self):
-        if not hasattr(self, "lineEditSearchOpen"):
-            return
-        query = self.lineEditSearchOpen.text().strip().lower()
-        if not query:
-            self.show_projects_open()
-            return
-        open_projects = [p for p in self.projects if p.status == "Open"]
-        filtered = [p for p in open_projects if query in p.project_id.lower() or query in p.name.lower()]
-        self.show_filtered_projects_open(filtered)
-
-    def show_filtered_projects_open(self, projs):
-        table = self.tableWidgetOpen
-        table.setRowCount(0)
-        for row, project in enumerate(projs):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_open)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_open)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_open)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_open)
-            table.setCellWidget(row, 13, btn_details)
-
-    def reset_filter_open(self):
-        if hasattr(self, "lineEditSearchOpen"):
-            self.lineEditSearchOpen.clear()
-        self.show_projects_open()
-
-    def select_all_projects_open(self, state):
-        if not hasattr(self, "tableWidgetOpen"):
-            return
-        table = self.tableWidgetOpen
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox):
-                w.setChecked(state == Qt.CheckState.Checked.value)
-
-    def show_context_menu_open(self, pos):
-        if not hasattr(self, "tableWidgetOpen"):
-            return
-        table = self.tableWidgetOpen
-        menu = QMenu(self)
-        act_edit = QAction("Edit Project", self)
-        act_delete = QAction("Delete Project", self)
-        current_row = table.currentRow()
-
-        def do_edit():
-            open_projects = [p for p in self.projects if p.status == "Open"]
-            if 0 <= current_row < len(open_projects):
-                project = open_projects[current_row]
-                old_name = project.name
-                new_name, ok = QInputDialog.getText(self, "Edit Project", "Enter new name:", text=old_name)
-                if ok and new_name.strip():
-                    project.name = new_name
-                    self.dc.save_project(project)
-                    QMessageBox.information(self, "Success", "Project updated.")
-                self.show_projects_open()
-
-        def do_delete():
-            open_projects = [p for p in self.projects if p.status == "Open"]
-            if 0 <= current_row < len(open_projects):
-                reply = QMessageBox.question(
-                    self, "Confirm", "Are you sure to remove this project?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    proj = open_projects[current_row]
-                    self.projects.remove(proj)
-                    self.dc.save_all_projects(self.projects)
-                    self.show_projects_open()
-
-        act_edit.triggered.connect(do_edit)
-        act_delete.triggered.connect(do_delete)
-        menu.addAction(act_edit)
-        menu.addAction(act_delete)
-        menu.exec(table.mapToGlobal(pos))
-
-    def edit_assignment_for_project_open(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = EditAssignmentDialog(self, project)
-        dlg.exec()
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_open()
-
-    def open_project_details_open(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = ProjectDetailsDialog(project, self)
-        dlg.exec()
-
-
-    def setup_tab_pending(self):
-        """Giả sử trong .ui có tableWidgetPending, lineEditSearchPending, pushButtonPendingAddTask, ..."""
-        if hasattr(self, "pushButtonPendingAddTask"):
-            self.pushButtonPendingAddTask.clicked.connect(self.open_add_project_pending)
-        if hasattr(self, "pushButtonPendingDelete"):
-            self.pushButtonPendingDelete.clicked.connect(self.remove_selected_projects_pending)
-        if hasattr(self, "pushButtonPendingSearch"):
-            self.pushButtonPendingSearch.clicked.connect(self.filter_projects_pending)
-        if hasattr(self, "pushButtonPendingReload"):
-            self.pushButtonPendingReload.clicked.connect(self.reset_filter_pending)
-        if hasattr(self, "checkBoxSelectAllPending"):
-            self.checkBoxSelectAllPending.stateChanged.connect(self.select_all_projects_pending)
-
-        if hasattr(self, "tableWidgetPending"):
-            self.tableWidgetPending.setColumnCount(14)
-            self.tableWidgetPending.setHorizontalHeaderLabels([
-                "Select", "ID", "Name", "Assignment", "Manager",
-                "Status", "Progress", "Start Date", "End Date",
-                "Priority", "Dependency", "Description", "Attachments", "Details"
-            ])
-            self.tableWidgetPending.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            self.tableWidgetPending.customContextMenuRequested.connect(self.show_context_menu_pending)
-
-        self.show_projects_pending()
-        self.tableWidgetOpen.horizontalHeader().setStretchLastSection(True)
-        self.tableWidgetOpen.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-    def show_projects_pending(self):
-        """Hiển thị project có status == 'Pending'."""
-        if not hasattr(self, "tableWidgetPending"):
-            return
-        table = self.tableWidgetPending
-        table.setRowCount(0)
-        pending_projects = [p for p in self.projects if p.status == "Pending"]
-        for row, project in enumerate(pending_projects):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_pending)
-            table.setCellWidget(row, 3, btn_assign)
-
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_pending)
-            table.setCellWidget(row, 5, combo)
-
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_pending)
-            table.setCellWidget(row, 6, prog_widget)
-
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_pending)
-            table.setCellWidget(row, 13, btn_details)
-
-    def open_add_project_pending(self):
-        self.mainwindow_pending = QMainWindow()
-        self.myui_pending = AddProjectWindowNewExt(onProjectAdded=self.load_projects_pending)
-        self.myui_pending.setupUi(self.mainwindow_pending)
-        self.mainwindow_pending.show()
-
-    def load_projects_pending(self, new_project=None):
-        self.projects = self.dc.get_all_projects() or []
-        self.show_projects_pending()
-
-    def remove_selected_projects_pending(self):
-        if not hasattr(self, "tableWidgetPending"):
-            return
-        table = self.tableWidgetPending
-        selected_rows = []
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox) and w.isChecked():
-                selected_rows.append(row)
-        pending_projects = [p for p in self.projects if p.status == "Pending"]
-        for row in reversed(selected_rows):
-            if row < len(pending_projects):
-                proj = pending_projects[row]
-                self.projects.remove(proj)
-                self.add_notification("Deleted", proj, self.current_user)
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_pending()
-
-    def filter_projects_pending(self):
-        if not hasattr(self, "lineEditSearchPending"):
-            return
-        query = self.lineEditSearchPending.text().strip().lower()
-        if not query:
-            self.show_projects_pending()
-            return
-        pending_projects = [p for p in self.projects if p.status == "Pending"]
-        filtered = [p for p in pending_projects if query in p.project_id.lower() or query in p.name.lower()]
-        self.show_filtered_projects_pending(filtered)
-
-    def show_filtered_projects_pending(self, projs):
-        table = self.tableWidgetPending
-        table.setRowCount(0)
-        for row, project in enumerate(projs):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_pending)
-            table.setCellWidget(row, 3, btn_assign)
-
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_pending)
-            table.setCellWidget(row, 5, combo)
-
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_pending)
-            table.setCellWidget(row, 6, prog_widget)
-
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            table.setItem(row, 10, QTableWidgetItem(project.dependency or ""))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_pending)
-            table.setCellWidget(row, 13, btn_details)
-
-    def reset_filter_pending(self):
-        if hasattr(self, "lineEditSearchPending"):
-            self.lineEditSearchPending.clear()
-        self.show_projects_pending()
-
-    def select_all_projects_pending(self, state):
-        if not hasattr(self, "tableWidgetPending"):
-            return
-        table = self.tableWidgetPending
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox):
-                w.setChecked(state == Qt.CheckState.Checked.value)
-
-    def show_context_menu_pending(self, pos):
-        if not hasattr(self, "tableWidgetPending"):
-            return
-        table = self.tableWidgetPending
-        menu = QMenu(self)
-        act_edit = QAction("Edit Project", self)
-        act_delete = QAction("Delete Project", self)
-
-        current_row = table.currentRow()
-
-        def do_edit():
-            pending_projects = [p for p in self.projects if p.status == "Pending"]
-            if 0 <= current_row < len(pending_projects):
-                project = pending_projects[current_row]
-                old_name = project.name
-                new_name, ok = QInputDialog.getText(self, "Edit Project", "Enter new name:", text=old_name)
-                if ok and new_name.strip():
-                    project.name = new_name
-                    self.dc.save_project(project)
-                    QMessageBox.information(self, "Success", "Project updated.")
-                self.show_projects_pending()
-
-        def do_delete():
-            pending_projects = [p for p in self.projects if p.status == "Pending"]
-            if 0 <= current_row < len(pending_projects):
-                reply = QMessageBox.question(
-                    self, "Confirm", "Are you sure to remove this project?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    proj = pending_projects[current_row]
-                    self.projects.remove(proj)
-                    self.dc.save_all_projects(self.projects)
-                    self.show_projects_pending()
-
-        act_edit.triggered.connect(do_edit)
-        act_delete.triggered.connect(do_delete)
-        menu.addAction(act_edit)
-        menu.addAction(act_delete)
-        menu.exec(table.mapToGlobal(pos))
-
-    def edit_assignment_for_project_pending(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = EditAssignmentDialog(self, project)
-        dlg.exec()
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_pending()
-
-    def open_project_details_pending(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = ProjectDetailsDialog(project, self)
-        dlg.exec()
-
-
-    def setup_tab_ongoing(self):
-        if hasattr(self, "pushButtonOngoingAddTask"):
-            self.pushButtonOngoingAddTask.clicked.connect(self.open_add_project_ongoing)
-        if hasattr(self, "pushButtonOngoingDelete"):
-            self.pushButtonOngoingDelete.clicked.connect(self.remove_selected_projects_ongoing)
-        if hasattr(self, "pushButtonOngoingSearch"):
-            self.pushButtonOngoingSearch.clicked.connect(self.filter_projects_ongoing)
-        if hasattr(self, "pushButtonOngoingReload"):
-            self.pushButtonOngoingReload.clicked.connect(self.reset_filter_ongoing)
-        if hasattr(self, "checkBoxSelectAllOngoing"):
-            self.checkBoxSelectAllOngoing.stateChanged.connect(self.select_all_projects_ongoing)
-        if hasattr(self, "tableWidgetOngoing"):
-            self.tableWidgetOngoing.setColumnCount(14)
-            self.tableWidgetOngoing.setHorizontalHeaderLabels([
-                "Select", "ID", "Name", "Assignment", "Manager",
-                "Status", "Progress", "Start Date", "End Date",
-                "Priority", "Dependency", "Description", "Attachments", "Details"
-            ])
-            self.tableWidgetOngoing.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            self.tableWidgetOngoing.customContextMenuRequested.connect(self.show_context_menu_ongoing)
-        self.show_projects_ongoing()
-        self.tableWidgetOpen.horizontalHeader().setStretchLastSection(True)
-        self.tableWidgetOpen.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-    def show_projects_ongoing(self):
-        if not hasattr(self, "tableWidgetOngoing"):
-            return
-        table = self.tableWidgetOngoing
-        table.setRowCount(0)
-        ongoing_projects = [p for p in self.projects if p.status == "Ongoing"]
-        for row, project in enumerate(ongoing_projects):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_ongoing)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_ongoing)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_ongoing)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_ongoing)
-            table.setCellWidget(row, 13, btn_details)
-
-    def open_add_project_ongoing(self):
-        self.mainwindow_ongoing = QMainWindow()
-        self.myui_ongoing = AddProjectWindowNewExt(onProjectAdded=self.load_projects_ongoing)
-        self.myui_ongoing.setupUi(self.mainwindow_ongoing)
-        self.mainwindow_ongoing.show()
-
-    def load_projects_ongoing(self, new_project=None):
-        self.projects = self.dc.get_all_projects() or []
-        self.show_projects_ongoing()
-
-    def remove_selected_projects_ongoing(self):
-        if not hasattr(self, "tableWidgetOngoing"):
-            return
-        table = self.tableWidgetOngoing
-        selected_rows = []
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox) and w.isChecked():
-                selected_rows.append(row)
-        ongoing_projects = [p for p in self.projects if p.status == "Ongoing"]
-        for row in reversed(selected_rows):
-            if row < len(ongoing_projects):
-                proj = ongoing_projects[row]
-                self.projects.remove(proj)
-                self.add_notification("Deleted", proj, self.current_user)
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_ongoing()
-
-    def filter_projects_ongoing(self):
-        if not hasattr(self, "lineEditSearchOngoing"):
-            return
-        query = self.lineEditSearchOngoing.text().strip().lower()
-        if not query:
-            self.show_projects_ongoing()
-            return
-        ongoing_projects = [p for p in self.projects if p.status == "Ongoing"]
-        filtered = [p for p in ongoing_projects if query in p.project_id.lower() or query in p.name.lower()]
-        self.show_filtered_projects_ongoing(filtered)
-
-    def show_filtered_projects_ongoing(self, projs):
-        table = self.tableWidgetOngoing
-        table.setRowCount(0)
-        for row, project in enumerate(projs):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_ongoing)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_ongoing)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_ongoing)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_ongoing)
-            table.setCellWidget(row, 13, btn_details)
-
-    def reset_filter_ongoing(self):
-        if hasattr(self, "lineEditSearchOngoing"):
-            self.lineEditSearchOngoing.clear()
-        self.show_projects_ongoing()
-
-    def select_all_projects_ongoing(self, state):
-        if not hasattr(self, "tableWidgetOngoing"):
-            return
-        table = self.tableWidgetOngoing
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox):
-                w.setChecked(state == Qt.CheckState.Checked.value)
-
-    def show_context_menu_ongoing(self, pos):
-        if not hasattr(self, "tableWidgetOngoing"):
-            return
-        table = self.tableWidgetOngoing
-        menu = QMenu(self)
-        act_edit = QAction("Edit Project", self)
-        act_delete = QAction("Delete Project", self)
-        current_row = table.currentRow()
-
-        def do_edit():
-            ongoing_projects = [p for p in self.projects if p.status == "Ongoing"]
-            if 0 <= current_row < len(ongoing_projects):
-                project = ongoing_projects[current_row]
-                old_name = project.name
-                new_name, ok = QInputDialog.getText(self, "Edit Project", "Enter new name:", text=old_name)
-                if ok and new_name.strip():
-                    project.name = new_name
-                    self.dc.save_project(project)
-                    QMessageBox.information(self, "Success", "Project updated.")
-                self.show_projects_ongoing()
-
-        def do_delete():
-            ongoing_projects = [p for p in self.projects if p.status == "Ongoing"]
-            if 0 <= current_row < len(ongoing_projects):
-                reply = QMessageBox.question(self, "Confirm", "Are you sure to remove this project?",
-                                             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                             QMessageBox.StandardButton.No)
-                if reply == QMessageBox.StandardButton.Yes:
-                    proj = ongoing_projects[current_row]
-                    self.projects.remove(proj)
-                    self.dc.save_all_projects(self.projects)
-                    self.show_projects_ongoing()
-
-        act_edit.triggered.connect(do_edit)
-        act_delete.triggered.connect(do_delete)
-        menu.addAction(act_edit)
-        menu.addAction(act_delete)
-        menu.exec(table.mapToGlobal(pos))
-
-    def edit_assignment_for_project_ongoing(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = EditAssignmentDialog(self, project)
-        dlg.exec()
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_ongoing()
-
-    def open_project_details_ongoing(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = ProjectDetailsDialog(project, self)
-        dlg.exec()
-
-    def setup_tab_completed(self):
-        if hasattr(self, "pushButtonCompletedAddTask"):
-            self.pushButtonCompletedAddTask.clicked.connect(self.open_add_project_completed)
-        if hasattr(self, "pushButtonCompletedDelete"):
-            self.pushButtonCompletedDelete.clicked.connect(self.remove_selected_projects_completed)
-        if hasattr(self, "pushButtonCompletedSearch"):
-            self.pushButtonCompletedSearch.clicked.connect(self.filter_projects_completed)
-        if hasattr(self, "pushButtonCompletedReload"):
-            self.pushButtonCompletedReload.clicked.connect(self.reset_filter_completed)
-        if hasattr(self, "checkBoxSelectAllCompleted"):
-            self.checkBoxSelectAllCompleted.stateChanged.connect(self.select_all_projects_completed)
-
-        if hasattr(self, "tableWidgetCompleted"):
-            self.tableWidgetCompleted.setColumnCount(14)
-            self.tableWidgetCompleted.setHorizontalHeaderLabels([
-                "Select", "ID", "Name", "Assignment", "Manager",
-                "Status", "Progress", "Start Date", "End Date",
-                "Priority", "Dependency", "Description", "Attachments", "Details"
-            ])
-            self.tableWidgetCompleted.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            self.tableWidgetCompleted.customContextMenuRequested.connect(self.show_context_menu_completed)
-        self.show_projects_completed()
-        self.tableWidgetOpen.horizontalHeader().setStretchLastSection(True)
-        self.tableWidgetOpen.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-    def show_projects_completed(self):
-        if not hasattr(self, "tableWidgetCompleted"):
-            return
-        table = self.tableWidgetCompleted
-        table.setRowCount(0)
-        completed_projects = [p for p in self.projects if p.status == "Completed"]
-        for row, project in enumerate(completed_projects):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_completed)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_completed)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_completed)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_completed)
-            table.setCellWidget(row, 13, btn_details)
-
-    def open_add_project_completed(self):
-        self.mainwindow_completed = QMainWindow()
-        self.myui_completed = AddProjectWindowNewExt(onProjectAdded=self.load_projects_completed)
-        self.myui_completed.setupUi(self.mainwindow_completed)
-        self.mainwindow_completed.show()
-
-    def load_projects_completed(self, new_project=None):
-        self.projects = self.dc.get_all_projects() or []
-        self.show_projects_completed()
-
-    def remove_selected_projects_completed(self):
-        if not hasattr(self, "tableWidgetCompleted"):
-            return
-        table = self.tableWidgetCompleted
-        selected_rows = []
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox) and w.isChecked():
-                selected_rows.append(row)
-        completed_projects = [p for p in self.projects if p.status == "Completed"]
-        for row in reversed(selected_rows):
-            if row < len(completed_projects):
-                proj = completed_projects[row]
-                self.projects.remove(proj)
-                self.add_notification("Deleted", proj, self.current_user)
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_completed()
-
-    def filter_projects_completed(self):
-        if not hasattr(self, "lineEditSearchCompleted"):
-            return
-        query = self.lineEditSearchCompleted.text().strip().lower()
-        if not query:
-            self.show_projects_completed()
-            return
-        completed_projects = [p for p in self.projects if p.status == "Completed"]
-        filtered = [p for p in completed_projects if query in p.project_id.lower() or query in p.name.lower()]
-        self.show_filtered_projects_completed(filtered)
-
-    def show_filtered_projects_completed(self, projs):
-        table = self.tableWidgetCompleted
-        table.setRowCount(0)
-        for row, project in enumerate(projs):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_completed)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_completed)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_completed)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_completed)
-            table.setCellWidget(row, 13, btn_details)
-
-    def reset_filter_completed(self):
-        if hasattr(self, "lineEditSearchCompleted"):
-            self.lineEditSearchCompleted.clear()
-        self.show_projects_completed()
-
-    def select_all_projects_completed(self, state):
-        if not hasattr(self, "tableWidgetCompleted"):
-            return
-        table = self.tableWidgetCompleted
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox):
-                w.setChecked(state == Qt.CheckState.Checked.value)
-
-    def show_context_menu_completed(self, pos):
-        if not hasattr(self, "tableWidgetCompleted"):
-            return
-        table = self.tableWidgetCompleted
-        menu = QMenu(self)
-        act_edit = QAction("Edit Project", self)
-        act_delete = QAction("Delete Project", self)
-        current_row = table.currentRow()
-
-        def do_edit():
-            completed_projects = [p for p in self.projects if p.status == "Completed"]
-            if 0 <= current_row < len(completed_projects):
-                project = completed_projects[current_row]
-                old_name = project.name
-                new_name, ok = QInputDialog.getText(self, "Edit Project", "Enter new name:", text=old_name)
-                if ok and new_name.strip():
-                    project.name = new_name
-                    self.dc.save_project(project)
-                    QMessageBox.information(self, "Success", "Project updated.")
-                self.show_projects_completed()
-
-        def do_delete():
-            completed_projects = [p for p in self.projects if p.status == "Completed"]
-            if 0 <= current_row < len(completed_projects):
-                reply = QMessageBox.question(
-                    self, "Confirm", "Are you sure to remove this project?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    proj = completed_projects[current_row]
-                    self.projects.remove(proj)
-                    self.dc.save_all_projects(self.projects)
-                    self.show_projects_completed()
-
-        act_edit.triggered.connect(do_edit)
-        act_delete.triggered.connect(do_delete)
-        menu.addAction(act_edit)
-        menu.addAction(act_delete)
-        menu.exec(table.mapToGlobal(pos))
-
-    def edit_assignment_for_project_completed(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = EditAssignmentDialog(self, project)
-        dlg.exec()
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_completed()
-
-    def open_project_details_completed(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = ProjectDetailsDialog(project, self)
-        dlg.exec()
-
-    def setup_tab_canceled(self):
-        if hasattr(self, "pushButtonCanceledAddTask"):
-            self.pushButtonCanceledAddTask.clicked.connect(self.open_add_project_canceled)
-        if hasattr(self, "pushButtonCanceledDelete"):
-            self.pushButtonCanceledDelete.clicked.connect(self.remove_selected_projects_canceled)
-        if hasattr(self, "pushButtonCanceledSearch"):
-            self.pushButtonCanceledSearch.clicked.connect(self.filter_projects_canceled)
-        if hasattr(self, "pushButtonCanceledReload"):
-            self.pushButtonCanceledReload.clicked.connect(self.reset_filter_canceled)
-        if hasattr(self, "checkBoxSelectAllCanceled"):
-            self.checkBoxSelectAllCanceled.stateChanged.connect(self.select_all_projects_canceled)
-
-        if hasattr(self, "tableWidgetCanceled"):
-            self.tableWidgetCanceled.setColumnCount(14)
-            self.tableWidgetCanceled.setHorizontalHeaderLabels([
-                "Select", "ID", "Name", "Assignment", "Manager",
-                "Status", "Progress", "Start Date", "End Date",
-                "Priority", "Dependency", "Description", "Attachments", "Details"
-            ])
-            self.tableWidgetCanceled.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            self.tableWidgetCanceled.customContextMenuRequested.connect(self.show_context_menu_canceled)
-        self.show_projects_canceled()
-        self.tableWidgetOpen.horizontalHeader().setStretchLastSection(True)
-        self.tableWidgetOpen.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-    def show_projects_canceled(self):
-        if not hasattr(self, "tableWidgetCanceled"):
-            return
-        table = self.tableWidgetCanceled
-        table.setRowCount(0)
-        canceled_projects = [p for p in self.projects if p.status == "Canceled"]
-        for row, project in enumerate(canceled_projects):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_canceled)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_canceled)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_canceled)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_canceled)
-            table.setCellWidget(row, 13, btn_details)
-
-    def open_add_project_canceled(self):
-        self.mainwindow_canceled = QMainWindow()
-        self.myui_canceled = AddProjectWindowNewExt(onProjectAdded=self.load_projects_canceled)
-        self.myui_canceled.setupUi(self.mainwindow_canceled)
-        self.mainwindow_canceled.show()
-
-    def load_projects_canceled(self, new_project=None):
-        self.projects = self.dc.get_all_projects() or []
-        self.show_projects_canceled()
-
-    def remove_selected_projects_canceled(self):
-        if not hasattr(self, "tableWidgetCanceled"):
-            return
-        table = self.tableWidgetCanceled
-        selected_rows = []
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox) and w.isChecked():
-                selected_rows.append(row)
-        canceled_projects = [p for p in self.projects if p.status == "Canceled"]
-        for row in reversed(selected_rows):
-            if row < len(canceled_projects):
-                proj = canceled_projects[row]
-                self.projects.remove(proj)
-                self.add_notification("Deleted", proj, self.current_user)
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_canceled()
-
-    def filter_projects_canceled(self):
-        if not hasattr(self, "lineEditSearchCanceled"):
-            return
-        query = self.lineEditSearchCanceled.text().strip().lower()
-        if not query:
-            self.show_projects_canceled()
-            return
-        canceled_projects = [p for p in self.projects if p.status == "Canceled"]
-        filtered = [p for p in canceled_projects if query in p.project_id.lower() or query in p.name.lower()]
-        self.show_filtered_projects_canceled(filtered)
-
-    def show_filtered_projects_canceled(self, projs):
-        table = self.tableWidgetCanceled
-        table.setRowCount(0)
-        for row, project in enumerate(projs):
-            table.insertRow(row)
-            cb = QCheckBox()
-            cb_widget = QWidget()
-            layout = QHBoxLayout(cb_widget)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cb_widget.setLayout(layout)
-            table.setCellWidget(row, 0, cb_widget)
-            table.setItem(row, 1, QTableWidgetItem(project.project_id))
-            table.setItem(row, 2, QTableWidgetItem(project.name))
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project_canceled)
-            table.setCellWidget(row, 3, btn_assign)
-            table.setItem(row, 4, QTableWidgetItem(project.manager))
-            combo = self.create_status_combo(project, refresh_fn=self.show_projects_canceled)
-            table.setCellWidget(row, 5, combo)
-            prog_widget = self.create_progress_widget(project, refresh_fn=self.show_projects_canceled)
-            table.setCellWidget(row, 6, prog_widget)
-            table.setItem(row, 7, QTableWidgetItem(project.start_date))
-            table.setItem(row, 8, QTableWidgetItem(project.end_date))
-            table.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            table.setItem(row, 10, QTableWidgetItem(dep))
-            table.setItem(row, 11, QTableWidgetItem(project.description))
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            table.setItem(row, 12, QTableWidgetItem(attach_str))
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details_canceled)
-            table.setCellWidget(row, 13, btn_details)
-
-    def reset_filter_canceled(self):
-        if hasattr(self, "lineEditSearchCanceled"):
-            self.lineEditSearchCanceled.clear()
-        self.show_projects_canceled()
-
-    def select_all_projects_canceled(self, state):
-        if not hasattr(self, "tableWidgetCanceled"):
-            return
-        table = self.tableWidgetCanceled
-        for row in range(table.rowCount()):
-            w = table.cellWidget(row, 0)
-            if isinstance(w, QCheckBox):
-                w.setChecked(state == Qt.CheckState.Checked.value)
-
-    def show_context_menu_canceled(self, pos):
-        if not hasattr(self, "tableWidgetCanceled"):
-            return
-        table = self.tableWidgetCanceled
-        menu = QMenu(self)
-        act_edit = QAction("Edit Project", self)
-        act_delete = QAction("Delete Project", self)
-        current_row = table.currentRow()
-
-        def do_edit():
-            canceled_projects = [p for p in self.projects if p.status == "Canceled"]
-            if 0 <= current_row < len(canceled_projects):
-                project = canceled_projects[current_row]
-                old_name = project.name
-                new_name, ok = QInputDialog.getText(self, "Edit Project", "Enter new name:", text=old_name)
-                if ok and new_name.strip():
-                    project.name = new_name
-                    self.dc.save_project(project)
-                    QMessageBox.information(self, "Success", "Project updated.")
-                self.show_projects_canceled()
-
-        def do_delete():
-            canceled_projects = [p for p in self.projects if p.status == "Canceled"]
-            if 0 <= current_row < len(canceled_projects):
-                reply = QMessageBox.question(
-                    self, "Confirm", "Are you sure to remove this project?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    proj = canceled_projects[current_row]
-                    self.projects.remove(proj)
-                    self.dc.save_all_projects(self.projects)
-                    self.show_projects_canceled()
-
-        act_edit.triggered.connect(do_edit)
-        act_delete.triggered.connect(do_delete)
-        menu.addAction(act_edit)
-        menu.addAction(act_delete)
-        menu.exec(table.mapToGlobal(pos))
-
-    def edit_assignment_for_project_canceled(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = EditAssignmentDialog(self, project)
-        dlg.exec()
-        self.dc.save_all_projects(self.projects)
-        self.show_projects_canceled()
-
-    def open_project_details_canceled(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = ProjectDetailsDialog(project, self)
-        dlg.exec()
-
-
     # Gantt tab
     def setup_gantt_tab(self):
         if hasattr(self, "tab_gantt"):
@@ -2058,7 +1371,7 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
             # Thay vì self.gantt_view = GanttTimeLineView(),
             # ta dùng container:
             self.gantt_container = GanttContainer()
-            self.gantt_container.set_projects(self.projects)
+            self.gantt_container.set_projects([])  # được nạp dần (start_progressive_load)
             self.gantt_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
             layout.addWidget(self.gantt_container)
@@ -2082,7 +1395,7 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         from ui.ForgotPassWindow.ForgotPasswordWindowExt import ForgotPasswordWindowExt
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = ForgotPasswordWindowExt()
+        self.myui = ForgotPasswordWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()
 
@@ -2137,11 +1450,10 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         if not new_email:
             QMessageBox.warning(self.MainWindow, "Invalid Email", "Email cannot be empty.")
             return
-        all_users = self.dc.get_all_users()
-        for u in all_users:
-            if u.Username != self.current_user.Username and u.Email.strip().lower() == new_email:
-                QMessageBox.warning(self.MainWindow, "Duplicate Email", "That email is already used by another user.")
-                return
+        other = self.dc.get_user_by_email(new_email)
+        if other and other.Username != self.current_user.Username:
+            QMessageBox.warning(self.MainWindow, "Duplicate Email", "That email is already used by another user.")
+            return
         self.current_user.Email = new_email
         self.save_current_user()
         QMessageBox.information(self.MainWindow, "Success", "Email updated.")
@@ -2158,11 +1470,7 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            all_users = self.dc.get_all_users()
-            all_users = [u for u in all_users if u.Username != self.current_user.Username]
-            from libs.JsonFileFactory import JsonFileFactory
-            jff = JsonFileFactory()
-            jff.write_data(all_users, self.dc.users_file)
+            self.dc.delete_user(self.current_user.Username)
 
             QMessageBox.information(self.MainWindow, "Account Deleted", "Your account has been deleted.")
             self.log_out()
@@ -2173,25 +1481,14 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
         from ui.LoginWindow.LoginMainWindowExt import LoginMainWindowExt
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = LoginMainWindowExt()
+        self.myui = LoginMainWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()
 
     def save_current_user(self):
         if not self.current_user:
             return
-        all_users = self.dc.get_all_users()
-        found = False
-        for i, u in enumerate(all_users):
-            if u.Username == self.current_user.Username:
-                all_users[i] = self.current_user
-                found = True
-                break
-        if not found:
-            all_users.append(self.current_user)
-        from libs.JsonFileFactory import JsonFileFactory
-        jff = JsonFileFactory()
-        jff.write_data(all_users, self.dc.users_file)
+        self.dc.save_user(self.current_user)
 
     # Kanban
     def setup_kanban_board(self):
@@ -2216,82 +1513,75 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
                 col_layout.addWidget(column_widget)
 
                 self.tab_3.layout().addWidget(col_frame)
-        self.load_kanban_projects()
 
     def load_kanban_projects(self):
         if not hasattr(self, 'kanban_columns'):
             return
         for col in self.kanban_columns.values():
             col.clear()
-        for proj in self.projects:
-            item = ProjectItem(proj)
-            if proj.status in self.kanban_columns:
+        self._kanban_items = {}
+        self.extend_kanban(self.projects)
+
+    def extend_kanban(self, projects):
+        """Adds the cards of the projects that have none yet."""
+        if not hasattr(self, 'kanban_columns'):
+            return
+        for proj in projects:
+            pid = str(proj.project_id)
+            if pid not in self._kanban_items and proj.status in self.kanban_columns:
+                item = ProjectItem(proj)
+                self._kanban_items[pid] = item
                 self.kanban_columns[proj.status].addItem(item)
 
-    def on_kanban_updated(self):
-        self.dc.save_all_projects(self.projects)
-        self.update_ui()
+    def on_kanban_updated(self, project=None):
+        self.uow.mark_dirty(project)
 
-    # Table
+    # Table: All Projects (key None) và các tab Open, Pending, Ongoing, Completed, Canceled
     def setup_table(self):
-        self.tableWidgetAllProjects.setColumnCount(14)
-        self.tableWidgetAllProjects.setHorizontalHeaderLabels([
-            "Select", "ID", "Name", "Assignment", "Manager",
-            "Status", "Progress", "Start Date", "End Date",
-            "Priority", "Dependency", "Description", "Attachments", "Details"
-        ])
-        self.tableWidgetAllProjects.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.tableWidgetAllProjects.customContextMenuRequested.connect(self.show_context_menu)
-        self.tableWidgetAllProjects.horizontalHeader().setStretchLastSection(True)
-        self.tableWidgetAllProjects.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        for key in (None,) + self.STATUSES:
+            self._setup_project_table(key)
+
+    def start_progressive_load(self, started_at=None):
+        """
+        Fills the tables, the Kanban board and the Gantt chart: the first screenful
+        now, the rest in chunks from the event loop, with a progress bar in the
+        status bar. The time-to-first-row is logged and kept in self._loader.
+        """
+        sinks = [self.project_model.extend, self.extend_kanban]
+        if hasattr(self, "gantt_container"):
+            sinks.append(self.gantt_container.extend)
+        self._loader = ChunkedLoader(self.projects, sinks, self.FIRST_CHUNK, self.CHUNK_SIZE,
+                                     started_at=started_at, parent=self)
+        if hasattr(self, "statusbar") and len(self.projects) > self.FIRST_CHUNK:
+            bar = self._loading_bar = QProgressBar()
+            bar.setRange(0, len(self.projects))
+            bar.setFormat("Loading projects... %v / %m")
+            bar.setMaximumWidth(260)
+            self.statusbar.addPermanentWidget(bar)
+            self._loader.progress.connect(lambda done, total: bar.setValue(done))
+        self._loader.first_rows.connect(
+            lambda ms: logging.info(f"First {self.FIRST_CHUNK} of {len(self.projects)} projects shown after {ms:.0f} ms"))
+        self._loader.finished.connect(self._on_projects_loaded)
+        self._loader.start()
+
+    def _hide_loading_bar(self):
+        if self._loading_bar is not None:
+            self.statusbar.removeWidget(self._loading_bar)
+            self._loading_bar.deleteLater()
+            self._loading_bar = None
+
+    def _on_projects_loaded(self, ms):
+        self._hide_loading_bar()
+        # Các đoạn được nối vào theo thứ tự nạp: sắp xếp lại nếu người dùng đã chọn cột sắp xếp
+        self.project_model.resort()
+        logging.info(f"All {len(self.projects)} projects loaded after {ms:.0f} ms")
+        if hasattr(self, "statusbar"):
+            self.statusbar.showMessage(
+                f"Loaded {len(self.projects)} projects - first rows after {self._loader.first_row_ms:.0f} ms", 5000)
 
     def show_projects(self):
-        self.tableWidgetAllProjects.setRowCount(0)
-        for row, project in enumerate(self.projects):
-            self.tableWidgetAllProjects.insertRow(row)
-            cb = QCheckBox()
-            self.tableWidgetAllProjects.setCellWidget(row, 0, cb)
-
-            self.tableWidgetAllProjects.setItem(row, 1, QTableWidgetItem(project.project_id))
-            self.tableWidgetAllProjects.setItem(row, 2, QTableWidgetItem(project.name))
-
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project)
-            self.tableWidgetAllProjects.setCellWidget(row, 3, btn_assign)
-
-            self.tableWidgetAllProjects.setItem(row, 4, QTableWidgetItem(project.manager))
-
-            combo = self.create_status_combo(project)
-            self.tableWidgetAllProjects.setCellWidget(row, 5, combo)
-
-            prog_widget = self.create_progress_widget(project)
-            self.tableWidgetAllProjects.setCellWidget(row, 6, prog_widget)
-
-            self.tableWidgetAllProjects.setItem(row, 7, QTableWidgetItem(project.start_date))
-            self.tableWidgetAllProjects.setItem(row, 8, QTableWidgetItem(project.end_date))
-            self.tableWidgetAllProjects.setItem(row, 9, QTableWidgetItem(project.priority))
-            dep = project.dependency or ""
-            self.tableWidgetAllProjects.setItem(row, 10, QTableWidgetItem(dep))
-            self.tableWidgetAllProjects.setItem(row, 11, QTableWidgetItem(project.description))
-
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            self.tableWidgetAllProjects.setItem(row, 12, QTableWidgetItem(attach_str))
-
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details)
-            self.tableWidgetAllProjects.setCellWidget(row, 13, btn_details)
-
-    def open_project_details(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = ProjectDetailsDialog(project, self.MainWindow)
-        dlg.exec()
+        """Brings the shared model in line with self.projects (only changed rows are touched)."""
+        self.project_model.reconcile(self.projects)
 
     # Charts
     def setup_charts(self):
@@ -2302,13 +1592,13 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
 
     def draw_pie_chart(self):
         series = QPieSeries()
-        status_count = {s: 0 for s in ["Open", "Pending", "Ongoing", "Completed", "Canceled"]}
-        for p in self.projects:
-            if p.status in status_count:
-                status_count[p.status] += 1
-        for s, c in status_count.items():
+        self._status_counts = self.dc.get_project_columns().status_counts()
+        self._pie_series = series
+        self._pie_slices = {}
+        for s in self.STATUSES:
+            c = self._status_counts.get(s, 0)
             if c > 0:
-                series.append(f"{s} ({c})", c)
+                self._pie_slices[s] = series.append(f"{s} ({c})", c)
         chart = QChart()
         chart.addSeries(series)
         chart.setTitle("Project Status Distribution")
@@ -2317,24 +1607,17 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
 
     def draw_line_chart(self):
         series = QLineSeries()
-        week_map = {}
-        for p in self.projects:
-            qd = QDate.fromString(p.start_date, "dd/MM/yyyy")
-            if not qd.isValid():
-                qd = QDate.fromString(p.start_date, "dd-MM-yyyy")
-            if not qd.isValid():
-                qd = QDate.fromString(p.start_date, "yyyy-MM-dd")
-            if qd.isValid():
-                w = qd.weekNumber()[0]
-                week_map[w] = week_map.get(w, 0) + 1
-
-        for w, cnt in sorted(week_map.items()):
+        self._week_counts = self.dc.get_project_columns().week_histogram()
+
+        for w, cnt in sorted(self._week_counts.items()):
             series.append(w, cnt)
 
         chart = QChart()
         chart.addSeries(series)
         chart.setTitle("Projects by Week")
         chart.createDefaultAxes()
+        self._line_series = series
+        self._line_chart = chart
         chart_view = QChartView(chart)
         self.update_chart(self.chart_layout_2, chart_view)
 
@@ -2349,214 +1632,258 @@ class   MainWindowNewExt(QMainWindow, Ui_MainWindow):
 
     # Signals
     def setup_signals(self):
-        if hasattr(self, "pushButtonAllAddTask"):
-            self.pushButtonAllAddTask.clicked.connect(self.open_add_project)
-        if hasattr(self, "pushButtonAllDelete"):
-            self.pushButtonAllDelete.clicked.connect(self.remove_selected_projects)
-        if hasattr(self, "pushButtonAllSearch"):
-            self.pushButtonAllSearch.clicked.connect(self.filter_projects)
-        if hasattr(self, "pushButtonAllReload"):
-            self.pushButtonAllReload.clicked.connect(self.reset_filter)
-        if hasattr(self, "checkBoxSelectAll"):
-            self.checkBoxSelectAll.stateChanged.connect(self.select_all_projects)
-
-    def select_all_projects(self, state):
-        for row in range(self.tableWidgetAllProjects.rowCount()):
-            w = self.tableWidgetAllProjects.cellWidget(row, 0)
-            if isinstance(w, QCheckBox):
-                w.setChecked(state == Qt.CheckState.Checked.value)
-
-    def reset_filter(self):
-        if hasattr(self, "lineEditSearchAll"):
-            self.lineEditSearchAll.clear()
-        self.show_projects()
-
-    def filter_projects(self):
-        query = ""
-        if hasattr(self, "lineEditSearchAll"):
-            query = self.lineEditSearchAll.text().strip().lower()
+        for key in (None,) + self.STATUSES:
+            name = "All" if key is None else key
+            if hasattr(self, f"pushButton{name}AddTask"):
+                getattr(self, f"pushButton{name}AddTask").clicked.connect(self.open_add_project)
+            if hasattr(self, f"pushButton{name}Delete"):
+                getattr(self, f"pushButton{name}Delete").clicked.connect(
+                    lambda _checked=False, key=key: self.remove_selected_projects(key))
+            if hasattr(self, f"pushButton{name}Search"):
+                getattr(self, f"pushButton{name}Search").clicked.connect(
+                    lambda _checked=False, key=key: self.filter_projects(key))
+            if hasattr(self, f"pushButton{name}Reload"):
+                getattr(self, f"pushButton{name}Reload").clicked.connect(
+                    lambda _checked=False, key=key: self.reset_filter(key))
+            select_all = "checkBoxSelectAll" if key is None else f"checkBoxSelectAll{key}"
+            if hasattr(self, select_all):
+                getattr(self, select_all).stateChanged.connect(
+                    lambda state, key=key: self.select_all_projects(state, key))
+
+    def select_all_projects(self, state, key=None):
+        self._table_proxies[key].set_all_checked(state == Qt.CheckState.Checked.value)
+
+    def reset_filter(self, key=None):
+        box = self._search_box(key)
+        if box is not None:
+            box.clear()
+        self._table_proxies[key].set_matches(None)
+
+    def filter_projects(self, key=None):
+        """Narrows the table of `key` to the search result; nothing is rebuilt."""
+        box = self._search_box(key)
+        query = box.text().strip().lower() if box is not None else ""
         if not query:
-            self.show_projects()
+            self._table_proxies[key].set_matches(None)
             return
-        filtered = [p for p in self.projects if query in p.project_id.lower() or query in p.name.lower()]
-        self.show_filtered_projects(filtered)
+        self._table_proxies[key].set_matches(p.project_id for p in self.search_projects(query, status=key))
 
-    def show_filtered_projects(self, projs):
-        self.tableWidgetAllProjects.setRowCount(0)
-        for row, project in enumerate(projs):
-            self.tableWidgetAllProjects.insertRow(row)
-            cb = QCheckBox()
-            self.tableWidgetAllProjects.setCellWidget(row, 0, cb)
-            self.tableWidgetAllProjects.setItem(row, 1, QTableWidgetItem(project.project_id))
-            self.tableWidgetAllProjects.setItem(row, 2, QTableWidgetItem(project.name))
+    # CRUD
+    def open_add_project(self):
+        self.mainwindow = QMainWindow()
+        self.myui = AddProjectWindowNewExt(main_ext=self, dc=self.dc)
+        self.myui.setupUi(self.mainwindow)
+        self.myui.showWindow()
 
-            btn_assign = QPushButton(", ".join(project.assignment) if project.assignment else "Add People")
-            btn_assign.setProperty("project_obj", project)
-            btn_assign.clicked.connect(self.edit_assignment_for_project)
-            self.tableWidgetAllProjects.setCellWidget(row, 3, btn_assign)
+    def remove_selected_projects(self, key=None):
+        # Theo project_id của dòng được tick (bảng có thể đang lọc nên thứ tự khác self.projects)
+        self.bulk_delete(self._table_proxies[key].checked_projects())
 
-            self.tableWidgetAllProjects.setItem(row, 4, QTableWidgetItem(project.manager))
+    # --- Thao tác hàng loạt: một giao dịch lưu trữ và một lần cập nhật giao diện ---
+    def bulk_delete(self, projects):
+        return self._commit_bulk("deleted", deleted=projects)
 
-            combo = self.create_status_combo(project)
-            self.tableWidgetAllProjects.setCellWidget(row, 5, combo)
+    def bulk_set_status(self, projects, status):
+        return self._bulk_edit("changed status of", projects, "status", status)
 
-            prog_widget = self.create_progress_widget(project)
-            self.tableWidgetAllProjects.setCellWidget(row, 6, prog_widget)
+    def bulk_set_priority(self, projects, priority):
+        return self._bulk_edit("changed priority of", projects, "priority", priority)
 
-            self.tableWidgetAllProjects.setItem(row, 7, QTableWidgetItem(project.start_date))
-            self.tableWidgetAllProjects.setItem(row, 8, QTableWidgetItem(project.end_date))
-            self.tableWidgetAllProjects.setItem(row, 9, QTableWidgetItem(project.priority))
-            self.tableWidgetAllProjects.setItem(row, 10, QTableWidgetItem(project.dependency or ""))
-            self.tableWidgetAllProjects.setItem(row, 11, QTableWidgetItem(project.description))
+    def bulk_reassign(self, projects, assignees):
+        return self._bulk_edit("reassigned", projects, "assignment", list(assignees))
 
-            attach_str = ", ".join(project.attachments) if project.attachments else ""
-            self.tableWidgetAllProjects.setItem(row, 12, QTableWidgetItem(attach_str))
+    def _bulk_edit(self, action, projects, field, value):
+        """
+        Sets `field` to `value` on the projects where it differs and saves them with
+        _commit_bulk(). If the save fails, the projects that were not saved get their old value back.
+        """
+        def current(p):
+            v = getattr(p, field)
+            return list(v or []) if isinstance(value, list) else v
 
-            btn_details = QPushButton("View Details")
-            btn_details.setProperty("project_obj", project)
-            btn_details.clicked.connect(self.open_project_details)
-            self.tableWidgetAllProjects.setCellWidget(row, 13, btn_details)
+        projects = [p for p in projects if current(p) != value]
+        previous = {str(p.project_id): (p.version, {field: current(p)}) for p in projects}
+        for p in projects:
+            setattr(p, field, list(value) if isinstance(value, list) else value)
+        return self._commit_bulk(action, changed=projects, previous=previous)
 
-    # CRUD
-    def open_add_project(self):
-        self.mainwindow = QMainWindow()
-        self.myui = AddProjectWindowNewExt(onProjectAdded=self._on_project_added)
-        self.myui.setupUi(self.mainwindow)
-        self.myui.showWindow()
+    def _commit_bulk(self, action, changed=(), deleted=(), previous=None):
+        """
+        Saves `changed`, deletes `deleted` and writes one `action` notification per
+        project in a single backend transaction, then updates the views once from
+        the events it produced. `previous` is {project_id: (version, {field: old value})}
+        of the edits made on `changed`: if the save fails they are undone, except on
+        projects that were saved anyway or reverted to the stored data after a conflict.
+        Returns True on success.
+        """
+        changed, deleted = list(changed), list(deleted)
+        targets = changed + deleted
+        if not targets:
+            return True
+        user = self.current_user
+        now_str = datetime.now().strftime("%H:%M:%S - %d/%m/%Y")
+        notifications = [{
+            "username": user.Username if user else "",
+            "action": action,
+            "project_id": p.project_id,
+            "time_str": now_str
+        } for p in targets]
+        # Thay đổi đang chờ của các project này được ghi luôn trong giao dịch (hoặc bỏ đi nếu bị xoá)
+        for p in targets:
+            self.uow.discard(p.project_id)
+        self._deferred_events = []
+        try:
+            ok = self.dc.commit_bulk(changed, [p.project_id for p in deleted], notifications)
+        finally:
+            events, self._deferred_events = self._deferred_events, None
+        self._apply_bulk_events(events)
+        if not ok:
+            rejected = set()
+            for event, args in events:
+                if event == SAVE_REJECTED:
+                    rejected.update(args[0])
+            for p in changed:
+                version, fields = (previous or {}).get(str(p.project_id), (None, {}))
+                # Bản đã được lưu (version tăng) hoặc đã được đưa về dữ liệu đang lưu thì giữ nguyên
+                if p.version == version and str(p.project_id) not in rejected:
+                    for field, value in fields.items():
+                        setattr(p, field, value)
+            if not rejected:
+                QMessageBox.warning(self.MainWindow, "Error",
+                                    f"Could not save the changes to {len(targets)} project(s).")
+            return False
+        name = user.Name if user else ""
+        self.trayIcon.showMessage(
+            "New Notification",
+            f"{name} {action} project '{targets[0].project_id}'" if len(targets) == 1
+            else f"{name} {action} {len(targets)} projects",
+            QIcon(self.NOTIFICATION_ICON),
+            3000
+        )
+        return True
 
-    def _on_project_added(self, new_project: Project):
-        new_project.project_id = self.generate_new_project_id()
-        self.dc.save_project(new_project)
-        self.load_projects()
-        # Ghi notification
-        self.add_notification("added", new_project, self.current_user)
-
-    def remove_selected_projects(self):
-        selected_rows = []
-        for row in range(self.tableWidgetAllProjects.rowCount()):
-            w = self.tableWidgetAllProjects.cellWidget(row, 0)
-            if isinstance(w, QCheckBox) and w.isChecked():
-                selected_rows.append(row)
-        for row in reversed(selected_rows):
-            proj = self.projects[row]
-            del self.projects[row]
-            # Ghi notification
-            self.add_notification("Deleted", proj, self.current_user)
-        self.dc.save_all_projects(self.projects)
-        self.load_projects()
+    def _apply_bulk_events(self, events):
+        """
+        Applies the backend events of a bulk action: deleted rows go in runs, the
+        counts, charts, Gantt and notification list are refreshed once.
+        """
+        if not events:
+            return
+        deleted = {str(args[0]) for event, args in events if event == PROJECT_DELETED}
+        if deleted:
+            self.projects[:] = [p for p in self.projects if str(p.project_id) not in deleted]
+            self.project_model.remove_many(deleted)
+            for pid in deleted:
+                if self._loader is not None:
+                    self._loader.discard(pid)
+                item = self._kanban_items.pop(pid, None)
+                if item is not None and item.listWidget() is not None:
+                    item.listWidget().takeItem(item.listWidget().row(item))
+            if hasattr(self, "gantt_container"):
+                self.gantt_container.remove_projects(deleted)
+        for event, args in events:
+            if event == PROJECT_UPDATED:
+                project, changes = args
+                self.project_model.update(project, changes)
+                if "status" in changes or "name" in changes:
+                    self._kanban_put(project)
+                if hasattr(self, "gantt_container") and not self.GANTT_FIELDS.isdisjoint(changes):
+                    self.gantt_container.update_project(project)
+            elif event == PROJECT_ADDED:
+                self.on_project_added(*args)
+            elif event == SAVE_REJECTED:
+                self.on_save_rejected(*args)
+        if any(event not in (NOTIFICATION_ADDED, SAVE_REJECTED) for event, _ in events):
+            self.update_project_counts()
+            self.draw_pie_chart()
+            self.draw_line_chart()
+        if any(event == NOTIFICATION_ADDED for event, _ in events):
+            self.load_notifications()
+            self.update_notifications_view()
 
     def load_projects(self):
-        self.projects = self.dc.get_all_projects() or []
+        self.projects = self.dc.get_project_summaries() or []
         self.update_ui()
 
     def update_ui(self):
+        """Rebuilds every view from scratch (changes are normally applied per project by the event handlers)."""
+        if self._loader is not None:
+            self._loader.stop()
+            self._hide_loading_bar()
         self.show_projects()
         self.update_project_counts()
         self.draw_pie_chart()
         self.draw_line_chart()
         self.load_kanban_projects()
-        if hasattr(self, "gantt_view"):
-            self.gantt_view.set_projects(self.projects)
-            self.gantt_view.update()
-
-    def edit_assignment_for_project(self):
-        btn = self.sender()
-        if not btn:
-            return
-        project = btn.property("project_obj")
-        if not project:
-            return
-        dlg = EditAssignmentDialog(self, project)
-        dlg.exec()
-        self.dc.save_all_projects(self.projects)
-        self.update_ui()
-
-    def create_status_combo(self, project, refresh_fn=None):
-        combo = QComboBox()
-        combo.addItems(["Open", "Pending", "Ongoing", "Completed", "Canceled"])
-        combo.setCurrentText(project.status)
-
-        def on_status_changed_wrapper(new_status):
-            self.on_status_changed(project, new_status)
-            if refresh_fn:
-                refresh_fn()
-
-        combo.currentTextChanged.connect(on_status_changed_wrapper)
-        return combo
+        if hasattr(self, "gantt_container"):
+            self.gantt_container.set_projects(self.projects)
 
     def on_status_changed(self, project, new_status):
         project.status = new_status
-        self.dc.save_project(project)
-        self.update_ui()
+        self.uow.mark_dirty(project)
 
-    def create_progress_widget(self, project, refresh_fn=None):
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        slider = QSlider(Qt.Orientation.Horizontal)
-        slider.setRange(0, 100)
-        slider.setValue(project.progress)
-
-        label = QLabel(f"{project.progress}%")
-
-        def on_slider_changed(value):
-            project.progress = value
-            label.setText(f"{value}%")
-            self.dc.save_project(project)
-            self.update_ui()
-            if refresh_fn:
-                refresh_fn()  # Gọi hàm refresh_fn() nếu có
-
-        slider.valueChanged.connect(on_slider_changed)
-        layout.addWidget(slider)
-        layout.addWidget(label)
-        return container
-
-    def show_context_menu(self, pos):
+    def show_context_menu(self, pos, key=None):
+        project = self._table_project(key, pos)
+        if project is None:
+            return
         menu = QMenu(self.MainWindow)
         act_edit = QAction("Edit Project", self.MainWindow)
         act_delete = QAction("Delete Project", self.MainWindow)
-        current_row = self.tableWidgetAllProjects.currentRow()
 
         def do_edit():
-            if 0 <= current_row < len(self.projects):
-                project = self.projects[current_row]
-                old_name = project.name
-                new_name, ok = QInputDialog.getText(
-                    self.MainWindow, "Edit Project", "Enter new name:", text=old_name
-                )
-                if ok and new_name.strip():
-                    project.name = new_name
-                    self.dc.save_project(project)
-                    QMessageBox.information(self.MainWindow, "Success", "Project updated.")
-                self.update_ui()
+            old_name = project.name
+            new_name, ok = QInputDialog.getText(
+                self.MainWindow, "Edit Project", "Enter new name:", text=old_name
+            )
+            if ok and new_name.strip():
+                project.name = new_name
+                self.dc.save_project(project)
+                QMessageBox.information(self.MainWindow, "Success", "Project updated.")
 
         def do_delete():
-            if 0 <= current_row < len(self.projects):
-                reply = QMessageBox.question(
-                    self.MainWindow,
-                    "Confirm",
-                    "Are you sure to remove this project?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    del self.projects[current_row]
-                    self.dc.save_all_projects(self.projects)
-                    self.update_ui()
+            reply = QMessageBox.question(
+                self.MainWindow,
+                "Confirm",
+                "Are you sure to remove this project?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                self._commit_bulk("deleted", deleted=[project])
 
         act_edit.triggered.connect(do_edit)
         act_delete.triggered.connect(do_delete)
         menu.addAction(act_edit)
         menu.addAction(act_delete)
-        menu.exec(self.tableWidgetAllProjects.mapToGlobal(pos))
+
+        # Các dòng được tick: đổi/xoá tất cả trong một lần ghi
+        checked = self._table_proxies[key].checked_projects()
+        if checked:
+            bulk = menu.addMenu(f"Selected ({len(checked)})")
+            status_menu = bulk.addMenu("Set Status")
+            for status in self.STATUSES:
+                status_menu.addAction(status).triggered.connect(
+                    lambda _=False, status=status: self.bulk_set_status(checked, status))
+            priority_menu = bulk.addMenu("Set Priority")
+            for priority in self.PRIORITIES:
+                priority_menu.addAction(priority).triggered.connect(
+                    lambda _=False, priority=priority: self.bulk_set_priority(checked, priority))
+
+            def do_reassign():
+                usernames = [u.Username for u in self.users]
+                username, ok = QInputDialog.getItem(
+                    self.MainWindow, "Reassign", f"Assign {len(checked)} project(s) to:", usernames, 0, False
+                )
+                if ok and username:
+                    self.bulk_reassign(checked, [username])
+
+            bulk.addAction("Reassign...").triggered.connect(do_reassign)
+            bulk.addAction("Delete Selected").triggered.connect(lambda: self.remove_selected_projects(key))
+        menu.exec(self._project_table(key).viewport().mapToGlobal(pos))
 
     def update_project_counts(self):
-        statuses = [p.status for p in self.projects]
-        counts = Counter(statuses)
-        for s in ["Open", "Pending", "Ongoing", "Completed", "Canceled"]:
-            counts.setdefault(s, 0)
+        # Đếm bằng mảng NumPy (np.bincount) thay vì duyệt từng Project
+        counts = self._status_counts = self.dc.get_project_columns().status_counts()
 
         if hasattr(self, "lblOpenCount"):
             self.lblOpenCount.setText(str(counts["Open"]))
@@ -571,7 +571,7 @@ class Ui_MainWindow(object):
         self.lineEditSearchAll.setFont(font)
         self.lineEditSearchAll.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.lineEditSearchAll.setObjectName("lineEditSearchAll")
-        self.tableWidgetAllProjects = QtWidgets.QTableWidget(parent=self.widget_2)
+        self.tableWidgetAllProjects = QtWidgets.QTableView(parent=self.widget_2)
         self.tableWidgetAllProjects.setEnabled(True)
         self.tableWidgetAllProjects.setGeometry(QtCore.QRect(0, 150, 1261, 721))
         font = QtGui.QFont()
@@ -582,9 +582,7 @@ class Ui_MainWindow(object):
         self.tableWidgetAllProjects.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.tableWidgetAllProjects.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tableWidgetAllProjects.setDragDropOverwriteMode(True)
-        self.tableWidgetAllProjects.setColumnCount(0)
         self.tableWidgetAllProjects.setObjectName("tableWidgetAllProjects")
-        self.tableWidgetAllProjects.setRowCount(0)
         self.ProjectListAll = QtWidgets.QLabel(parent=self.widget_2)
         self.ProjectListAll.setGeometry(QtCore.QRect(0, 0, 1291, 71))
         font = QtGui.QFont()
@@ -716,7 +714,7 @@ class Ui_MainWindow(object):
 "background-color: rgb(0, 170, 255);")
         self.pushButtonOpenAddTask.setIcon(icon14)
         self.pushButtonOpenAddTask.setObjectName("pushButtonOpenAddTask")
-        self.tableWidgetOpen = QtWidgets.QTableWidget(parent=self.tab_7)
+        self.tableWidgetOpen = QtWidgets.QTableView(parent=self.tab_7)
         self.tableWidgetOpen.setEnabled(True)
         self.tableWidgetOpen.setGeometry(QtCore.QRect(0, 150, 1261, 731))
         font = QtGui.QFont()
@@ -727,9 +725,7 @@ class Ui_MainWindow(object):
         self.tableWidgetOpen.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.tableWidgetOpen.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tableWidgetOpen.setDragDropOverwriteMode(True)
-        self.tableWidgetOpen.setColumnCount(0)
         self.tableWidgetOpen.setObjectName("tableWidgetOpen")
-        self.tableWidgetOpen.setRowCount(0)
         self.lineEditSearchOpen = QtWidgets.QLineEdit(parent=self.tab_7)
         self.lineEditSearchOpen.setGeometry(QtCore.QRect(20, 80, 611, 31))
         font = QtGui.QFont()
@@ -818,7 +814,7 @@ class Ui_MainWindow(object):
 "background-color: rgb(0, 255, 127);")
         self.pushButtonPendingAddTask.setIcon(icon14)
         self.pushButtonPendingAddTask.setObjectName("pushButtonPendingAddTask")
-        self.tableWidgetPending = QtWidgets.QTableWidget(parent=self.tab_11)
+        self.tableWidgetPending = QtWidgets.QTableView(parent=self.tab_11)
         self.tableWidgetPending.setEnabled(True)
         self.tableWidgetPending.setGeometry(QtCore.QRect(0, 150, 1261, 731))
         font = QtGui.QFont()
@@ -829,9 +825,7 @@ class Ui_MainWindow(object):
         self.tableWidgetPending.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.tableWidgetPending.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tableWidgetPending.setDragDropOverwriteMode(True)
-        self.tableWidgetPending.setColumnCount(0)
         self.tableWidgetPending.setObjectName("tableWidgetPending")
-        self.tableWidgetPending.setRowCount(0)
         self.pushButtonPendingSearch = QtWidgets.QPushButton(parent=self.tab_11)
         self.pushButtonPendingSearch.setGeometry(QtCore.QRect(650, 80, 93, 31))
         font = QtGui.QFont()
@@ -914,7 +908,7 @@ class Ui_MainWindow(object):
 "background-color: rgb(255, 255, 127);")
         self.pushButtonOngoingAddTask.setIcon(icon14)
         self.pushButtonOngoingAddTask.setObjectName("pushButtonOngoingAddTask")
-        self.tableWidgetOngoing = QtWidgets.QTableWidget(parent=self.tab_12)
+        self.tableWidgetOngoing = QtWidgets.QTableView(parent=self.tab_12)
         self.tableWidgetOngoing.setEnabled(True)
         self.tableWidgetOngoing.setGeometry(QtCore.QRect(0, 150, 1261, 721))
         font = QtGui.QFont()
@@ -925,9 +919,7 @@ class Ui_MainWindow(object):
         self.tableWidgetOngoing.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.tableWidgetOngoing.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tableWidgetOngoing.setDragDropOverwriteMode(True)
-        self.tableWidgetOngoing.setColumnCount(0)
         self.tableWidgetOngoing.setObjectName("tableWidgetOngoing")
-        self.tableWidgetOngoing.setRowCount(0)
         self.pushButtonOngoingSearch = QtWidgets.QPushButton(parent=self.tab_12)
         self.pushButtonOngoingSearch.setGeometry(QtCore.QRect(650, 80, 93, 31))
         font = QtGui.QFont()
@@ -1011,7 +1003,7 @@ class Ui_MainWindow(object):
 "background-color: rgb(0, 255, 255);")
         self.pushButtonCompletedAddTask.setIcon(icon14)
         self.pushButtonCompletedAddTask.setObjectName("pushButtonCompletedAddTask")
-        self.tableWidgetCompleted = QtWidgets.QTableWidget(parent=self.tab_13)
+        self.tableWidgetCompleted = QtWidgets.QTableView(parent=self.tab_13)
         self.tableWidgetCompleted.setEnabled(True)
         self.tableWidgetCompleted.setGeometry(QtCore.QRect(0, 150, 1261, 731))
         font = QtGui.QFont()
@@ -1022,9 +1014,7 @@ class Ui_MainWindow(object):
         self.tableWidgetCompleted.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.tableWidgetCompleted.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tableWidgetCompleted.setDragDropOverwriteMode(True)
-        self.tableWidgetCompleted.setColumnCount(0)
         self.tableWidgetCompleted.setObjectName("tableWidgetCompleted")
-        self.tableWidgetCompleted.setRowCount(0)
         self.pushButtonCompletedSearch = QtWidgets.QPushButton(parent=self.tab_13)
         self.pushButtonCompletedSearch.setGeometry(QtCore.QRect(650, 80, 93, 31))
         font = QtGui.QFont()
@@ -1108,7 +1098,7 @@ class Ui_MainWindow(object):
 "background-color: rgb(255, 170, 0);")
         self.pushButtonCanceledAddTask.setIcon(icon14)
         self.pushButtonCanceledAddTask.setObjectName("pushButtonCanceledAddTask")
-        self.tableWidgetCanceled = QtWidgets.QTableWidget(parent=self.tab_14)
+        self.tableWidgetCanceled = QtWidgets.QTableView(parent=self.tab_14)
         self.tableWidgetCanceled.setEnabled(True)
         self.tableWidgetCanceled.setGeometry(QtCore.QRect(0, 150, 1261, 721))
         font = QtGui.QFont()
@@ -1119,9 +1109,7 @@ class Ui_MainWindow(object):
         self.tableWidgetCanceled.setStyleSheet("background-color: rgb(255, 255, 255);")
         self.tableWidgetCanceled.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tableWidgetCanceled.setDragDropOverwriteMode(True)
-        self.tableWidgetCanceled.setColumnCount(0)
         self.tableWidgetCanceled.setObjectName("tableWidgetCanceled")
-        self.tableWidgetCanceled.setRowCount(0)
         self.pushButtonCanceledSearch = QtWidgets.QPushButton(parent=self.tab_14)
         self.pushButtonCanceledSearch.setGeometry(QtCore.QRect(650, 80, 93, 31))
         font = QtGui.QFont()
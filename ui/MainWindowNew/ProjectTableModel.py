@@ -0,0 +1,841 @@
+import re
+import sys
+from bisect import bisect_left
+from operator import attrgetter, itemgetter
+
+import numpy as np
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex, QSortFilterProxyModel, QEvent, QTimer, pyqtSignal
+)
+from PyQt6.QtWidgets import (
+    QApplication, QStyledItemDelegate, QStyle, QStyleOptionButton, QStyleOptionComboBox,
+    QStyleOptionProgressBar, QComboBox, QSlider
+)
+
+from libs.ProjectColumns import STATUSES
+from libs.SearchIndex import fold
+from Models.Project import Project
+
+# Vai trò dữ liệu riêng: delegate/handler lấy thẳng đối tượng Project của một dòng
+PROJECT_ROLE = Qt.ItemDataRole.UserRole
+
+_STATUS_RANK = {status: i for i, status in enumerate(STATUSES)}
+_NO_DATE = sys.maxsize  # ngày không parse được xếp sau mọi ngày (khi tăng dần)
+# Nhãn priority không có số: xếp sau "Priority <n>", theo thứ tự mức độ quen thuộc
+_PRIORITY_WORDS = {"critical": 0, "urgent": 1, "high": 2, "medium": 3, "normal": 4, "low": 5}
+_PRIORITY_NUMBER = re.compile(r"(\d+)")
+
+
+def priority_rank(priority):
+    """
+    Numeric sort rank of a priority label: "Priority 2" -> 2, so "Priority 10"
+    sorts after it (as text it would come first); labels without a number
+    come after every numbered one.
+    """
+    text = str(priority or "")
+    match = _PRIORITY_NUMBER.search(text)
+    if match:
+        return int(match.group(1))
+    return 1_000_000_000 + _PRIORITY_WORDS.get(text.strip().lower(), len(_PRIORITY_WORDS))
+
+
+def _progress_rank(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class ProjectTableModel(QAbstractTableModel):
+    """
+    Table model over the list of Project objects, shared by the All Projects
+    table and the status tabs (each through a ProjectFilterProxy). The view
+    only asks for the cells it paints, so no widget exists per row: the
+    checkbox is a check state, status / progress / the two buttons are drawn
+    by the delegates below and an editor is created only while the user
+    edits a cell.
+
+    Rows are looked up by project_id, so single projects can be added,
+    patched or removed without rebuilding the table. description and
+    attachments of summaries (see Project.summary) are fetched in one batch
+    for the rows the view actually asks for, through `load_details`.
+    """
+
+    HEADERS = ["Select", "ID", "Name", "Assignment", "Manager",
+               "Status", "Progress", "Start Date", "End Date",
+               "Priority", "Dependency", "Description", "Attachments", "Details"]
+    SELECT, ASSIGNMENT, STATUS, PROGRESS, DETAILS = 0, 3, 5, 6, 13
+    # Cột -> field của Project
+    FIELD_COLUMNS = {"project_id": 1, "name": 2, "assignment": 3, "manager": 4, "status": 5, "progress": 6,
+                     "start_date": 7, "end_date": 8, "priority": 9, "dependency": 10,
+                     "description": 11, "attachments": 12}
+    COLUMN_FIELDS = {col: field for field, col in FIELD_COLUMNS.items()}
+    EDITABLE_FIELDS = ("status", "progress")
+    # signature(): các trường đơn giản lấy một lượt bằng attrgetter, sau đó assignment và hai trường nặng
+    _PLAIN_FIELDS = tuple(f for f in FIELD_COLUMNS if f != "assignment" and f not in Project.HEAVY_FIELDS)
+    _PLAIN_VALUES = attrgetter(*_PLAIN_FIELDS)
+    SIGNATURE_COLUMNS = itemgetter(*_PLAIN_FIELDS, "assignment", *Project.HEAVY_FIELDS)(FIELD_COLUMNS)
+
+    # Cột sắp xếp được -> vị trí trong sort_key() (description/attachments không: phải nạp chi tiết mọi dòng)
+    SORT_COLUMNS = {col: i for i, col in enumerate(range(1, 11))}
+    NUMERIC_SORT_COLUMNS = (5, 6, 7, 8, 9)  # status, progress, hai ngày, priority: sắp bằng NumPy
+    MAX_SORT_COLUMNS = 3  # bấm header: cột mới thành khoá chính, giữ tối đa 2 khoá cũ phía sau
+
+    # (project, field, value): người dùng đổi status/progress qua editor; handler áp dụng và lưu
+    edited = pyqtSignal(object, str, object)
+
+    def __init__(self, load_details=None, parent=None):
+        super().__init__(parent)
+        self._projects = []
+        self._rows = {}         # project_id -> row
+        # Sau khi xoá, các dòng từ _stale_from trở đi đã dịch lên tối đa _removed dòng (xem _row)
+        self._stale_from = None
+        self._removed = 0
+        self._checked = set()   # project_id của các dòng được tick
+        self._signatures = {}   # project_id -> giá trị các cột lúc hiển thị (xem reconcile)
+        self._sort_keys = {}    # project_id -> sort_key(), tính khi cần và bỏ khi project đổi
+        # Sau lần sắp xếp đầu: sort_key() theo thứ tự dòng, và mảng giá trị của các cột đã dùng để sắp xếp
+        self._row_keys = None
+        self._key_columns = {}  # cột -> mảng theo thứ tự dòng (xem _row_key_column)
+        self._sort_spec = []    # [(cột, Qt.SortOrder)], khoá chính trước
+        self._load_details = load_details
+        self._pending_details = {}  # project_id -> summary chờ nạp description/attachments
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(30)
+        self._details_timer.timeout.connect(self._fetch_details)
+
+    # ----- Qt model interface -----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._projects)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        project = self._projects[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cell_text(project, col, self._schedule_details)
+        if role == Qt.ItemDataRole.EditRole:
+            field = self.COLUMN_FIELDS.get(col)
+            return getattr(project, field) if field in self.EDITABLE_FIELDS else None
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.SELECT:
+            checked = str(project.project_id) in self._checked
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        if role == PROJECT_ROLE:
+            return project
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.SELECT:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif self.COLUMN_FIELDS.get(index.column()) in self.EDITABLE_FIELDS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        project = self._projects[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.SELECT:
+            pid = str(project.project_id)
+            if value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value):
+                self._checked.add(pid)
+            else:
+                self._checked.discard(pid)
+            self.dataChanged.emit(index, index, [role])
+            return True
+        field = self.COLUMN_FIELDS.get(col)
+        if role != Qt.ItemDataRole.EditRole or field not in self.EDITABLE_FIELDS:
+            return False
+        if getattr(project, field) == value:
+            return False
+        self.edited.emit(project, field, value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    # ----- Nội dung ô -----
+    @classmethod
+    def cell_text(cls, project, col, on_missing_details=None):
+        """
+        Text of one cell. Heavy fields of a summary are shown empty and reported
+        to `on_missing_details(project)` instead of being loaded one by one.
+        """
+        if col == cls.DETAILS:
+            return "View Details"
+        field = cls.COLUMN_FIELDS.get(col)
+        if field is None:
+            return None
+        if field in Project.HEAVY_FIELDS and not project.details_loaded:
+            if on_missing_details is not None:
+                on_missing_details(project)
+            return ""
+        value = getattr(project, field)
+        if field == "assignment":
+            return ", ".join(value) if value else "Add People"
+        if field == "progress":
+            return f"{value}%"
+        if isinstance(value, list):
+            return ", ".join(value)
+        return "" if value is None else str(value)
+
+    def _schedule_details(self, project):
+        if self._load_details is None:
+            return
+        self._pending_details[str(project.project_id)] = project
+        self._details_timer.start()
+
+    def _fetch_details(self):
+        """Loads description/attachments of the summaries painted since the last batch."""
+        pending, self._pending_details = self._pending_details, {}
+        rows = [row for row in map(self._row, pending) if row is not None]
+        projects = [p for p in pending.values() if not p.details_loaded]
+        if projects:
+            self._load_details(projects)
+            for project in projects:
+                if str(project.project_id) in self._signatures:
+                    self._signatures[str(project.project_id)] = self.signature(project)
+        if rows:
+            first, last = self.FIELD_COLUMNS["description"], self.FIELD_COLUMNS["attachments"]
+            # Chỉ DisplayRole: các proxy không phải lọc lại các dòng này
+            self.dataChanged.emit(self.index(min(rows), first), self.index(max(rows), last),
+                                  [Qt.ItemDataRole.DisplayRole])
+
+    # ----- Dữ liệu theo project_id -----
+    def set_projects(self, projects):
+        """Replaces every row (one model reset; the view repaints only what is visible)."""
+        self.beginResetModel()
+        self._projects = list(projects)
+        self._rows = {str(p.project_id): row for row, p in enumerate(self._projects)}
+        self._signatures = {pid: self.signature(p) for pid, p in zip(self._rows, self._projects)}
+        self._sort_keys = {}
+        self._row_keys, self._key_columns = None, {}
+        self._stale_from = None
+        self._removed = 0
+        self._checked = set()
+        self._pending_details = {}
+        self.endResetModel()
+
+    @classmethod
+    def signature(cls, project):
+        """
+        The values shown in the columns of a project (slots follow SIGNATURE_COLUMNS),
+        copied so that later in-place edits can be detected. Heavy fields of a summary are not read.
+        """
+        heavy = (project.description, tuple(project.attachments or ())) if project.details_loaded else (None, None)
+        return cls._PLAIN_VALUES(project) + (tuple(project.assignment or ()),) + heavy
+
+    MAX_MOVES = 256  # nhiều hơn thì sắp lại bằng một layoutChanged thay vì từng rowsMoved
+
+    def reconcile(self, projects):
+        """
+        Makes the rows equal to `projects` (matched by project_id) by emitting only
+        the needed row removals, moves, insertions and cell updates, so ticks,
+        selection and scroll position survive. A project whose shown values did not
+        change (see signature) is not repainted. Returns {"removed", "moved",
+        "inserted", "updated"} counts.
+        """
+        # Chữ ký tính trước khi sắp xếp: khoá sắp xếp đã cache của project có giá trị đổi phải bỏ trước
+        signatures = {str(p.project_id): self.signature(p) for p in projects}
+        for pid, sig in signatures.items():
+            if self._signatures.get(pid) != sig:
+                self._sort_keys.pop(pid, None)
+        new = self._sorted(projects) if self._sort_spec else list(projects)
+        new_ids = [str(p.project_id) for p in new]
+        target = {pid: i for i, pid in enumerate(new_ids)}
+        self._index_rows()
+        stats = {"removed": 0, "moved": 0, "inserted": 0, "updated": 0}
+
+        # 1) Xoá các dòng không còn trong danh sách mới, từng đoạn liên tiếp, từ dưới lên
+        gone = [row for pid, row in self._rows.items() if pid not in target]
+        self._remove_rows(gone)
+        stats["removed"] = len(gone)
+
+        # 2) Đưa các dòng còn lại về thứ tự mới: giữ nguyên dãy con tăng dài nhất, chỉ chuyển phần còn lại
+        order = [target[str(p.project_id)] for p in self._projects]
+        if order == sorted(order):
+            to_move = []  # thường gặp: thứ tự không đổi
+        else:
+            keep = _longest_increasing(order)
+            to_move = [pos for pos in order if pos not in keep]
+        if len(to_move) > self.MAX_MOVES:
+            self._reorder(sorted(self._projects, key=lambda p: target[str(p.project_id)]))
+        else:
+            ranked = sorted(order)
+            for pos in sorted(to_move):
+                src = order.index(pos)
+                # Đặt ngay sau dòng đứng trước nó trong thứ tự mới (dòng đó đã đúng chỗ)
+                k = bisect_left(ranked, pos)
+                dest = order.index(ranked[k - 1]) + 1 if k else 0
+                if self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dest):
+                    at = dest - 1 if src < dest else dest
+                    self._projects.insert(at, self._projects.pop(src))
+                    order.insert(at, order.pop(src))
+                    self.endMoveRows()
+        stats["moved"] = len(to_move)
+
+        # 3) Chèn các project mới, từng đoạn liên tiếp
+        row = 0
+        while row < len(new):
+            if new_ids[row] in self._signatures:
+                row += 1
+                continue
+            end = row
+            while end < len(new) and new_ids[end] not in self._signatures:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._projects[row:row] = new[row:end]
+            for pid in new_ids[row:end]:
+                self._signatures[pid] = signatures[pid]
+            self.endInsertRows()
+            stats["inserted"] += end - row
+            row = end
+
+        # 4) Thay đối tượng và chỉ vẽ lại các ô có giá trị đổi
+        changed = []
+        for row, (pid, project) in enumerate(zip(new_ids, new)):
+            self._projects[row] = project
+            sig = signatures[pid]
+            old = self._signatures.get(pid)
+            if old != sig:
+                self._signatures[pid] = sig
+                cols = [col for (col, a, b) in zip(self.SIGNATURE_COLUMNS, old, sig) if a != b]
+                changed.append((row, min(cols), max(cols)))
+        self._rows = {pid: row for row, pid in enumerate(new_ids)}
+        self._stale_from, self._removed = None, 0
+        self._row_keys, self._key_columns = None, {}
+        if len(changed) > self.MAX_MOVES:
+            self.dataChanged.emit(self.index(changed[0][0], 0), self.index(changed[-1][0], self.DETAILS))
+        else:
+            for row, first, last in changed:
+                self.dataChanged.emit(self.index(row, first), self.index(row, last))
+        stats["updated"] = len(changed)
+        return stats
+
+    # ----- Sắp xếp -----
+    @classmethod
+    def sort_key(cls, project):
+        """
+        Typed sort values of the sortable columns (SORT_COLUMNS order): texts folded
+        (case and accents ignored), status in workflow order, progress as a number,
+        dates as day ordinals and priorities by priority_rank.
+        """
+        return (str(project.project_id), fold(project.name),
+                fold(" ".join(str(a) for a in project.assignment or ())), fold(project.manager),
+                _STATUS_RANK.get(project.status, len(_STATUS_RANK)), _progress_rank(project.progress),
+                _NO_DATE if project.start_ordinal is None else project.start_ordinal,
+                _NO_DATE if project.end_ordinal is None else project.end_ordinal,
+                priority_rank(project.priority), fold(project.dependency))
+
+    def _sort_keys_of(self, projects):
+        # map() chạy vòng lặp trong C: ~100k project mỗi lần sắp xếp
+        result = list(map(self._sort_keys.get, _project_ids(projects)))
+        if None in result:
+            for i in [i for i, key in enumerate(result) if key is None]:
+                project = projects[i]
+                result[i] = self._sort_keys[str(project.project_id)] = self.sort_key(project)
+        return result
+
+    def _cached_sort_key(self, project):
+        pid = str(project.project_id)
+        key = self._sort_keys.get(pid)
+        if key is None:
+            key = self._sort_keys[pid] = self.sort_key(project)
+        return key
+
+    @classmethod
+    def _key_column(cls, keys, column):
+        """The sort values of one column as an array (int64 for NUMERIC_SORT_COLUMNS)."""
+        values = map(itemgetter(cls.SORT_COLUMNS[column]), keys)
+        if column in cls.NUMERIC_SORT_COLUMNS:
+            return np.fromiter(values, dtype=np.int64, count=len(keys))
+        return np.fromiter(values, dtype=object, count=len(keys))
+
+    def _row_key_column(self, column):
+        """Sort values of `column` in row order, kept in step with the rows (see _patch_key_columns)."""
+        array = self._key_columns.get(column)
+        if array is None:
+            if self._row_keys is None:
+                self._row_keys = self._sort_keys_of(self._projects)
+            array = self._key_columns[column] = self._key_column(self._row_keys, column)
+        return array
+
+    def _patch_key_columns(self, row=None, project=None, removed=False):
+        """
+        Keeps the row-order key columns valid: one changed, appended (row None)
+        or removed row. Only that project's key is recomputed.
+        """
+        if self._row_keys is None:
+            return
+        if removed:
+            del self._row_keys[row]
+            for column, array in self._key_columns.items():
+                self._key_columns[column] = np.delete(array, row)
+            return
+        key = self._cached_sort_key(project)
+        if row is None:
+            self._row_keys.append(key)
+        else:
+            self._row_keys[row] = key
+        for column, array in self._key_columns.items():
+            value = key[self.SORT_COLUMNS[column]]
+            if row is None:
+                self._key_columns[column] = np.append(array, np.array([value], dtype=array.dtype))
+            else:
+                array[row] = value
+
+    def _sort_order(self, column_values, spec=None):
+        """
+        Row positions ordered by `spec` (default: the current sort), one stable pass
+        per column from the last key to the main one. `column_values(column)` gives
+        the sort values of a column as an array.
+        """
+        order = None
+        for column, sort_order in reversed(self._sort_spec if spec is None else spec):
+            descending = sort_order == Qt.SortOrder.DescendingOrder
+            values = column_values(column)
+            if order is None:
+                order = np.arange(len(values))
+            if column in self.NUMERIC_SORT_COLUMNS:
+                # Khoá số: argsort ổn định của NumPy; giảm dần = tăng dần của số đối
+                values = values[order]
+                order = order[np.argsort(-values if descending else values, kind="stable")]
+            else:
+                values = values[order].tolist()
+                ranked = sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+                order = order[ranked]
+        return order
+
+    def _sorted(self, projects, spec=None):
+        projects = list(projects)
+        if not projects:
+            return projects
+        keys = self._sort_keys_of(projects)
+        return _take(projects, self._sort_order(lambda column: self._key_column(keys, column), spec))
+
+    def sort_spec(self):
+        return list(self._sort_spec)
+
+    def sort_by(self, spec):
+        """
+        Orders the rows by several columns, e.g. [(STATUS, AscendingOrder), (8, AscendingOrder)]
+        for status then end date. Ticks, selection and the current cell follow their
+        project. Later edits do not move rows; the list is sorted again on the next
+        sort or reconcile. Columns that cannot be sorted are ignored.
+        """
+        self._sort_spec = [(col, order) for col, order in spec if col in self.SORT_COLUMNS]
+        if not self._sort_spec or not self._projects:
+            return
+        order = self._sort_order(self._row_key_column)
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        new_row = np.empty(len(order), dtype=np.intp)
+        new_row[order] = np.arange(len(order))
+        new_indexes = [self.index(int(new_row[i.row()]), i.column()) for i in old_indexes]
+        self._projects = _take(self._projects, order)
+        self._key_columns = {column: array[order] for column, array in self._key_columns.items()}
+        self._row_keys = _take(self._row_keys, order)
+        # _rows được đánh số lại ở lần tra cứu đầu tiên (xem _row), không phải ở mỗi lần sắp xếp
+        self._stale_from, self._removed = 0, self.MAX_STALE_ROWS + 1
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def resort(self):
+        """Sorts the rows again by the active sort (e.g. after extend() appended a load)."""
+        if self._sort_spec:
+            self.sort_by(self._sort_spec)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Header click: `column` becomes the main key, the previous keys break its ties."""
+        if column not in self.SORT_COLUMNS:
+            return
+        rest = [(col, o) for col, o in self._sort_spec if col != column]
+        self.sort_by([(column, order)] + rest[:self.MAX_SORT_COLUMNS - 1])
+
+    def _reorder(self, projects):
+        """Puts the same projects in a new order as one layout change (persistent indexes follow)."""
+        self.layoutAboutToBeChanged.emit()
+        new_rows = dict(zip(_project_ids(projects), range(len(projects))))
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_rows[str(self._projects[i.row()].project_id)], i.column())
+                       for i in old_indexes]
+        self._projects = list(projects)
+        self._rows = new_rows
+        self._stale_from, self._removed = None, 0
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def projects(self):
+        return list(self._projects)
+
+    def project(self, row):
+        return self._projects[row] if 0 <= row < len(self._projects) else None
+
+    MAX_STALE_ROWS = 64  # số lần xoá trước khi đánh số lại toàn bộ các dòng phía sau
+
+    def _index_rows(self):
+        """Renumbers the rows that shifted up after removals."""
+        if self._stale_from is not None:
+            start, self._stale_from, self._removed = self._stale_from, None, 0
+            self._rows.update({str(p.project_id): row for row, p in enumerate(self._projects[start:], start)})
+
+    def _row(self, pid):
+        """
+        Current row of a project id, or None. Removing a row does not renumber the
+        rows below it (O(n) at 100k rows); a stale row number is at most
+        `_removed` too high, so the project is found by scanning back that far.
+        """
+        row = self._rows.get(pid)
+        if row is None or self._stale_from is None or row < self._stale_from:
+            return row
+        if self._removed > self.MAX_STALE_ROWS:
+            self._index_rows()
+            return self._rows.get(pid)
+        for r in range(min(row, len(self._projects) - 1), max(row - self._removed, 0) - 1, -1):
+            if str(self._projects[r].project_id) == pid:
+                return r
+        self._index_rows()
+        return self._rows.get(pid)
+
+    def row_of(self, project_id):
+        row = self._row(str(project_id))
+        return -1 if row is None else row
+
+    def put(self, project):
+        """Appends a project, or replaces its row if it is already shown."""
+        pid = str(project.project_id)
+        if pid in self._rows:
+            self.update(project)
+            return
+        row = len(self._projects)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._projects.append(project)
+        self._rows[pid] = row
+        self._signatures[pid] = self.signature(project)
+        self._patch_key_columns(project=project)
+        self.endInsertRows()
+
+    def extend(self, projects):
+        """
+        Appends the projects that are not shown yet, as one insertion (chunked loading).
+        Rows keep the load order; call resort() once loading is done to apply the active sort.
+        """
+        new = [p for p in projects if str(p.project_id) not in self._rows]
+        if not new:
+            return
+        first = len(self._projects)
+        self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+        for row, project in enumerate(new, first):
+            pid = str(project.project_id)
+            self._rows[pid] = row
+            self._signatures[pid] = self.signature(project)
+        self._projects.extend(new)
+        self._row_keys, self._key_columns = None, {}
+        self.endInsertRows()
+
+    def update(self, project, fields=None):
+        """Repaints the cells of `fields` (every cell if None) in the row of a project."""
+        row = self._row(str(project.project_id))
+        if row is None:
+            return
+        self._projects[row] = project
+        self._signatures[str(project.project_id)] = self.signature(project)
+        self._sort_keys.pop(str(project.project_id), None)
+        self._patch_key_columns(row, project)
+        cols = [self.FIELD_COLUMNS[f] for f in fields if f in self.FIELD_COLUMNS] if fields is not None else [0, 13]
+        if cols:
+            self.dataChanged.emit(self.index(row, min(cols)), self.index(row, max(cols)))
+
+    def remove(self, project_id):
+        pid = str(project_id)
+        row = self._row(pid)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._projects[row]
+        self._patch_key_columns(row, removed=True)
+        del self._rows[pid]
+        self._signatures.pop(pid, None)
+        self._sort_keys.pop(pid, None)
+        self._stale_from = row if self._stale_from is None else min(self._stale_from, row)
+        self._removed += 1
+        self._checked.discard(pid)
+        self._pending_details.pop(pid, None)
+        self.endRemoveRows()
+
+    def remove_many(self, project_ids):
+        """
+        Removes the rows of several projects with one removal per run of consecutive
+        rows (bulk delete). Returns the number of removed rows.
+        """
+        self._index_rows()
+        rows = [self._rows[pid] for pid in {str(pid) for pid in project_ids} if pid in self._rows]
+        if rows:
+            self._remove_rows(rows)
+            self._stale_from, self._removed = min(rows), self.MAX_STALE_ROWS + 1
+            self._row_keys, self._key_columns = None, {}
+        return len(rows)
+
+    def _remove_rows(self, rows):
+        """Removes `rows` (current row numbers) run by run from the bottom up; row numbers are left stale."""
+        for first, last in _runs(sorted(rows, reverse=True)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for project in self._projects[first:last + 1]:
+                pid = str(project.project_id)
+                self._rows.pop(pid, None)
+                self._signatures.pop(pid, None)
+                self._sort_keys.pop(pid, None)
+                self._checked.discard(pid)
+                self._pending_details.pop(pid, None)
+            del self._projects[first:last + 1]
+            self.endRemoveRows()
+
+    # ----- Ô chọn (checkbox) -----
+    def checked_projects(self):
+        """Ticked projects in row order."""
+        self._index_rows()
+        return [self._projects[row] for row in sorted(self._rows[pid] for pid in self._checked if pid in self._rows)]
+
+    def set_checked(self, project_ids, checked):
+        """Ticks or clears the rows of `project_ids` (one repaint of the Select column)."""
+        ids = {str(pid) for pid in project_ids}
+        if checked:
+            self._checked |= ids
+        else:
+            self._checked -= ids
+        if self._projects:
+            last = self.index(len(self._projects) - 1, self.SELECT)
+            self.dataChanged.emit(self.index(0, self.SELECT), last, [Qt.ItemDataRole.CheckStateRole])
+
+
+def _take(items, order):
+    """[items[i] for i in order], gathered by NumPy (several times faster at 100k rows)."""
+    return np.fromiter(items, dtype=object, count=len(items))[order].tolist()
+
+
+def _project_ids(projects):
+    return map(str, map(attrgetter("project_id"), projects))
+
+
+def _runs(rows):
+    """Splits row numbers sorted from the bottom up into (first, last) runs of consecutive rows."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][0] == row + 1:
+            runs[-1][0] = row
+        else:
+            runs.append([row, row])
+    return [tuple(run) for run in runs]
+
+
+def _longest_increasing(values):
+    """Set of the values forming a longest increasing subsequence of `values` (distinct ints)."""
+    tails, tail_at, prev = [], [], [None] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_at.append(i)
+        else:
+            tails[k] = value
+            tail_at[k] = i
+        prev[i] = tail_at[k - 1] if k else None
+    keep, i = set(), tail_at[-1] if tail_at else None
+    while i is not None:
+        keep.add(values[i])
+        i = prev[i]
+    return keep
+
+
+class ProjectFilterProxy(QSortFilterProxyModel):
+    """
+    What one table shows of the shared ProjectTableModel: the projects of
+    `status` (every project if None), narrowed to a search result while one
+    is set. The filter is dynamic, so a status edit in the source model
+    (one dataChanged) moves the row from one tab to another by itself and
+    no table is ever refilled. Sorting is done by the source model (see
+    ProjectTableModel.sort_by), so the proxy keeps its order, except for a
+    search result of up to MAX_RANKED rows, which is shown best match first.
+    """
+
+    MAX_RANKED = 5000  # kết quả lớn hơn: giữ thứ tự model (sắp xếp theo hạng gọi lessThan bằng Python)
+
+    def __init__(self, status=None, parent=None):
+        super().__init__(parent)
+        self.status = status
+        self._matches = None  # None: không tìm kiếm; project_id -> hạng trong kết quả tìm kiếm
+        self.setDynamicSortFilter(True)
+        # Chỉ lọc lại khi cả dòng đổi (dataChanged không kèm role); tick chọn/nạp chi tiết không ảnh hưởng
+        self.setFilterRole(PROJECT_ROLE)
+
+    def accepts(self, project):
+        if self.status is not None and project.status != self.status:
+            return False
+        return self._matches is None or str(project.project_id) in self._matches
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        project = self.sourceModel().project(source_row)
+        return project is not None and self.accepts(project)
+
+    @property
+    def searching(self):
+        return self._matches is not None
+
+    def set_matches(self, project_ids):
+        """
+        Shows only `project_ids` (a search result, best match first) in that order;
+        None shows every project of the status again, in the model's order.
+        """
+        if project_ids is None:
+            # Bỏ sắp xếp theo hạng trước: invalidateFilter() sẽ sắp xếp lại nếu proxy còn sort cột 0
+            QSortFilterProxyModel.sort(self, -1)
+            self._matches = None
+        else:
+            self._matches = {}
+            for pid in project_ids:
+                self._matches.setdefault(str(pid), len(self._matches))
+        self.invalidateFilter()
+        # Cột 0: theo hạng tìm kiếm (lessThan); -1: thứ tự của model nguồn
+        ranked = self._matches is not None and len(self._matches) <= self.MAX_RANKED
+        QSortFilterProxyModel.sort(self, 0 if ranked else -1)
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        matches = self._matches or {}
+        left_rank = matches.get(str(model.project(left.row()).project_id))
+        right_rank = matches.get(str(model.project(right.row()).project_id))
+        if left_rank is None or right_rank is None:
+            # Không tìm kiếm (hoặc id không có trong kết quả): giữ thứ tự của model nguồn
+            return left.row() < right.row()
+        return left_rank < right_rank
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Header click: sorts the shared model (precomputed keys) instead of comparing rows here."""
+        QSortFilterProxyModel.sort(self, -1)
+        self.sourceModel().sort(column, order)
+
+    def project(self, row):
+        source = self.mapToSource(self.index(row, 0))
+        return self.sourceModel().project(source.row()) if source.isValid() else None
+
+    def checked_projects(self):
+        """Ticked projects shown by this table, in row order."""
+        return [p for p in self.sourceModel().checked_projects() if self.accepts(p)]
+
+    def set_all_checked(self, checked):
+        source = self.sourceModel()
+        source.set_checked([p.project_id for p in source.projects() if self.accepts(p)], checked)
+
+
+def _style(option):
+    return option.widget.style() if option.widget is not None else QApplication.style()
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a cell as a push button and emits clicked(index) when it is clicked."""
+
+    clicked = pyqtSignal(QModelIndex)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pressed = None
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionButton()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.text = index.data() or ""
+        opt.state = QStyle.StateFlag.State_Enabled
+        if self._pressed is not None and self._pressed == QPersistentModelIndex(index):
+            opt.state |= QStyle.StateFlag.State_Sunken
+        else:
+            opt.state |= QStyle.StateFlag.State_Raised
+        _style(option).drawControl(QStyle.ControlElement.CE_PushButton, opt, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            self._pressed = QPersistentModelIndex(index)
+            return True
+        if event.type() == QEvent.Type.MouseButtonRelease and self._pressed is not None:
+            pressed, self._pressed = self._pressed, None
+            if pressed == QPersistentModelIndex(index) and option.rect.contains(event.position().toPoint()):
+                self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Paints the status as a combo box; a real QComboBox exists only while editing."""
+
+    def __init__(self, statuses, parent=None):
+        super().__init__(parent)
+        self.statuses = list(statuses)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionComboBox()
+        opt.rect = option.rect.adjusted(1, 1, -1, -1)
+        opt.currentText = index.data() or ""
+        opt.state = QStyle.StateFlag.State_Enabled
+        style = _style(option)
+        style.drawComplexControl(QStyle.ComplexControl.CC_ComboBox, opt, painter, option.widget)
+        style.drawControl(QStyle.ControlElement.CE_ComboBoxLabel, opt, painter, option.widget)
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(self.statuses)
+        combo.activated.connect(lambda _i, combo=combo: self._commit_and_close(combo))
+        # Mở danh sách ngay: một lần bấm như với combo box thật
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def _commit_and_close(self, combo):
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.ItemDataRole.EditRole) or "")
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints progress as a progress bar; a QSlider exists only while editing."""
+
+    def paint(self, painter, option, index):
+        value = index.data(Qt.ItemDataRole.EditRole) or 0
+        opt = QStyleOptionProgressBar()
+        opt.rect = option.rect.adjusted(2, 4, -2, -4)
+        opt.minimum, opt.maximum, opt.progress = 0, 100, int(value)
+        opt.text = f"{value}%"
+        opt.textVisible = True
+        opt.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+        _style(option).drawControl(QStyle.ControlElement.CE_ProgressBar, opt, painter, option.widget)
+
+    def createEditor(self, parent, option, index):
+        slider = QSlider(Qt.Orientation.Horizontal, parent)
+        slider.setRange(0, 100)
+        # Ghi từng giá trị khi kéo (việc ghi file được gom lại trong unit of work)
+        slider.valueChanged.connect(lambda _value, slider=slider: self.commitData.emit(slider))
+        return slider
+
+    def setEditorData(self, editor, index):
+        value = int(index.data(Qt.ItemDataRole.EditRole) or 0)
+        if editor.value() != value:
+            editor.blockSignals(True)
+            editor.setValue(value)
+            editor.blockSignals(False)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
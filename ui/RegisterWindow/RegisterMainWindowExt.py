@@ -5,7 +5,7 @@ from PyQt6.QtGui import QPixmap, QIcon
 from PyQt6.QtCore import Qt
 
 from Models.User import User
-from libs.DataConnector import DataConnector
+from libs.StorageBackend import create_connector
 from ui.RegisterWindow.RegisterMainWindow import Ui_MainWindow
 from ui.TermAndCoditionsWindow.TermAndCoditionsWindowExt import TermAndCoditionsWindowExt
 import ui.LoginWindow.LoginMainWindowExt as login_ext
@@ -27,9 +27,9 @@ def is_valid_phone(phone: str) -> bool:
 
 
 class RegisterMainWindowExt(Ui_MainWindow):
-    def __init__(self):
+    def __init__(self, dc=None):
         super().__init__()
-        self.dc = DataConnector()
+        self.dc = dc if dc is not None else create_connector()
         self.users = self.dc.get_all_users()
         self.avatar_path = None  # Store the selected avatar file path
 
@@ -125,10 +125,9 @@ class RegisterMainWindowExt(Ui_MainWindow):
             return
 
         # Check if email is already used
-        for usr in self.users:
-            if usr.Email.strip().lower() == email.lower():
-                QMessageBox.warning(self.MainWindow, "Registration Error", "This email is already registered.")
-                return
+        if self.dc.get_user_by_email(email):
+            QMessageBox.warning(self.MainWindow, "Registration Error", "This email is already registered.")
+            return
 
         # Validate phone format
         if not is_valid_phone(phonenum):
@@ -164,7 +163,7 @@ class RegisterMainWindowExt(Ui_MainWindow):
 
         # Open login window
         self.mainwindow = QMainWindow()
-        self.myui = login_ext.LoginMainWindowExt()
+        self.myui = login_ext.LoginMainWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.mainwindow.show()
 
@@ -178,6 +177,6 @@ class RegisterMainWindowExt(Ui_MainWindow):
     def BackToLogin(self):
         self.MainWindow.close()
         self.mainwindow = QMainWindow()
-        self.myui = login_ext.LoginMainWindowExt()
+        self.myui = login_ext.LoginMainWindowExt(dc=self.dc)
         self.myui.setupUi(self.mainwindow)
         self.myui.showWindow()